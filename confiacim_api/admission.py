@@ -0,0 +1,166 @@
+import math
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from confiacim_api.affinity import AFFINITY_QUEUE_SUFFIX, queue_depths, task_queue
+from confiacim_api.conf import settings
+from confiacim_api.fair_share import pending_depth
+from confiacim_api.logger import logger
+from confiacim_api.models import User
+from confiacim_api.runtime_model import fit_runtime_model
+
+TASK_ANALYSIS = {
+    "confiacim_api.tasks.tencim_standalone_run": "tencim",
+    "confiacim_api.tasks.form_solve": "form",
+    "confiacim_api.tasks.form_group_point_run": "form",
+    "confiacim_api.tasks.monte_carlo_chunk_run": "monte_carlo",
+}
+
+
+def estimated_runtime(session: Session, name: str) -> int:
+    """
+    Tempo estimado de uma simulação da task.
+
+    Parameters:
+        session: Secção aberta com o banco
+        name: Nome da task (ex: `confiacim_api.tasks.form_solve`)
+
+    Returns:
+        Retorna o tempo típico do histórico da análise (`fit_runtime_model`)
+        em segundos (no mínimo 1).
+    """
+    runtime = fit_runtime_model(session, TASK_ANALYSIS[name]).predict()
+    return max(math.ceil(runtime), 1)
+
+
+def backlog_depth(queue: str) -> Optional[int]:
+    """
+    Número de simulações esperando para rodar na fila.
+
+    Soma as mensagens da fila e das suas filas de afinidade e as simulações
+    pendentes do fair-share que vão para essas filas.
+
+    Parameters:
+        queue: Fila base da task
+
+    Returns:
+        Retorna o número de simulações ou `None` se o broker não responder.
+    """
+    queues = [queue] + [f"{queue}.{AFFINITY_QUEUE_SUFFIX}.{i}" for i in range(settings.AFFINITY_QUEUES)]
+
+    depths = queue_depths(queues).values()
+    if any(depth is None for depth in depths):
+        return None
+
+    return sum(depth or 0 for depth in depths) + pending_depth(queues)
+
+
+def admission_limit(user: User, runtime: int) -> Optional[int]:
+    """
+    Número máximo de simulações esperando na fila para aceitar novas simulações.
+
+    O limite é o menor entre o `ADMISSION_MAX_QUEUE_DEPTH` e o número de
+    simulações que os `ADMISSION_WORKERS` rodam em `ADMISSION_MAX_BACKLOG`
+    segundos. O `max_queue_depth` do usuário substitui os dois.
+
+    Parameters:
+        user: Usuário da requisição
+        runtime: Tempo estimado de uma simulação em segundos
+
+    Returns:
+        Retorna o limite ou `None` se não houver limite.
+    """
+    if user.max_queue_depth is not None:
+        return user.max_queue_depth or None
+
+    limits = []
+    if settings.ADMISSION_MAX_QUEUE_DEPTH > 0:
+        limits.append(settings.ADMISSION_MAX_QUEUE_DEPTH)
+    if settings.ADMISSION_MAX_BACKLOG > 0:
+        limits.append(max(settings.ADMISSION_MAX_BACKLOG * max(settings.ADMISSION_WORKERS, 1) // runtime, 1))
+
+    return min(limits) if limits else None
+
+
+def retry_after(excess: int, runtime: int) -> int:
+    """
+    Tempo até a fila ter espaço para a requisição.
+
+    Parameters:
+        excess: Número de simulações acima do limite
+        runtime: Tempo estimado de uma simulação em segundos
+
+    Returns:
+        Retorna o tempo em segundos (no mínimo 1).
+    """
+    return max(math.ceil(excess * runtime / max(settings.ADMISSION_WORKERS, 1)), 1)
+
+
+def admission_enabled(user: User) -> bool:
+    """
+    Se o controle de admissão vale para o usuário.
+
+    Parameters:
+        user: Usuário da requisição
+
+    Returns:
+        Retorna `True` se houver algum limite.
+    """
+    if user.max_queue_depth is not None:
+        return user.max_queue_depth > 0
+    return settings.ADMISSION_MAX_QUEUE_DEPTH > 0 or settings.ADMISSION_MAX_BACKLOG > 0
+
+
+def check_admission(session: Session, user: User, task_name: str, n_jobs: int = 1):
+    """
+    Controle de admissão das rotas que executam simulações.
+
+    Recusa a requisição quando as simulações esperando na fila da task mais
+    as `n_jobs` novas passam do limite (`admission_limit`). O `Retry-After`
+    é o tempo estimado para os workers rodarem as simulações excedentes.
+
+    Parameters:
+        session: Secção aberta com o banco
+        user: Usuário da requisição
+        task_name: Nome da task das simulações
+        n_jobs: Número de simulações da requisição
+
+    Raises:
+        HTTPException: A requisição tem mais simulações que o limite (422) ou
+                       a fila está cheia (429 com o cabeçalho `Retry-After`).
+
+    Info:
+        Se o broker não responder a requisição é aceita.
+    """
+    if not admission_enabled(user):
+        return
+
+    runtime = estimated_runtime(session, task_name)
+    limit = admission_limit(user, runtime)
+
+    if limit is None:
+        return
+
+    if n_jobs > limit:
+        raise HTTPException(
+            detail=f"The request has more simulations than the admission limit ({limit}).",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    queue = task_queue(task_name)
+    depth = backlog_depth(queue)
+
+    if depth is None:
+        logger.warning(f"Admission - queue depth of {queue} not available, accepting the request.")
+        return
+
+    if (excess := depth + n_jobs - limit) > 0:
+        seconds = retry_after(excess, runtime)
+        logger.info(f"Admission - {queue} full (depth={depth}, limit={limit}), retry after {seconds}s.")
+        raise HTTPException(
+            detail="Too many simulations in the queue.",
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(seconds)},
+        )
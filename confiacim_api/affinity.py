@@ -0,0 +1,158 @@
+import hashlib
+from typing import Optional
+
+from kombu.exceptions import ChannelError
+
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
+from confiacim_api.logger import logger
+
+AFFINITY_QUEUE_SUFFIX = "affinity"
+
+
+def affinity_queue(key: str, n_queues: int, queue: Optional[str] = None) -> str:
+    """
+    Fila de afinidade de uma chave.
+
+    Parameters:
+        key: Chave (ex: `sha256` do arquivo do caso)
+        n_queues: Número de filas de afinidade
+        queue: Fila base (`None` é a fila padrão)
+
+    Returns:
+        Retorna o nome da fila no formato `<queue>.affinity.<i>`.
+
+    Info:
+        O hash é estável entre processos (diferente do `hash` do python), logo a
+        mesma chave sempre cai na mesma fila.
+    """
+    queue = queue or celery_app.conf.task_default_queue
+    index = int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big") % n_queues
+    return f"{queue}.{AFFINITY_QUEUE_SUFFIX}.{index}"
+
+
+def task_queue(name: str) -> str:
+    """
+    Fila de uma task segundo o `task_routes` do celery.
+
+    Parameters:
+        name: Nome da task (ex: `confiacim_api.tasks.form_solve`)
+
+    Returns:
+        Retorna o nome da fila, a fila padrão se a task não tiver rota.
+    """
+    route = (celery_app.conf.task_routes or {}).get(name, {})
+    queue: str = route.get("queue") or celery_app.conf.task_default_queue
+    return queue
+
+
+def queue_depths(queues: list[str]) -> dict[str, Optional[int]]:
+    """
+    Número de mensagens esperando em cada fila, com uma única conexão com o broker.
+
+    Parameters:
+        queues: Nomes das filas
+
+    Returns:
+        Retorna o número de mensagens de cada fila ou `None` se o broker não
+        responder.
+    """
+    depths: dict[str, Optional[int]] = {}
+    try:
+        with celery_app.connection_for_read() as conn:
+            conn.ensure_connection(max_retries=1)
+            for queue in queues:
+                try:
+                    depths[queue] = int(conn.default_channel.queue_declare(queue=queue, passive=True).message_count)
+                except ChannelError:
+                    # Fila sem mensagens no redis não existe
+                    depths[queue] = 0
+    except Exception as e:
+        logger.warning(f"Queue depth of {', '.join(queues)} not available: {e}")
+        return dict.fromkeys(queues)
+    return depths
+
+
+def queue_depth(queue: str) -> Optional[int]:
+    """
+    Número de mensagens esperando na fila.
+
+    Parameters:
+        queue: Nome da fila
+
+    Returns:
+        Retorna o número de mensagens ou `None` se o broker não responder.
+    """
+    return queue_depths([queue])[queue]
+
+
+def select_queue(key: Optional[str], queue: Optional[str] = None) -> str:
+    """
+    Escolhe a fila de uma task do caso.
+
+    Com `AFFINITY_QUEUES` maior que zero, as tasks do mesmo caso vão para a
+    mesma fila de afinidade, aumentando os acertos do cache de casos
+    extraidos do worker. Cada worker consome a sua fila de afinidade e a fila
+    base (`-Q <queue>.affinity.<i>,<queue>`). Quando a fila de afinidade tem
+    `AFFINITY_SPILLOVER_DEPTH` ou mais mensagens, ou o broker não responde, a
+    task vai para a fila base e é executada pelo primeiro worker livre.
+
+    Parameters:
+        key: Chave de afinidade (ex: `sha256` do arquivo do caso)
+        queue: Fila base da task (`None` é a fila padrão)
+
+    Returns:
+        Retorna o nome da fila.
+    """
+    base_queue: str = queue or celery_app.conf.task_default_queue
+
+    if settings.AFFINITY_QUEUES <= 0 or key is None:
+        return base_queue
+
+    affinity = affinity_queue(key, settings.AFFINITY_QUEUES, base_queue)
+    depth = queue_depth(affinity)
+
+    if depth is None or depth >= settings.AFFINITY_SPILLOVER_DEPTH:
+        logger.info(f"Affinity queue {affinity} busy (depth={depth}), spilling over to {base_queue}.")
+        return base_queue
+
+    return affinity
+
+
+def io_queue() -> str:
+    """
+    Fila das etapas leves (I/O) das simulações.
+
+    As etapas que só leem e escrevem no banco, no `BlobStore` e no disco
+    (ex: preparar o caso e salvar os resultados do **FORM**) vão para a fila
+    `IO_QUEUE`, liberando os workers do solver. Sem `IO_QUEUE` é a fila
+    padrão.
+
+    Returns:
+        Retorna o nome da fila.
+    """
+    return settings.IO_QUEUE or celery_app.conf.task_default_queue
+
+
+def known_queues() -> list[str]:
+    """
+    Filas usadas pela `api`.
+
+    A fila padrão, as filas do `task_routes`, as filas de afinidade das filas
+    do **TENCIM** e do solver do **FORM** e a fila das amostras do **FORM**
+    distribuido.
+
+    Returns:
+        Retorna os nomes das filas sem repetição.
+    """
+    queues = [celery_app.conf.task_default_queue]
+    queues += [route["queue"] for route in (celery_app.conf.task_routes or {}).values()]
+
+    if settings.FORM_DISTRIBUTED_QUEUE:
+        queues.append(settings.FORM_DISTRIBUTED_QUEUE)
+
+    for name in ("confiacim_api.tasks.tencim_standalone_run", "confiacim_api.tasks.form_solve"):
+        base_queue = task_queue(name)
+        queues += [f"{base_queue}.{AFFINITY_QUEUE_SUFFIX}.{i}" for i in range(settings.AFFINITY_QUEUES)]
+
+    return list(dict.fromkeys(queues))
@@ -18,6 +18,7 @@ from confiacim_api.routers import (
     base_router,
     case_router,
     form_router,
+    monte_carlo_router,
     tencim_router,
     user_router,
     variable_group_router,
@@ -52,6 +53,7 @@ app.include_router(case_router)
 app.include_router(user_router)
 app.include_router(tencim_router)
 app.include_router(form_router)
+app.include_router(monte_carlo_router)
 app.include_router(variable_group_router)
 
 
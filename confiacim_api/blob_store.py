@@ -0,0 +1,174 @@
+import os
+from abc import ABC, abstractmethod
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from confiacim_api.conf import settings
+from confiacim_api.errors import BlobNotFoundError, BlobStoreBackendError
+from confiacim_api.utils import CHUNK_SIZE, scan_file
+
+
+class BlobStore(ABC):
+    """
+    Armazenamento de arquivos endereçado pelo conteudo.
+
+    Cada blob é identificado pelo `sha256` do seu conteudo, assim arquivos
+    identicos são armazenados apenas uma vez. Novos backends (ex: object
+    stores) devem implementar os métodos abstratos e ser registrados com
+    `register_blob_store_backend`.
+    """
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool: ...
+
+    @abstractmethod
+    def open(self, digest: str) -> BinaryIO:
+        """
+        Abre o blob para leitura.
+
+        Parameters:
+            digest: `sha256` do blob
+
+        Returns:
+            Retorna o arquivo aberto em modo binario.
+
+        Raises:
+            BlobNotFoundError: Blob não existe.
+        """
+
+    @abstractmethod
+    def size(self, digest: str) -> int: ...
+
+    @abstractmethod
+    def mtime(self, digest: str) -> float:
+        """Data da ultima modificação do blob (timestamp)."""
+
+    @abstractmethod
+    def delete(self, digest: str) -> None: ...
+
+    @abstractmethod
+    def digests(self) -> Iterator[str]: ...
+
+    @abstractmethod
+    def _write(self, digest: str, file: BinaryIO) -> None: ...
+
+    def put(self, file: BinaryIO, digest: Optional[str] = None) -> str:
+        """
+        Salva o conteudo do arquivo caso ele ainda não exista.
+
+        Parameters:
+            file: Arquivo
+            digest: `sha256` do conteudo quando já calculado (ex: com o
+                    `scan_file`), assim o arquivo não é lido de novo só
+                    para calcular o hash.
+
+        Returns:
+            Retorna o `sha256` do conteudo.
+        """
+        if digest is None:
+            digest = scan_file(file).sha256
+        if not self.exists(digest):
+            self._write(digest, file)
+            file.seek(0)
+        return digest
+
+    def put_bytes(self, content: bytes) -> str:
+        return self.put(BytesIO(content))
+
+
+class FileSystemBlobStore(BlobStore):
+    """
+    Backend que salva os blobs em disco no formato `<root>/ab/cd/<sha256>`.
+
+    A escrita é feita em um arquivo temporário dentro de `root` e movida com
+    `os.replace`, logo um blob nunca é visto parcialmente escrito.
+
+    Parameters:
+        root: Diretório base
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def open(self, digest: str) -> BinaryIO:
+        try:
+            return open(self.path(digest), "rb")
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(f"Blob {digest} not found.") from e
+
+    def size(self, digest: str) -> int:
+        try:
+            return self.path(digest).stat().st_size
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(f"Blob {digest} not found.") from e
+
+    def mtime(self, digest: str) -> float:
+        return self.path(digest).stat().st_mtime
+
+    def delete(self, digest: str) -> None:
+        self.path(digest).unlink(missing_ok=True)
+
+    def digests(self) -> Iterator[str]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob("??/??/*"):
+            if path.is_file():
+                yield path.name
+
+    def _write(self, digest: str, file: BinaryIO) -> None:
+        dst = self.path(digest)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        file.seek(0)
+        with NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+            try:
+                while chunk := file.read(CHUNK_SIZE):
+                    tmp.write(chunk)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+
+        os.replace(tmp.name, dst)
+
+
+BLOB_STORE_BACKENDS: dict[str, Callable[[], BlobStore]] = {
+    "filesystem": lambda: FileSystemBlobStore(settings.BLOB_STORE_DIR),
+}
+
+
+def register_blob_store_backend(name: str, factory: Callable[[], BlobStore]):
+    """
+    Registra um novo backend para o `BlobStore`.
+
+    Parameters:
+        name: Nome usado em `BLOB_STORE_BACKEND`
+        factory: Função que cria o backend
+    """
+    BLOB_STORE_BACKENDS[name] = factory
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Retorna o backend configurado em `BLOB_STORE_BACKEND`.
+
+    Raises:
+        BlobStoreBackendError: Backend não registrado.
+    """
+    try:
+        factory = BLOB_STORE_BACKENDS[settings.BLOB_STORE_BACKEND]
+    except KeyError as e:
+        raise BlobStoreBackendError(f"Blob store backend '{settings.BLOB_STORE_BACKEND}' not registered.") from e
+    return factory()
@@ -0,0 +1,191 @@
+import fcntl
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import BinaryIO, Callable, Iterator, Optional
+from zipfile import ZipFile
+
+from confiacim_api.conf import settings
+from confiacim_api.logger import logger
+
+LINK_MODES = ("hardlink", "copy")
+
+
+@dataclass
+class CaseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+
+def _tree_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class ExtractedCaseCache:
+    """
+    Cache em disco dos casos já extraidos pelo worker.
+
+    Cada entrada é a pasta do caso extraido, identificada pelo `sha256` do zip.
+    O diretório de trabalho da task é montado com hardlinks para os arquivos
+    da entrada, logo arquivos do diretório de trabalho devem ser substituidos
+    (`os.replace`) e nunca reescritos no lugar.
+
+    Quando o tamanho total passa de `max_size` as entradas menos usadas
+    recentemente são removidas. Um `flock` em `<root>/.lock` serializa o
+    acesso entre os processos do worker.
+
+    Parameters:
+        root: Diretório base do cache
+        max_size: Tamanho máximo em bytes
+        link_mode: `hardlink` ou `copy`
+    """
+
+    def __init__(self, root: Path, max_size: int, link_mode: str = "hardlink"):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Invalid link mode '{link_mode}'. Valid options: {LINK_MODES}.")
+
+        self.root = Path(root)
+        self.max_size = max_size
+        self.link_mode = link_mode
+
+        self.entries_dir = self.root / "entries"
+        self.tmp_dir = self.root / "tmp"
+        self.stats_file = self.root / "stats.json"
+
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def entry_path(self, digest: str) -> Path:
+        return self.entries_dir / digest
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        with open(self.root / ".lock", "w") as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+    def _read_stats(self) -> CaseCacheStats:
+        try:
+            return CaseCacheStats(**json.loads(self.stats_file.read_text()))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return CaseCacheStats()
+
+    def _write_stats(self, stats: CaseCacheStats):
+        tmp = self.stats_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(stats)))
+        os.replace(tmp, self.stats_file)
+
+    def _populate(self, digest: str, opener: Callable[[], BinaryIO]) -> Path:
+        tmp = Path(mkdtemp(dir=self.tmp_dir))
+        try:
+            with opener() as file, ZipFile(file, "r") as zip_ref:
+                zip_ref.extractall(tmp)
+            os.rename(tmp, self.entry_path(digest))
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        return self.entry_path(digest)
+
+    def _evict(self, stats: CaseCacheStats, keep: str):
+        entries = [(p, p.stat().st_mtime, _tree_size(p)) for p in self.entries_dir.iterdir() if p.is_dir()]
+        total = sum(size for *_, size in entries)
+
+        for path, _, size in sorted(entries, key=lambda e: e[1]):
+            if total <= self.max_size:
+                break
+            if path.name == keep:
+                continue
+            shutil.rmtree(path)
+            total -= size
+            stats.evictions += 1
+            stats.evicted_bytes += size
+            logger.info(f"Case cache - Evicted {path.name} ({size} bytes).")
+
+    def _link_tree(self, src: Path, dst: Path):
+        for dirpath, dirnames, filenames in os.walk(src):
+            rel = Path(dirpath).relative_to(src)
+            for dirname in dirnames:
+                (dst / rel / dirname).mkdir(exist_ok=True)
+            for filename in filenames:
+                src_file, dst_file = Path(dirpath) / filename, dst / rel / filename
+                if self.link_mode == "hardlink":
+                    try:
+                        os.link(src_file, dst_file)
+                        continue
+                    except OSError:
+                        pass
+                shutil.copy2(src_file, dst_file)
+
+    def checkout(self, digest: str, opener: Callable[[], BinaryIO], dst: Path) -> bool:
+        """
+        Monta o caso extraido em `dst`.
+
+        Parameters:
+            digest: `sha256` do zip do caso
+            opener: Função que abre o zip, chamada apenas se não estiver no cache
+            dst: Diretório de trabalho (já existente)
+
+        Returns:
+            Retorna `True` se o caso já estava no cache.
+        """
+        with self._lock():
+            stats = self._read_stats()
+            entry = self.entry_path(digest)
+
+            if hit := entry.is_dir():
+                stats.hits += 1
+                os.utime(entry)
+            else:
+                stats.misses += 1
+                self._populate(digest, opener)
+                self._evict(stats, keep=digest)
+
+            self._link_tree(entry, dst)
+            self._write_stats(stats)
+
+        return hit
+
+    def stats(self) -> dict:
+        """
+        Métricas do cache.
+
+        Returns:
+            Retorna o número de `hits`, `misses`, `evictions`, `evicted_bytes`,
+            entradas e tamanho atual em bytes.
+        """
+        with self._lock():
+            entries = [p for p in self.entries_dir.iterdir() if p.is_dir()]
+            return asdict(self._read_stats()) | {
+                "entries": len(entries),
+                "size": sum(_tree_size(p) for p in entries),
+                "max_size": self.max_size,
+            }
+
+    def clear(self):
+        """Remove todas as entradas e zera as métricas."""
+        with self._lock():
+            for path in self.entries_dir.iterdir():
+                shutil.rmtree(path)
+            self._write_stats(CaseCacheStats())
+
+
+def get_case_cache() -> Optional[ExtractedCaseCache]:
+    """
+    Retorna o cache configurado ou `None` se `CASE_CACHE_MAX_SIZE` for `0`.
+    """
+    if settings.CASE_CACHE_MAX_SIZE <= 0:
+        return None
+    return ExtractedCaseCache(
+        settings.CASE_CACHE_DIR,
+        max_size=settings.CASE_CACHE_MAX_SIZE,
+        link_mode=settings.CASE_CACHE_LINK_MODE,
+    )
@@ -13,6 +13,36 @@ def get_config_transport(settings):
     return config_transport
 
 
+# Tasks de cada fila configurável. As tasks sem fila vão para a fila padrão.
+TASK_QUEUE_SETTINGS = {
+    "TENCIM_QUEUE": ("tencim_standalone_run",),
+    "FORM_QUEUE": ("form_run", "form_solve", "form_group_point_run"),
+    "MONTE_CARLO_QUEUE": ("monte_carlo_chunk_run",),
+    "IO_QUEUE": ("form_prepare", "form_persist", "form_distributed_step", "form_group_run", "fair_share_release"),
+}
+
+
+def get_task_routes(settings) -> dict[str, dict]:
+    """
+    Rotas das tasks (`task_routes`) do celery.
+
+    Cada tipo de análise pode ter a sua fila (`TENCIM_QUEUE`, `FORM_QUEUE`,
+    `MONTE_CARLO_QUEUE`) e as etapas leves a fila `IO_QUEUE`, logo cada fila
+    pode ter um pool de workers com a sua própria concorrência.
+
+    Parameters:
+        settings: Configurações da `api`
+
+    Returns:
+        Retorna as rotas no formato `{"confiacim_api.tasks.<task>": {"queue": <fila>}}`.
+    """
+    routes: dict[str, dict] = {}
+    for name, tasks in TASK_QUEUE_SETTINGS.items():
+        if queue := getattr(settings, name):
+            routes |= {f"confiacim_api.tasks.{task}": {"queue": queue} for task in tasks}
+    return routes
+
+
 connection_url = sentinel_connection_url(
     password=settings.SENTINEL_PASSWORD,
     host=settings.SENTINEL_HOST,
@@ -31,5 +61,6 @@ config_transport = get_config_transport(settings)
 celery_app.conf.broker_transport_options = config_transport
 celery_app.conf.result_backend_transport_options = config_transport
 celery_app.visibility_timeout = settings.VISIBILITY_TIMEOUT
+celery_app.conf.task_routes = get_task_routes(settings)
 
 celery_app.autodiscover_tasks(packages=["confiacim_api"])
@@ -1,12 +1,26 @@
+import time
 from typing import Annotated, Sequence
 
 import typer
 from rich.console import Console
 from rich.table import Table
-from sqlalchemy import false, select, true
+from sqlalchemy import delete, false, func, select, true
+from sqlalchemy.orm import undefer
 
+from confiacim_api.blob_store import get_blob_store
+from confiacim_api.case_cache import get_case_cache
+from confiacim_api.conf import settings
 from confiacim_api.database import SessionFactory
-from confiacim_api.models import User
+from confiacim_api.models import (
+    Case,
+    FormResult,
+    FormResultGroup,
+    IdempotencyKey,
+    ResultStatus,
+    TencimResult,
+    User,
+)
+from confiacim_api.rc_summary import apply_rc_summary
 from confiacim_api.security import get_password_hash
 
 console = Console()
@@ -99,4 +113,168 @@ def delete_admin(email: str):
     console.print(f"[green]Admin com o email '{email}' deletado com sucesso[/green].")
 
 
+app_blobs = typer.Typer()
+
+
+@app_blobs.command(name="migrate")
+def migrate_blobs(batch_size: Annotated[int, typer.Option("--batch-size")] = 20):
+    """Move os arquivos salvos no DB para o BlobStore."""
+    store = get_blob_store()
+
+    n_cases = 0
+    n_results = 0
+    with SessionFactory() as session:
+        while cases := session.scalars(
+            select(Case).where(Case.base_file.is_not(None)).options(undefer(Case.base_file)).limit(batch_size)
+        ).all():
+            for case in cases:
+                case.base_file_digest = store.put_bytes(case.base_file or b"")
+                case.base_file = None
+            session.commit()
+            session.expunge_all()
+            n_cases += len(cases)
+
+        while results := session.scalars(
+            select(FormResult)
+            .where(FormResult.generated_case_files.is_not(None))
+            .options(undefer(FormResult.generated_case_files))
+            .limit(batch_size)
+        ).all():
+            for result in results:
+                result.generated_case_files_digest = store.put_bytes(result.generated_case_files or b"")
+                result.generated_case_files = None
+            session.commit()
+            session.expunge_all()
+            n_results += len(results)
+
+    console.print(f"[green]{n_cases} casos e {n_results} resultados do FORM migrados[/green].")
+
+
+@app_blobs.command(name="gc")
+def gc_blobs(
+    min_age: Annotated[int, typer.Option("--min-age", help="Idade minima em segundos.")] = 3600,
+    dry_run: Annotated[bool, typer.Option("--dry-run")] = False,
+):
+    """Remove os blobs que não são referenciados por nenhum caso ou resultado."""
+    store = get_blob_store()
+
+    with SessionFactory() as session:
+        referenced = set(session.scalars(select(Case.base_file_digest).where(Case.base_file_digest.is_not(None))))
+        referenced |= set(
+            session.scalars(
+                select(FormResult.generated_case_files_digest).where(
+                    FormResult.generated_case_files_digest.is_not(None)
+                )
+            )
+        )
+        referenced |= set(
+            session.scalars(
+                select(FormResultGroup.generated_case_files_digest).where(
+                    FormResultGroup.generated_case_files_digest.is_not(None)
+                )
+            )
+        )
+
+    # Blobs recentes podem pertencer a um upload com o commit ainda em andamento
+    now = time.time()
+    orphans = [d for d in store.digests() if d not in referenced and now - store.mtime(d) >= min_age]
+
+    for digest in orphans:
+        if not dry_run:
+            store.delete(digest)
+        console.print(digest)
+
+    console.print(f"[green]{len(orphans)} blobs {'encontrados' if dry_run else 'removidos'}[/green].")
+
+
+app_case_cache = typer.Typer()
+
+
+@app_case_cache.command(name="stats")
+def case_cache_stats():
+    """Métricas do cache de casos extraidos do worker."""
+    cache = get_case_cache()
+    if cache is None:
+        console.print("[yellow]Cache de casos desabilitado[/yellow].")
+        raise typer.Exit()
+
+    table = Table(title="Case cache")
+    table.add_column("Metric", justify="center", style="cyan")
+    table.add_column("Value", justify="center", style="magenta")
+
+    for name, value in cache.stats().items():
+        table.add_row(name, str(value))
+
+    console.print(table)
+
+
+@app_case_cache.command(name="clear")
+def case_cache_clear():
+    """Limpa o cache de casos extraidos do worker."""
+    cache = get_case_cache()
+    if cache is None:
+        console.print("[yellow]Cache de casos desabilitado[/yellow].")
+        raise typer.Exit()
+
+    cache.clear()
+
+    console.print("[green]Cache de casos limpo[/green].")
+
+
+app_idempotency_keys = typer.Typer()
+
+
+@app_idempotency_keys.command(name="purge")
+def purge_idempotency_keys():
+    """Remove as chaves de idempotência expiradas."""
+    with SessionFactory() as session:
+        n_keys = session.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < func.now())).rowcount
+        session.commit()
+
+    console.print(f"[green]{n_keys} chaves expiradas removidas[/green].")
+
+
+app_tencim = typer.Typer()
+
+
+@app_tencim.command(name="backfill-summary")
+def backfill_tencim_summary(
+    batch_size: Annotated[int, typer.Option("--batch-size")] = 100,
+    all_results: Annotated[bool, typer.Option("--all", help="Recalcula os resumos já salvos.")] = False,
+):
+    """Calcula o resumo das curvas de RC dos resultados do TENCIM com sucesso."""
+    threshold = settings.RC_SUMMARY_THRESHOLD
+
+    n_results, last_id = 0, 0
+    with SessionFactory() as session:
+        stmt = (
+            select(TencimResult)
+            .where(TencimResult.status == ResultStatus.SUCCESS)
+            .options(
+                undefer(TencimResult.istep),
+                undefer(TencimResult.t),
+                undefer(TencimResult.rankine_rc),
+                undefer(TencimResult.mohr_coulomb_rc),
+            )
+            .order_by(TencimResult.id)
+            .limit(batch_size)
+        )
+        if not all_results:
+            stmt = stmt.where(TencimResult.rc_threshold.is_(None))
+
+        while results := session.scalars(stmt.where(TencimResult.id > last_id)).all():
+            for result in results:
+                apply_rc_summary(result, threshold)
+            last_id = results[-1].id
+            session.commit()
+            session.expunge_all()
+            n_results += len(results)
+
+    console.print(f"[green]{n_results} resultados do TENCIM resumidos[/green].")
+
+
 app.add_typer(app_users, name="user", help="Lista os usuarios cadastrados.")
+app.add_typer(app_blobs, name="blobs", help="Gerencia o BlobStore dos arquivos dos casos.")
+app.add_typer(app_case_cache, name="case-cache", help="Gerencia o cache de casos extraidos do worker.")
+app.add_typer(app_idempotency_keys, name="idempotency-keys", help="Gerencia as chaves de idempotência.")
+app.add_typer(app_tencim, name="tencim", help="Gerencia os resultados do TENCIM.")
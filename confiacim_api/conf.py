@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -27,5 +29,48 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     VISIBILITY_TIMEOUT: int = 86400
 
+    BLOB_STORE_BACKEND: str = "filesystem"
+    BLOB_STORE_DIR: Path = Path("blob_store")
+
+    CASE_CACHE_DIR: Path = Path("case_cache")
+    CASE_CACHE_MAX_SIZE: int = 5 * 1024**3
+    CASE_CACHE_LINK_MODE: str = "hardlink"
+
+    AFFINITY_QUEUES: int = 0
+    AFFINITY_SPILLOVER_DEPTH: int = 2
+
+    TENCIM_QUEUE: str | None = None
+    FORM_QUEUE: str | None = None
+    MONTE_CARLO_QUEUE: str | None = None
+    IO_QUEUE: str | None = None
+
+    FORM_DISTRIBUTED: bool = False
+    FORM_DISTRIBUTED_QUEUE: str | None = None
+    FORM_DISTRIBUTED_TIMEOUT: int = 3600
+
+    FAIR_SHARE_ENABLED: bool = False
+    FAIR_SHARE_MAX_RUNNING_JOBS: int = 2
+    FAIR_SHARE_LEASE_TTL: int = 86400
+
+    ADMISSION_MAX_QUEUE_DEPTH: int = 0
+    ADMISSION_MAX_BACKLOG: int = 0
+    ADMISSION_WORKERS: int = 1
+    ADMISSION_TENCIM_RUNTIME: int = 60
+    ADMISSION_FORM_RUNTIME: int = 600
+    ADMISSION_MONTE_CARLO_RUNTIME: int = 300
+
+    RUNTIME_HISTORY_SIZE: int = 500
+    ETA_MAX_QUEUE_AGE: int = 86400
+
+    RC_SUMMARY_THRESHOLD: float = 0.0
+
+    COALESCE_MAX_AGE: int = 86400
+    TENCIM_VERSION: str | None = None
+
+    IDEMPOTENCY_KEY_TTL: int = 86400
+
+    EVENTS_POLL_INTERVAL: float = 1.0
+    EVENTS_HEARTBEAT: float = 15.0
+
 
 settings = Settings()  # type: ignore
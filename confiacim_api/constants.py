@@ -1,6 +1,15 @@
 MAX_TAG_NAME_LENGTH = 30
 MIN_TAG_NAME_LENGTH = 3
 
+MAX_SWEEP_RUNS = 500
+
+MAX_FORM_GROUP_POINTS = 100
+
+MAX_MONTE_CARLO_SAMPLES = 100_000
+MAX_MONTE_CARLO_CHUNK_SIZE = 1_000
+
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
 PROP_MAT_POSITION = {
     # cement
     "E_c": 2,
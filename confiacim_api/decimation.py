@@ -0,0 +1,194 @@
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+LTTB = "lttb"
+MINMAX = "minmax"
+
+
+class SeriesGroup(NamedTuple):
+    """
+    Séries que dividem as mesmas abscissas.
+
+    Parameters:
+        x: Nome das abscissas
+        ys: Nomes das ordenadas usadas na escolha dos pontos
+        extra: Nomes das outras séries reduzidas com os mesmos índices (ex: `istep`)
+    """
+
+    x: str
+    ys: tuple[str, ...]
+    extra: tuple[str, ...] = ()
+
+
+def stride_indices(n: int, stride: int) -> np.ndarray:
+    """
+    Índices de um a cada `stride` pontos.
+
+    Parameters:
+        n: Número de pontos
+        stride: Passo
+
+    Returns:
+        Retorna os índices, sempre com o primeiro e o último ponto.
+    """
+    indices = np.arange(0, n, max(stride, 1))
+    if n and indices[-1] != n - 1:
+        indices = np.append(indices, n - 1)
+    return indices
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Índices dos pontos escolhidos pelo `Largest-Triangle-Three-Buckets`.
+
+    Os pontos do meio são divididos em `n_out - 2` baldes e de cada balde é
+    escolhido o ponto que forma o maior triângulo com o ponto escolhido no
+    balde anterior e a média do balde seguinte. As médias e as áreas de cada
+    balde são calculadas com o `numpy`, só a escolha é sequencial.
+
+    Parameters:
+        x: Abscissas
+        y: Ordenadas
+        n_out: Número de pontos da saída
+
+    Returns:
+        Retorna os índices, sempre com o primeiro e o último ponto.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+
+    avg_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        area = np.abs((x[a] - next_x[i]) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y[i] - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Índices do mínimo e do máximo de cada balde.
+
+    Parameters:
+        y: Ordenadas
+        n_out: Número de pontos da saída (`(n_out - 2) // 2` baldes)
+
+    Returns:
+        Retorna os índices, sempre com o primeiro e o último ponto.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    size = -(-n // ((n_out - 2) // 2))
+    n_buckets = -(-n // size)
+    offsets = np.arange(n_buckets) * size
+
+    padding = n_buckets * size - n
+    lows = np.pad(y, (0, padding), constant_values=np.inf).reshape(n_buckets, size)
+    highs = np.pad(y, (0, padding), constant_values=-np.inf).reshape(n_buckets, size)
+
+    indices: np.ndarray = np.unique(
+        np.concatenate(([0, n - 1], offsets + lows.argmin(axis=1), offsets + highs.argmax(axis=1))),
+    )
+    return indices
+
+
+def decimate_indices(
+    x: ArrayLike,
+    ys: Sequence[ArrayLike],
+    max_points: Optional[int] = None,
+    stride: Optional[int] = None,
+    downsample: str = LTTB,
+) -> np.ndarray:
+    """
+    Índices dos pontos de séries que dividem as mesmas abscissas.
+
+    O `stride` é aplicado primeiro e depois, se ainda houver mais que
+    `max_points` pontos, cada série escolhe a sua parte dos pontos com o
+    `downsample` (`lttb` ou `minmax`). O mínimo global de cada série sempre
+    é mantido.
+
+    Parameters:
+        x: Abscissas
+        ys: Ordenadas de cada série
+        max_points: Número máximo de pontos
+        stride: Passo
+        downsample: Modo de redução até o `max_points`
+
+    Returns:
+        Retorna os índices ordenados.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    arrays = [np.asarray(y, dtype=np.float64) for y in ys]
+    n = len(x)
+
+    indices = stride_indices(n, stride) if stride else np.arange(n)
+
+    if max_points and len(indices) > max_points and arrays:
+        budget = max((max_points - len(arrays)) // len(arrays), 3)
+        picked = [
+            (
+                minmax_indices(y[indices], budget)
+                if downsample == MINMAX
+                else lttb_indices(x[indices], y[indices], budget)
+            )
+            for y in arrays
+        ]
+        indices = indices[np.unique(np.concatenate(picked))]
+
+    minimums = [int(np.argmin(y)) for y in arrays if len(y)]
+
+    return np.union1d(indices, minimums).astype(np.intp)
+
+
+def decimate_series(
+    data: dict,
+    groups: Sequence[SeriesGroup],
+    max_points: Optional[int] = None,
+    stride: Optional[int] = None,
+    downsample: str = LTTB,
+) -> dict:
+    """
+    Reduz os pontos das séries de um dicionário.
+
+    Parameters:
+        data: Dicionário com as séries
+        groups: Grupos de séries
+        max_points: Número máximo de pontos de cada grupo
+        stride: Passo
+        downsample: Modo de redução até o `max_points`
+
+    Returns:
+        Retorna o dicionário com as séries de cada grupo reduzidas (`list`).
+        Grupos com alguma série `None` não são alterados.
+    """
+    if not max_points and not stride:
+        return data
+
+    for group in groups:
+        names = (group.x, *group.ys, *group.extra)
+        if any(data.get(name) is None for name in names):
+            continue
+
+        indices = decimate_indices(data[group.x], [data[name] for name in group.ys], max_points, stride, downsample)
+
+        for name in names:
+            data[name] = np.asarray(data[name])[indices].tolist()
+
+    return data
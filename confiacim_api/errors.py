@@ -29,3 +29,15 @@ class InvalidDistNameError(Exception): ...
 
 
 class CorrelationsInvalidError(Exception): ...
+
+
+class BlobNotFoundError(Exception): ...
+
+
+class BlobStoreBackendError(Exception): ...
+
+
+class RangeNotSatisfiableError(Exception): ...
+
+
+class ExportDependencyError(Exception): ...
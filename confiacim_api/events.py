@@ -0,0 +1,376 @@
+import asyncio
+import json
+import threading
+from contextlib import suppress
+from dataclasses import asdict
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Optional
+from weakref import WeakKeyDictionary
+
+import psycopg
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from psycopg import sql
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from confiacim_api.conf import settings
+from confiacim_api.database import SessionFactory
+from confiacim_api.logger import logger
+from confiacim_api.models import ResultStatus
+from confiacim_api.monte_carlo import MonteCarloEstimate
+
+FINAL_STATUS = (ResultStatus.SUCCESS.value, ResultStatus.FAILED.value)
+
+Event = tuple[str, dict]
+
+
+def _conninfo() -> str:
+    return psycopg.conninfo.make_conninfo(
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        dbname=settings.DB_NAME,
+    )
+
+
+def result_channel(kind: str, result_id: int) -> str:
+    """
+    Canal do `LISTEN/NOTIFY` de um resultado.
+
+    Parameters:
+        kind: Tipo do resultado (`form` ou `tencim`)
+        result_id: ID do resultado
+
+    Returns:
+        Retorna o nome do canal.
+    """
+    return f"confiacim_{kind}_result_{result_id}"
+
+
+def publish_result_event(kind: str, result_id: int, event: str, data: dict) -> None:
+    """
+    Publica um evento do resultado para todas as replicas da API.
+
+    O evento é enviado com `pg_notify` em uma sessão própria, com uma conexão
+    do pool do `engine`, e entregue no `commit`, independente da transação de
+    quem publicou. Erros são apenas registrados no log, o evento nunca derruba
+    a task.
+
+    Parameters:
+        kind: Tipo do resultado (`form` ou `tencim`)
+        result_id: ID do resultado
+        event: Nome do evento (`status` ou `iteration`)
+        data: Dados do evento
+    """
+    payload = json.dumps({"event": event, "data": data})
+    try:
+        with SessionFactory() as session:
+            session.execute(select(func.pg_notify(result_channel(kind, result_id), payload)))
+            session.commit()
+    except SQLAlchemyError as e:
+        logger.warning(f"Event {event} of {kind} result {result_id} not published: {e}")
+
+
+def publish_status(kind: str, result_id: int, status: Optional[ResultStatus], error: Optional[str] = None) -> None:
+    data: dict = {"status": status.value if status else None}
+    if error is not None:
+        data["error"] = error
+    publish_result_event(kind, result_id, "status", data)
+
+
+def iteration_event(iteration_infos: dict, index: int) -> dict:
+    """
+    Dados do evento de uma iteração do **FORM**.
+
+    Parameters:
+        iteration_infos: Conteúdo do `form_iteration_log.json`
+        index: Índice da iteração (começando em `0`)
+
+    Returns:
+        Retorna a iteração, `beta`, `resid` e os valores das variáveis.
+    """
+    return {
+        "it": index + 1,
+        "beta": iteration_infos["beta"][index],
+        "resid": iteration_infos["resid"][index],
+        "variables": {k: v[index] for k, v in iteration_infos.items() if k not in ("beta", "resid")},
+    }
+
+
+def iteration_events(iteration_infos: Optional[dict]) -> list[Event]:
+    if not iteration_infos:
+        return []
+    return [("iteration", iteration_event(iteration_infos, i)) for i in range(len(iteration_infos["beta"]))]
+
+
+def estimate_event(chunks_done: int, chunks_total: int, estimate: MonteCarloEstimate) -> dict:
+    """
+    Dados do evento da estimativa parcial do **Monte Carlo**.
+
+    Parameters:
+        chunks_done: Número de lotes terminados
+        chunks_total: Número total de lotes
+        estimate: Estimativa com as amostras dos lotes terminados
+
+    Returns:
+        Retorna os lotes, `Pf` e o intervalo de confiança de Wilson.
+    """
+    return {"chunks_done": chunks_done, "chunks_total": chunks_total, **asdict(estimate)}
+
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _is_final(event: str, data: dict) -> bool:
+    return event == "status" and data.get("status") in FINAL_STATUS
+
+
+Message = Optional[Event]
+
+
+class ResultEventsListener:
+    """
+    Conexão de `LISTEN` compartilhada pelos streams SSE do processo.
+
+    O canal recebe o `LISTEN` com o primeiro inscrito e o `UNLISTEN` com a
+    saída do último. Uma task lê as notificações e as distribui para as filas
+    dos inscritos do canal. O `notifies` segura a conexão enquanto espera,
+    por isso a leitura é cancelada para mudar os `LISTEN` e depois retomada.
+    Se a conexão cair, os inscritos recebem `None` e a próxima inscrição abre
+    uma conexão nova.
+    """
+
+    def __init__(self):
+        self._conn: Optional[psycopg.AsyncConnection] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._subscribers: dict[str, set[asyncio.Queue[Message]]] = {}
+
+    def _dispatch(self, notify: psycopg.Notify) -> None:
+        try:
+            message = json.loads(notify.payload)
+            event = (message["event"], message["data"])
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Invalid event on {notify.channel}: {e}")
+            return
+        for queue in self._subscribers.get(notify.channel, ()):
+            queue.put_nowait(event)
+
+    async def _read(self, conn: psycopg.AsyncConnection) -> None:
+        try:
+            async for notify in conn.notifies():
+                self._dispatch(notify)
+        except psycopg.Error as e:
+            logger.warning(f"Events listener connection lost: {e}")
+            await self._reset()
+
+    async def _reset(self) -> None:
+        conn, self._conn = self._conn, None
+        subscribers, self._subscribers = self._subscribers, {}
+        for queues in subscribers.values():
+            for queue in queues:
+                queue.put_nowait(None)
+        if conn is not None:
+            with suppress(psycopg.Error):
+                await conn.close()
+
+    async def _stop_reader(self) -> None:
+        if self._reader is None:
+            return
+        self._reader.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._reader
+        self._reader = None
+
+    def _start_reader(self) -> None:
+        if self._conn is not None and self._subscribers:
+            self._reader = asyncio.create_task(self._read(self._conn))
+
+    async def _execute(self, command: str, channel: str) -> None:
+        if self._conn is None:
+            self._conn = await psycopg.AsyncConnection.connect(_conninfo(), autocommit=True)
+            self._conn.add_notify_handler(self._dispatch)
+        try:
+            await self._conn.execute(sql.SQL(command).format(sql.Identifier(channel)))
+        except psycopg.Error:
+            await self._reset()
+            raise
+
+    async def subscribe(self, channel: str) -> asyncio.Queue[Message]:
+        """
+        Inscreve uma fila no canal.
+
+        Parameters:
+            channel: Nome do canal
+
+        Returns:
+            Retorna a fila que recebe os eventos do canal.
+        """
+        queue: asyncio.Queue[Message] = asyncio.Queue()
+        async with self._lock:
+            await self._stop_reader()
+            try:
+                if channel not in self._subscribers:
+                    await self._execute("LISTEN {}", channel)
+                self._subscribers.setdefault(channel, set()).add(queue)
+            finally:
+                self._start_reader()
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue[Message]) -> None:
+        """
+        Remove a fila do canal.
+
+        Parameters:
+            channel: Nome do canal
+            queue: Fila devolvida pelo `subscribe`
+        """
+        queues = self._subscribers.get(channel)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if queues:
+            return
+
+        async with self._lock:
+            if self._subscribers.get(channel) != set():
+                return
+            del self._subscribers[channel]
+            await self._stop_reader()
+            try:
+                if self._conn is not None:
+                    await self._execute("UNLISTEN {}", channel)
+            except psycopg.Error as e:
+                logger.warning(f"UNLISTEN {channel} failed: {e}")
+            finally:
+                self._start_reader()
+
+
+_listeners: WeakKeyDictionary[asyncio.AbstractEventLoop, ResultEventsListener] = WeakKeyDictionary()
+
+
+def events_listener() -> ResultEventsListener:
+    """
+    `ResultEventsListener` do event loop corrente, um por processo da API.
+
+    Returns:
+        Retorna o listener.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _listeners:
+        _listeners[loop] = ResultEventsListener()
+    return _listeners[loop]
+
+
+def result_events_response(
+    request: Request,
+    *,
+    kind: str,
+    result_id: int,
+    snapshot: Callable[[], Iterable[Event]],
+) -> StreamingResponse:
+    """
+    Resposta `text/event-stream` (SSE) com os eventos do resultado.
+
+    Primeiro a resposta se inscreve no canal do resultado no listener
+    compartilhado do processo e só depois lê o estado atual (`snapshot`),
+    assim nenhuma transição é perdida. O stream termina quando o resultado
+    chega em `success` ou `failed`, o cliente desconecta ou a conexão do
+    listener cai (o `EventSource` reconecta sozinho). Sem eventos, um
+    comentário é enviado a cada `EVENTS_HEARTBEAT` segundos para manter a
+    conexão aberta.
+
+    Parameters:
+        request: Requisição
+        kind: Tipo do resultado (`form` ou `tencim`)
+        result_id: ID do resultado
+        snapshot: Função que lê os eventos do estado atual do resultado
+
+    Returns:
+        Retorna a resposta.
+    """
+
+    async def stream() -> AsyncIterator[str]:
+        listener = events_listener()
+        channel = result_channel(kind, result_id)
+        queue = await listener.subscribe(channel)
+        try:
+            for event, data in await run_in_threadpool(lambda: list(snapshot())):
+                yield format_sse(event, data)
+                if _is_final(event, data):
+                    return
+
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT)
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    return
+                yield format_sse(*message)
+                if _is_final(*message):
+                    return
+        finally:
+            # O stream pode ser cancelado quando o cliente desconecta
+            await asyncio.shield(listener.unsubscribe(channel, queue))
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class IterationLogWatcher(threading.Thread):
+    """
+    Acompanha o `form_iteration_log.json` escrito pelo `confiacim`.
+
+    A cada `interval` segundos o arquivo é lido e, se existirem novas
+    iterações, o `callback` é chamado com o conteúdo do log e o número de
+    iterações já vistas. O `stop` faz uma ultima leitura para não perder a
+    ultima iteração.
+
+    Parameters:
+        path: Caminho do `form_iteration_log.json`
+        callback: Função chamada com as novas iterações
+        interval: Intervalo entre as leituras em segundos
+    """
+
+    def __init__(self, path: Path, callback: Callable[[dict, int], None], interval: float):
+        super().__init__(daemon=True)
+        self.path = path
+        self.callback = callback
+        self.interval = interval
+        self.seen = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def check(self):
+        try:
+            iteration_infos = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            # O confiacim reescreve o arquivo no lugar, a leitura pode pegar
+            # o arquivo pela metade.
+            return
+
+        n = len(iteration_infos.get("beta", []))
+        if n > self.seen:
+            try:
+                self.callback(iteration_infos, self.seen)
+            except Exception as e:
+                logger.warning(f"Iteration log callback failed: {e}")
+            self.seen = n
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+        self.check()
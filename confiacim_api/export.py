@@ -0,0 +1,262 @@
+import importlib
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from confiacim_api.errors import ExportDependencyError
+from confiacim_api.models import FormResult, TencimResult
+from confiacim_api.utils import CHUNK_SIZE
+
+PARQUET = "parquet"
+ARROW = "arrow"
+
+MEDIA_TYPES = {
+    PARQUET: "application/vnd.apache.parquet",
+    ARROW: "application/vnd.apache.arrow.file",
+}
+
+# Linhas de cada `record batch` (e `row group` do parquet)
+EXPORT_BATCH_ROWS = 65_536
+
+# Resultados buscados no banco por vez
+EXPORT_FETCH_RESULTS = 16
+
+# Tamanho do arquivo mantido em memória antes de ir para o disco
+EXPORT_SPOOL_SIZE = 8 * CHUNK_SIZE
+
+TENCIM_EXPORT_FIELDS: tuple[tuple[str, DTypeLike], ...] = (
+    ("result_id", np.int64),
+    ("istep", np.int32),
+    ("t", np.float64),
+    ("rankine_rc", np.float64),
+    ("mohr_coulomb_rc", np.float64),
+)
+
+Chunk = dict[str, np.ndarray]
+
+
+def load_pyarrow() -> Any:
+    """
+    Importa o `pyarrow`, dependência opcional da exportação.
+
+    Returns:
+        Retorna o módulo `pyarrow`.
+
+    Raises:
+        ExportDependencyError: `pyarrow` não está instalado.
+    """
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as e:
+        raise ExportDependencyError("Columnar export requires pyarrow.") from e
+
+
+def rebatch(chunks: Iterable[Chunk], batch_rows: int = EXPORT_BATCH_ROWS) -> Iterator[Chunk]:
+    """
+    Junta e divide blocos de colunas em blocos de `batch_rows` linhas.
+
+    Parameters:
+        chunks: Blocos com as mesmas colunas
+        batch_rows: Número de linhas de cada bloco
+
+    Returns:
+        Retorna um iterador com os blocos. Apenas o último pode ter menos
+        que `batch_rows` linhas.
+    """
+    pending: list[Chunk] = []
+    n_pending = 0
+
+    def flush() -> Chunk:
+        return {name: np.concatenate([c[name] for c in pending]) for name in pending[0]}
+
+    for chunk in chunks:
+        n = len(next(iter(chunk.values()), ()))
+        start = 0
+        while start < n:
+            end = min(n, start + batch_rows - n_pending)
+            pending.append({name: values[start:end] for name, values in chunk.items()})
+            n_pending += end - start
+            start = end
+            if n_pending == batch_rows:
+                yield flush()
+                pending, n_pending = [], 0
+
+    if pending:
+        yield flush()
+
+
+def write_export(
+    chunks: Iterable[Chunk],
+    fields: Sequence[tuple[str, DTypeLike]],
+    export_format: str,
+) -> BinaryIO:
+    """
+    Escreve os blocos de colunas em um arquivo `parquet` ou `arrow` (IPC).
+
+    Cada bloco vira um `record batch`, logo apenas um bloco fica em memória
+    além do arquivo, que vai para o disco depois de `EXPORT_SPOOL_SIZE`.
+
+    Parameters:
+        chunks: Blocos de colunas
+        fields: Nome e `dtype` de cada coluna
+        export_format: `parquet` ou `arrow`
+
+    Returns:
+        Retorna o arquivo aberto no início.
+
+    Raises:
+        ExportDependencyError: `pyarrow` não está instalado.
+    """
+    pa = load_pyarrow()
+
+    dtypes = {name: np.dtype(dtype) for name, dtype in fields}
+    schema = pa.schema([(name, pa.from_numpy_dtype(dtype)) for name, dtype in dtypes.items()])
+
+    file = SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+
+    if export_format == PARQUET:
+        writer = importlib.import_module("pyarrow.parquet").ParquetWriter(file, schema)
+    else:
+        writer = pa.ipc.new_file(file, schema)
+
+    with writer:
+        for chunk in chunks:
+            # O `pyarrow` não aceita arrays `big-endian` (linhas migradas)
+            arrays = [
+                pa.array(chunk[name].astype(dtype.newbyteorder("="), copy=False)) for name, dtype in dtypes.items()
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+
+    file.seek(0)
+    return file  # type: ignore[return-value]
+
+
+def tencim_chunks(rows: Iterable[Any]) -> Iterator[Chunk]:
+    """
+    Blocos de colunas das curvas de `RC` de resultados do **TENCIM**.
+
+    Parameters:
+        rows: Linhas com `id`, `istep`, `t`, `rankine_rc` e `mohr_coulomb_rc`
+
+    Returns:
+        Retorna um bloco por resultado com a coluna `result_id`. Resultados
+        sem alguma das curvas são ignorados.
+    """
+    for result_id, *series in rows:
+        if any(s is None for s in series):
+            continue
+        n = min(len(s) for s in series)
+        yield {
+            "result_id": np.full(n, result_id, dtype=np.int64),
+            **{name: s[:n] for (name, _), s in zip(TENCIM_EXPORT_FIELDS[1:], series)},
+        }
+
+
+def export_tencim_results(session: Session, *criteria: Any, export_format: str) -> BinaryIO:
+    """
+    Exporta as curvas de `RC` de resultados do **TENCIM**.
+
+    Os resultados são buscados no banco em grupos de `EXPORT_FETCH_RESULTS`
+    e as colunas são os arrays do `numpy` já decodificados pela coluna
+    `NumpyArray`.
+
+    Parameters:
+        session: Sessão do banco
+        criteria: Filtros dos resultados
+        export_format: `parquet` ou `arrow`
+
+    Returns:
+        Retorna o arquivo aberto no início.
+
+    Raises:
+        ExportDependencyError: `pyarrow` não está instalado.
+    """
+    load_pyarrow()
+
+    stmt = (
+        select(
+            TencimResult.id,
+            TencimResult.istep,
+            TencimResult.t,
+            TencimResult.rankine_rc,
+            TencimResult.mohr_coulomb_rc,
+        )
+        .join(TencimResult.case)
+        .where(*criteria)
+        .order_by(TencimResult.id)
+        .execution_options(yield_per=EXPORT_FETCH_RESULTS)
+    )
+
+    return write_export(rebatch(tencim_chunks(session.execute(stmt))), TENCIM_EXPORT_FIELDS, export_format)
+
+
+def form_chunks(rows: Iterable[Any], names: Sequence[str]) -> Iterator[Chunk]:
+    """
+    Blocos de colunas do log das iterações de resultados do **FORM**.
+
+    Parameters:
+        rows: Linhas com `id` e `iteration_infos`
+        names: Colunas do log (`beta`, `resid` e as variáveis)
+
+    Returns:
+        Retorna um bloco por resultado com as colunas `result_id` e
+        `iteration`. Colunas que não existem no resultado ficam com `NaN`.
+    """
+    for result_id, iteration_infos in rows:
+        if not iteration_infos:
+            continue
+        n = min(len(values) for values in iteration_infos.values())
+        yield {
+            "result_id": np.full(n, result_id, dtype=np.int64),
+            "iteration": np.arange(1, n + 1, dtype=np.int32),
+            **{
+                name: (
+                    np.asarray(iteration_infos[name][:n], dtype=np.float64)
+                    if name in iteration_infos
+                    else np.full(n, np.nan)
+                )
+                for name in names
+            },
+        }
+
+
+def export_form_results(session: Session, *criteria: Any, export_format: str) -> BinaryIO:
+    """
+    Exporta o log das iterações de resultados do **FORM**.
+
+    As colunas são `result_id`, `iteration`, `beta`, `resid` e a média de
+    cada variável. As variáveis de todos os resultados são levantadas antes
+    da escrita, pois o esquema do arquivo é fixo.
+
+    Parameters:
+        session: Sessão do banco
+        criteria: Filtros dos resultados
+        export_format: `parquet` ou `arrow`
+
+    Returns:
+        Retorna o arquivo aberto no início.
+
+    Raises:
+        ExportDependencyError: `pyarrow` não está instalado.
+    """
+    load_pyarrow()
+
+    stmt = (
+        select(FormResult.id, FormResult.iteration_infos)
+        .join(FormResult.case)
+        .where(*criteria)
+        .order_by(FormResult.id)
+        .execution_options(yield_per=EXPORT_FETCH_RESULTS)
+    )
+
+    names: dict[str, None] = {"beta": None, "resid": None}
+    for _, iteration_infos in session.execute(stmt):
+        names |= dict.fromkeys(iteration_infos or ())
+
+    fields = (("result_id", np.int64), ("iteration", np.int32), *((name, np.float64) for name in names))
+
+    return write_export(rebatch(form_chunks(session.execute(stmt), list(names))), fields, export_format)
@@ -0,0 +1,314 @@
+import json
+import time
+from typing import Any, Optional
+from uuid import uuid4
+
+from celery import Signature, group, signature
+from celery.result import AsyncResult
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from confiacim_api.affinity import io_queue, task_queue
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
+from confiacim_api.database import SessionFactory
+from confiacim_api.logger import logger
+from confiacim_api.models import User
+
+FAIR_SHARE_PREFIX = "fair_share"
+USERS_KEY = f"{FAIR_SHARE_PREFIX}:users"
+PENDING_QUEUES_KEY = f"{FAIR_SHARE_PREFIX}:pending_queues"
+RELEASE_TASK = "confiacim_api.tasks.fair_share_release"
+
+# O `redis-py` tipa as respostas como `Awaitable | Any` mesmo no cliente síncrono
+RedisClient = Any
+
+
+def pending_key(user_id: int) -> str:
+    return f"{FAIR_SHARE_PREFIX}:pending:{user_id}"
+
+
+def leases_key(user_id: int) -> str:
+    return f"{FAIR_SHARE_PREFIX}:leases:{user_id}"
+
+
+def get_redis() -> RedisClient:
+    """
+    Cliente do `redis` usado pelo fair-share.
+
+    Returns:
+        Retorna o cliente do `result_backend` do celery (mesmo `redis` do broker).
+    """
+    client: RedisClient = celery_app.backend.client
+    return client
+
+
+def max_running_jobs(session: Session, user_id: int) -> int:
+    """
+    Número máximo de simulações rodando ao mesmo tempo do usuário.
+
+    Parameters:
+        session: Secção aberta com o banco
+        user_id: ID do usuário
+
+    Returns:
+        Retorna o `max_running_jobs` do usuário ou o
+        `FAIR_SHARE_MAX_RUNNING_JOBS` se o usuário não tiver limite próprio.
+    """
+    value = session.scalar(select(User.max_running_jobs).where(User.id == user_id))
+    return settings.FAIR_SHARE_MAX_RUNNING_JOBS if value is None else value
+
+
+def signature_queues(sig: dict) -> list[str]:
+    """
+    Filas em que as tasks de uma simulação vão rodar.
+
+    Parameters:
+        sig: Assinatura da task ou `chain` da simulação (ou o seu json)
+
+    Returns:
+        Retorna as filas sem repetição, a fila de cada task é a do `queue` da
+        assinatura ou a do `task_routes`.
+    """
+    tasks = sig["kwargs"]["tasks"] if sig.get("subtask_type") == "chain" else [sig]
+    return list(dict.fromkeys((task.get("options") or {}).get("queue") or task_queue(task["task"]) for task in tasks))
+
+
+def _count_pending(client: RedisClient, sig: dict, amount: int):
+    for queue in signature_queues(sig):
+        if client.hincrby(PENDING_QUEUES_KEY, queue, amount) < 0:
+            client.hset(PENDING_QUEUES_KEY, queue, 0)
+
+
+def _with_release(user_id: int, lease_id: str, sig: Signature) -> Signature:
+    release = celery_app.signature(
+        RELEASE_TASK,
+        kwargs={"user_id": user_id, "lease_id": lease_id},
+        immutable=True,
+        queue=io_queue(),
+    )
+    sig.link(release)
+    sig.link_error(release)
+    return sig
+
+
+def _push(client: RedisClient, user_id: int, sig: Signature):
+    if client.rpush(pending_key(user_id), json.dumps(sig)) == 1:
+        client.rpush(USERS_KEY, user_id)
+    _count_pending(client, sig, 1)
+
+
+def _running(client: RedisClient, user_id: int) -> int:
+    """Remove as vagas vencidas e retorna o número de vagas em uso do usuário."""
+    if expired := client.zremrangebyscore(leases_key(user_id), "-inf", time.time()):
+        logger.warning(f"Fair-share - {expired} expired leases of user {user_id} removed.")
+    return int(client.zcard(leases_key(user_id)))
+
+
+def _acquire(client: RedisClient, user_id: int, limit: int) -> Optional[str]:
+    if _running(client, user_id) >= limit:
+        return None
+
+    lease_id = str(uuid4())
+    client.zadd(leases_key(user_id), {lease_id: time.time() + settings.FAIR_SHARE_LEASE_TTL})
+    # Outro processo pode ter reservado a última vaga entre o `zcard` e o `zadd`
+    if client.zcard(leases_key(user_id)) > limit:
+        client.zrem(leases_key(user_id), lease_id)
+        return None
+
+    return lease_id
+
+
+def _drop_user(client: RedisClient, user_id: int):
+    client.lrem(USERS_KEY, 0, user_id)
+    # Uma simulação pode ter sido enviada entre o `lpop` e o `lrem`
+    if client.llen(pending_key(user_id)):
+        client.rpush(USERS_KEY, user_id)
+
+
+def submit(user_id: int, sig: Signature) -> AsyncResult:
+    """
+    Envia uma simulação para o celery respeitando o fair-share.
+
+    Com `FAIR_SHARE_ENABLED` a simulação vai para a fila de pendentes do
+    usuário e só é enviada ao celery pelo `dispatch` quando o usuário tiver
+    menos de `max_running_jobs` simulações rodando. O ID da task é definido
+    no envio, logo pode ser salvo antes da task chegar no celery.
+
+    Parameters:
+        user_id: ID do usuário dono da simulação
+        sig: Assinatura da task ou `chain` da simulação
+
+    Returns:
+        Retorna o `AsyncResult` da simulação.
+    """
+    if not settings.FAIR_SHARE_ENABLED:
+        return sig.apply_async()
+
+    result: AsyncResult = sig.freeze()
+
+    client = get_redis()
+    _push(client, user_id, sig)
+    dispatch(client)
+
+    return result
+
+
+def submit_group(user_id: int, group_sig: group) -> str:
+    """
+    Envia um grupo de simulações para o celery respeitando o fair-share.
+
+    Com `FAIR_SHARE_ENABLED` cada simulação do grupo ocupa uma vaga do
+    usuário e é enviada separadamente.
+
+    Parameters:
+        user_id: ID do usuário dono das simulações
+        group_sig: Grupo com as simulações
+
+    Returns:
+        Retorna o ID do grupo.
+
+    Info:
+        Com `FAIR_SHARE_ENABLED` não existe um `GroupResult` no celery com o
+        ID retornado.
+    """
+    if not settings.FAIR_SHARE_ENABLED:
+        group_id: str = group_sig.apply_async().id
+        return group_id
+
+    client = get_redis()
+    for sig in group_sig.tasks:
+        sig.freeze()
+        _push(client, user_id, sig)
+    dispatch(client)
+
+    # As simulações são enviadas separadamente, o ID apenas identifica o grupo
+    return str(uuid4())
+
+
+def dispatch(client: Optional[RedisClient] = None) -> int:
+    """
+    Envia as simulações pendentes para o celery.
+
+    Os usuários com simulações pendentes são percorridos em rodízio
+    (`round-robin`), uma simulação por usuário em cada volta, até nenhum
+    usuário ter vaga. Cada simulação enviada reserva uma vaga (`lease`) no
+    `sorted set` do usuário, com validade de `FAIR_SHARE_LEASE_TTL` segundos,
+    logo o limite vale entre vários processos da `api` e workers. A vaga é
+    liberada pelo `fair_share_release` ligado à simulação ou, se o worker
+    morrer sem rodar o callback (`SIGKILL`, `OOM`), quando vencer.
+
+    Parameters:
+        client: Cliente do `redis`
+
+    Returns:
+        Retorna o número de simulações enviadas.
+    """
+    client = client or get_redis()
+
+    dispatched = 0
+    with SessionFactory() as session:
+        limits: dict[int, int] = {}
+        progress = True
+        while progress:
+            progress = False
+            for _ in range(client.llen(USERS_KEY)):
+                raw_user_id = client.lmove(USERS_KEY, USERS_KEY, "LEFT", "RIGHT")
+                if raw_user_id is None:
+                    break
+                user_id = int(raw_user_id)
+
+                if user_id not in limits:
+                    limits[user_id] = max_running_jobs(session, user_id)
+
+                lease_id = _acquire(client, user_id, limits[user_id])
+                if lease_id is None:
+                    continue
+
+                data = client.lpop(pending_key(user_id))
+                if data is None:
+                    client.zrem(leases_key(user_id), lease_id)
+                    _drop_user(client, user_id)
+                    continue
+
+                sig = json.loads(data)
+                _count_pending(client, sig, -1)
+                _with_release(user_id, lease_id, signature(sig, app=celery_app)).apply_async()
+                dispatched += 1
+                progress = True
+
+                if not client.llen(pending_key(user_id)):
+                    _drop_user(client, user_id)
+
+    if dispatched:
+        logger.info(f"Fair-share - {dispatched} simulations dispatched.")
+
+    return dispatched
+
+
+def release(user_id: int, lease_id: Optional[str] = None, client: Optional[RedisClient] = None) -> int:
+    """
+    Libera a vaga de uma simulação que terminou e envia as pendentes.
+
+    Parameters:
+        user_id: ID do usuário dono da simulação
+        lease_id: ID da vaga reservada no `dispatch`
+        client: Cliente do `redis`
+
+    Returns:
+        Retorna o número de simulações enviadas.
+
+    Info:
+        Simulações enviadas antes das vagas com validade não têm `lease_id`,
+        nesse caso apenas as pendentes são enviadas.
+    """
+    client = client or get_redis()
+
+    if lease_id is not None:
+        client.zrem(leases_key(user_id), lease_id)
+
+    return dispatch(client)
+
+
+def user_stats(user_id: int, client: Optional[RedisClient] = None) -> dict[str, int]:
+    """
+    Simulações rodando e pendentes do usuário.
+
+    Parameters:
+        user_id: ID do usuário
+        client: Cliente do `redis`
+
+    Returns:
+        Retorna o número de simulações rodando (`running`) e pendentes (`pending`).
+        Sem `FAIR_SHARE_ENABLED` os dois são zero.
+    """
+    if not settings.FAIR_SHARE_ENABLED:
+        return {"running": 0, "pending": 0}
+
+    client = client or get_redis()
+
+    return {
+        "running": _running(client, user_id),
+        "pending": client.llen(pending_key(user_id)),
+    }
+
+
+def pending_depth(queues: list[str], client: Optional[RedisClient] = None) -> int:
+    """
+    Simulações pendentes, de todos os usuários, que vão rodar nas filas.
+
+    Parameters:
+        queues: Nomes das filas
+        client: Cliente do `redis`
+
+    Returns:
+        Retorna o número de simulações pendentes. Uma simulação com tasks em
+        mais de uma das filas (ex: `chain` do **FORM**) conta uma vez por
+        fila. Sem `FAIR_SHARE_ENABLED` é zero.
+    """
+    if not settings.FAIR_SHARE_ENABLED or not queues:
+        return 0
+
+    client = client or get_redis()
+
+    return sum(max(int(count or 0), 0) for count in client.hmget(PENDING_QUEUES_KEY, queues))
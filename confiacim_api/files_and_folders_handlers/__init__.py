@@ -1,8 +1,21 @@
+from confiacim_api.files_and_folders_handlers.bundle import (
+    CaseBundle,
+    CaseBundleMember,
+)
+from confiacim_api.files_and_folders_handlers.case_dat import (
+    CaseDatInfos,
+    extract_case_dat_infos,
+)
 from confiacim_api.files_and_folders_handlers.core import (
     add_nocliprc_macro,
     clean_temporary_simulation_folder,
+    extract_form_generated_case,
+    extract_tencim_case,
     new_time_loop,
+    open_case_file,
+    open_form_generated_case_file,
     remove_tab_and_unnecessary_spaces,
+    replace_file_content,
     rewrite_case_file,
     rm_nocliprc_macro,
     rm_setpnode_and_setptime,
@@ -33,17 +46,28 @@ from confiacim_api.files_and_folders_handlers.materials import (
 )
 
 __all__ = (
+    # bundle
+    "CaseBundle",
+    "CaseBundleMember",
+    # case.dat
+    "CaseDatInfos",
+    "extract_case_dat_infos",
     # core
     "temporary_simulation_folder",
     "unzip_file",
     "clean_temporary_simulation_folder",
     "unzip_tencim_case",
+    "extract_tencim_case",
+    "extract_form_generated_case",
+    "replace_file_content",
     "add_nocliprc_macro",
     "rm_nocliprc_macro",
     "rm_setpnode_and_setptime",
     "rewrite_case_file",
     "remove_tab_and_unnecessary_spaces",
     "new_time_loop",
+    "open_case_file",
+    "open_form_generated_case_file",
     "save_generated_form_files",
     "save_zip_in_db",
     "zip_generated_form_case",
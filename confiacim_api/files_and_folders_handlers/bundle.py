@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import BinaryIO
+from zipfile import ZipFile
+
+from confiacim_api.errors import (
+    LoadsFileNotFoundInZipError,
+    MaterialsFileNotFoundInZipError,
+)
+from confiacim_api.files_and_folders_handlers.case_dat import (
+    CaseDatInfos,
+    extract_case_dat_infos,
+)
+from confiacim_api.files_and_folders_handlers.core import open_case_file
+from confiacim_api.files_and_folders_handlers.hidration import (
+    HidrationProp,
+    extract_hidration_infos,
+)
+from confiacim_api.files_and_folders_handlers.loads import (
+    LoadsInfos,
+    extract_loads_infos,
+)
+from confiacim_api.files_and_folders_handlers.materials import (
+    MaterialsInfos,
+    extract_materials_infos,
+)
+from confiacim_api.logger import logger
+from confiacim_api.models import Case
+
+CASE_FILE_NAME = "case.dat"
+MESH_FILE_NAME = "mesh.dat"
+MATERIALS_FILE_NAME = "materials.dat"
+LOADS_FILE_NAME = "loads.dat"
+HIDRATION_FILE_NAME = "hidrationprop.dat"
+
+
+@dataclass(frozen=True)
+class CaseBundleMember:
+    name: str
+    file_size: int
+    compress_size: int
+    CRC: int
+    header_offset: int
+
+
+class CaseBundle:
+    """
+    Arquivo `zip` do caso aberto uma única vez.
+
+    O diretório central é lido na criação e cada membro é indexado. As
+    informações de materiais, loads, hidratação, `case.dat` e `mesh.dat` são
+    extraídas apenas quando acessadas pela primeira vez.
+
+    Parameters:
+        file: Arquivo zip
+    """
+
+    def __init__(self, file: BinaryIO):
+        self._file: BinaryIO | None = None
+        self._zip_ref = ZipFile(file, "r")
+        self.members = {
+            info.filename: CaseBundleMember(
+                name=info.filename,
+                file_size=info.file_size,
+                compress_size=info.compress_size,
+                CRC=info.CRC,
+                header_offset=info.header_offset,
+            )
+            for info in self._zip_ref.infolist()
+            if not info.is_dir()
+        }
+
+    @classmethod
+    def from_blob(cls, case: Case) -> "CaseBundle":
+        """
+        Abre o arquivo base do caso.
+
+        Parameters:
+            case: Caso
+
+        Returns:
+            Retorna o bundle do caso.
+        """
+        file = open_case_file(case)
+        try:
+            bundle = cls(file)
+        except BaseException:
+            file.close()
+            raise
+        bundle._file = file
+        return bundle
+
+    def __enter__(self) -> "CaseBundle":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.members
+
+    def close(self):
+        self._zip_ref.close()
+        if self._file is not None:
+            self._file.close()
+
+    def read_text(self, name: str) -> str:
+        """
+        Lê o conteudo de um membro do zip.
+
+        Parameters:
+            name: Nome do arquivo dentro do zip
+
+        Returns:
+            Retorna o conteudo do arquivo no formato de `str`.
+
+        Raises:
+            KeyError: Arquivo não existe no zip.
+        """
+        with self._zip_ref.open(name) as fp:
+            return fp.read().decode()
+
+    @cached_property
+    def materials(self) -> MaterialsInfos:
+        if MATERIALS_FILE_NAME not in self:
+            raise MaterialsFileNotFoundInZipError("Materials file not found in zip.")
+        return extract_materials_infos(self.read_text(MATERIALS_FILE_NAME))
+
+    @cached_property
+    def loads(self) -> LoadsInfos:
+        if LOADS_FILE_NAME not in self:
+            raise LoadsFileNotFoundInZipError("Loads file not found in zip.")
+        return extract_loads_infos(self.read_text(LOADS_FILE_NAME))
+
+    @cached_property
+    def hidration(self) -> HidrationProp | None:
+        if HIDRATION_FILE_NAME not in self:
+            logger.info("No hydration files found.")
+            return None
+        logger.info("Hydration files found.")
+        return extract_hidration_infos(self.read_text(HIDRATION_FILE_NAME))
+
+    @cached_property
+    def case_dat(self) -> str:
+        return self.read_text(CASE_FILE_NAME)
+
+    @cached_property
+    def case_dat_infos(self) -> CaseDatInfos | None:
+        if CASE_FILE_NAME not in self:
+            return None
+        return extract_case_dat_infos(self.case_dat)
+
+    @cached_property
+    def mesh(self) -> str:
+        return self.read_text(MESH_FILE_NAME)
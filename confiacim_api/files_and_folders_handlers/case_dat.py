@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CaseDatInfos:
+    n_nodes: Optional[int]
+    n_steps: int
+
+
+def extract_case_dat_infos(file_str: str) -> CaseDatInfos:
+    """
+    Extrai o tamanho da malha e o número de passos de tempo do `case.dat`.
+
+    Parameters:
+        file_str: Conteudo do arquivo de `case.dat` no formato de `str`.
+
+    Returns:
+        Retorna o número de nós (`nnode`) e a soma dos `loop` dos blocos `dt`.
+    """
+
+    n_nodes, n_steps = None, 0
+
+    lines = [line.split() for line in file_str.split("\n")]
+
+    for k, words in enumerate(lines):
+        if not words:
+            continue
+
+        if "nnode" in words[:-1]:
+            n_nodes = int(words[words.index("nnode") + 1])
+
+        elif words[0] == "dt" and k + 1 < len(lines):
+            next_words = lines[k + 1]
+            if len(next_words) > 1 and next_words[0] == "loop":
+                n_steps += int(next_words[1])
+
+    return CaseDatInfos(n_nodes=n_nodes, n_steps=n_steps)
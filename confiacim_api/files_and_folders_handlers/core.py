@@ -1,16 +1,20 @@
+import os
 from io import BytesIO
 from itertools import chain
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Callable, Optional
 from uuid import UUID
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from confiacim.tencim.deterministic import new_case_with_until_the_step
 from sqlalchemy.orm import Session
 
+from confiacim_api.blob_store import get_blob_store
+from confiacim_api.case_cache import get_case_cache
+from confiacim_api.errors import BlobNotFoundError
 from confiacim_api.logger import logger
-from confiacim_api.models import Case, FormResult
+from confiacim_api.models import Case, FormResult, FormResultGroup
 
 NO_CLIP_RC = "nocliprc"
 
@@ -47,16 +51,133 @@ def clean_temporary_simulation_folder(dir: TemporaryDirectory):
     dir.cleanup()
 
 
+def _open_blob(digest: Optional[str], legacy_content: Callable[[], Optional[bytes]]) -> BinaryIO:
+    if digest is None:
+        return BytesIO(legacy_content() or b"")
+
+    store = get_blob_store()
+    if store.exists(digest):
+        return store.open(digest)
+
+    # Linhas ainda não migradas (`blobs migrate`) já têm o digest, mas os bytes continuam no DB
+    content = legacy_content()
+    if content is None:
+        raise BlobNotFoundError(f"Blob {digest} not found.")
+    return BytesIO(content)
+
+
+def open_case_file(case: Case) -> BinaryIO:
+    """
+    Abre o arquivo base do caso.
+
+    Parameters:
+        case: Caso (ORM)
+
+    Returns:
+        Retorna o arquivo zip aberto em modo binario.
+
+    Raises:
+        BlobNotFoundError: O `base_file_digest` não está no `BlobStore` nem no DB.
+
+    Info:
+        O arquivo é lido do `BlobStore` pelo `base_file_digest`. Casos antigos,
+        ainda não migrados, são lidos da coluna `base_file` do DB.
+    """
+    return _open_blob(case.base_file_digest, lambda: case.base_file)
+
+
+def open_form_generated_case_file(form_result: FormResult) -> BinaryIO:
+    """
+    Abre o zip com os arquivos gerados para o `FORM`.
+
+    Parameters:
+        form_result: Resultado do `FORM`
+
+    Returns:
+        Retorna o arquivo zip aberto em modo binario.
+
+    Raises:
+        BlobNotFoundError: O `generated_case_files_digest` não está no `BlobStore` nem no DB.
+
+    Info:
+        Mesma estrategia de `open_case_file`.
+    """
+    return _open_blob(form_result.generated_case_files_digest, lambda: form_result.generated_case_files)
+
+
 def unzip_tencim_case(case: Case, tmp_dir: TemporaryDirectory):
     """
-    Unzip o caso da simulação do Tencim do blob salvo no banco de Dados
+    Unzip o caso da simulação do Tencim do `BlobStore`
 
     Parameters:
         case: Caso (ORM)
         tmp_dir: Diretorio temporario
     """
-    file_like = BytesIO(case.base_file)
-    unzip_file(file_like, tmp_dir)
+    with open_case_file(case) as file:
+        unzip_file(file, tmp_dir)
+
+
+def extract_tencim_case(case: Case, tmp_dir: TemporaryDirectory) -> bool:
+    """
+    Monta o caso da simulação do Tencim no diretorio temporario usando o
+    cache de casos extraidos do worker.
+
+    Parameters:
+        case: Caso (ORM)
+        tmp_dir: Diretorio temporario
+
+    Returns:
+        Retorna `True` se o caso já estava no cache.
+
+    Info:
+        O arquivo do caso só é lido na falta no cache. Com o cache
+        desabilitado (`CASE_CACHE_MAX_SIZE=0`) o caso é sempre extraido.
+    """
+    cache = get_case_cache()
+    if cache is None or case.base_file_digest is None:
+        unzip_tencim_case(case, tmp_dir)
+        return False
+
+    return cache.checkout(case.base_file_digest, lambda: open_case_file(case), Path(tmp_dir.name))
+
+
+def extract_form_generated_case(digest: str, tmp_dir: TemporaryDirectory) -> bool:
+    """
+    Monta os arquivos gerados para o `FORM` no diretorio temporario usando o
+    cache de casos extraidos do worker.
+
+    Parameters:
+        digest: `sha256` do zip com os arquivos gerados
+        tmp_dir: Diretorio temporario
+
+    Returns:
+        Retorna `True` se os arquivos já estavam no cache.
+    """
+    cache = get_case_cache()
+    if cache is None:
+        with get_blob_store().open(digest) as file:
+            unzip_file(file, tmp_dir)
+        return False
+
+    return cache.checkout(digest, lambda: get_blob_store().open(digest), Path(tmp_dir.name))
+
+
+def replace_file_content(path: Path, content: str):
+    """
+    Escreve o conteudo em um arquivo temporário e substitui o arquivo com
+    `os.replace`.
+
+    Parameters:
+        path: Caminho do arquivo
+        content: Novo conteudo
+
+    Info:
+        Os arquivos do diretorio de trabalho podem ser hardlinks para o cache
+        de casos extraidos, assim eles nunca devem ser reescritos no lugar.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def add_nocliprc_macro(case_file_str: str) -> str:
@@ -145,8 +266,7 @@ def rewrite_case_file(
         new_file_case = new_time_loop(new_file_case, critical_point)
 
     logger.debug(f"Task {task_id} - Writing the new file in disk ...")
-    with open(case_path, mode="w", encoding="utf-8") as fp:
-        fp.write(new_file_case)
+    replace_file_content(case_path, new_file_case)
 
 
 def remove_tab_and_unnecessary_spaces(file_case_str: str) -> str:
@@ -200,31 +320,31 @@ def zip_generated_form_case(path_folder: Path):
             zipf.write(file, file.relative_to(path_folder))
 
 
-def save_zip_in_db(session: Session, zip_path: Path, form_result: FormResult):
+def save_zip_in_db(session: Session, zip_path: Path, form_result: FormResult | FormResultGroup):
     """
-    Salva zip no DB.
+    Salva zip no `BlobStore` e a referência no DB.
 
     Parameters:
         session: Secção aberta com o banco
         zip_path: Caminho para o arquivo zipado
-        form_result: Resultado do `FORM`
+        form_result: Resultado ou grupo de resultados do `FORM`
     """
 
     with open(zip_path, "rb") as zip_ref:
-        form_result.generated_case_files = zip_ref.read()
+        form_result.generated_case_files_digest = get_blob_store().put(zip_ref)
 
     session.add(form_result)
     session.commit()
 
 
-def save_generated_form_files(session: Session, path_folder: Path, form_result: FormResult):
+def save_generated_form_files(session: Session, path_folder: Path, form_result: FormResult | FormResultGroup):
     """
     Salva os arquivos do caso `FORM` no DB.
 
     Parameters:
         session: Secção aberta com o banco
         path_folder: Caminho para o arquivo zipado
-        form_result: Resultado do `FORM`
+        form_result: Resultado ou grupo de resultados do `FORM`
     """
 
     zip_path = path_folder / "tmp_case_form.zip"
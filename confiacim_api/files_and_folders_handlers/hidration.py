@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from io import BytesIO
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -10,6 +9,7 @@ from confiacim_api.constants import (
     HIDRATIONPROP_POISSON_C,
 )
 from confiacim_api.errors import hidrationFileEmptyError
+from confiacim_api.files_and_folders_handlers.core import open_case_file
 from confiacim_api.logger import logger
 from confiacim_api.models import Case
 from confiacim_api.types import TArrayFloat
@@ -86,8 +86,8 @@ def read_hidration_file(path_file: Path) -> HidrationProp:
 
 def extract_hidration_infos_from_blob(case: Case) -> HidrationProp | None:
     """
-    Extrai as informações da hidratação diretamentamente do blob salvo no
-    DB.
+    Extrai as informações da hidratação diretamentamente do arquivo base do
+    caso.
 
     Parameters:
         case: Caso
@@ -96,7 +96,7 @@ def extract_hidration_infos_from_blob(case: Case) -> HidrationProp | None:
         Retorna as curvas de hidratação.
     """
 
-    with ZipFile(BytesIO(case.base_file), "r") as zip_ref:
+    with open_case_file(case) as file, ZipFile(file, "r") as zip_ref:
         try:
             with zip_ref.open("hidrationprop.dat") as fp:
                 logger.info("Hydration files found.")
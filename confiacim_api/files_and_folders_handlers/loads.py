@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from io import BytesIO
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -7,6 +6,7 @@ from confiacim_api.errors import (
     LoadsFileEmptyError,
     LoadsFileNotFoundInZipError,
 )
+from confiacim_api.files_and_folders_handlers.core import open_case_file
 from confiacim_api.models import Case
 from confiacim_api.types import TArrayFloat
 
@@ -105,8 +105,8 @@ def read_loads_file(path_file: Path) -> LoadsInfos:
 
 def extract_loads_infos_from_blob(case: Case) -> LoadsInfos:
     """
-    Extrai as informações dos loads diretamentamente do blob salvo no
-    DB.
+    Extrai as informações dos loads diretamentamente do arquivo base do
+    caso.
 
     Parameters:
         case: Caso
@@ -115,7 +115,7 @@ def extract_loads_infos_from_blob(case: Case) -> LoadsInfos:
         LoadsInfos: Retorna o valor dos loads.
     """
 
-    with ZipFile(BytesIO(case.base_file), "r") as zip_ref:
+    with open_case_file(case) as file, ZipFile(file, "r") as zip_ref:
         try:
             with zip_ref.open("loads.dat") as fp:
                 loads_infos = extract_loads_infos(fp.read().decode())
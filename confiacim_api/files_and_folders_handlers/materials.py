@@ -1,6 +1,5 @@
 from dataclasses import dataclass
 from enum import Enum
-from io import BytesIO
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -9,6 +8,7 @@ from confiacim_api.errors import (
     MaterialsFileNotFoundInZipError,
     MaterialsFileValueError,
 )
+from confiacim_api.files_and_folders_handlers.core import open_case_file
 from confiacim_api.models import Case
 
 
@@ -126,8 +126,8 @@ def read_materials_file(path_file: Path) -> MaterialsInfos:
 
 def extract_materials_infos_from_blob(case: Case) -> MaterialsInfos:
     """
-    Extrai as informações dos materiais diretamentamente do blob salvo no
-    DB.
+    Extrai as informações dos materiais diretamentamente do arquivo base do
+    caso.
 
     Parameters:
         case: Caso
@@ -136,7 +136,7 @@ def extract_materials_infos_from_blob(case: Case) -> MaterialsInfos:
         MaterialsInfos: Retorna o valor dos materiais.
     """
 
-    with ZipFile(BytesIO(case.base_file), "r") as zip_ref:
+    with open_case_file(case) as file, ZipFile(file, "r") as zip_ref:
         try:
             with zip_ref.open("materials.dat") as fp:
                 mat_infos = extract_materials_infos(fp.read().decode())
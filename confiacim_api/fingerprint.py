@@ -0,0 +1,69 @@
+import hashlib
+import json
+
+from confiacim import __version__ as confiacim_version
+
+from confiacim_api.conf import settings
+from confiacim_api.schemes import FormConfigCreateIn, TencimCreateRunIn
+from confiacim_api.schemes.form import FormConfig
+
+
+def solver_versions() -> str:
+    """
+    Versões do `confiacim` e do `tencim1D` usadas pelos workers.
+
+    Returns:
+        Retorna uma string com as versões.
+
+    Info:
+        A versão do `tencim1D` vem do `CONFIACIM_API_TENCIM_VERSION`, que deve
+        ser a mesma dos workers. O executavel nunca é chamado pela `api`.
+    """
+    if settings.TENCIM_VERSION is None:
+        return f"Confiacim {confiacim_version}"
+    return f"Confiacim {confiacim_version} ({settings.TENCIM_VERSION})"
+
+
+def canonical_fingerprint(kind: str, base_file_digest: str, params: dict) -> str:
+    """
+    Hash canônico das entradas de uma simulação.
+
+    Parameters:
+        kind: Tipo da simulação (`form` ou `tencim`)
+        base_file_digest: `sha256` do arquivo base do caso
+        params: Parâmetros da simulação
+
+    Returns:
+        Retorna o `sha256` das entradas.
+
+    Info:
+        O json é gerado com as chaves ordenadas e sem espaços, logo a ordem
+        das chaves no payload não muda o hash. As versões do `confiacim` e do
+        `tencim1D` também fazem parte do hash.
+    """
+    payload = {
+        "kind": kind,
+        "case": base_file_digest,
+        "params": params,
+        "versions": solver_versions(),
+    }
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def form_fingerprint(base_file_digest: str, config: FormConfigCreateIn) -> str:
+    return form_config_fingerprint(base_file_digest, config.form, config.critical_point)
+
+
+def form_config_fingerprint(base_file_digest: str, form: FormConfig, critical_point: int) -> str:
+    params = {"form": form.model_dump(mode="json"), "critical_point": critical_point}
+    return canonical_fingerprint("form", base_file_digest, params)
+
+
+def tencim_fingerprint(base_file_digest: str, critical_point: int | None, rc_limit: bool) -> str:
+    params = {"critical_point": critical_point, "rc_limit": rc_limit}
+    return canonical_fingerprint("tencim", base_file_digest, params)
+
+
+def tencim_run_fingerprint(base_file_digest: str, payload: TencimCreateRunIn) -> str:
+    return tencim_fingerprint(base_file_digest, payload.critical_point, payload.rc_limit)
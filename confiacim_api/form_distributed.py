@@ -0,0 +1,147 @@
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from confiacim.erros import CaseFileNotFound, InputDirNotExists
+from confiacim.form.correlations import generate_correlation_matrix
+from confiacim.form.iteration import form_step
+from confiacim.form.math_utils import (
+    Ua2avgs,
+    importance_factors,
+    omission_factors,
+    variables_mean2Ua,
+)
+from confiacim.form.model import FormResult as CoreFormResult
+from confiacim.samples import Sample, SamplesGeneratorForm
+from confiacim.simulation_config import SimulationConfig, load_config
+from confiacim.tencim.input_file import check_for_nocliprc_macro
+from confiacim.variables import pdf_cdf_ppf_of_distributions
+from scipy.linalg import cholesky
+from scipy.stats import norm
+
+from confiacim_api.logger import logger
+
+SampleRCs = dict[str, Optional[dict[str, float]]]
+
+FormState = dict
+"""Estado do loop do **FORM** entre as iterações, serializável em `JSON`."""
+
+
+def _load_config(input_dir: Path) -> SimulationConfig:
+    if not input_dir.exists():
+        raise InputDirNotExists(input_dir)
+
+    return load_config(file_path=input_dir / "case.yml")
+
+
+def form_initial_state(input_dir: Path) -> FormState:
+    """
+    Estado inicial do **FORM** distribuido.
+
+    Parameters:
+        input_dir: Diretório com o caso e o `case.yml`
+
+    Returns:
+        Retorna o estado antes da primeira iteração.
+
+    Raises:
+        InputDirNotExists: Diretório de entrada não existe.
+        CaseFileNotFound: Caso sem o arquivo `case.dat`.
+    """
+    simulation_conf = _load_config(input_dir)
+
+    try:
+        check_for_nocliprc_macro(case_file=input_dir / "case.dat")
+    except FileNotFoundError as e:
+        raise CaseFileNotFound(e.filename) from FileNotFoundError
+
+    return {
+        "it": 0,
+        "Ua": variables_mean2Ua(simulation_conf.variables).tolist(),
+        "beta": simulation_conf.form_configs["beta"],
+        "iteration_infos": {},
+    }
+
+
+def form_samples(input_dir: Path, state: FormState) -> list[Sample]:
+    """
+    Amostras da próxima iteração do **FORM**.
+
+    Parameters:
+        input_dir: Diretório com o `case.yml`
+        state: Estado do **FORM**
+
+    Returns:
+        Retorna as `n + 1` amostras da iteração.
+    """
+    simulation_conf = _load_config(input_dir)
+
+    avgs = Ua2avgs(np.asarray(state["Ua"]), simulation_conf.variables)
+
+    return SamplesGeneratorForm(avgs, delta=simulation_conf.form_configs["delta"]).all()
+
+
+def form_iteration(input_dir: Path, state: FormState, rcs: SampleRCs) -> tuple[FormState, Optional[dict]]:
+    """
+    Uma iteração do **FORM** com os `RCs` das amostras.
+
+    São os mesmos cálculos de uma iteração de `confiacim.form.mainloop.loop`,
+    mas o estado entre as iterações é passado de uma task para a outra. O
+    `iteration_infos` do estado tem o mesmo formato do `form_iteration_log.json`.
+
+    Parameters:
+        input_dir: Diretório com o `case.yml`
+        state: Estado do **FORM**
+        rcs: `RCs` das amostras da iteração
+
+    Returns:
+        Retorna o novo estado e, quando o **FORM** termina (`resid < tol` ou
+        `maxit`), o resultado final no formato do `results.json`.
+    """
+    simulation_conf = _load_config(input_dir)
+    form_configs = simulation_conf.form_configs
+    variables = simulation_conf.variables
+
+    f_F_IFs = pdf_cdf_ppf_of_distributions(variables)
+    L = cholesky(generate_correlation_matrix(simulation_conf.correlations, variables), lower=True)
+
+    it = state["it"] + 1
+
+    Ua, betai, resid, alpha = form_step(
+        np.asarray(state["Ua"]),
+        L,
+        rcs,
+        form_configs["gamma"],
+        form_configs["delta"],
+        state["beta"],
+        f_F_IFs,
+        it,
+        form_configs["Nr"],
+    )
+
+    avgs = Ua2avgs(Ua, variables)
+
+    iteration_infos = state["iteration_infos"] or {"beta": [], "resid": [], **{k: [] for k in avgs}}
+    iteration_infos["beta"].append(float(betai))
+    iteration_infos["resid"].append(float(resid))
+    for k, v in avgs.items():
+        iteration_infos[k].append(float(v))
+
+    logger.info(f"Distributed FORM - Iteration: {it=} {betai=:.6e} {resid=:.6e}")
+
+    new_state = {"it": it, "Ua": Ua.tolist(), "beta": float(betai), "iteration_infos": iteration_infos}
+
+    if resid >= form_configs["tol"] and it < form_configs["maxit"]:
+        return new_state, None
+
+    results = CoreFormResult(
+        beta=betai,
+        resid=resid,
+        rcs=rcs,
+        it=it,
+        Pf=norm.cdf(-betai),
+        importance_factors=importance_factors(alpha),
+        omission_factors=omission_factors(alpha),
+    )
+
+    return new_state, results.json_results()
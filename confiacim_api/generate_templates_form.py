@@ -18,7 +18,10 @@ from confiacim_api.constants import (
     PROP_FORMANTION,
     PROP_MAT_POSITION,
 )
-from confiacim_api.files_and_folders_handlers import extract_materials_infos
+from confiacim_api.files_and_folders_handlers import (
+    extract_materials_infos,
+    replace_file_content,
+)
 from confiacim_api.logger import logger
 
 
@@ -204,7 +207,7 @@ def generate_templates(task_id: UUID | None, base_folder: Path, config: dict):
             mat_props,
         )
         materials_jinja = base_folder_template / "materials.jinja"
-        materials_jinja.write_text(jinja_str)
+        replace_file_content(materials_jinja, jinja_str)
 
     if at_least_one_key_in_the_list(variables_name, HIDRATIONPROP) and hidrationprop.exists():
         logger.info(f"Task {task_id} - Generating hidrationprop.jinja ...")
@@ -216,7 +219,7 @@ def generate_templates(task_id: UUID | None, base_folder: Path, config: dict):
             variables,
         )
         hidrationprop_jinja = base_folder_template / "hidrationprop.jinja"
-        hidrationprop_jinja.write_text(jinja_str)
+        replace_file_content(hidrationprop_jinja, jinja_str)
 
     if at_least_one_key_in_the_list(variables_name, LOADS):
         logger.info(f"Task {task_id} - Generating loads.jinja ...")
@@ -227,6 +230,6 @@ def generate_templates(task_id: UUID | None, base_folder: Path, config: dict):
         jinja_str = generate_loads_template(loads_str, loads_infos)
 
         loads_jinja = base_folder_template / "loads.jinja"
-        loads_jinja.write_text(jinja_str)
+        replace_file_content(loads_jinja, jinja_str)
 
     logger.info(f"Task {task_id} - Generated.")
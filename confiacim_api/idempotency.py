@@ -0,0 +1,162 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Annotated, Any, Callable, Optional
+
+from fastapi import Header, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from confiacim_api.conf import settings
+from confiacim_api.constants import MAX_IDEMPOTENCY_KEY_LENGTH
+from confiacim_api.models import IdempotencyKey, User
+
+IdempotencyKeyHeader = Annotated[
+    Optional[str],
+    Header(
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=MAX_IDEMPOTENCY_KEY_LENGTH,
+        description="Chave que identifica a requisição. Uma requisição repetida com a mesma chave "
+        "retorna a resposta original sem executar a operação de novo.",
+    ),
+]
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def request_hash(*parts: Any) -> str:
+    """
+    Hash canônico do conteúdo da requisição.
+
+    Parameters:
+        parts: Partes da requisição (serializáveis em json)
+
+    Returns:
+        Retorna o `sha256` da requisição.
+    """
+    data = json.dumps(jsonable_encoder(parts), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _same_key(user: User, scope: str, key: str):
+    return (
+        IdempotencyKey.user_id == user.id,
+        IdempotencyKey.scope == scope,
+        IdempotencyKey.key == key,
+    )
+
+
+def _claim_key(session: Session, user: User, scope: str, key: str, hash: str) -> Optional[IdempotencyKey]:
+    same_key = _same_key(user, scope, key)
+
+    session.execute(delete(IdempotencyKey).where(*same_key, IdempotencyKey.expires_at < func.now()))
+
+    claimed = session.scalar(
+        insert(IdempotencyKey)
+        .values(
+            user_id=user.id,
+            scope=scope,
+            key=key,
+            request_hash=hash,
+            expires_at=func.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+        )
+        .on_conflict_do_nothing(constraint="user_scope_idempotency_key")
+        .returning(IdempotencyKey.id)
+    )
+    session.commit()
+
+    if claimed is not None:
+        return None
+
+    return session.scalar(select(IdempotencyKey).where(*same_key))
+
+
+def run_idempotent(
+    session: Session,
+    user: User,
+    *,
+    key: Optional[str],
+    scope: str,
+    hash: Callable[[], str],
+    handler: Callable[[], Any],
+    response_model: Optional[type[BaseModel]] = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Any:
+    """
+    Executa o `handler` apenas uma vez por `Idempotency-Key`.
+
+    A chave é reservada antes do `handler` rodar. Uma requisição repetida
+    com a mesma chave, depois do `handler` terminar, recebe a resposta
+    original com o cabeçalho `Idempotent-Replayed: true`. Se o `handler`
+    falhar a chave é liberada e a requisição pode ser repetida. As chaves
+    expiram depois de `IDEMPOTENCY_KEY_TTL` segundos.
+
+    Parameters:
+        session: Secção aberta com o banco
+        user: Usuário da requisição
+        key: Valor do cabeçalho `Idempotency-Key` (`None` desabilita)
+        scope: Nome da rota
+        hash: Função que calcula o hash do conteúdo da requisição
+        handler: Função que executa a operação
+        response_model: Modelo usado para salvar a resposta
+        status_code: Status da resposta salva
+
+    Returns:
+        Retorna o resultado do `handler` ou a resposta original.
+
+    Raises:
+        HTTPException: A chave foi usada com outra requisição (422) ou a
+                       requisição original ainda está rodando (409).
+    """
+    if key is None:
+        return handler()
+
+    request = hash()
+
+    existing = _claim_key(session, user, scope, key, request)
+
+    if existing is not None:
+        if existing.request_hash != request:
+            raise HTTPException(
+                detail="Idempotency-Key already used with a different request.",
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        if existing.response is None:
+            raise HTTPException(
+                detail="A request with this Idempotency-Key is still being processed.",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+
+        return JSONResponse(
+            content=existing.response,
+            status_code=existing.status_code or status.HTTP_200_OK,
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+    same_key = _same_key(user, scope, key)
+
+    try:
+        response = handler()
+    except Exception:
+        # Descarta apenas as alterações que o handler deixou sem commit
+        if not session.is_active or session.new or session.dirty or session.deleted:
+            session.rollback()
+        session.execute(delete(IdempotencyKey).where(*same_key))
+        session.commit()
+        raise
+
+    if response_model is not None:
+        content = response_model.model_validate(response, from_attributes=True).model_dump(mode="json", by_alias=True)
+    else:
+        content = jsonable_encoder(response)
+
+    session.execute(update(IdempotencyKey).where(*same_key).values(response=content, status_code=status_code))
+    session.commit()
+
+    return response
@@ -1,14 +1,16 @@
 import enum
+import hashlib
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import (
+    BigInteger,
     DateTime,
     Enum,
     Float,
     ForeignKey,
-    Integer,
     LargeBinary,
     String,
     Text,
@@ -22,10 +24,12 @@ from sqlalchemy.orm import (
     Mapped,
     mapped_column,
     relationship,
+    validates,
 )
 
-from confiacim_api.constants import MAX_TAG_NAME_LENGTH
-from confiacim_api.types import TArrayFloat, TArrayInt
+from confiacim_api.constants import MAX_IDEMPOTENCY_KEY_LENGTH, MAX_TAG_NAME_LENGTH
+from confiacim_api.numpy_array import NumpyArray
+from confiacim_api.types import TArrayFloat, TNDArrayFloat, TNDArrayInt
 
 
 class ResultStatus(enum.Enum):
@@ -61,6 +65,8 @@ class User(TimestampMixin, Base):
         default=false(),
         server_default="false",
     )
+    max_running_jobs: Mapped[Optional[int]]
+    max_queue_depth: Mapped[Optional[int]]
     cases: Mapped[list["Case"]] = relationship(
         back_populates="user",
         cascade="all, delete-orphan",
@@ -78,8 +84,11 @@ class Case(TimestampMixin, Base):
     tag: Mapped[str] = mapped_column(String(MAX_TAG_NAME_LENGTH))
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     user: Mapped["User"] = relationship(back_populates="cases")
-    base_file: Mapped[bytes] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    base_file: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    base_file_digest: Mapped[Optional[str]] = mapped_column(String(64))
     description: Mapped[str] = mapped_column(Text, nullable=True)
+    n_nodes: Mapped[Optional[int]]
+    n_steps: Mapped[Optional[int]]
 
     tencim_results: Mapped[list["TencimResult"]] = relationship(
         back_populates="case",
@@ -91,6 +100,21 @@ class Case(TimestampMixin, Base):
         cascade="all, delete-orphan",
     )
 
+    tencim_sweeps: Mapped[list["TencimSweep"]] = relationship(
+        back_populates="case",
+        cascade="all, delete-orphan",
+    )
+
+    monte_carlo_results: Mapped[list["MonteCarloResult"]] = relationship(
+        back_populates="case",
+        cascade="all, delete-orphan",
+    )
+
+    form_result_groups: Mapped[list["FormResultGroup"]] = relationship(
+        back_populates="case",
+        cascade="all, delete-orphan",
+    )
+
     materials: Mapped["MaterialsBaseCaseAverageProps"] = relationship(
         back_populates="case",
         cascade="all, delete-orphan",
@@ -111,6 +135,12 @@ class Case(TimestampMixin, Base):
         cascade="all, delete-orphan",
     )
 
+    @validates("base_file")
+    def _validate_base_file(self, key, value):
+        if value is not None:
+            self.base_file_digest = hashlib.sha256(value).hexdigest()
+        return value
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.id}, case={self.tag})"
 
@@ -121,10 +151,10 @@ class TencimResult(TimestampMixin, Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[Optional[UUID]]
-    istep: Mapped[Optional[TArrayInt]] = mapped_column(ARRAY(Integer, as_tuple=True), deferred=True)
-    t: Mapped[Optional[TArrayFloat]] = mapped_column(ARRAY(Float, as_tuple=True), deferred=True)
-    rankine_rc: Mapped[Optional[TArrayFloat]] = mapped_column(ARRAY(Float, as_tuple=True), deferred=True)
-    mohr_coulomb_rc: Mapped[Optional[TArrayFloat]] = mapped_column(ARRAY(Float, as_tuple=True), deferred=True)
+    istep: Mapped[Optional[TNDArrayInt]] = mapped_column(NumpyArray(np.int32), deferred=True)
+    t: Mapped[Optional[TNDArrayFloat]] = mapped_column(NumpyArray(np.float64), deferred=True)
+    rankine_rc: Mapped[Optional[TNDArrayFloat]] = mapped_column(NumpyArray(np.float64), deferred=True)
+    mohr_coulomb_rc: Mapped[Optional[TNDArrayFloat]] = mapped_column(NumpyArray(np.float64), deferred=True)
     error: Mapped[Optional[str]] = mapped_column(Text)
     status: Mapped[Optional[ResultStatus]] = mapped_column(
         Enum(ResultStatus, name="result_status"),
@@ -135,9 +165,67 @@ class TencimResult(TimestampMixin, Base):
     rc_limit: Mapped[Optional[bool]]
     critical_point: Mapped[Optional[int]]
 
+    # Resumo das curvas de RC
+    rc_threshold: Mapped[Optional[float]]
+    rankine_rc_min: Mapped[Optional[float]] = mapped_column(index=True)
+    rankine_rc_max: Mapped[Optional[float]] = mapped_column(index=True)
+    rankine_rc_mean: Mapped[Optional[float]] = mapped_column(index=True)
+    rankine_rc_min_istep: Mapped[Optional[int]]
+    rankine_rc_min_t: Mapped[Optional[float]] = mapped_column(index=True)
+    rankine_rc_steps_below: Mapped[Optional[int]] = mapped_column(index=True)
+    mohr_coulomb_rc_min: Mapped[Optional[float]] = mapped_column(index=True)
+    mohr_coulomb_rc_max: Mapped[Optional[float]] = mapped_column(index=True)
+    mohr_coulomb_rc_mean: Mapped[Optional[float]] = mapped_column(index=True)
+    mohr_coulomb_rc_min_istep: Mapped[Optional[int]]
+    mohr_coulomb_rc_min_t: Mapped[Optional[float]] = mapped_column(index=True)
+    mohr_coulomb_rc_steps_below: Mapped[Optional[int]] = mapped_column(index=True)
+
     case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"))
     case: Mapped["Case"] = relationship(back_populates="tencim_results")
 
+    sweep_id: Mapped[Optional[int]] = mapped_column(ForeignKey("tencim_sweeps.id", ondelete="SET NULL"), index=True)
+    sweep: Mapped[Optional["TencimSweep"]] = relationship(back_populates="results")
+
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), index=True)
+    source_result_id: Mapped[Optional[int]] = mapped_column(ForeignKey("tencim_results.id", ondelete="SET NULL"))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, case={self.case.tag})"
+
+
+class TencimSweep(TimestampMixin, Base):
+    __tablename__ = "tencim_sweeps"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[Optional[UUID]]
+    description: Mapped[str] = mapped_column(Text, nullable=True)
+
+    case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"))
+    case: Mapped["Case"] = relationship(back_populates="tencim_sweeps")
+
+    results: Mapped[list["TencimResult"]] = relationship(back_populates="sweep")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, case={self.case.tag})"
+
+
+class FormResultGroup(TimestampMixin, Base):
+    __tablename__ = "form_result_groups"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[Optional[UUID]]
+    description: Mapped[str] = mapped_column(Text, nullable=True)
+
+    config: Mapped[dict] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+
+    generated_case_files_digest: Mapped[Optional[str]] = mapped_column(String(64))
+
+    case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"))
+    case: Mapped["Case"] = relationship(back_populates="form_result_groups")
+
+    results: Mapped[list["FormResult"]] = relationship(back_populates="group")
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.id}, case={self.case.tag})"
 
@@ -165,17 +253,107 @@ class FormResult(TimestampMixin, Base):
 
     config: Mapped[dict] = mapped_column(JSON, nullable=True)
     variables_stats: Mapped[dict] = mapped_column(JSON, nullable=True)
-    iteration_infos: Mapped[dict] = mapped_column(JSON, nullable=True)
+    iteration_infos: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"))
     case: Mapped["Case"] = relationship(back_populates="form_results")
 
-    generated_case_files: Mapped[bytes] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    generated_case_files: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True, deferred=True)
+
+    generated_case_files_digest: Mapped[Optional[str]] = mapped_column(String(64))
+
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), index=True)
+    source_result_id: Mapped[Optional[int]] = mapped_column(ForeignKey("form_results.id", ondelete="SET NULL"))
+
+    warm_start_from_id: Mapped[Optional[int]] = mapped_column(ForeignKey("form_results.id", ondelete="SET NULL"))
+    initial_point: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+
+    group_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("form_result_groups.id", ondelete="SET NULL"),
+        index=True,
+    )
+    group: Mapped[Optional["FormResultGroup"]] = relationship(back_populates="results")
+
+    @validates("generated_case_files")
+    def _validate_generated_case_files(self, key, value):
+        if value is not None:
+            self.generated_case_files_digest = hashlib.sha256(value).hexdigest()
+        return value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, case={self.case.tag})"
+
+
+class MonteCarloResult(TimestampMixin, Base):
+    __tablename__ = "monte_carlo_results"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[Optional[UUID]]
+
+    critical_point: Mapped[Optional[int]]
+    n_samples: Mapped[int]
+    chunk_size: Mapped[int]
+    seed: Mapped[int] = mapped_column(BigInteger)
+
+    chunks_total: Mapped[int]
+    chunks_done: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    total: Mapped[int] = mapped_column(default=0, server_default="0")
+    valid_simulations: Mapped[int] = mapped_column(default=0, server_default="0")
+    fail: Mapped[int] = mapped_column(default=0, server_default="0")
+    Pf: Mapped[Optional[float]]
+    estimator: Mapped[Optional[float]]
+    Pf_lower: Mapped[Optional[float]]
+    Pf_upper: Mapped[Optional[float]]
+
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    status: Mapped[Optional[ResultStatus]] = mapped_column(
+        Enum(ResultStatus, name="result_status"),
+        default=ResultStatus.CREATED,
+    )
+    description: Mapped[str] = mapped_column(Text, nullable=True)
+
+    config: Mapped[dict] = mapped_column(JSON, nullable=True)
+
+    case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"))
+    case: Mapped["Case"] = relationship(back_populates="monte_carlo_results")
+
+    chunks: Mapped[list["MonteCarloChunk"]] = relationship(
+        back_populates="result",
+        cascade="all, delete-orphan",
+        order_by="MonteCarloChunk.index",
+    )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.id}, case={self.case.tag})"
 
 
+class MonteCarloChunk(Base):
+    __tablename__ = "monte_carlo_chunks"
+    __table_args__ = (UniqueConstraint("result_id", "index", name="monte_carlo_result_chunk_index"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    index: Mapped[int]
+    seed: Mapped[int] = mapped_column(BigInteger)
+    n_samples: Mapped[int]
+
+    status: Mapped[Optional[ResultStatus]] = mapped_column(
+        Enum(ResultStatus, name="result_status"),
+        default=ResultStatus.CREATED,
+    )
+    total: Mapped[int] = mapped_column(default=0, server_default="0")
+    valid_simulations: Mapped[int] = mapped_column(default=0, server_default="0")
+    fail: Mapped[int] = mapped_column(default=0, server_default="0")
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    result_id: Mapped[int] = mapped_column(ForeignKey("monte_carlo_results.id", ondelete="CASCADE"), index=True)
+    result: Mapped["MonteCarloResult"] = relationship(back_populates="chunks")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, result_id={self.result_id}, index={self.index})"
+
+
 class MaterialsBaseCaseAverageProps(TimestampMixin, Base):
     __tablename__ = "materials_base_case_average_prop"
     __table_args__ = (UniqueConstraint("case_id"),)
@@ -264,3 +442,45 @@ class VariableGroup(TimestampMixin, Base):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.id}, tag={self.tag})"
+
+
+class IdempotencyKey(TimestampMixin, Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (UniqueConstraint("user_id", "scope", "key", name="user_scope_idempotency_key"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    key: Mapped[str] = mapped_column(String(MAX_IDEMPOTENCY_KEY_LENGTH))
+    scope: Mapped[str] = mapped_column(String(64))
+    request_hash: Mapped[str] = mapped_column(String(64))
+
+    status_code: Mapped[Optional[int]]
+    response: Mapped[Optional[dict]] = mapped_column(JSON)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, scope={self.scope}, key={self.key})"
+
+
+class RunMetrics(Base):
+    __tablename__ = "run_metrics"
+    __table_args__ = (UniqueConstraint("analysis", "result_id", name="analysis_run_metrics"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    analysis: Mapped[str] = mapped_column(String(32))
+    result_id: Mapped[int]
+
+    phases: Mapped[dict] = mapped_column(JSON, default=dict)
+    duration: Mapped[float] = mapped_column(default=0.0)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, index=True)
+
+    n_steps: Mapped[Optional[int]]
+    n_nodes: Mapped[Optional[int]]
+    n_variables: Mapped[Optional[int]]
+    iterations: Mapped[Optional[int]]
+    n_samples: Mapped[Optional[int]]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, analysis={self.analysis}, result_id={self.result_id})"
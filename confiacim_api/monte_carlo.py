@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from math import ceil, sqrt
+from typing import Optional
+
+import numpy as np
+from confiacim.monte_carlo.model import MonteCarloResult as CoreMonteCarloResult
+from scipy.stats import norm
+
+CONFIDENCE_LEVEL = 0.95
+
+
+@dataclass(frozen=True)
+class MonteCarloEstimate:
+    total: int
+    valid_simulations: int
+    fail: int
+    Pf: Optional[float]
+    estimator: Optional[float]
+    Pf_lower: Optional[float]
+    Pf_upper: Optional[float]
+
+
+def spawn_seeds(seed: int, n: int) -> list[int]:
+    """
+    Gera `n` sementes independentes a partir de uma semente.
+
+    Parameters:
+        seed: Semente base
+        n: Número de sementes
+
+    Returns:
+        Retorna a lista com as sementes.
+
+    Info:
+        Usa o `SeedSequence` do `numpy`, logo a mesma semente sempre gera as
+        mesmas sementes, sem alterar o estado global do `random`.
+    """
+    return [int(s) for s in np.random.SeedSequence(seed).generate_state(n)]
+
+
+def chunk_sizes(n_samples: int, chunk_size: int) -> list[int]:
+    """
+    Divide as amostras em lotes.
+
+    Parameters:
+        n_samples: Número total de amostras
+        chunk_size: Tamanho máximo do lote
+
+    Returns:
+        Retorna o número de amostras de cada lote.
+    """
+    n_chunks = ceil(n_samples / chunk_size)
+    return [min(chunk_size, n_samples - i * chunk_size) for i in range(n_chunks)]
+
+
+def pf_confidence_interval(
+    fail: int,
+    n: int,
+    confidence: float = CONFIDENCE_LEVEL,
+) -> tuple[Optional[float], Optional[float]]:
+    """
+    Intervalo de confiança da probabilidade de falha.
+
+    Parameters:
+        fail: Número de falhas
+        n: Número de simulações válidas
+        confidence: Nível de confiança
+
+    Returns:
+        Retorna os limites inferior e superior ou `(None, None)` sem simulações.
+
+    Info:
+        Usa o intervalo de Wilson, que continua valido quando não há falhas ou
+        a probabilidade é muito pequena, diferente da aproximação normal.
+    """
+    if n <= 0:
+        return None, None
+
+    z = norm.ppf(0.5 + confidence / 2.0)
+    p = fail / n
+    z2 = z * z
+
+    center = (p + z2 / (2 * n)) / (1 + z2 / n)
+    half = z * sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+
+    lower = 0.0 if fail == 0 else max(center - half, 0.0)
+    upper = 1.0 if fail == n else min(center + half, 1.0)
+
+    return lower, upper
+
+
+def monte_carlo_estimate(total: int, valid_simulations: int, fail: int) -> MonteCarloEstimate:
+    """
+    Estimativa da probabilidade de falha com as amostras já simuladas.
+
+    Parameters:
+        total: Número de amostras
+        valid_simulations: Número de simulações válidas
+        fail: Número de falhas
+
+    Returns:
+        Retorna a probabilidade de falha, o estimador (coeficiente de variação)
+        do `confiacim` e o intervalo de confiança.
+    """
+    core = CoreMonteCarloResult(total=total, valid_simulations=valid_simulations, fail=fail)
+    lower, upper = pf_confidence_interval(fail, valid_simulations)
+
+    return MonteCarloEstimate(
+        total=total,
+        valid_simulations=valid_simulations,
+        fail=fail,
+        Pf=core.P if valid_simulations else None,
+        estimator=core.estimator,
+        Pf_lower=lower,
+        Pf_upper=upper,
+    )
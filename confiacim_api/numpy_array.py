@@ -0,0 +1,96 @@
+import struct
+import zlib
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+# dtype (ex: `<f8`), flags e número de elementos
+HEADER = struct.Struct("!3sBI")
+
+COMPRESSED = 0x01
+
+
+def encode_array(array: ArrayLike, dtype: DTypeLike, compress: bool = False) -> bytes:
+    """
+    Codifica um array no formato binário da coluna `NumpyArray`.
+
+    O formato é um cabeçalho de 8 bytes (`HEADER`) com o `dtype`, as flags e
+    o número de elementos seguido dos valores `little-endian`.
+
+    Parameters:
+        array: Valores (`np.ndarray`, `tuple`, `list`, ...)
+        dtype: Tipo dos valores (ex: `np.float64`)
+        compress: Se os valores são compactados com `zlib`
+
+    Returns:
+        Retorna os bytes do array.
+    """
+    data = np.ascontiguousarray(array, dtype=np.dtype(dtype).newbyteorder("<")).ravel()
+
+    flags = 0
+    payload: Any = data.data
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= COMPRESSED
+
+    return b"".join((HEADER.pack(data.dtype.str.encode(), flags, data.size), payload))
+
+
+def decode_array(value: bytes) -> np.ndarray:
+    """
+    Decodifica os bytes da coluna `NumpyArray`.
+
+    Parameters:
+        value: Bytes do array
+
+    Returns:
+        Retorna o `np.ndarray`.
+
+    Info:
+        Sem compactação o array é uma `view` dos bytes (sem cópia), logo é
+        somente leitura.
+    """
+    dtype, flags, length = HEADER.unpack_from(value)
+
+    if flags & COMPRESSED:
+        return np.frombuffer(zlib.decompress(memoryview(value)[HEADER.size :]), dtype=dtype.decode(), count=length)
+
+    return np.frombuffer(value, dtype=dtype.decode(), count=length, offset=HEADER.size)
+
+
+class NumpyArray(TypeDecorator):
+    """
+    Coluna `bytea` com um array do `numpy`.
+
+    Aceita qualquer sequência na escrita e retorna um `np.ndarray` na leitura.
+
+    Parameters:
+        dtype: Tipo dos valores (ex: `np.float64`)
+        compress: Se os valores são compactados com `zlib`
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, dtype: DTypeLike, compress: bool = False):
+        super().__init__()
+        self.dtype = np.dtype(dtype)
+        self.compress = compress
+
+    def process_bind_param(self, value: Optional[ArrayLike], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return encode_array(value, self.dtype, self.compress)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        return decode_array(value)
+
+    def compare_values(self, x, y) -> bool:
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(x, y)
@@ -0,0 +1,88 @@
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from confiacim_api.models import TencimResult
+
+RC_CRITERIA = ("rankine", "mohr_coulomb")
+
+RC_SUMMARY_STATS = ("rc_min", "rc_max", "rc_mean", "rc_min_istep", "rc_min_t", "rc_steps_below")
+
+RC_SUMMARY_FIELDS = (
+    "rc_threshold",
+    *(f"{criterion}_{stat}" for criterion in RC_CRITERIA for stat in RC_SUMMARY_STATS),
+)
+
+
+def rc_stats(istep: ArrayLike, t: ArrayLike, rc: ArrayLike, threshold: float) -> dict[str, Optional[float]]:
+    """
+    Estatísticas de uma curva de `RC`.
+
+    Parameters:
+        istep: Passos de tempo
+        t: Tempos
+        rc: Valores do `RC`
+        threshold: Limite do `RC`
+
+    Returns:
+        Retorna o mínimo, o máximo e a média do `RC`, o passo (`rc_min_istep`)
+        e o tempo (`rc_min_t`) do mínimo e o número de passos com o `RC`
+        abaixo do `threshold` (`rc_steps_below`).
+
+    Info:
+        Caso o mínimo seja um patamar é usado o primeiro passo, como no
+        `first_timestamp_minimal_rc` do `confiacim`.
+    """
+    values = np.asarray(rc, dtype=np.float64)
+
+    if not values.size:
+        return {stat: None for stat in RC_SUMMARY_STATS} | {"rc_steps_below": 0}
+
+    i_min = int(np.argmin(values))
+
+    return {
+        "rc_min": float(values[i_min]),
+        "rc_max": float(values.max()),
+        "rc_mean": float(values.mean()),
+        "rc_min_istep": int(np.asarray(istep)[i_min]),
+        "rc_min_t": float(np.asarray(t)[i_min]),
+        "rc_steps_below": int(np.count_nonzero(values < threshold)),
+    }
+
+
+def rc_summary(result: TencimResult, threshold: float) -> dict[str, Optional[float]]:
+    """
+    Resumo das curvas de `RC` de um resultado do **TENCIM**.
+
+    Parameters:
+        result: Resultado com as curvas
+        threshold: Limite do `RC` da contagem de passos
+
+    Returns:
+        Retorna os valores das colunas `RC_SUMMARY_FIELDS`.
+    """
+    summary: dict[str, Optional[float]] = {"rc_threshold": threshold}
+
+    for criterion in RC_CRITERIA:
+        rc = getattr(result, f"{criterion}_rc")
+        if result.istep is None or result.t is None or rc is None:
+            stats = rc_stats((), (), (), threshold)
+        else:
+            stats = rc_stats(result.istep, result.t, rc, threshold)
+
+        summary |= {f"{criterion}_{stat}": value for stat, value in stats.items()}
+
+    return summary
+
+
+def apply_rc_summary(result: TencimResult, threshold: float) -> None:
+    """
+    Salva o resumo das curvas de `RC` nas colunas do resultado.
+
+    Parameters:
+        result: Resultado com as curvas
+        threshold: Limite do `RC` da contagem de passos
+    """
+    for name, value in rc_summary(result, threshold).items():
+        setattr(result, name, value)
@@ -0,0 +1,229 @@
+import zlib
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+from fastapi import Request, status
+from fastapi.responses import Response, StreamingResponse
+
+from confiacim_api.errors import RangeNotSatisfiableError
+from confiacim_api.utils import CHUNK_SIZE
+
+
+def _etag(digest: str) -> str:
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Verifica se a `ETag` está no header `If-None-Match`.
+
+    Parameters:
+        if_none_match: Valor do header
+        etag: ETag do recurso
+
+    Returns:
+        Retorna `True` se o cliente já possui a versão atual.
+
+    Info:
+        A comparação é fraca, como definido na RFC 9110 para o
+        `If-None-Match`, logo o prefixo `W/` é ignorado.
+    """
+    if not if_none_match:
+        return False
+
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+
+    return "*" in tags or etag in tags
+
+
+def parse_range(range_header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Interpreta o header `Range` com um único intervalo.
+
+    Parameters:
+        range_header: Valor do header (ex: `bytes=0-499`, `bytes=500-`, `bytes=-500`)
+        size: Tamanho do arquivo em bytes
+
+    Returns:
+        Retorna o intervalo `(start, end)` inclusivo ou `None` se o header não
+        for suportado, nesse caso o arquivo inteiro deve ser enviado.
+
+    Raises:
+        RangeNotSatisfiableError: Intervalo fora do arquivo.
+    """
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip() != "bytes" or "," in ranges:
+        return None
+
+    start_str, sep, end_str = ranges.strip().partition("-")
+    if not sep or not (start_str + end_str).isdigit():
+        return None
+
+    if start_str == "":
+        suffix = int(end_str)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiableError("Range not satisfiable.")
+        return max(size - suffix, 0), size - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else size - 1
+
+    if end_str and start > end:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiableError("Range not satisfiable.")
+
+    return start, min(end, size - 1)
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Verifica se o cliente aceita respostas com `gzip`.
+
+    Parameters:
+        accept_encoding: Valor do header `Accept-Encoding`
+
+    Returns:
+        Retorna `True` se `gzip` (ou `*`) foi aceito com `q` maior que zero.
+    """
+    if not accept_encoding:
+        return False
+
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        _, _, q = params.strip().partition("q=")
+        try:
+            return not q or float(q) > 0
+        except ValueError:
+            return False
+
+    return False
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Compacta blocos com `gzip` sem juntar o conteúdo em memória.
+
+    Parameters:
+        chunks: Blocos do conteúdo
+        level: Nível de compactação
+
+    Returns:
+        Retorna um iterador com os blocos compactados.
+
+    Info:
+        Cada bloco é enviado com `Z_SYNC_FLUSH`, logo o cliente consegue
+        descompactar o que já recebeu sem esperar o fim da resposta.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _iter_file(file: BinaryIO, start: int, length: int) -> Iterator[bytes]:
+    try:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def file_stream_response(file: BinaryIO, *, media_type: str, filename: str) -> StreamingResponse:
+    """
+    Resposta do download de um arquivo já aberto.
+
+    Parameters:
+        file: Arquivo, é enviado em blocos e fechado no fim
+        media_type: Tipo do arquivo
+        filename: Nome do arquivo
+
+    Returns:
+        Retorna a resposta do download.
+    """
+    size = file.seek(0, 2)
+
+    return StreamingResponse(
+        _iter_file(file, 0, size),
+        media_type=media_type,
+        headers={
+            "Content-Length": str(size),
+            "Content-Disposition": f"attachment; filename={filename}",
+        },
+    )
+
+
+def zip_file_response(
+    request: Request,
+    *,
+    digest: str,
+    opener: Callable[[], BinaryIO],
+    filename: str,
+) -> Response:
+    """
+    Resposta do download de um arquivo zip.
+
+    O arquivo é enviado em blocos e possui uma `ETag` forte gerada a partir
+    do `sha256` do conteudo. Suporta `If-None-Match` (`304`) e `Range` com um
+    único intervalo (`206`/`416`) para downloads resumíveis.
+
+    Parameters:
+        request: Requisição
+        digest: `sha256` do arquivo
+        opener: Função que abre o arquivo
+        filename: Nome do arquivo
+
+    Returns:
+        Retorna a resposta do download.
+    """
+
+    etag = _etag(digest)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    file = opener()
+    size = file.seek(0, 2)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiableError:
+            file.close()
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers | {"Content-Range": f"bytes */{size}"},
+            )
+
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+
+    if byte_range is None:
+        return StreamingResponse(
+            _iter_file(file, 0, size),
+            media_type="application/zip",
+            headers=headers | {"Content-Length": str(size)},
+        )
+
+    start, end = byte_range
+    length = end - start + 1
+    return StreamingResponse(
+        _iter_file(file, start, length),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="application/zip",
+        headers=headers | {"Content-Length": str(length), "Content-Range": f"bytes {start}-{end}/{size}"},
+    )
@@ -0,0 +1,167 @@
+from datetime import timedelta
+from typing import Optional, TypeVar
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, undefer
+
+from confiacim_api.conf import settings
+from confiacim_api.models import Case, FormResult, ResultStatus, TencimResult
+from confiacim_api.rc_summary import RC_SUMMARY_FIELDS
+
+IN_FLIGHT_STATUS = (ResultStatus.CREATED, ResultStatus.RUNNING)
+
+REUSABLE_FIELDS: dict[type, tuple[str, ...]] = {
+    TencimResult: ("istep", "t", "rankine_rc", "mohr_coulomb_rc", *RC_SUMMARY_FIELDS),
+    FormResult: (
+        "beta",
+        "resid",
+        "it",
+        "Pf",
+        "variables_stats",
+        "iteration_infos",
+        "generated_case_files_digest",
+    ),
+}
+
+ReusableResult = TypeVar("ReusableResult", TencimResult, FormResult)
+
+
+def lock_fingerprint(session: Session, fingerprint: str) -> None:
+    """
+    Trava o `fingerprint` até o fim da transação.
+
+    Duas submissões idênticas simultâneas são serializadas, logo a segunda
+    sempre encontra o resultado criado pela primeira.
+
+    Parameters:
+        session: Secção aberta com o banco
+        fingerprint: Hash das entradas da simulação
+    """
+    session.execute(select(func.pg_advisory_xact_lock(func.hashtextextended(fingerprint, 0))))
+
+
+def find_reusable_result(
+    session: Session,
+    model: type[ReusableResult],
+    user_id: int,
+    fingerprint: str,
+) -> Optional[ReusableResult]:
+    """
+    Busca um resultado do usuário com as mesmas entradas.
+
+    Primeiro é procurado o ultimo resultado com sucesso. Se não existir, é
+    procurado o resultado ainda em execução (`created` ou `runnig`) criado a
+    menos de `COALESCE_MAX_AGE` segundos.
+
+    Parameters:
+        session: Secção aberta com o banco
+        model: `TencimResult` ou `FormResult`
+        user_id: ID do usuário
+        fingerprint: Hash das entradas da simulação
+
+    Returns:
+        Retorna o resultado ou `None`.
+    """
+    stmt = (
+        select(model)
+        .join(model.case)
+        .where(
+            model.fingerprint == fingerprint,
+            model.source_result_id.is_(None),
+            Case.user_id == user_id,
+        )
+        .options(*(undefer(getattr(model, field)) for field in REUSABLE_FIELDS[model]))
+        .order_by(model.id.desc())
+        .limit(1)
+    )
+
+    source = session.scalar(stmt.where(model.status == ResultStatus.SUCCESS))
+    if source is not None:
+        return source
+
+    max_age = timedelta(seconds=settings.COALESCE_MAX_AGE)
+    return session.scalar(
+        stmt.where(
+            model.status.in_(IN_FLIGHT_STATUS),
+            model.created_at >= func.now() - max_age,
+        )
+    )
+
+
+def reuse_result(result: ReusableResult, source: ReusableResult) -> None:
+    """
+    Liga o `result` ao resultado `source`.
+
+    Com o `source` terminado os valores são copiados. Com o `source` em
+    execução, o `result` fica com o mesmo status e recebe os valores quando a
+    task do `source` terminar (`update_attached_results`).
+
+    Parameters:
+        result: Novo resultado
+        source: Resultado com as mesmas entradas
+    """
+    result.source_result_id = source.id
+    result.status = source.status
+
+    if source.status == ResultStatus.SUCCESS:
+        for field in REUSABLE_FIELDS[type(source)]:
+            setattr(result, field, getattr(source, field))
+
+
+def reused_result_response(result: ReusableResult, source: ReusableResult) -> dict:
+    """
+    Resposta da rota de execução com o resultado reaproveitado.
+
+    Parameters:
+        result: Novo resultado
+        source: Resultado com as mesmas entradas
+
+    Returns:
+        Retorna o `task_id` do `source` e se o resultado foi copiado
+        (`cached`) ou ligado a uma execução em andamento (`coalesced`).
+    """
+    cached = source.status == ResultStatus.SUCCESS
+    return {
+        "task_id": source.task_id,
+        "result_id": result.id,
+        "cached": cached,
+        "coalesced": not cached,
+    }
+
+
+def update_attached_results(session: Session, result: TencimResult | FormResult) -> list[int]:
+    """
+    Atualiza os resultados ligados ao `result` que ainda esperam por ele.
+
+    O `fingerprint` é travado como nas rotas, antes do novo status do `result`
+    ir para o banco. Assim um resultado ligado por uma rota que ainda não fez
+    o `commit` é atualizado aqui ou a rota já encontra o status final.
+
+    Parameters:
+        session: Secção aberta com o banco
+        result: Resultado que está sendo executado
+
+    Returns:
+        Retorna os IDs dos resultados atualizados.
+    """
+    model = type(result)
+
+    if result.fingerprint is not None:
+        with session.no_autoflush:
+            lock_fingerprint(session, result.fingerprint)
+
+    values = {"status": result.status, "error": result.error}
+    if result.status == ResultStatus.SUCCESS:
+        values |= {field: getattr(result, field) for field in REUSABLE_FIELDS[model]}
+
+    stmt = (
+        update(model)
+        .where(
+            model.source_result_id == result.id,
+            model.status.in_(IN_FLIGHT_STATUS),
+        )
+        .values(**values)
+        .returning(model.id)
+    )
+
+    return list(session.scalars(stmt, execution_options={"synchronize_session": False}).all())
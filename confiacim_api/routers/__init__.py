@@ -3,6 +3,7 @@ from confiacim_api.routers.auth import router as auth_router
 from confiacim_api.routers.base import router as base_router
 from confiacim_api.routers.case import router as case_router
 from confiacim_api.routers.form import router as form_router
+from confiacim_api.routers.monte_carlo import router as monte_carlo_router
 from confiacim_api.routers.tencim import router as tencim_router
 from confiacim_api.routers.users import router as user_router
 from confiacim_api.routers.variable_group import router as variable_group_router
@@ -15,5 +16,6 @@ __all__ = (
     "admin_router",
     "tencim_router",
     "form_router",
+    "monte_carlo_router",
     "variable_group_router",
 )
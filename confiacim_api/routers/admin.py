@@ -5,9 +5,11 @@ from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import false, select, true
 
+from confiacim_api.conf import settings
 from confiacim_api.database import ActiveSession
+from confiacim_api.fair_share import dispatch, user_stats
 from confiacim_api.models import User
-from confiacim_api.schemes import UserOut
+from confiacim_api.schemes import UserFairShareOut, UserFairSharePatch, UserOut
 from confiacim_api.security import CurrentUser
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
@@ -16,11 +18,7 @@ router = APIRouter(prefix="/api/admin", tags=["Admin"])
 @router.get("/users", response_model=Page[UserOut])
 def admin_list_users(session: ActiveSession, user: CurrentUser, role: Union[str, None] = None):
     """Rota para lista os usuarios cadastrados. Apenas usuario admins pondem acessar essa rota"""
-    if user.is_admin is not True:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not enough permissions",
-        )
+    _check_admin(user)
 
     if not role:
         return paginate(session, select(User))
@@ -36,3 +34,75 @@ def admin_list_users(session: ActiveSession, user: CurrentUser, role: Union[str,
         )
 
     return paginate(session, stmt)
+
+
+def _check_admin(user: User):
+    if user.is_admin is not True:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not enough permissions",
+        )
+
+
+def _fair_share_out(user: User) -> dict:
+    return {
+        "id": user.id,
+        "email": user.email,
+        "max_running_jobs": user.max_running_jobs,
+        "max_queue_depth": user.max_queue_depth,
+        **user_stats(user.id),
+    }
+
+
+@router.get("/fair_share", response_model=list[UserFairShareOut])
+def admin_fair_share_list(session: ActiveSession, user: CurrentUser):
+    """
+    Lista o limite de simulações rodando ao mesmo tempo (`max_running_jobs`),
+    o limite de simulações na fila do controle de admissão (`max_queue_depth`)
+    e as simulações rodando e pendentes do fair-share de cada usuário.
+    Usuários sem limite próprio (`null`) usam o `FAIR_SHARE_MAX_RUNNING_JOBS`
+    e os limites `ADMISSION_*`.
+    Apenas usuario admins pondem acessar essa rota.
+    """
+    _check_admin(user)
+
+    users = session.scalars(select(User).order_by(User.id)).all()
+
+    return [_fair_share_out(u) for u in users]
+
+
+@router.patch("/fair_share/{user_id}", response_model=UserFairShareOut)
+def admin_fair_share_update(
+    session: ActiveSession,
+    user: CurrentUser,
+    user_id: int,
+    payload: UserFairSharePatch,
+):
+    """
+    Altera o limite de simulações rodando ao mesmo tempo (`max_running_jobs`)
+    e o limite de simulações na fila (`max_queue_depth`) do usuário. Apenas
+    os campos enviados são alterados. Com `null` o usuário volta a usar o
+    `FAIR_SHARE_MAX_RUNNING_JOBS` e os limites `ADMISSION_*`, com
+    `max_queue_depth` igual a zero o usuário não tem limite na fila. Com um
+    `max_running_jobs` maior as simulações pendentes são enviadas na hora.
+    Apenas usuario admins pondem acessar essa rota.
+    """
+    _check_admin(user)
+
+    target = session.get(User, user_id)
+
+    if target is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found.",
+        )
+
+    for name, value in payload.model_dump(exclude_unset=True).items():
+        setattr(target, name, value)
+    session.commit()
+    session.refresh(target)
+
+    if settings.FAIR_SHARE_ENABLED:
+        dispatch()
+
+    return _fair_share_out(target)
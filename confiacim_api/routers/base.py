@@ -6,12 +6,14 @@ from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
 from confiacim_api import __version__
+from confiacim_api.affinity import known_queues
 from confiacim_api.celery import celery_app
 from confiacim_api.database import ActiveSession
 from confiacim_api.schemes import HealthOut, Message, VersionOut
 from confiacim_api.system_stats import (
     count_case_with_simulation_success,
     count_tasks,
+    queues_depth,
     total_success_simulations,
 )
 
@@ -47,6 +49,7 @@ def system_stats(session: ActiveSession):
         "runnings_simulation": count_tasks(inspector.active()),
         "total_simulation": total_success_simulations(session),
         "total_projects_with_simulations": count_case_with_simulation_success(session),
+        "queues": queues_depth(known_queues()),
     }
 
 
@@ -1,42 +1,59 @@
 from dataclasses import asdict
-from typing import Annotated, Optional
+from functools import cache
+from typing import Annotated, BinaryIO, Callable, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import Response
+from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile, status
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
 from slugify import slugify
 from sqlalchemy import select
 
+from confiacim_api.blob_store import get_blob_store
 from confiacim_api.constants import MAX_TAG_NAME_LENGTH, MIN_TAG_NAME_LENGTH
 from confiacim_api.database import ActiveSession, Session
+from confiacim_api.decimation import SeriesGroup, decimate_series
+from confiacim_api.errors import BlobNotFoundError
 from confiacim_api.files_and_folders_handlers import (
+    CaseBundle,
     HidrationProp,
     LoadsInfos,
     MaterialsInfos,
-    extract_hidration_infos_from_blob,
-    extract_loads_infos_from_blob,
-    extract_materials_infos_from_blob,
+    open_case_file,
 )
+from confiacim_api.idempotency import IdempotencyKeyHeader, request_hash, run_idempotent
 from confiacim_api.models import (
     Case,
     HidrationPropInfos,
     LoadsBaseCaseInfos,
     MaterialsBaseCaseAverageProps,
+    User,
 )
+from confiacim_api.responses import zip_file_response
 from confiacim_api.schemes import (
     CaseCreateIn,
     CaseCreateOut,
     CaseOut,
+    DecimationQuery,
     HidrationPropsOut,
     LoadInfosOut,
     MaterialsOut,
 )
 from confiacim_api.security import CurrentUser
-from confiacim_api.utils import file_case_is_zipfile
+from confiacim_api.utils import file_case_is_zipfile, scan_file
 
 router = APIRouter(prefix="/api/case", tags=["Case"])
 
+LOADS_SERIES = (
+    SeriesGroup(x="mechanical_t", ys=("mechanical_force",)),
+    SeriesGroup(x="thermal_t", ys=("thermal_h", "thermal_temperature")),
+)
+
+HIDRATION_SERIES = (
+    SeriesGroup(x="E_c_t", ys=("E_c_values",)),
+    SeriesGroup(x="poisson_c_t", ys=("poisson_c_values",)),
+    SeriesGroup(x="cohesion_c_t", ys=("cohesion_c_values",)),
+)
+
 
 # TODO: Testar de forma unitaria
 def _create_or_update_materials(session: Session, case: Case, mat_infos: MaterialsInfos):
@@ -124,6 +141,44 @@ def _create_or_update_hidrationprops(session: Session, case: Case, hidration_inf
             case.hidration_props.cohesion_c_values = hidration_infos.cohesion_c.values
 
 
+# TODO: Testar de forma unitaria
+def _upload_digest(case_file: UploadFile) -> Callable[[], str]:
+    """
+    `sha256` do arquivo do upload calculado apenas uma vez.
+
+    O mesmo hash é usado no `Idempotency-Key` e no `BlobStore`, logo o
+    arquivo temporário do upload é percorrido uma única vez para o hash.
+    """
+    return cache(lambda: scan_file(case_file.file).sha256)
+
+
+def _update_case_file(session: Session, case: Case, case_file: BinaryIO, digest: Optional[str] = None):
+    """
+    Atualiza o arquivo base do caso e as informações extraidas dele.
+
+    Os membros do zip são lidos diretamente do arquivo temporário do upload
+    e o arquivo é salvo no `BlobStore`, onde arquivos identicos são
+    armazenados apenas uma vez. O caso guarda apenas o `sha256`.
+
+    Parameters:
+        session: Secção aberta com o banco
+        case: Caso
+        case_file: Arquivo zip do upload
+        digest: `sha256` do arquivo quando já calculado
+    """
+
+    with CaseBundle(case_file) as bundle:
+        _create_or_update_materials(session, case, bundle.materials)
+        _create_or_update_loads(session, case, bundle.loads)
+        _create_or_update_hidrationprops(session, case, bundle.hidration)
+        if case_dat_infos := bundle.case_dat_infos:
+            case.n_nodes = case_dat_infos.n_nodes
+            case.n_steps = case_dat_infos.n_steps
+
+    case.base_file = None
+    case.base_file_digest = get_blob_store().put(case_file, digest)
+
+
 @router.get("", response_model=Page[CaseOut])
 def case_list(session: ActiveSession, user: CurrentUser):
     "Lista os casos do usuario logado"
@@ -137,8 +192,37 @@ def case_create(
     case_file: Annotated[UploadFile, File()],
     tag: Annotated[str, Form(min_length=MIN_TAG_NAME_LENGTH, max_length=MAX_TAG_NAME_LENGTH)],
     description: Annotated[Optional[str], Form()] = None,
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
+    """
+    Cria um caso com o arquivo base.
+
+    Com o cabeçalho `Idempotency-Key`, uma requisição repetida com a mesma
+    chave retorna o caso criado pela requisição original sem processar o
+    arquivo de novo.
+    """
     form_data = CaseCreateIn(tag=tag, description=description)
+    digest = _upload_digest(case_file)
+
+    return run_idempotent(
+        session,
+        user,
+        key=idempotency_key,
+        scope="case_create",
+        hash=lambda: request_hash(form_data, digest()),
+        handler=lambda: _case_create(session, user, form_data, case_file, digest()),
+        response_model=CaseCreateOut,
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+def _case_create(
+    session: Session,
+    user: User,
+    form_data: CaseCreateIn,
+    case_file: UploadFile,
+    digest: Optional[str] = None,
+) -> Case:
 
     db_case_with_new_tag_name = session.scalar(select(Case).where(Case.tag == form_data.tag, Case.user == user))
 
@@ -156,15 +240,7 @@ def case_create(
 
     new_case = Case(**form_data.model_dump(exclude_unset=True), user=user)
 
-    new_case.base_file = case_file.file.read()
-
-    mat_infos = extract_materials_infos_from_blob(new_case)
-    loads_infos = extract_loads_infos_from_blob(new_case)
-    hidration_infos = extract_hidration_infos_from_blob(new_case)
-
-    _create_or_update_materials(session, new_case, mat_infos)
-    _create_or_update_loads(session, new_case, loads_infos)
-    _create_or_update_hidrationprops(session, new_case, hidration_infos)
+    _update_case_file(session, new_case, case_file.file, digest)
 
     session.commit()
     session.refresh(new_case)
@@ -221,11 +297,35 @@ def upload_case_file(
     case_id: int,
     user: CurrentUser,
     case_file: Annotated[UploadFile, File()],
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
     """
     Upload do arquivos do `simentar` para o caso `case_id`.
     O arquivo precisa estar campactado no formato `zip`.
+
+    Com o cabeçalho `Idempotency-Key`, uma requisição repetida com a mesma
+    chave retorna a resposta original sem processar o arquivo de novo.
     """
+
+    digest = _upload_digest(case_file)
+
+    return run_idempotent(
+        session,
+        user,
+        key=idempotency_key,
+        scope="upload_case_file",
+        hash=lambda: request_hash(case_id, digest()),
+        handler=lambda: _upload_case_file(session, case_id, user, case_file, digest()),
+    )
+
+
+def _upload_case_file(
+    session: Session,
+    case_id: int,
+    user: User,
+    case_file: UploadFile,
+    digest: Optional[str] = None,
+) -> dict:
     case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
     if case is None:
         raise HTTPException(
@@ -239,15 +339,7 @@ def upload_case_file(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    case.base_file = case_file.file.read()
-
-    mat_infos = extract_materials_infos_from_blob(case)
-    loads_infos = extract_loads_infos_from_blob(case)
-    hidration_infos = extract_hidration_infos_from_blob(case)
-
-    _create_or_update_materials(session, case, mat_infos)
-    _create_or_update_loads(session, case, loads_infos)
-    _create_or_update_hidrationprops(session, case, hidration_infos)
+    _update_case_file(session, case, case_file.file, digest)
 
     session.commit()
 
@@ -256,6 +348,7 @@ def upload_case_file(
 
 @router.get("/{case_id}/download")
 def download_case_file(
+    request: Request,
     session: ActiveSession,
     case_id: int,
     user: CurrentUser,
@@ -269,17 +362,21 @@ def download_case_file(
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    if case.base_file is None:
+    if case.base_file_digest is None:
         raise HTTPException(
             detail="The case has no base file.",
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    filename = f"{slugify(case.tag)}.zip"
-    response = Response(content=case.base_file, media_type="application/zip")
-    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
-
-    return response
+    try:
+        return zip_file_response(
+            request,
+            digest=case.base_file_digest,
+            opener=lambda: open_case_file(case),
+            filename=f"{slugify(case.tag)}.zip",
+        )
+    except BlobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found.") from e
 
 
 @router.get("/{case_id}/materials", response_model=MaterialsOut)
@@ -312,8 +409,12 @@ def loads_case_retrieve(
     session: ActiveSession,
     case_id: int,
     user: CurrentUser,
+    decimation: Annotated[DecimationQuery, Query()],
 ):
-    """Retorno a informações do loads do caso `case_id`"""
+    """Retorno a informações do loads do caso `case_id`
+
+    As séries podem ser reduzidas com `stride`, `max_points` e `downsample`.
+    """
 
     case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
 
@@ -329,7 +430,9 @@ def loads_case_retrieve(
             detail="The case not have registered loads",
         )
 
-    return case.loads
+    data = {name: getattr(case.loads, name) for name in LoadInfosOut.model_fields}
+
+    return decimate_series(data, LOADS_SERIES, **decimation.model_dump(mode="json"))
 
 
 @router.get("/{case_id}/hidration_props", response_model=HidrationPropsOut)
@@ -337,8 +440,12 @@ def hidration_props_case_retrieve(
     session: ActiveSession,
     case_id: int,
     user: CurrentUser,
+    decimation: Annotated[DecimationQuery, Query()],
 ):
-    """Retorno a informações da propriedades de hidratação do caso `case_id`"""
+    """Retorno a informações da propriedades de hidratação do caso `case_id`
+
+    As séries podem ser reduzidas com `stride`, `max_points` e `downsample`.
+    """
 
     case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
 
@@ -354,4 +461,6 @@ def hidration_props_case_retrieve(
             detail="The case not have registered hidration props",
         )
 
-    return case.hidration_props
+    data = {name: getattr(case.hidration_props, name) for name in HidrationPropsOut.model_fields}
+
+    return decimate_series(data, HIDRATION_SERIES, **decimation.model_dump(mode="json"))
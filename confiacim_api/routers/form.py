@@ -1,29 +1,61 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import Response
+from collections import Counter
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
 from slugify import slugify
-from sqlalchemy import select
-
-from confiacim_api.database import ActiveSession
-from confiacim_api.models import Case, FormResult
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, contains_eager
+
+from confiacim_api.admission import check_admission
+from confiacim_api.affinity import io_queue, select_queue, task_queue
+from confiacim_api.database import ActiveSession, SessionFactory
+from confiacim_api.errors import BlobNotFoundError, ExportDependencyError
+from confiacim_api.events import Event, iteration_events, result_events_response
+from confiacim_api.export import MEDIA_TYPES, export_form_results
+from confiacim_api.files_and_folders_handlers import open_form_generated_case_file
+from confiacim_api.fingerprint import form_config_fingerprint, form_fingerprint
+from confiacim_api.idempotency import IdempotencyKeyHeader, request_hash, run_idempotent
+from confiacim_api.models import Case, FormResult, FormResultGroup, ResultStatus, User
+from confiacim_api.responses import file_stream_response, zip_file_response
+from confiacim_api.result_reuse import (
+    find_reusable_result,
+    lock_fingerprint,
+    reuse_result,
+    reused_result_response,
+)
+from confiacim_api.runtime_model import result_eta
 from confiacim_api.schemes import (
+    ExportFormatEnum,
     FormConfigCreateIn,
     FormResultDetailOut,
     FormResultErrorOut,
+    FormResultGroupCreateIn,
+    FormResultGroupCreateOut,
+    FormResultGroupOut,
     FormResultStatusOut,
     FormResultSummaryOut,
     ResultCeleryTaskOut,
+    ResultEtaOut,
 )
 from confiacim_api.security import CurrentUser
-from confiacim_api.tasks import form_run as form_task
+from confiacim_api.tasks import form_group_point_run, form_solve, run_form_pipeline
+from confiacim_api.tasks import form_group_run as form_group_task
+from confiacim_api.warm_start import design_point
 
 router = APIRouter(prefix="/api/case", tags=["Form"])
 
 
 @router.get("/{case_id}/form/results", response_model=Page[FormResultSummaryOut])
-def form_result_list(session: ActiveSession, user: CurrentUser, case_id: int):
-    """Lista o resultados do **FORM** do usuário logado para o `case_id`"""
+def form_result_list(
+    session: ActiveSession,
+    user: CurrentUser,
+    case_id: int,
+    group_id: Optional[int] = None,
+):
+    """Lista o resultados do **FORM** do usuário logado para o `case_id`. Com
+    `group_id` apenas os resultados do grupo são listados."""
 
     case = session.scalar(select(Case).where(Case.id == case_id, Case.user_id == user.id))
 
@@ -42,6 +74,9 @@ def form_result_list(session: ActiveSession, user: CurrentUser, case_id: int):
         )
     )
 
+    if group_id is not None:
+        stmt = stmt.where(FormResult.group_id == group_id)
+
     return paginate(session, stmt)
 
 
@@ -51,8 +86,41 @@ def form_run(
     case_id: int,
     config: FormConfigCreateIn,
     user: CurrentUser,
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
-    """Envia uma simulação do `FORM` do caso `case_id` para a fila de execução"""
+    """Envia uma simulação do `FORM` do caso `case_id` para a fila de execução.
+
+    Se o usuário já tiver um resultado com sucesso com as mesmas entradas (mesmo
+    arquivo base, `form`, `critical_point` e versões do `confiacim` e
+    `tencim1D`), o novo resultado é criado já com os valores do resultado
+    anterior (`source_result_id`) e nenhuma task é enviada (`cached=true`).
+
+    Se o resultado com as mesmas entradas ainda estiver em execução, o novo
+    resultado é ligado a ele (`coalesced=true`) e recebe os valores quando a
+    task terminar, sem enviar outra task.
+
+    Com `force=true` a simulação é sempre enviada.
+
+    Com `warm_start_from=<form_result_id>` o **FORM** começa no ponto de
+    projeto (última iteração) do resultado informado em vez das médias. As
+    variáveis que não existem no resultado informado começam na média.
+
+    Com o cabeçalho `Idempotency-Key`, uma requisição repetida com a mesma
+    chave retorna o `task_id`/`result_id` da requisição original.
+    """
+
+    return run_idempotent(
+        session,
+        user,
+        key=idempotency_key,
+        scope="form_run",
+        hash=lambda: request_hash(case_id, config),
+        handler=lambda: _form_run(session, case_id, config, user),
+        response_model=ResultCeleryTaskOut,
+    )
+
+
+def _form_run(session: Session, case_id: int, config: FormConfigCreateIn, user: User) -> dict:
 
     case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
 
@@ -62,25 +130,51 @@ def form_run(
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    if case.base_file is None:
+    if case.base_file_digest is None:
         raise HTTPException(
             detail="The case has no base file.",
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
+    initial_point = None
+    if config.warm_start_from is not None:
+        initial_point = _warm_start_initial_point(session, config, user)
+
     payload_configs = config.model_dump()
+    fingerprint = form_fingerprint(case.base_file_digest, config)
 
     result = FormResult(
         case=case,
         config=payload_configs["form"],
         critical_point=payload_configs["critical_point"],
         description=payload_configs["description"],
+        fingerprint=fingerprint,
+        warm_start_from_id=config.warm_start_from,
+        initial_point=initial_point,
     )
+
+    source = None
+    if not config.force:
+        lock_fingerprint(session, fingerprint)
+        source = find_reusable_result(session, FormResult, user.id, fingerprint)
+
+    if source is not None:
+        reuse_result(result, source)
+    else:
+        check_admission(session, user, form_solve.name)
+
     session.add(result)
     session.commit()
     session.refresh(result)
 
-    task = form_task.delay(result_id=result.id)
+    if source is not None:
+        return reused_result_response(result, source)
+
+    solver_queue = select_queue(case.base_file_digest, queue=task_queue(form_solve.name))
+    task = run_form_pipeline(result.id, user.id, solver_queue=solver_queue)
+
+    result.task_id = task.id
+    session.commit()
 
     return {
         "task_id": task.id,
@@ -88,6 +182,169 @@ def form_run(
     }
 
 
+def _warm_start_initial_point(session: Session, config: FormConfigCreateIn, user: User) -> dict[str, float]:
+
+    warm_start = session.scalar(
+        select(FormResult)
+        .join(FormResult.case)
+        .where(
+            FormResult.id == config.warm_start_from,
+            Case.user_id == user.id,
+        )
+    )
+
+    if warm_start is None:
+        raise HTTPException(
+            detail="Warm start result not found.",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    if not warm_start.iteration_infos:
+        raise HTTPException(
+            detail="The warm start result has no iterations.",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    return design_point(warm_start.iteration_infos, (v.name.value for v in config.form.variables))
+
+
+@router.post("/{case_id}/form/group", response_model=FormResultGroupCreateOut)
+def form_group_run(
+    session: ActiveSession,
+    case_id: int,
+    payload: FormResultGroupCreateIn,
+    user: CurrentUser,
+):
+    """Envia um grupo de simulações do `FORM` do caso `case_id`, uma para cada
+    `critical_point`, para a fila de execução.
+
+    Os `critical_points` podem ser uma lista ou um intervalo
+    `{"start": 10, "stop": 100, "step": 10}` (`stop` incluso).
+
+    O caso é preparado (arquivo base, templates e `case.yml`) apenas uma vez
+    e cada ponto critico apenas trunca o `case.dat`. As análises de cada
+    ponto são enviadas como um `group` do celery. Todos os resultados do
+    grupo compartilham os mesmos arquivos gerados. A curva `beta(t)`/`Pf(t)`
+    e o progresso podem ser acompanhados em `/{case_id}/form/groups/{group_id}`.
+    """
+
+    case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
+
+    if case is None:
+        raise HTTPException(
+            detail="Case not found.",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    if case.base_file_digest is None:
+        raise HTTPException(
+            detail="The case has no base file.",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    critical_points = payload.critical_point_values()
+
+    check_admission(session, user, form_group_point_run.name, n_jobs=len(critical_points))
+
+    config = payload.form.model_dump()
+
+    form_group = FormResultGroup(case=case, config=config, description=payload.description)
+    session.add(form_group)
+    session.flush()
+
+    result_ids = session.scalars(
+        insert(FormResult).returning(FormResult.id, sort_by_parameter_order=True),
+        [
+            {
+                "case_id": case.id,
+                "group_id": form_group.id,
+                "config": config,
+                "critical_point": critical_point,
+                "description": payload.description,
+                "status": ResultStatus.CREATED,
+                "fingerprint": form_config_fingerprint(case.base_file_digest, payload.form, critical_point),
+            }
+            for critical_point in critical_points
+        ],
+    ).all()
+    session.commit()
+
+    # O preparo do grupo só faz I/O, os pontos vão para a fila do solver
+    task = form_group_task.apply_async(
+        kwargs={"group_id": form_group.id},
+        queue=io_queue(),
+    )
+
+    form_group.task_id = task.id
+    session.commit()
+
+    return {
+        "group_id": form_group.id,
+        "task_id": task.id,
+        "result_ids": result_ids,
+    }
+
+
+@router.get("/{case_id}/form/groups/{group_id}", response_model=FormResultGroupOut)
+def form_group_retrieve(
+    session: ActiveSession,
+    case_id: int,
+    group_id: int,
+    user: CurrentUser,
+):
+    """Retorna o progresso e a curva `beta(t)`/`Pf(t)` do grupo `group_id` do
+    caso `case_id`. Os pontos são ordenados pelo `critical_point`."""
+
+    form_group = session.scalar(
+        select(FormResultGroup)
+        .join(FormResultGroup.case)
+        .where(
+            FormResultGroup.id == group_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+
+    if not form_group:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Group/Case not found",
+        )
+
+    points = session.execute(
+        select(
+            FormResult.id.label("result_id"),
+            FormResult.critical_point,
+            FormResult.status,
+            FormResult.beta,
+            FormResult.Pf,
+        )
+        .where(FormResult.group_id == form_group.id)
+        .order_by(FormResult.critical_point)
+    ).all()
+
+    counts = Counter(point.status for point in points)
+
+    created = counts.get(ResultStatus.CREATED, 0)
+    running = counts.get(ResultStatus.RUNNING, 0)
+
+    return {
+        "id": form_group.id,
+        "task_id": form_group.task_id,
+        "description": form_group.description,
+        "config": form_group.config,
+        "error": form_group.error,
+        "total": len(points),
+        "created": created,
+        "running": running,
+        "success": counts.get(ResultStatus.SUCCESS, 0),
+        "failed": counts.get(ResultStatus.FAILED, 0),
+        "done": created + running == 0,
+        "points": [point._asdict() for point in points],
+        "created_at": form_group.created_at,
+    }
+
+
 @router.get(
     "/{case_id}/form/results/{result_id}",
     response_model=FormResultDetailOut,
@@ -181,6 +438,45 @@ def form_result_error_retrieve(
     return {"error": result.error}
 
 
+@router.get("/{case_id}/form/results/{result_id}/eta", response_model=ResultEtaOut)
+def form_result_eta(
+    session: ActiveSession,
+    case_id: int,
+    result_id: int,
+    user: CurrentUser,
+):
+    """Retorna a previsão do início (`start_at`) e do fim (`finish_at`) da
+    simulação do `FORM`.
+
+    O tempo de cada simulação (`runtime`) é estimado por um modelo ajustado
+    com o histórico das simulações (`history_runs`) a partir do número de
+    passos de tempo, do tamanho da malha e do número de variáveis. Uma
+    simulação na fila começa depois das `position` simulações na frente
+    dela e do restante das que estão rodando. Para as simulações que já
+    terminaram são retornados os tempos medidos.
+    """
+
+    stmt = (
+        select(FormResult)
+        .join(FormResult.case)
+        .options(contains_eager(FormResult.case))
+        .where(
+            FormResult.id == result_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+    result = session.scalar(stmt)
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    return result_eta(session, "form", result)
+
+
 @router.get("/{case_id}/form/results/{result_id}/status", response_model=FormResultStatusOut)
 def form_result_status_retrieve(
     session: ActiveSession,
@@ -219,8 +515,68 @@ def form_result_status_retrieve(
     return {"status": result.status}
 
 
+def _form_result_snapshot(result_id: int) -> list[Event]:
+    with SessionFactory() as session:
+        row = session.execute(
+            select(FormResult.status, FormResult.error, FormResult.iteration_infos).where(FormResult.id == result_id)
+        ).one_or_none()
+
+    if row is None:
+        return []
+
+    data = {"status": row.status.value if row.status else None}
+    if row.error is not None:
+        data["error"] = row.error
+
+    return [*iteration_events(row.iteration_infos), ("status", data)]
+
+
+@router.get("/{case_id}/form/results/{result_id}/events")
+def form_result_events(
+    request: Request,
+    session: ActiveSession,
+    case_id: int,
+    result_id: int,
+    user: CurrentUser,
+):
+    """Stream (`Server-Sent Events`) do progresso do resultado do `FORM`.
+
+    Os eventos são:
+
+    - `iteration` - Iteração do `FORM` com `it`, `beta`, `resid` e `variables`.
+    - `status` - Mudança do status do resultado, com `error` quando falhar.
+
+    Primeiro são enviados as iterações já feitas e o status atual. O stream
+    termina quando o status for `success` ou `failed`.
+    """
+
+    stmt = (
+        select(FormResult.id)
+        .join(FormResult.case)
+        .where(
+            FormResult.id == result_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+
+    if session.scalar(stmt) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    return result_events_response(
+        request,
+        kind="form",
+        result_id=result_id,
+        snapshot=lambda: _form_result_snapshot(result_id),
+    )
+
+
 @router.get("/{case_id}/form/results/{result_id}/download-generated-case-file")
 def download_form_generated_case_file(
+    request: Request,
     session: ActiveSession,
     case_id: int,
     result_id: int,
@@ -245,14 +601,95 @@ def download_form_generated_case_file(
             detail="Result/Case not found.",
         )
 
-    if result.generated_case_files is None:
+    if result.generated_case_files_digest is None:
         raise HTTPException(
             detail="The form result has no generated case file.",
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    filename = f"{slugify(result.case.tag)}.zip"
-    response = Response(content=result.generated_case_files, media_type="application/zip")
-    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    try:
+        return zip_file_response(
+            request,
+            digest=result.generated_case_files_digest,
+            opener=lambda: open_form_generated_case_file(result),
+            filename=f"{slugify(result.case.tag)}.zip",
+        )
+    except BlobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found.") from e
+
 
-    return response
+@router.get("/{case_id}/form/export")
+def form_case_export(
+    session: ActiveSession,
+    case_id: int,
+    user: CurrentUser,
+    export_format: Annotated[ExportFormatEnum, Query(alias="format")] = ExportFormatEnum.PARQUET,
+):
+    """
+    Exporta o log das iterações (`beta`, `resid` e as variáveis) de todos os resultados do caso em um arquivo
+    `parquet` ou `arrow` (IPC), com a coluna `result_id`.
+
+    Info:
+        Depende do `pyarrow`, sem ele a rota retorna `501`.
+    """
+
+    tag = session.scalar(select(Case.tag).where(Case.id == case_id, Case.user_id == user.id))
+
+    if tag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found",
+        )
+
+    try:
+        file = export_form_results(
+            session,
+            Case.id == case_id,
+            Case.user_id == user.id,
+            export_format=export_format.value,
+        )
+    except ExportDependencyError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e)) from e
+
+    return file_stream_response(
+        file,
+        media_type=MEDIA_TYPES[export_format.value],
+        filename=f"{slugify(tag)}-form.{export_format.value}",
+    )
+
+
+@router.get("/{case_id}/form/results/{result_id}/export")
+def form_result_export(
+    session: ActiveSession,
+    case_id: int,
+    result_id: int,
+    user: CurrentUser,
+    export_format: Annotated[ExportFormatEnum, Query(alias="format")] = ExportFormatEnum.PARQUET,
+):
+    """
+    Exporta o log das iterações (`beta`, `resid` e as variáveis) do resultado em um arquivo `parquet` ou `arrow` (IPC).
+
+    Info:
+        Depende do `pyarrow`, sem ele a rota retorna `501`.
+    """
+
+    criteria = (FormResult.id == result_id, Case.id == case_id, Case.user_id == user.id)
+
+    tag = session.scalar(select(Case.tag).join(Case.form_results).where(*criteria))
+
+    if tag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    try:
+        file = export_form_results(session, *criteria, export_format=export_format.value)
+    except ExportDependencyError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e)) from e
+
+    return file_stream_response(
+        file,
+        media_type=MEDIA_TYPES[export_format.value],
+        filename=f"{slugify(tag)}-form-{result_id}.{export_format.value}",
+    )
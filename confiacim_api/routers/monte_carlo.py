@@ -0,0 +1,298 @@
+import secrets
+from dataclasses import asdict
+from datetime import datetime
+from uuid import UUID
+
+from celery import group
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from confiacim_api.admission import check_admission
+from confiacim_api.database import ActiveSession, SessionFactory
+from confiacim_api.events import Event, estimate_event, result_events_response
+from confiacim_api.fair_share import submit_group
+from confiacim_api.models import (
+    Case,
+    MonteCarloChunk,
+    MonteCarloResult,
+    ResultStatus,
+    User,
+)
+from confiacim_api.monte_carlo import (
+    MonteCarloEstimate,
+    chunk_sizes,
+    monte_carlo_estimate,
+    spawn_seeds,
+)
+from confiacim_api.schemes import (
+    MonteCarloConfigCreateIn,
+    MonteCarloEstimateOut,
+    MonteCarloResultDetailOut,
+    MonteCarloResultSummaryOut,
+    ResultCeleryTaskOut,
+)
+from confiacim_api.security import CurrentUser
+from confiacim_api.tasks import monte_carlo_chunk_run
+
+router = APIRouter(prefix="/api/case", tags=["Monte Carlo"])
+
+
+@router.get("/{case_id}/montecarlo/results", response_model=Page[MonteCarloResultSummaryOut])
+def monte_carlo_result_list(session: ActiveSession, user: CurrentUser, case_id: int):
+    """Lista o resultados do **Monte Carlo** do usuário logado para o `case_id`"""
+
+    case = session.scalar(select(Case).where(Case.id == case_id, Case.user_id == user.id))
+
+    if not case:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found",
+        )
+
+    stmt = (
+        select(MonteCarloResult)
+        .join(MonteCarloResult.case)
+        .where(
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+
+    return paginate(session, stmt)
+
+
+@router.post("/{case_id}/montecarlo/run", response_model=ResultCeleryTaskOut)
+def monte_carlo_run(
+    session: ActiveSession,
+    case_id: int,
+    config: MonteCarloConfigCreateIn,
+    user: CurrentUser,
+):
+    """Envia uma simulação do **Monte Carlo** do caso `case_id` para a fila de execução.
+
+    As `n_samples` amostras são divididas em lotes de `chunk_size` amostras,
+    cada lote com a sua semente gerada a partir do `seed`, e os lotes são
+    enviados como um `group` do celery. Com o mesmo `seed` as amostras são
+    sempre as mesmas. A estimativa da probabilidade de falha e o intervalo de
+    confiança são atualizados a cada lote terminado.
+    """
+
+    case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
+
+    if case is None:
+        raise HTTPException(
+            detail="Case not found.",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    if case.base_file_digest is None:
+        raise HTTPException(
+            detail="The case has no base file.",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    payload_configs = config.model_dump()
+
+    seed = config.seed if config.seed is not None else secrets.randbits(32)
+    sizes = chunk_sizes(config.n_samples, config.chunk_size)
+
+    check_admission(session, user, monte_carlo_chunk_run.name, n_jobs=len(sizes))
+
+    result = MonteCarloResult(
+        case=case,
+        config=payload_configs["monte_carlo"],
+        critical_point=config.critical_point,
+        n_samples=config.n_samples,
+        chunk_size=config.chunk_size,
+        seed=seed,
+        chunks_total=len(sizes),
+        description=config.description,
+    )
+    session.add(result)
+    session.flush()
+
+    chunk_ids = session.scalars(
+        insert(MonteCarloChunk).returning(MonteCarloChunk.id, sort_by_parameter_order=True),
+        [
+            {
+                "result_id": result.id,
+                "index": index,
+                "seed": chunk_seed,
+                "n_samples": n_samples,
+                "status": ResultStatus.CREATED,
+            }
+            for index, (n_samples, chunk_seed) in enumerate(zip(sizes, spawn_seeds(seed, len(sizes))))
+        ],
+    ).all()
+    session.commit()
+
+    group_id = submit_group(user.id, group(monte_carlo_chunk_run.si(chunk_id=chunk_id) for chunk_id in chunk_ids))
+
+    result.task_id = UUID(group_id)
+    session.commit()
+
+    return {
+        "task_id": group_id,
+        "result_id": result.id,
+    }
+
+
+def _get_result_or_404(session: Session, user: User, case_id: int, result_id: int) -> MonteCarloResult:
+    stmt = (
+        select(MonteCarloResult)
+        .join(MonteCarloResult.case)
+        .where(
+            MonteCarloResult.id == result_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+    result = session.scalar(stmt)
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    return result
+
+
+@router.get(
+    "/{case_id}/montecarlo/results/{result_id}",
+    response_model=MonteCarloResultDetailOut,
+)
+def monte_carlo_result_retrieve(
+    session: ActiveSession,
+    user: CurrentUser,
+    case_id: int,
+    result_id: int,
+):
+    """Retorna o resultado do **Monte Carlo** com `result_id` do caso `case_id` do usuário logado.
+
+    Enquanto a simulação roda, `Pf`, `Pf_lower` e `Pf_upper` são a estimativa
+    parcial com os lotes já terminados (`chunks_done` de `chunks_total`).
+    """
+
+    return _get_result_or_404(session, user, case_id, result_id)
+
+
+@router.get(
+    "/{case_id}/montecarlo/results/{result_id}/estimates",
+    response_model=list[MonteCarloEstimateOut],
+)
+def monte_carlo_result_estimates(
+    session: ActiveSession,
+    user: CurrentUser,
+    case_id: int,
+    result_id: int,
+):
+    """Historico das estimativas parciais da probabilidade de falha.
+
+    Uma estimativa para cada lote terminado com sucesso, na ordem em que os
+    lotes terminaram, acumulando as amostras dos lotes anteriores. O
+    intervalo de confiança (95%) é o de Wilson.
+    """
+
+    result = _get_result_or_404(session, user, case_id, result_id)
+
+    return [
+        {"chunks_done": chunks_done, "finished_at": finished_at, **asdict(estimate)}
+        for chunks_done, finished_at, estimate in _chunk_estimates(session, result.id)
+    ]
+
+
+def _chunk_estimates(session: Session, result_id: int) -> list[tuple[int, datetime, MonteCarloEstimate]]:
+    chunks = session.execute(
+        select(
+            MonteCarloChunk.total,
+            MonteCarloChunk.valid_simulations,
+            MonteCarloChunk.fail,
+            MonteCarloChunk.finished_at,
+        )
+        .where(
+            MonteCarloChunk.result_id == result_id,
+            MonteCarloChunk.status == ResultStatus.SUCCESS,
+        )
+        .order_by(MonteCarloChunk.finished_at, MonteCarloChunk.id)
+    ).all()
+
+    estimates = []
+    total, valid_simulations, fail = 0, 0, 0
+    for chunks_done, chunk in enumerate(chunks, start=1):
+        total += chunk.total
+        valid_simulations += chunk.valid_simulations
+        fail += chunk.fail
+        estimates.append((chunks_done, chunk.finished_at, monte_carlo_estimate(total, valid_simulations, fail)))
+
+    return estimates
+
+
+def _monte_carlo_result_snapshot(result_id: int) -> list[Event]:
+    with SessionFactory() as session:
+        row = session.execute(
+            select(MonteCarloResult.status, MonteCarloResult.error, MonteCarloResult.chunks_total).where(
+                MonteCarloResult.id == result_id
+            )
+        ).one_or_none()
+
+        if row is None:
+            return []
+
+        estimates = _chunk_estimates(session, result_id)
+
+    data = {"status": row.status.value if row.status else None}
+    if row.error is not None:
+        data["error"] = row.error
+
+    return [
+        *(("estimate", estimate_event(chunks_done, row.chunks_total, e)) for chunks_done, _, e in estimates),
+        ("status", data),
+    ]
+
+
+@router.get("/{case_id}/montecarlo/results/{result_id}/events")
+def monte_carlo_result_events(
+    request: Request,
+    session: ActiveSession,
+    user: CurrentUser,
+    case_id: int,
+    result_id: int,
+):
+    """Stream (`Server-Sent Events`) das estimativas parciais do **Monte Carlo**.
+
+    Um evento `estimate` (`Pf` e o intervalo de confiança de Wilson) é enviado
+    a cada lote terminado e os eventos `status` a cada mudança do status do
+    resultado. Primeiro são enviadas as estimativas dos lotes já terminados e
+    o status atual. O stream termina quando o status for `success` ou `failed`.
+    """
+
+    _get_result_or_404(session, user, case_id, result_id)
+
+    return result_events_response(
+        request,
+        kind="montecarlo",
+        result_id=result_id,
+        snapshot=lambda: _monte_carlo_result_snapshot(result_id),
+    )
+
+
+@router.delete(
+    "/{case_id}/montecarlo/results/{result_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def monte_carlo_result_delete(
+    session: ActiveSession,
+    user: CurrentUser,
+    case_id: int,
+    result_id: int,
+):
+    """Deleta o resultado do **Monte Carlo** com `result_id` do caso co `case_id` do usuário logado"""
+
+    result = _get_result_or_404(session, user, case_id, result_id)
+
+    session.delete(result)
+    session.commit()
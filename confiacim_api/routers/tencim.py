@@ -1,30 +1,72 @@
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import Response
+from typing import Annotated
+from uuid import UUID
+
+from celery import group
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
 from slugify import slugify
-from sqlalchemy import select
-
-from confiacim_api.database import ActiveSession
-from confiacim_api.models import Case, TencimResult
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, contains_eager, undefer
+
+from confiacim_api.admission import check_admission
+from confiacim_api.affinity import select_queue, task_queue
+from confiacim_api.database import ActiveSession, SessionFactory
+from confiacim_api.decimation import SeriesGroup, decimate_series
+from confiacim_api.errors import ExportDependencyError
+from confiacim_api.events import Event, result_events_response
+from confiacim_api.export import MEDIA_TYPES, export_tencim_results
+from confiacim_api.fair_share import submit, submit_group
+from confiacim_api.fingerprint import tencim_fingerprint, tencim_run_fingerprint
+from confiacim_api.idempotency import IdempotencyKeyHeader, request_hash, run_idempotent
+from confiacim_api.models import Case, ResultStatus, TencimResult, TencimSweep, User
+from confiacim_api.responses import accepts_gzip, file_stream_response, gzip_chunks
+from confiacim_api.result_reuse import (
+    find_reusable_result,
+    lock_fingerprint,
+    reuse_result,
+    reused_result_response,
+)
+from confiacim_api.runtime_model import result_eta
 from confiacim_api.schemes import (
+    DecimationQuery,
+    ExportFormatEnum,
     ResultCeleryTaskOut,
+    ResultEtaOut,
     TencimCreateRunIn,
     TencimResultDetailOut,
     TencimResultErrorOut,
+    TencimResultListOut,
+    TencimResultListQuery,
     TencimResultStatusOut,
-    TencimResultSummaryOut,
+    TencimSweepCreateIn,
+    TencimSweepCreateOut,
+    TencimSweepOut,
 )
 from confiacim_api.security import CurrentUser
 from confiacim_api.tasks import tencim_standalone_run as tencim_run
-from confiacim_api.write_csv import write_rc_result_to_csv
+from confiacim_api.write_csv import iter_rc_result_csv
 
 router = APIRouter(prefix="/api/case", tags=["Tencim"])
 
+RC_SERIES = (SeriesGroup(x="t", ys=("rankine_rc", "mohr_coulomb_rc"), extra=("istep",)),)
+
+
+@router.get("/{case_id}/tencim/results", response_model=Page[TencimResultListOut])
+def tencim_result_list(
+    session: ActiveSession,
+    user: CurrentUser,
+    case_id: int,
+    query: Annotated[TencimResultListQuery, Query()],
+):
+    """Lista o resultados do usuário logado para o `case_id`. Com `sweep_id`
+    apenas os resultados do sweep são listados.
 
-@router.get("/{case_id}/tencim/results", response_model=Page[TencimResultSummaryOut])
-def tencim_result_list(session: ActiveSession, user: CurrentUser, case_id: int):
-    """Lista o resultados do usuário logado para o `case_id`"""
+    Os resultados podem ser filtrados (`*_lte`/`*_gte`) e ordenados
+    (`order_by` e `desc`) pelo resumo das curvas de `RC` salvo no fim da
+    simulação. Os resultados sem resumo ficam por último.
+    """
 
     case = session.scalar(select(Case).where(Case.id == case_id, Case.user_id == user.id))
 
@@ -43,6 +85,20 @@ def tencim_result_list(session: ActiveSession, user: CurrentUser, case_id: int):
         )
     )
 
+    if query.sweep_id is not None:
+        stmt = stmt.where(TencimResult.sweep_id == query.sweep_id)
+
+    for name, op, value in query.filters():
+        column = getattr(TencimResult, name)
+        stmt = stmt.where(column <= value if op == "lte" else column >= value)
+
+    if query.order_by is not None:
+        column = getattr(TencimResult, query.order_by.value)
+        stmt = stmt.order_by(
+            column.desc().nulls_last() if query.desc else column.asc().nulls_last(),
+            TencimResult.id,
+        )
+
     return paginate(session, stmt)
 
 
@@ -55,8 +111,14 @@ def tencim_result_retrieve(
     user: CurrentUser,
     case_id: int,
     result_id: int,
+    decimation: Annotated[DecimationQuery, Query()],
 ):
-    """Retorna o resultado `result_id` do caso `case_id` do usuário logado"""
+    """Retorna o resultado `result_id` do caso `case_id` do usuário logado
+
+    As curvas de `RC` podem ser reduzidas para os gráficos com `stride` (um a
+    cada `stride` passos) e `max_points` (`downsample` `lttb` ou `minmax`).
+    O primeiro, o último e o ponto de `RC` mínimo sempre são mantidos.
+    """
 
     stmt = (
         select(TencimResult)
@@ -75,7 +137,9 @@ def tencim_result_retrieve(
             detail="Result/Case not found",
         )
 
-    return result
+    data = {name: getattr(result, name) for name in TencimResultDetailOut.model_fields}
+
+    return decimate_series(data, RC_SERIES, **decimation.model_dump(mode="json"))
 
 
 @router.delete(
@@ -117,12 +181,40 @@ def tencim_standalone_run(
     case_id: int,
     payload: TencimCreateRunIn,
     user: CurrentUser,
+    idempotency_key: IdempotencyKeyHeader = None,
 ):
     """Envia uma simulação do `tencim` do caso `case_id` para a fila execução.
     Caso `critical_point` seja omitido ou definido como `null` o ponto critico será o
     ultimo passo de tempo definido no aquivo base.
+
+    Se o usuário já tiver um resultado com sucesso com as mesmas entradas (mesmo
+    arquivo base, `critical_point`, `rc_limit` e versões do `confiacim` e
+    `tencim1D`), o novo resultado é criado já com os valores do resultado
+    anterior (`source_result_id`) e nenhuma task é enviada (`cached=true`).
+
+    Se o resultado com as mesmas entradas ainda estiver em execução, o novo
+    resultado é ligado a ele (`coalesced=true`) e recebe os valores quando a
+    task terminar, sem enviar outra task.
+
+    Com `force=true` a simulação é sempre enviada.
+
+    Com o cabeçalho `Idempotency-Key`, uma requisição repetida com a mesma
+    chave retorna o `task_id`/`result_id` da requisição original.
     """
 
+    return run_idempotent(
+        session,
+        user,
+        key=idempotency_key,
+        scope="tencim_standalone_run",
+        hash=lambda: request_hash(case_id, payload),
+        handler=lambda: _tencim_standalone_run(session, case_id, payload, user),
+        response_model=ResultCeleryTaskOut,
+    )
+
+
+def _tencim_standalone_run(session: Session, case_id: int, payload: TencimCreateRunIn, user: User) -> dict:
+
     case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
 
     if case is None:
@@ -131,26 +223,48 @@ def tencim_standalone_run(
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    if case.base_file is None:
+    if case.base_file_digest is None:
         raise HTTPException(
             detail="The case has no base file.",
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
+    fingerprint = tencim_run_fingerprint(case.base_file_digest, payload)
+
     result = TencimResult(
         case=case,
-        **payload.model_dump(exclude_unset=True),
+        fingerprint=fingerprint,
+        **payload.model_dump(exclude_unset=True, exclude={"force"}),
     )
 
+    source = None
+    if not payload.force:
+        lock_fingerprint(session, fingerprint)
+        source = find_reusable_result(session, TencimResult, user.id, fingerprint)
+
+    if source is not None:
+        reuse_result(result, source)
+    else:
+        check_admission(session, user, tencim_run.name)
+
     session.add(result)
     session.commit()
     session.refresh(result)
 
-    task = tencim_run.delay(
-        result_id=result.id,
-        **payload.model_dump(
-            exclude_unset=True,
-            exclude={"description"},
+    if source is not None:
+        return reused_result_response(result, source)
+
+    task = submit(
+        user.id,
+        tencim_run.signature(
+            kwargs={
+                "result_id": result.id,
+                **payload.model_dump(
+                    exclude_unset=True,
+                    exclude={"description", "force"},
+                ),
+            },
+            queue=select_queue(case.base_file_digest, queue=task_queue(tencim_run.name)),
         ),
     )
 
@@ -160,6 +274,173 @@ def tencim_standalone_run(
     }
 
 
+@router.post("/{case_id}/tencim/sweep", response_model=TencimSweepCreateOut)
+def tencim_sweep_run(
+    session: ActiveSession,
+    case_id: int,
+    payload: TencimSweepCreateIn,
+    user: CurrentUser,
+):
+    """Envia um conjunto de simulações do `tencim` do caso `case_id` para a
+    fila execução, uma para cada combinação de `critical_points` e
+    `rc_limits`.
+
+    Os `critical_points` podem ser uma lista ou um intervalo
+    `{"start": 10, "stop": 100, "step": 10}` (`stop` incluso). O `null` na
+    lista usa o ultimo passo de tempo definido no aquivo base.
+
+    Todos os resultados são criados de uma vez e as tasks são enviadas como
+    um `group` do celery. O progresso pode ser acompanhado em
+    `/{case_id}/tencim/sweeps/{sweep_id}`.
+    """
+
+    case = session.scalar(select(Case).filter(Case.id == case_id, Case.user == user))
+
+    if case is None:
+        raise HTTPException(
+            detail="Case not found.",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    if case.base_file_digest is None:
+        raise HTTPException(
+            detail="The case has no base file.",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    runs = payload.runs()
+
+    check_admission(session, user, tencim_run.name, n_jobs=len(runs))
+
+    sweep = TencimSweep(case=case, description=payload.description)
+    session.add(sweep)
+    session.flush()
+
+    result_ids = session.scalars(
+        insert(TencimResult).returning(TencimResult.id, sort_by_parameter_order=True),
+        [
+            {
+                "case_id": case.id,
+                "sweep_id": sweep.id,
+                "description": payload.description,
+                "status": ResultStatus.CREATED,
+                "fingerprint": tencim_fingerprint(case.base_file_digest, **run),
+                **run,
+            }
+            for run in runs
+        ],
+    ).all()
+    session.commit()
+
+    # As tasks vão para a fila do tencim (`task_routes`) para que todos os
+    # workers livres participem, cada worker extrai o caso apenas uma vez
+    # (cache de casos).
+    group_id = submit_group(
+        user.id,
+        group(tencim_run.si(result_id=result_id, **run) for result_id, run in zip(result_ids, runs)),
+    )
+
+    sweep.task_id = UUID(group_id)
+    session.commit()
+
+    return {
+        "sweep_id": sweep.id,
+        "task_id": group_id,
+        "result_ids": result_ids,
+    }
+
+
+@router.get("/{case_id}/tencim/sweeps/{sweep_id}", response_model=TencimSweepOut)
+def tencim_sweep_retrieve(
+    session: ActiveSession,
+    case_id: int,
+    sweep_id: int,
+    user: CurrentUser,
+):
+    """Retorna o progresso do sweep `sweep_id` do caso `case_id`."""
+
+    sweep = session.scalar(
+        select(TencimSweep)
+        .join(TencimSweep.case)
+        .where(
+            TencimSweep.id == sweep_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+
+    if not sweep:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sweep/Case not found",
+        )
+
+    counts = dict(
+        session.execute(
+            select(TencimResult.status, func.count())
+            .where(TencimResult.sweep_id == sweep.id)
+            .group_by(TencimResult.status)
+        )
+        .tuples()
+        .all()
+    )
+
+    created = counts.get(ResultStatus.CREATED, 0)
+    running = counts.get(ResultStatus.RUNNING, 0)
+
+    return {
+        "id": sweep.id,
+        "task_id": sweep.task_id,
+        "description": sweep.description,
+        "total": sum(counts.values()),
+        "created": created,
+        "running": running,
+        "success": counts.get(ResultStatus.SUCCESS, 0),
+        "failed": counts.get(ResultStatus.FAILED, 0),
+        "done": created + running == 0,
+        "created_at": sweep.created_at,
+    }
+
+
+@router.get("/{case_id}/tencim/results/{result_id}/eta", response_model=ResultEtaOut)
+def tencim_result_eta(
+    session: ActiveSession,
+    case_id: int,
+    result_id: int,
+    user: CurrentUser,
+):
+    """Retorna a previsão do início (`start_at`) e do fim (`finish_at`) da
+    simulação do `tencim`.
+
+    O tempo de cada simulação (`runtime`) é estimado por um modelo ajustado
+    com o histórico das simulações (`history_runs`) a partir do número de
+    passos de tempo e do tamanho da malha. Uma simulação na fila começa
+    depois das `position` simulações na frente dela e do restante das que
+    estão rodando. Para as simulações que já terminaram são retornados os
+    tempos medidos.
+    """
+
+    stmt = (
+        select(TencimResult)
+        .join(TencimResult.case)
+        .options(contains_eager(TencimResult.case))
+        .where(
+            TencimResult.id == result_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+    result = session.scalar(stmt)
+
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    return result_eta(session, "tencim", result)
+
+
 @router.get("/{case_id}/tencim/results/{result_id}/status", response_model=TencimResultStatusOut)
 def tencim_result_status_retrieve(
     session: ActiveSession,
@@ -198,6 +479,61 @@ def tencim_result_status_retrieve(
     return {"status": result.status}
 
 
+def _tencim_result_snapshot(result_id: int) -> list[Event]:
+    with SessionFactory() as session:
+        row = session.execute(
+            select(TencimResult.status, TencimResult.error).where(TencimResult.id == result_id)
+        ).one_or_none()
+
+    if row is None:
+        return []
+
+    data = {"status": row.status.value if row.status else None}
+    if row.error is not None:
+        data["error"] = row.error
+
+    return [("status", data)]
+
+
+@router.get("/{case_id}/tencim/results/{result_id}/events")
+def tencim_result_events(
+    request: Request,
+    session: ActiveSession,
+    case_id: int,
+    result_id: int,
+    user: CurrentUser,
+):
+    """Stream (`Server-Sent Events`) do progresso do resultado do `tencim`.
+
+    Os eventos `status` são enviados a cada mudança do status do resultado,
+    com `error` quando falhar. Primeiro é enviado o status atual e o stream
+    termina quando o status for `success` ou `failed`.
+    """
+
+    stmt = (
+        select(TencimResult.id)
+        .join(TencimResult.case)
+        .where(
+            TencimResult.id == result_id,
+            Case.id == case_id,
+            Case.user_id == user.id,
+        )
+    )
+
+    if session.scalar(stmt) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    return result_events_response(
+        request,
+        kind="tencim",
+        result_id=result_id,
+        snapshot=lambda: _tencim_result_snapshot(result_id),
+    )
+
+
 @router.get("/{case_id}/tencim/results/{result_id}/error", response_model=TencimResultErrorOut)
 def tencim_result_error_retrieve(
     session: ActiveSession,
@@ -228,12 +564,19 @@ def tencim_result_error_retrieve(
 
 @router.get("/{case_id}/tencim/results/{result_id}/csv")
 def tencim_result_retrieve_csv(
+    request: Request,
     session: ActiveSession,
     case_id: int,
     result_id: int,
     user: CurrentUser,
 ):
-    """Retorna download do resultados do Tencim no  formato `CSV`."""
+    """
+    Retorna download do resultados do Tencim no  formato `CSV`.
+
+    O CSV é enviado em blocos de linhas, sem montar o arquivo em memória. Se
+    o cliente aceitar (`Accept-Encoding: gzip`) os blocos são compactados com
+    `gzip` (`Content-Encoding: gzip`).
+    """
 
     result = session.scalar(
         select(TencimResult)
@@ -243,6 +586,12 @@ def tencim_result_retrieve_csv(
             Case.id == case_id,
             Case.user_id == user.id,
         )
+        .options(
+            undefer(TencimResult.istep),
+            undefer(TencimResult.t),
+            undefer(TencimResult.rankine_rc),
+            undefer(TencimResult.mohr_coulomb_rc),
+        )
     )
 
     if not result:
@@ -251,10 +600,96 @@ def tencim_result_retrieve_csv(
             detail="Result/Case not found",
         )
 
-    csv_file = write_rc_result_to_csv(result)
-
     filename = f"{slugify(result.case.tag)}.csv"
-    response = Response(content=csv_file.read(), media_type="text/csv")
-    response.headers["Content-Disposition"] = f"attachment;filename={filename}"
+    headers = {
+        "Content-Disposition": f"attachment;filename={filename}",
+        "Vary": "Accept-Encoding",
+    }
+
+    content = (chunk.encode() for chunk in iter_rc_result_csv(result))
+
+    if accepts_gzip(request.headers.get("accept-encoding")):
+        return StreamingResponse(
+            gzip_chunks(content),
+            media_type="text/csv",
+            headers=headers | {"Content-Encoding": "gzip"},
+        )
+
+    return StreamingResponse(content, media_type="text/csv", headers=headers)
+
+
+@router.get("/{case_id}/tencim/export")
+def tencim_case_export(
+    session: ActiveSession,
+    case_id: int,
+    user: CurrentUser,
+    export_format: Annotated[ExportFormatEnum, Query(alias="format")] = ExportFormatEnum.PARQUET,
+):
+    """
+    Exporta as curvas de `RC` de todos os resultados do caso em um arquivo
+    `parquet` ou `arrow` (IPC), com a coluna `result_id`.
+
+    Info:
+        Depende do `pyarrow`, sem ele a rota retorna `501`.
+    """
+
+    tag = session.scalar(select(Case.tag).where(Case.id == case_id, Case.user_id == user.id))
+
+    if tag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found",
+        )
 
-    return response
+    try:
+        file = export_tencim_results(
+            session,
+            Case.id == case_id,
+            Case.user_id == user.id,
+            export_format=export_format.value,
+        )
+    except ExportDependencyError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e)) from e
+
+    return file_stream_response(
+        file,
+        media_type=MEDIA_TYPES[export_format.value],
+        filename=f"{slugify(tag)}-tencim.{export_format.value}",
+    )
+
+
+@router.get("/{case_id}/tencim/results/{result_id}/export")
+def tencim_result_export(
+    session: ActiveSession,
+    case_id: int,
+    result_id: int,
+    user: CurrentUser,
+    export_format: Annotated[ExportFormatEnum, Query(alias="format")] = ExportFormatEnum.PARQUET,
+):
+    """
+    Exporta as curvas de `RC` do resultado em um arquivo `parquet` ou `arrow` (IPC).
+
+    Info:
+        Depende do `pyarrow`, sem ele a rota retorna `501`.
+    """
+
+    criteria = (TencimResult.id == result_id, Case.id == case_id, Case.user_id == user.id)
+
+    tag = session.scalar(select(Case.tag).join(Case.tencim_results).where(*criteria))
+
+    if tag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Result/Case not found",
+        )
+
+    try:
+        file = export_tencim_results(session, *criteria, export_format=export_format.value)
+    except ExportDependencyError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e)) from e
+
+    return file_stream_response(
+        file,
+        media_type=MEDIA_TYPES[export_format.value],
+        filename=f"{slugify(tag)}-tencim-{result_id}.{export_format.value}",
+    )
@@ -0,0 +1,346 @@
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, TypeVar
+
+import numpy as np
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from confiacim_api.conf import settings
+from confiacim_api.models import Case, FormResult, ResultStatus, RunMetrics, TencimResult
+
+ANALYSIS_FEATURES = {
+    "tencim": ("n_steps", "n_nodes"),
+    "form": ("n_steps", "n_nodes", "n_variables", "iterations"),
+    "monte_carlo": ("n_steps", "n_nodes", "n_variables", "n_samples"),
+}
+
+# Tempo de uma simulação sem histórico
+DEFAULT_RUNTIME_SETTINGS = {
+    "tencim": "ADMISSION_TENCIM_RUNTIME",
+    "form": "ADMISSION_FORM_RUNTIME",
+    "monte_carlo": "ADMISSION_MONTE_CARLO_RUNTIME",
+}
+
+RunResult = TypeVar("RunResult", TencimResult, FormResult)
+
+
+def save_run_metrics(
+    session: Session,
+    analysis: str,
+    result_id: int,
+    phases: dict[str, float],
+    **features: Optional[int],
+):
+    """
+    Salva a duração das etapas e as características de uma simulação.
+
+    Cada etapa pode rodar em um worker diferente, logo as etapas são
+    acumuladas na mesma linha do `RunMetrics`.
+
+    Parameters:
+        session: Secção aberta com o banco
+        analysis: Tipo de análise (`tencim`, `form` ou `monte_carlo`)
+        result_id: ID do resultado (do lote no `monte_carlo`)
+        phases: Duração de cada etapa em segundos
+        features: Características da simulação (`n_steps`, `n_nodes`, ...)
+    """
+    seconds = sum(phases.values())
+
+    session.execute(
+        insert(RunMetrics)
+        .values(
+            analysis=analysis,
+            result_id=result_id,
+            phases={},
+            duration=0.0,
+            started_at=func.localtimestamp() - timedelta(seconds=seconds),
+        )
+        .on_conflict_do_nothing(constraint="analysis_run_metrics")
+    )
+
+    metrics = session.scalar(
+        select(RunMetrics)
+        .where(
+            RunMetrics.analysis == analysis,
+            RunMetrics.result_id == result_id,
+        )
+        .with_for_update()
+    )
+    if metrics is None:
+        return
+
+    metrics.phases = {**metrics.phases, **{name: round(value, 3) for name, value in phases.items()}}
+    metrics.duration = sum(metrics.phases.values())
+    metrics.finished_at = func.localtimestamp()
+    for name, value in features.items():
+        if value is not None:
+            setattr(metrics, name, value)
+
+    session.commit()
+
+
+@dataclass(frozen=True)
+class RuntimeModel:
+    """
+    Modelo do tempo das simulações de uma análise.
+
+    O modelo é uma regressão linear do `log` da duração pelo `log(1 + x)` de
+    cada característica, logo o tempo cresce como uma potência do número de
+    passos, de nós, etc.
+
+    Parameters:
+        analysis: Tipo de análise
+        features: Nomes das características
+        coef: Coeficientes (o primeiro é o intercepto), `None` sem histórico suficiente
+        feature_means: Média do `log(1 + x)` de cada característica
+        default: Tempo usado sem histórico suficiente
+        n_runs: Número de simulações do histórico
+    """
+
+    analysis: str
+    features: tuple[str, ...]
+    coef: Optional[tuple[float, ...]]
+    feature_means: tuple[float, ...]
+    default: float
+    n_runs: int
+
+    def predict(self, **features: Optional[int]) -> float:
+        """
+        Tempo estimado de uma simulação.
+
+        Parameters:
+            features: Características da simulação. As que faltarem (ex: as
+                      `iterations` de um **FORM** que ainda não rodou) usam a
+                      média do histórico.
+
+        Returns:
+            Retorna o tempo em segundos.
+        """
+        if self.coef is None:
+            return self.default
+
+        x = [1.0]
+        for name, mean in zip(self.features, self.feature_means):
+            value = features.get(name)
+            x.append(math.log1p(value) if value is not None else mean)
+
+        return math.exp(sum(c * xi for c, xi in zip(self.coef, x)))
+
+
+def fit_runtime_model(session: Session, analysis: str) -> RuntimeModel:
+    """
+    Ajusta o modelo de tempo com o histórico da análise.
+
+    Usa as últimas `RUNTIME_HISTORY_SIZE` simulações do `RunMetrics`. Com
+    menos simulações que o número de características mais dois, o modelo
+    retorna a média do histórico e, sem histórico, o tempo do `ADMISSION_*_RUNTIME`.
+
+    Parameters:
+        session: Secção aberta com o banco
+        analysis: Tipo de análise (`tencim`, `form` ou `monte_carlo`)
+
+    Returns:
+        Retorna o modelo ajustado.
+    """
+    names = ANALYSIS_FEATURES[analysis]
+
+    rows = session.execute(
+        select(RunMetrics.duration, *(getattr(RunMetrics, name) for name in names))
+        .where(
+            RunMetrics.analysis == analysis,
+            RunMetrics.duration > 0,
+            RunMetrics.finished_at.is_not(None),
+        )
+        .order_by(RunMetrics.finished_at.desc())
+        .limit(settings.RUNTIME_HISTORY_SIZE)
+    ).all()
+
+    default = float(getattr(settings, DEFAULT_RUNTIME_SETTINGS[analysis]))
+
+    if not rows:
+        return RuntimeModel(analysis, names, None, (0.0,) * len(names), default, 0)
+
+    data = np.array([[np.nan if v is None else v for v in row] for row in rows], dtype=float)
+    y = np.log(data[:, 0])
+    X = np.log1p(data[:, 1:])
+
+    # Características sem valor usam a média das que têm
+    means = np.array([np.nanmean(col) if not np.isnan(col).all() else 0.0 for col in X.T])
+    X = np.where(np.isnan(X), means, X)
+
+    feature_means = tuple(means.tolist())
+    mean_runtime = float(np.exp(y.mean()))
+
+    if len(rows) < len(names) + 2:
+        return RuntimeModel(analysis, names, None, feature_means, mean_runtime, len(rows))
+
+    A = np.column_stack([np.ones(len(rows)), X])
+    coef, *_ = np.linalg.lstsq(A, y, rcond=None)
+
+    return RuntimeModel(analysis, names, tuple(coef.tolist()), feature_means, mean_runtime, len(rows))
+
+
+def result_features(analysis: str, result: TencimResult | FormResult, case: Case) -> dict[str, Optional[int]]:
+    """
+    Características de uma simulação conhecidas antes dela rodar.
+
+    Parameters:
+        analysis: Tipo de análise (`tencim` ou `form`)
+        result: Resultado
+        case: Caso do resultado
+
+    Returns:
+        Retorna o `n_steps` (limitado pelo `critical_point`), o `n_nodes` e,
+        no **FORM**, o `n_variables`.
+    """
+    n_steps = case.n_steps
+    if result.critical_point and (n_steps is None or result.critical_point < n_steps):
+        n_steps = result.critical_point
+
+    features: dict[str, Optional[int]] = {"n_steps": n_steps, "n_nodes": case.n_nodes}
+
+    if isinstance(result, FormResult):
+        features["n_variables"] = len((result.config or {}).get("variables", []))
+
+    return features
+
+
+def _feature_columns(Result: type[RunResult]) -> dict:
+    """Mesmas características do `result_features` calculadas no banco."""
+    n_steps = case(
+        (
+            and_(
+                Result.critical_point != 0,
+                or_(Case.n_steps.is_(None), Result.critical_point < Case.n_steps),
+            ),
+            Result.critical_point,
+        ),
+        else_=Case.n_steps,
+    )
+
+    columns = {"n_steps": n_steps, "n_nodes": Case.n_nodes}
+
+    if Result is FormResult:
+        columns["n_variables"] = func.coalesce(func.json_array_length(FormResult.config["variables"]), 0)
+
+    return columns
+
+
+def result_eta(session: Session, analysis: str, result: RunResult) -> dict:
+    """
+    Previsão do início e do fim de uma simulação.
+
+    Uma simulação na fila (`CREATED`) começa quando as simulações da mesma
+    análise na frente dela (criadas antes e ainda na fila, de qualquer
+    usuário) e o restante das que estão rodando terminarem, divididas entre
+    os `ADMISSION_WORKERS`. Os resultados reaproveitados e ligados a outro
+    resultado não contam, assim como os que estão na fila há mais de
+    `ETA_MAX_QUEUE_AGE` segundos (perdidos).
+
+    As simulações na frente são agrupadas no banco pelas características,
+    logo o modelo é avaliado uma vez por grupo.
+
+    Parameters:
+        session: Secção aberta com o banco
+        analysis: Tipo de análise (`tencim` ou `form`)
+        result: Resultado com o caso carregado
+
+    Returns:
+        Retorna o `status`, a `position` na fila, o tempo estimado (`runtime`)
+        e a previsão do início (`start_at`) e do fim (`finish_at`). Para as
+        simulações que já terminaram são os tempos medidos.
+    """
+    model = fit_runtime_model(session, analysis)
+    runtime = model.predict(**result_features(analysis, result, result.case))
+
+    now: datetime = session.execute(select(func.localtimestamp())).scalar_one()
+
+    metrics = session.scalar(
+        select(RunMetrics).where(
+            RunMetrics.analysis == analysis,
+            RunMetrics.result_id == result.id,
+        )
+    )
+
+    eta = {
+        "result_id": result.id,
+        "status": result.status,
+        "position": 0,
+        "runtime": runtime,
+        "history_runs": model.n_runs,
+    }
+
+    if result.status in (ResultStatus.SUCCESS, ResultStatus.FAILED):
+        if metrics is not None:
+            eta["runtime"] = metrics.duration
+        return eta | {
+            "start_at": metrics.started_at if metrics else result.created_at,
+            "finish_at": metrics.finished_at if metrics else result.updated_at,
+        }
+
+    if result.status == ResultStatus.RUNNING:
+        start_at = metrics.started_at if metrics and metrics.started_at else result.updated_at
+        return eta | {
+            "start_at": start_at,
+            "finish_at": max(start_at + timedelta(seconds=runtime), now) if start_at else None,
+        }
+
+    Result = type(result)
+
+    features = _feature_columns(Result)
+    running = Result.status == ResultStatus.RUNNING
+    started_at = func.coalesce(RunMetrics.started_at, Result.updated_at)
+
+    ahead = (
+        select(
+            *(column.label(name) for name, column in features.items()),
+            running.label("running"),
+            func.extract("epoch", now - started_at).label("elapsed"),
+        )
+        .join(Result.case)
+        .outerjoin(
+            RunMetrics,
+            and_(RunMetrics.analysis == analysis, RunMetrics.result_id == Result.id),
+        )
+        .where(
+            Result.source_result_id.is_(None),
+            or_(
+                running,
+                and_(
+                    Result.status == ResultStatus.CREATED,
+                    Result.id < result.id,
+                    Result.created_at >= now - timedelta(seconds=settings.ETA_MAX_QUEUE_AGE),
+                ),
+            ),
+        )
+        .subquery()
+    )
+
+    feature_columns = [ahead.c[name] for name in features]
+
+    groups = session.execute(
+        select(
+            *feature_columns,
+            func.count().filter(~ahead.c.running).label("queued"),
+            func.array_agg(ahead.c.elapsed).filter(ahead.c.running).label("elapsed"),
+        ).group_by(*feature_columns)
+    ).all()
+
+    backlog, position = 0.0, 0
+    for group in groups:
+        other_runtime = model.predict(**{name: group._mapping[name] for name in features})
+        backlog += group.queued * other_runtime
+        for elapsed in group.elapsed or ():
+            backlog += max(other_runtime - float(elapsed or 0.0), 0.0)
+        position += group.queued
+
+    start_at = now + timedelta(seconds=backlog / max(settings.ADMISSION_WORKERS, 1))
+
+    return eta | {
+        "position": position,
+        "start_at": start_at,
+        "finish_at": start_at + timedelta(seconds=runtime),
+    }
@@ -1,7 +1,11 @@
 from confiacim_api.schemes.base import (
+    DecimationQuery,
+    DownsampleEnum,
+    ExportFormatEnum,
     HealthOut,
     Message,
     ResultCeleryTaskOut,
+    ResultEtaOut,
     Token,
     VersionOut,
 )
@@ -17,20 +21,38 @@ from confiacim_api.schemes.form import (
     FormConfigCreateIn,
     FormResultDetailOut,
     FormResultErrorOut,
+    FormResultGroupCreateIn,
+    FormResultGroupCreateOut,
+    FormResultGroupOut,
+    FormResultGroupPointOut,
     FormResultStatusOut,
     FormResultSummaryOut,
     FormVariables,
     RandomDistribution,
 )
+from confiacim_api.schemes.monte_carlo import (
+    MonteCarloConfigCreateIn,
+    MonteCarloEstimateOut,
+    MonteCarloResultDetailOut,
+    MonteCarloResultSummaryOut,
+)
 from confiacim_api.schemes.tencim import (
     TencimCreateRunIn,
     TencimResultDetailOut,
     TencimResultErrorOut,
+    TencimResultListOut,
+    TencimResultListQuery,
+    TencimResultOrderEnum,
     TencimResultStatusOut,
     TencimResultSummaryOut,
+    TencimSweepCreateIn,
+    TencimSweepCreateOut,
+    TencimSweepOut,
 )
 from confiacim_api.schemes.users import (
     UserCreateIn,
+    UserFairShareOut,
+    UserFairSharePatch,
     UserOut,
 )
 from confiacim_api.schemes.variable_group import (
@@ -44,7 +66,11 @@ __all__ = (
     "Message",
     "Token",
     "ResultCeleryTaskOut",
+    "ResultEtaOut",
     "VersionOut",
+    "DecimationQuery",
+    "DownsampleEnum",
+    "ExportFormatEnum",
     "CaseCreateIn",
     "CaseCreateOut",
     "CaseOut",
@@ -56,15 +82,31 @@ __all__ = (
     "TencimResultSummaryOut",
     "TencimCreateRunIn",
     "TencimResultErrorOut",
+    "TencimResultListOut",
+    "TencimResultListQuery",
+    "TencimResultOrderEnum",
+    "TencimSweepCreateIn",
+    "TencimSweepCreateOut",
+    "TencimSweepOut",
     "UserOut",
     "UserCreateIn",
+    "UserFairShareOut",
+    "UserFairSharePatch",
     "FormConfigCreateIn",
     "FormResultDetailOut",
     "FormResultSummaryOut",
     "FormResultErrorOut",
     "FormResultStatusOut",
+    "FormResultGroupCreateIn",
+    "FormResultGroupCreateOut",
+    "FormResultGroupOut",
+    "FormResultGroupPointOut",
     "FormVariables",
     "RandomDistribution",
+    "MonteCarloConfigCreateIn",
+    "MonteCarloEstimateOut",
+    "MonteCarloResultDetailOut",
+    "MonteCarloResultSummaryOut",
     "VariableGroupOut",
     "VariableGroupIn",
     "VariableGroupPatch",
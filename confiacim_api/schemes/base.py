@@ -1,7 +1,11 @@
+from datetime import datetime
+from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt
+
+from confiacim_api.models import ResultStatus
 
 
 class HealthOut(BaseModel):
@@ -19,7 +23,35 @@ class Token(BaseModel):
 
 class ResultCeleryTaskOut(BaseModel):
     result_id: int
-    task_id: UUID
+    task_id: Optional[UUID] = None
+    cached: bool = False
+    coalesced: bool = False
+
+
+class ResultEtaOut(BaseModel):
+    result_id: int
+    status: Optional[ResultStatus]
+    position: int
+    runtime: float
+    history_runs: int
+    start_at: Optional[datetime] = None
+    finish_at: Optional[datetime] = None
+
+
+class DownsampleEnum(str, Enum):
+    LTTB = "lttb"
+    MINMAX = "minmax"
+
+
+class ExportFormatEnum(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+class DecimationQuery(BaseModel):
+    max_points: Optional[int] = Field(default=None, ge=3)
+    stride: Optional[PositiveInt] = None
+    downsample: DownsampleEnum = DownsampleEnum.LTTB
 
 
 class VersionOut(BaseModel):
@@ -3,9 +3,11 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, Field, PositiveInt, model_validator
 
+from confiacim_api.constants import MAX_FORM_GROUP_POINTS
 from confiacim_api.models import ResultStatus
+from confiacim_api.schemes.tencim import CriticalPointRange
 
 
 class FormVariablesEnum(str, Enum):
@@ -69,6 +71,64 @@ class FormConfigCreateIn(BaseModel):
     form: FormConfig = Field(examples=[FORM_CONFIG_EXAMPLE])
     critical_point: PositiveInt
     description: Optional[str] = None
+    force: bool = False
+    warm_start_from: Optional[PositiveInt] = None
+
+
+class FormResultGroupCreateIn(BaseModel):
+    form: FormConfig = Field(examples=[FORM_CONFIG_EXAMPLE])
+    critical_points: list[PositiveInt] | CriticalPointRange = Field(
+        examples=[[10, 20, 30], {"start": 10, "stop": 100, "step": 10}],
+    )
+    description: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_number_of_points(self):
+        # O intervalo é contado sem montar a lista, ele pode ser enorme
+        if isinstance(self.critical_points, CriticalPointRange):
+            n_points = self.critical_points.n_values()
+        else:
+            n_points = len(set(self.critical_points))
+        if n_points == 0:
+            raise ValueError("The group must have at least one critical point.")
+        if n_points > MAX_FORM_GROUP_POINTS:
+            raise ValueError(f"The group has {n_points} critical points, the maximum is {MAX_FORM_GROUP_POINTS}.")
+        return self
+
+    def critical_point_values(self) -> list[int]:
+        if isinstance(self.critical_points, CriticalPointRange):
+            return [cp for cp in self.critical_points.values() if cp is not None]
+        return sorted(set(self.critical_points))
+
+
+class FormResultGroupCreateOut(BaseModel):
+    group_id: int
+    task_id: UUID
+    result_ids: list[int]
+
+
+class FormResultGroupPointOut(BaseModel):
+    result_id: int
+    critical_point: int
+    status: ResultStatus
+    beta: Optional[float] = None
+    Pf: Optional[float] = None
+
+
+class FormResultGroupOut(BaseModel):
+    id: int
+    task_id: Optional[UUID] = None
+    description: Optional[str] = None
+    config: Optional[dict] = None
+    error: Optional[str] = None
+    total: int
+    created: int
+    running: int
+    success: int
+    failed: int
+    done: bool
+    points: list[FormResultGroupPointOut]
+    created_at: datetime
 
 
 class FormResultDetailOut(BaseModel):
@@ -84,6 +144,10 @@ class FormResultDetailOut(BaseModel):
     variables_stats: Optional[dict] = None
     iteration_infos: Optional[dict] = None
     description: Optional[str] = None
+    source_result_id: Optional[int] = None
+    group_id: Optional[int] = None
+    warm_start_from_id: Optional[int] = None
+    initial_point: Optional[dict] = None
     status: ResultStatus
     created_at: datetime
     updated_at: datetime
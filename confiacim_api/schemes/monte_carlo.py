@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+
+from confiacim_api.constants import MAX_MONTE_CARLO_CHUNK_SIZE, MAX_MONTE_CARLO_SAMPLES
+from confiacim_api.models import ResultStatus
+from confiacim_api.schemes.form import FORM_CONFIG_EXAMPLE, FormConfig
+
+
+class MonteCarloConfigCreateIn(BaseModel):
+    monte_carlo: FormConfig = Field(examples=[FORM_CONFIG_EXAMPLE])
+    critical_point: PositiveInt
+    n_samples: PositiveInt = Field(default=10_000, le=MAX_MONTE_CARLO_SAMPLES)
+    chunk_size: PositiveInt = Field(default=100, le=MAX_MONTE_CARLO_CHUNK_SIZE)
+    seed: Optional[NonNegativeInt] = None
+    description: Optional[str] = None
+
+
+class MonteCarloResultDetailOut(BaseModel):
+    id: int
+    task_id: Optional[UUID] = None
+    critical_point: Optional[PositiveInt] = None
+    n_samples: int
+    chunk_size: int
+    seed: int
+    chunks_total: int
+    chunks_done: int
+    total: int
+    valid_simulations: int
+    fail: int
+    Pf: Optional[float] = None
+    estimator: Optional[float] = None
+    Pf_lower: Optional[float] = None
+    Pf_upper: Optional[float] = None
+    error: Optional[str] = None
+    config: Optional[dict] = None
+    description: Optional[str] = None
+    status: ResultStatus
+    created_at: datetime
+    updated_at: datetime
+
+
+class MonteCarloResultSummaryOut(BaseModel):
+    id: int
+    task_id: Optional[UUID] = None
+    status: Optional[ResultStatus] = None
+    description: Optional[str] = None
+    critical_point: Optional[int] = None
+    n_samples: int
+    chunks_total: int
+    chunks_done: int
+    Pf: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class MonteCarloEstimateOut(BaseModel):
+    chunks_done: int
+    total: int
+    valid_simulations: int
+    fail: int
+    Pf: Optional[float] = None
+    estimator: Optional[float] = None
+    Pf_lower: Optional[float] = None
+    Pf_upper: Optional[float] = None
+    finished_at: datetime
@@ -1,9 +1,12 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, PositiveInt
+import numpy as np
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt, field_validator, model_validator
 
+from confiacim_api.constants import MAX_SWEEP_RUNS
 from confiacim_api.models import ResultStatus
 from confiacim_api.types import TArrayFloat, TArrayInt
 
@@ -17,6 +20,58 @@ class TencimResultSummaryOut(BaseModel):
     updated_at: datetime
 
 
+class TencimResultListOut(TencimResultSummaryOut):
+    rc_threshold: Optional[float] = None
+    rankine_rc_min: Optional[float] = None
+    rankine_rc_max: Optional[float] = None
+    rankine_rc_mean: Optional[float] = None
+    rankine_rc_min_istep: Optional[int] = None
+    rankine_rc_min_t: Optional[float] = None
+    rankine_rc_steps_below: Optional[int] = None
+    mohr_coulomb_rc_min: Optional[float] = None
+    mohr_coulomb_rc_max: Optional[float] = None
+    mohr_coulomb_rc_mean: Optional[float] = None
+    mohr_coulomb_rc_min_istep: Optional[int] = None
+    mohr_coulomb_rc_min_t: Optional[float] = None
+    mohr_coulomb_rc_steps_below: Optional[int] = None
+
+
+class TencimResultOrderEnum(str, Enum):
+    CREATED_AT = "created_at"
+    RANKINE_RC_MIN = "rankine_rc_min"
+    RANKINE_RC_MAX = "rankine_rc_max"
+    RANKINE_RC_MEAN = "rankine_rc_mean"
+    RANKINE_RC_MIN_T = "rankine_rc_min_t"
+    RANKINE_RC_STEPS_BELOW = "rankine_rc_steps_below"
+    MOHR_COULOMB_RC_MIN = "mohr_coulomb_rc_min"
+    MOHR_COULOMB_RC_MAX = "mohr_coulomb_rc_max"
+    MOHR_COULOMB_RC_MEAN = "mohr_coulomb_rc_mean"
+    MOHR_COULOMB_RC_MIN_T = "mohr_coulomb_rc_min_t"
+    MOHR_COULOMB_RC_STEPS_BELOW = "mohr_coulomb_rc_steps_below"
+
+
+class TencimResultListQuery(BaseModel):
+    sweep_id: Optional[int] = None
+    order_by: Optional[TencimResultOrderEnum] = None
+    desc: bool = False
+    rankine_rc_min_lte: Optional[float] = None
+    rankine_rc_min_gte: Optional[float] = None
+    mohr_coulomb_rc_min_lte: Optional[float] = None
+    mohr_coulomb_rc_min_gte: Optional[float] = None
+    rankine_rc_min_t_lte: Optional[float] = None
+    mohr_coulomb_rc_min_t_lte: Optional[float] = None
+    rankine_rc_steps_below_gte: Optional[NonNegativeInt] = None
+    mohr_coulomb_rc_steps_below_gte: Optional[NonNegativeInt] = None
+
+    def filters(self) -> list[tuple[str, str, float]]:
+        """Filtros informados no formato `(coluna, operador, valor)`."""
+        filters = []
+        for name, value in self.model_dump(exclude={"sweep_id", "order_by", "desc"}, exclude_none=True).items():
+            column, op = name.rsplit("_", 1)
+            filters.append((column, op, value))
+        return filters
+
+
 class TencimResultDetailOut(BaseModel):
     id: int
     task_id: Optional[UUID] = None
@@ -27,11 +82,20 @@ class TencimResultDetailOut(BaseModel):
     critical_point: Optional[PositiveInt] = None
     rc_limit: Optional[bool] = None
     description: Optional[str] = None
+    source_result_id: Optional[int] = None
     error: Optional[str] = None
     status: ResultStatus
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("istep", "t", "rankine_rc", "mohr_coulomb_rc", mode="before")
+    @classmethod
+    def array_to_list(cls, value):
+        # Converte os valores do `numpy` de uma só vez
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return value
+
 
 class TencimResultStatusOut(BaseModel):
     status: ResultStatus
@@ -45,3 +109,80 @@ class TencimCreateRunIn(BaseModel):
     rc_limit: bool = False
     critical_point: Optional[PositiveInt] = None
     description: Optional[str] = None
+    force: bool = False
+
+
+class CriticalPointRange(BaseModel):
+    start: PositiveInt
+    stop: PositiveInt
+    step: PositiveInt = 1
+
+    def n_values(self) -> int:
+        """
+        Número de passos, sem montar a lista.
+
+        Raises:
+            ValueError: `start` maior que o `stop`.
+        """
+        if self.start > self.stop:
+            raise ValueError(f"The range start ({self.start}) must be less than or equal to the stop ({self.stop}).")
+        return len(range(self.start, self.stop + 1, self.step))
+
+    def values(self) -> list[Optional[int]]:
+        """Passos de `start` até `stop` (inclusive)."""
+        return list(range(self.start, self.stop + 1, self.step))
+
+
+class TencimSweepCreateIn(BaseModel):
+    critical_points: list[Optional[PositiveInt]] | CriticalPointRange = Field(
+        default=[None],
+        examples=[[10, 20, 30], {"start": 10, "stop": 100, "step": 10}],
+    )
+    rc_limits: list[bool] = Field(default=[False], min_length=1)
+    description: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_number_of_runs(self):
+        # O intervalo é contado sem montar a lista, ele pode ser enorme
+        if isinstance(self.critical_points, CriticalPointRange):
+            n_points = self.critical_points.n_values()
+        else:
+            n_points = len(set(self.critical_points))
+        n_runs = n_points * len(set(self.rc_limits))
+        if n_runs == 0:
+            raise ValueError("The sweep must have at least one run.")
+        if n_runs > MAX_SWEEP_RUNS:
+            raise ValueError(f"The sweep has {n_runs} runs, the maximum is {MAX_SWEEP_RUNS}.")
+        return self
+
+    def critical_point_values(self) -> list[Optional[int]]:
+        if isinstance(self.critical_points, CriticalPointRange):
+            return self.critical_points.values()
+        return list(dict.fromkeys(self.critical_points))
+
+    def runs(self) -> list[dict]:
+        """Combinações de `critical_point` e `rc_limit` do sweep."""
+        return [
+            {"critical_point": critical_point, "rc_limit": rc_limit}
+            for critical_point in self.critical_point_values()
+            for rc_limit in dict.fromkeys(self.rc_limits)
+        ]
+
+
+class TencimSweepCreateOut(BaseModel):
+    sweep_id: int
+    task_id: UUID
+    result_ids: list[int]
+
+
+class TencimSweepOut(BaseModel):
+    id: int
+    task_id: Optional[UUID] = None
+    description: Optional[str] = None
+    total: int
+    created: int
+    running: int
+    success: int
+    failed: int
+    done: bool
+    created_at: datetime
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from typing import Optional
+
+from pydantic import BaseModel, EmailStr, NonNegativeInt
 
 
 class UserOut(BaseModel):
@@ -9,3 +11,17 @@ class UserOut(BaseModel):
 class UserCreateIn(BaseModel):
     email: EmailStr
     password: str
+
+
+class UserFairShareOut(BaseModel):
+    id: int
+    email: EmailStr
+    max_running_jobs: Optional[int]
+    max_queue_depth: Optional[int]
+    running: int
+    pending: int
+
+
+class UserFairSharePatch(BaseModel):
+    max_running_jobs: Optional[NonNegativeInt] = None
+    max_queue_depth: Optional[NonNegativeInt] = None
@@ -1,5 +1,8 @@
+from typing import Iterable, Optional
+
 from sqlalchemy import distinct, func, select
 
+from confiacim_api.affinity import queue_depth
 from confiacim_api.database import Session
 from confiacim_api.models import FormResult, ResultStatus, TencimResult
 
@@ -20,6 +23,21 @@ def count_tasks(celery_workers: dict[str, list] | None) -> int:
     return sum(len(tasks) for tasks in celery_workers.values())
 
 
+def queues_depth(queues: Iterable[str]) -> dict[str, Optional[int]]:
+    """
+    Número de mensagens esperando em cada fila
+
+    Parameters:
+        queues: Nomes das filas
+
+    Returns:
+        Dicionario com a fila e o número de mensagens (`None` se o broker não
+        responder)
+    """
+
+    return {queue: queue_depth(queue) for queue in queues}
+
+
 def count_case_with_simulation_success(session: Session) -> int:
     """
     Soma o número de casos com pelo menos um simulação com status sucesso. Não
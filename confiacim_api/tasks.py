@@ -1,7 +1,13 @@
 import json
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter, time
+from typing import Optional
+from uuid import UUID
 
 import yaml
+from celery import Signature, chain, chord, group
+from celery.result import AsyncResult
 from confiacim.controllers.form import run as run_form_core
 from confiacim.controllers.tencim import run as run_tencim_core
 from confiacim.erros import (
@@ -14,36 +20,107 @@ from confiacim.erros import (
     TencimRunError,
     VariableTemplateError,
 )
+from confiacim.form.correlations import generate_correlation_matrix
+from confiacim.monte_carlo.core import failure_probability_from_rcs
+from confiacim.monte_carlo.model import MonteCarloResult as CoreMonteCarloResult
+from confiacim.samples import Sample, SamplesGeneratorMonteCarlo
 from confiacim.simulation_config import (
     JsonIndentValueError,
     RCCriteriaInvalidOptionError,
     ResultFilesInvalidOptionError,
+    load_config,
 )
+from confiacim.tencim import run_samples_iteration_i
+from confiacim.tencim.rc import RCCriteria
 from confiacim.tencim.results import read_rc_file
+from confiacim.tencim.runner import TencimRunner, TencimRunnerByPassFailure
 from confiacim.variables.weibull_params import NoConvergenceWeibullParams
-from sqlalchemy import select
-from sqlalchemy.orm import defer, joinedload
+from scipy.linalg import cholesky
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, defer, joinedload
 
+from confiacim_api.affinity import io_queue
 from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
 from confiacim_api.database import SessionFactory
 from confiacim_api.dist_params_conversor import convert_variable_web_to_core
 from confiacim_api.errors import ResultNotFound, TaskFileCaseNotFound
+from confiacim_api.events import (
+    IterationLogWatcher,
+    estimate_event,
+    iteration_event,
+    publish_result_event,
+    publish_status,
+)
+from confiacim_api.fair_share import release, submit, submit_group
 from confiacim_api.files_and_folders_handlers import (
     clean_temporary_simulation_folder,
+    extract_case_dat_infos,
+    extract_form_generated_case,
+    extract_tencim_case,
+    new_time_loop,
+    replace_file_content,
     rewrite_case_file,
     save_generated_form_files,
     temporary_simulation_folder,
-    unzip_tencim_case,
+)
+from confiacim_api.form_distributed import (
+    FormState,
+    form_initial_state,
+    form_iteration,
+    form_samples,
 )
 from confiacim_api.generate_templates_form import generate_templates
 from confiacim_api.logger import logger
-from confiacim_api.models import Case, FormResult, ResultStatus, TencimResult
+from confiacim_api.models import (
+    Case,
+    FormResult,
+    FormResultGroup,
+    MonteCarloChunk,
+    MonteCarloResult,
+    ResultStatus,
+    TencimResult,
+)
+from confiacim_api.monte_carlo import (
+    MonteCarloEstimate,
+    monte_carlo_estimate,
+    spawn_seeds,
+)
+from confiacim_api.rc_summary import apply_rc_summary
+from confiacim_api.result_reuse import update_attached_results
+from confiacim_api.runtime_model import save_run_metrics
+from confiacim_api.warm_start import apply_initial_point
 
 
 def get_simulation_base_dir(user_id: int) -> Path:
     return Path.cwd() / "simulation_tmp_dir" / f"user_{user_id}"
 
 
+def _case_dat_features(base_folder: Path) -> dict[str, Optional[int]]:
+    infos = extract_case_dat_infos((base_folder / "case.dat").read_text(encoding="utf-8"))
+    return {"n_steps": infos.n_steps, "n_nodes": infos.n_nodes}
+
+
+def _save_run_metrics(analysis: str, result_id: int, phases: dict[str, float], **features: Optional[int]):
+    # As métricas não podem derrubar a simulação
+    try:
+        with SessionFactory() as session:
+            save_run_metrics(session, analysis, result_id, phases, **features)
+    except Exception as e:
+        logger.warning(f"Run metrics of {analysis} {result_id} not saved: {e}")
+
+
+def _tencim_result_failed(result_id: int, result: TencimResult, error: Exception):
+    result.error = str(error)
+    result.status = ResultStatus.FAILED
+    with SessionFactory() as session:
+        session.add(result)
+        attached_ids = update_attached_results(session, result)
+        session.commit()
+    for id_ in (result_id, *attached_ids):
+        publish_status("tencim", id_, ResultStatus.FAILED, str(error))
+
+
 @celery_app.task(bind=True, ignore_result=True)
 def tencim_standalone_run(self, result_id: int, **options):
 
@@ -54,7 +131,7 @@ def tencim_standalone_run(self, result_id: int, **options):
             select(TencimResult)
             .where(TencimResult.id == result_id)
             .options(
-                joinedload(TencimResult.case, innerjoin=True).load_only(Case.user_id, Case.base_file),
+                joinedload(TencimResult.case, innerjoin=True).load_only(Case.user_id, Case.base_file_digest),
             )
         )
         result = session.scalar(stmt)
@@ -62,7 +139,7 @@ def tencim_standalone_run(self, result_id: int, **options):
     if result is None:
         raise ResultNotFound("Result not found.")
 
-    if result.case.base_file is None:
+    if result.case.base_file_digest is None:
         raise TaskFileCaseNotFound("The case has no base file.")
 
     base_dir = get_simulation_base_dir(result.case.user_id)
@@ -71,32 +148,49 @@ def tencim_standalone_run(self, result_id: int, **options):
         base_dir.mkdir(parents=True)
 
     logger.info(f"Task {task_id} - Extracting case files ...")
+    start = perf_counter()
     tmp_dir = temporary_simulation_folder(base_dir)
-    unzip_tencim_case(result.case, tmp_dir)
-    logger.info(f"Task {task_id} - Extract.")
-    logger.info(f"Task {task_id} - Writing case file ...")
-    rewrite_case_file(task_id=task_id, case_path=Path(tmp_dir.name) / "case.dat", **options)
-    logger.info(f"Task {task_id} - Write.")
+    try:
+        with SessionFactory() as session:
+            session.add(result)
+            cache_hit = extract_tencim_case(result.case, tmp_dir)
+        logger.info(f"Task {task_id} - Extract (cache hit: {cache_hit}).")
+        logger.info(f"Task {task_id} - Writing case file ...")
+        rewrite_case_file(task_id=task_id, case_path=Path(tmp_dir.name) / "case.dat", **options)
+        logger.info(f"Task {task_id} - Write.")
+    except Exception as e:
+        logger.warning(f"Task {task_id} - Generic error.")
+        _tencim_result_failed(result_id, result, e)
+        clean_temporary_simulation_folder(tmp_dir)
+        raise e
 
     input_base_dir = Path(tmp_dir.name)
+    features = _case_dat_features(input_base_dir)
+    phases = {"prepare": perf_counter() - start}
 
     with SessionFactory() as session:
         result.task_id = self.request.id
         result.status = ResultStatus.RUNNING
         session.add(result)
+        attached_ids = update_attached_results(session, result)
         session.commit()
         session.refresh(result)
+    for id_ in (result_id, *attached_ids):
+        publish_status("tencim", id_, ResultStatus.RUNNING)
 
     try:
         logger.info(f"Task {task_id} - Running task ...")
+        start = perf_counter()
         run_tencim_core(input_dir=input_base_dir, output_dir=None, verbose_level=0)
 
         result_tencim = read_rc_file(input_base_dir / "output/case_RC.txt")
+        phases["solve"] = perf_counter() - start
 
-        result.istep = result_tencim.istep.tolist()
-        result.t = result_tencim.t.tolist()
-        result.rankine_rc = result_tencim.rc_rankine.tolist()
-        result.mohr_coulomb_rc = result_tencim.rc_mohr_coulomb.tolist()
+        result.istep = result_tencim.istep
+        result.t = result_tencim.t
+        result.rankine_rc = result_tencim.rc_rankine
+        result.mohr_coulomb_rc = result_tencim.rc_mohr_coulomb
+        apply_rc_summary(result, settings.RC_SUMMARY_THRESHOLD)
         result.status = ResultStatus.SUCCESS
         logger.info(f"Task {task_id} - Analysis completed.")
 
@@ -115,25 +209,79 @@ def tencim_standalone_run(self, result_id: int, **options):
     finally:
         with SessionFactory() as session:
             session.add(result)
+            attached_ids = update_attached_results(session, result)
             session.commit()
             session.refresh(result)
+        for id_ in (result_id, *attached_ids):
+            publish_status("tencim", id_, result.status, result.error)
 
         logger.debug(f"Task {task_id} - Cleaning up the temporary directory...")
         clean_temporary_simulation_folder(tmp_dir)
         logger.debug(f"Task {task_id} - Cleaned temporary directory.")
 
+    _save_run_metrics("tencim", result_id, phases, **features)
 
-@celery_app.task(bind=True, ignore_result=True)
-def form_run(self, result_id: int):
 
-    task_id = self.request.id
+def prepare_reliability_case(
+    task_id: UUID,
+    result: FormResult | MonteCarloResult | FormResultGroup,
+    tmp_dir: TemporaryDirectory,
+) -> Path:
+    """
+    Monta o diretório de uma simulação **FORM** ou **Monte Carlo**.
+
+    Extrai o caso, reescreve o `case.dat`, gera os templates e o `case.yml`.
+
+    Parameters:
+        task_id: ID da task do celery
+        result: Resultado com o caso carregado. Com um `FormResultGroup` o
+                `case.dat` não é truncado.
+        tmp_dir: Diretório temporário da simulação
+
+    Returns:
+        Retorna o caminho do diretório.
+    """
+    base_folder = Path(tmp_dir.name)
+
+    logger.info(f"Task {task_id} - Extracting case files ...")
+    with SessionFactory() as session:
+        session.add(result)
+        cache_hit = extract_tencim_case(result.case, tmp_dir)
+    logger.info(f"Task {task_id} - Extract (cache hit: {cache_hit}).")
+
+    logger.info(f"Task {task_id} - Writing case file ...")
+    rewrite_case_file(
+        task_id=task_id,
+        case_path=base_folder / "case.dat",
+        setpnode_and_setptime=True,
+        critical_point=None if isinstance(result, FormResultGroup) else result.critical_point,
+    )
+    logger.info(f"Task {task_id} - Write.")
+
+    logger.info(f"Task {task_id} - Writing templates ...")
+    generate_templates(task_id, base_folder, result.config)
+    logger.info(f"Task {task_id} - Write.")
 
+    logger.info(f"Task {task_id} - Create case.yml ...")
+    with open(base_folder / "case.yml", "w", encoding="utf-8") as yaml_file:
+        varibales_form_core = convert_variable_web_to_core(result.config["variables"])
+        if isinstance(result, FormResult) and result.initial_point:
+            varibales_form_core = apply_initial_point(varibales_form_core, result.initial_point)
+        new_config = result.config.copy()
+        new_config["variables"] = varibales_form_core
+        yaml.dump(new_config, yaml_file, encoding="utf-8")
+    logger.info(f"Task {task_id} - Create.")
+
+    return base_folder
+
+
+def _select_form_result(result_id: int) -> FormResult:
     with SessionFactory() as session:
         stmt = (
             select(FormResult)
             .where(FormResult.id == result_id)
             .options(
-                joinedload(FormResult.case, innerjoin=True).load_only(Case.user_id, Case.base_file),
+                joinedload(FormResult.case, innerjoin=True).load_only(Case.user_id, Case.base_file_digest),
                 defer(FormResult.created_at),
                 defer(FormResult.updated_at),
             )
@@ -143,82 +291,383 @@ def form_run(self, result_id: int):
     if result is None:
         raise ResultNotFound("Result not found.")
 
-    if result.case.base_file is None:
+    if result.case.base_file_digest is None:
         raise TaskFileCaseNotFound("The case has no base file.")
 
-    base_dir = get_simulation_base_dir(result.case.user_id)
+    return result
+
+
+@celery_app.task(bind=True)
+def form_sample_run(
+    self,
+    case: dict,
+    sample_name: str,
+    averages: dict[str, float],
+    iteration: int,
+) -> Optional[dict[str, float]]:
+    """
+    Roda a simulação do `tencim` de uma amostra do **FORM** distribuido.
+
+    O caso é montado a partir dos arquivos gerados no `form_prepare`
+    (`generated_case_files_digest`) com o cache de casos extraidos do worker,
+    sem refazer o preparo. A amostra é executada pelo `run_samples_iteration_i`
+    do `confiacim` com o `TencimRunner`.
+
+    Parameters:
+        case: Caso do **FORM** distribuido (montado no `_solve_form_distributed`)
+        sample_name: Nome da amostra (`base` ou nome da variável)
+        averages: Valores das variáveis da amostra
+        iteration: Número da iteração do **FORM**
+
+    Returns:
+        Retorna o `RC` mínimo e último da amostra ou `None` se o `tencim` não
+        gerar o arquivo de `RC`.
+
+    Info:
+        Em caso de erro o resultado do **FORM** é salvo como `FAILED`.
+    """
+    task_id = self.request.id
+
+    base_dir = get_simulation_base_dir(case["user_id"])
 
     if not base_dir.exists():
         base_dir.mkdir(parents=True)
 
+    tmp_dir = temporary_simulation_folder(base_dir)
     try:
-        logger.info(f"Task {task_id} - Extracting case files ...")
-        tmp_dir = temporary_simulation_folder(base_dir)
-        base_folder = Path(tmp_dir.name)
-        unzip_tencim_case(result.case, tmp_dir)
-        logger.info(f"Task {task_id} - Extract.")
+        base_folder = _checkout_form_case(task_id, case["digest"], case["time_loop"], tmp_dir)
 
-        logger.info(f"Task {task_id} - Writing case file ...")
-        rewrite_case_file(
-            task_id=task_id,
-            case_path=base_folder / "case.dat",
-            setpnode_and_setptime=True,
-            critical_point=result.critical_point,
+        rc_criteria = load_config(file_path=base_folder / "case.yml").rc_criteria
+
+        logger.info(f"Task {task_id} - Running sample {sample_name} of iteration {iteration} ...")
+        rcs = run_samples_iteration_i(
+            samples=[Sample(name=sample_name, averages=averages)],
+            input_dir=base_folder,
+            output_dir=base_folder / "output/form",
+            iteration=iteration,
+            rc_criteria=RCCriteria.str_to_enum(rc_criteria),
+            RunnerClass=TencimRunner,
+            verbose=False,
         )
-        logger.info(f"Task {task_id} - Write.")
+        logger.info(f"Task {task_id} - Sample completed.")
 
-        logger.info(f"Task {task_id} - Writing templates ...")
-        generate_templates(task_id, base_folder, result.config)
-        logger.info(f"Task {task_id} - Write.")
+    except Exception as e:
+        logger.warning(f"Task {task_id} - Sample {sample_name} error.")
+        _form_distributed_failed(case["result_id"], e)
+        raise e
+
+    finally:
+        clean_temporary_simulation_folder(tmp_dir)
+
+    return rcs[sample_name]
+
+
+@celery_app.task(bind=True)
+def form_distributed_step(self, rcs: list, case: dict, state: FormState, names: list[str]) -> dict:
+    """
+    Callback do `chord` das amostras de uma iteração do **FORM** distribuido.
+
+    Faz a iteração do **FORM** com os `RCs` das amostras. Se o **FORM** não
+    terminou, a task é substituida (`replace`) pelo `chord` da próxima
+    iteração, logo nenhum worker fica parado esperando as amostras.
+
+    Parameters:
+        rcs: `RCs` das amostras, na ordem de `names`
+        case: Caso do **FORM** distribuido (montado no `_solve_form_distributed`)
+        state: Estado do **FORM** antes da iteração
+        names: Nomes das amostras
+
+    Returns:
+        Retorna as saídas do **FORM** (`results` e `iteration_infos`), passadas
+        para o `form_persist`.
+
+    Info:
+        Em caso de erro o resultado do **FORM** é salvo como `FAILED`.
+    """
+    task_id = self.request.id
+    result_id = case["result_id"]
 
-        logger.info(f"Task {task_id} - Create case.yml ...")
-        with open(base_folder / "case.yml", "w", encoding="utf-8") as yaml_file:
-            varibales_form_core = convert_variable_web_to_core(result.config["variables"])
-            new_config = result.config.copy()
-            new_config["variables"] = varibales_form_core
-            yaml.dump(new_config, yaml_file, encoding="utf-8")
-        logger.info(f"Task {task_id} - Create.")
+    base_dir = get_simulation_base_dir(case["user_id"])
+
+    if not base_dir.exists():
+        base_dir.mkdir(parents=True)
+
+    tmp_dir = temporary_simulation_folder(base_dir)
+    try:
+        base_folder = _checkout_form_case(task_id, case["digest"], None, tmp_dir)
+
+        state, results = form_iteration(base_folder, state, dict(zip(names, rcs)))
+
+        try:
+            form_iteration_callback(result_id)(state["iteration_infos"], state["it"] - 1)
+        except Exception as e:
+            logger.warning(f"Iteration log callback failed: {e}")
+
+        if results is None:
+            next_iteration = _form_distributed_chord(case, state, form_samples(base_folder, state))
 
     except Exception as e:
-        logger.warning(f"Task {task_id} - Generic error.")
-        result.error = str(e)
-        result.status = ResultStatus.FAILED
+        logger.warning(f"Task {task_id} - Form error.")
+        _form_distributed_failed(result_id, e)
+        raise e
+
+    finally:
+        clean_temporary_simulation_folder(tmp_dir)
+
+    if results is None:
+        outputs: dict = self.replace(next_iteration)
+        return outputs
+
+    logger.info(f"Task {task_id} - Analysis completed.")
+
+    _save_run_metrics("form", result_id, {"solve": time() - case["start"]}, **case["features"])
+
+    return {"results": results, "iteration_infos": state["iteration_infos"]}
+
+
+def _form_distributed_chord(case: dict, state: FormState, samples: list[Sample]) -> Signature:
+    """
+    `chord` de uma iteração do **FORM** distribuido.
+
+    As `n + 1` amostras vão para a fila `FORM_DISTRIBUTED_QUEUE` como tasks
+    `form_sample_run` e o callback `form_distributed_step` para a fila de I/O.
+
+    Parameters:
+        case: Caso do **FORM** distribuido (montado no `_solve_form_distributed`)
+        state: Estado do **FORM**
+        samples: Amostras da iteração
+
+    Returns:
+        Retorna o `chord`.
+    """
+    queue = settings.FORM_DISTRIBUTED_QUEUE or celery_app.conf.task_default_queue
+
+    header = group(
+        form_sample_run.s(
+            case=case,
+            sample_name=s.name,
+            averages=dict(s.averages),
+            iteration=state["it"] + 1,
+        ).set(queue=queue, time_limit=settings.FORM_DISTRIBUTED_TIMEOUT)
+        for s in samples
+    )
+    body = form_distributed_step.s(case=case, state=state, names=[s.name for s in samples]).set(queue=io_queue())
+
+    return chord(header, body)
+
+
+def _form_distributed_failed(result_id: int, error: Exception):
+    result = _select_form_result(result_id)
+    if result.status != ResultStatus.FAILED:
+        _form_result_failed(result_id, result, error)
+
+
+def form_iteration_callback(result_id: int):
+    """
+    Callback do `IterationLogWatcher` do **FORM**.
+
+    Salva as iterações parciais no `iteration_infos` do resultado e publica um
+    evento `iteration` para cada nova iteração.
+
+    Parameters:
+        result_id: ID do resultado
+
+    Returns:
+        Retorna o callback.
+    """
+
+    def callback(iteration_infos: dict, seen: int) -> None:
+        with SessionFactory() as session:
+            session.execute(
+                update(FormResult).where(FormResult.id == result_id).values(iteration_infos=iteration_infos)
+            )
+            session.commit()
+
+        for index in range(seen, len(iteration_infos["beta"])):
+            publish_result_event("form", result_id, "iteration", iteration_event(iteration_infos, index))
+
+    return callback
+
+
+def _form_result_failed(result_id: int, result: FormResult, error: Exception):
+    result.error = str(error)
+    result.status = ResultStatus.FAILED
+    with SessionFactory() as session:
         session.add(result)
+        attached_ids = update_attached_results(session, result)
         session.commit()
+    for id_ in (result_id, *attached_ids):
+        publish_status("form", id_, ResultStatus.FAILED, str(error))
+
+
+def _prepare_form(task_id: UUID, result_id: int):
+    """
+    Monta o caso do **FORM** e salva os arquivos gerados no `BlobStore`.
+
+    Parameters:
+        task_id: ID da task do celery
+        result_id: ID do resultado
+    """
+
+    result = _select_form_result(result_id)
+
+    base_dir = get_simulation_base_dir(result.case.user_id)
+
+    if not base_dir.exists():
+        base_dir.mkdir(parents=True)
+
+    start = perf_counter()
+    tmp_dir = temporary_simulation_folder(base_dir)
+
+    try:
+        base_folder = prepare_reliability_case(task_id, result, tmp_dir)
+
+        logger.info(f"Task {task_id} - Saving generated files ...")
+        with SessionFactory() as session:
+            save_generated_form_files(session, base_folder, result)
+        logger.info(f"Task {task_id} - Save.")
+
+    except Exception as e:
+        logger.warning(f"Task {task_id} - Generic error.")
+        _form_result_failed(result_id, result, e)
         raise e
 
-    input_base_dir = Path(tmp_dir.name)
+    finally:
+        logger.debug(f"Task {task_id} - Cleaning up the temporary directory...")
+        clean_temporary_simulation_folder(tmp_dir)
+        logger.debug(f"Task {task_id} - Cleaned temporary directory.")
+
+    _save_run_metrics("form", result_id, {"prepare": perf_counter() - start})
+
+
+def _checkout_form_case(task_id: UUID, digest: str, time_loop: Optional[int], tmp_dir: TemporaryDirectory) -> Path:
+    """
+    Monta os arquivos gerados do **FORM** no diretório temporário.
+
+    Parameters:
+        task_id: ID da task do celery
+        digest: `generated_case_files_digest` do resultado
+        time_loop: Passo final do novo loop de tempo do `case.dat` (ponto
+                   critico de um `FormResultGroup`)
+        tmp_dir: Diretório temporário da simulação
+
+    Returns:
+        Retorna o caminho do diretório.
+    """
+    base_folder = Path(tmp_dir.name)
+
+    logger.info(f"Task {task_id} - Extracting generated files ...")
+    cache_hit = extract_form_generated_case(digest, tmp_dir)
+    logger.info(f"Task {task_id} - Extract (cache hit: {cache_hit}).")
+
+    if time_loop:
+        logger.info(f"Task {task_id} - Novo loop de tempo até passo {time_loop} ...")
+        case_path = base_folder / "case.dat"
+        case_str = case_path.read_text(encoding="utf-8")
+        replace_file_content(case_path, new_time_loop(case_str, time_loop))
+        logger.info(f"Task {task_id} - Write.")
+
+    return base_folder
+
+
+def _form_time_loop(result: FormResult) -> Optional[int]:
+    return result.critical_point if result.group_id is not None else None
+
+
+def _start_form(task_id: UUID, result: FormResult, tmp_dir: TemporaryDirectory) -> tuple[Path, dict]:
+    """
+    Monta o caso a partir dos arquivos gerados e marca o resultado como `RUNNING`.
+
+    Parameters:
+        task_id: ID da task do celery
+        result: Resultado com o caso carregado
+        tmp_dir: Diretório temporário da simulação
+
+    Returns:
+        Retorna o caminho do diretório e as características da simulação.
+
+    Raises:
+        TaskFileCaseNotFound: O resultado não tem os arquivos gerados.
+    """
+    if result.generated_case_files_digest is None:
+        raise TaskFileCaseNotFound(
+            "The group has no generated files." if result.group_id else "The result has no generated files."
+        )
+
+    base_folder = _checkout_form_case(task_id, result.generated_case_files_digest, _form_time_loop(result), tmp_dir)
+
+    features = _case_dat_features(base_folder) | {"n_variables": len(result.config["variables"])}
 
     with SessionFactory() as session:
-        save_generated_form_files(session, base_folder, result)
-        result.task_id = self.request.id
+        # Com a cadeia a rota já salvou o ID da cadeia
+        if result.task_id is None:
+            result.task_id = task_id
         result.status = ResultStatus.RUNNING
         session.add(result)
+        attached_ids = update_attached_results(session, result)
         session.commit()
         session.refresh(result)
+    for id_ in (result.id, *attached_ids):
+        publish_status("form", id_, ResultStatus.RUNNING)
+
+    return base_folder, features
+
+
+def _solve_form(task_id: UUID, result_id: int) -> dict:
+    """
+    Roda o **FORM** a partir dos arquivos gerados no `BlobStore`.
+
+    Parameters:
+        task_id: ID da task do celery
+        result_id: ID do resultado
+
+    Returns:
+        Retorna as saídas do **FORM** (`results.json` e `form_iteration_log.json`).
+
+    Raises:
+        TaskFileCaseNotFound: O resultado não tem os arquivos gerados.
+
+    Info:
+        Em caso de erro o resultado é salvo como `FAILED`.
+    """
+
+    result = _select_form_result(result_id)
+
+    base_dir = get_simulation_base_dir(result.case.user_id)
+
+    if not base_dir.exists():
+        base_dir.mkdir(parents=True)
+
+    start = perf_counter()
+    tmp_dir = temporary_simulation_folder(base_dir)
 
     try:
-        logger.info(f"Task {task_id} - Running task ...")
+        base_folder, features = _start_form(task_id, result, tmp_dir)
 
-        run_form_core(input_dir=input_base_dir, output_dir=None, verbose_level=0)
+        watcher = IterationLogWatcher(
+            base_folder / "output/form/form_iteration_log.json",
+            callback=form_iteration_callback(result_id),
+            interval=settings.EVENTS_POLL_INTERVAL,
+        )
 
-        result_form = json.load((base_folder / "output/form/results.json").open())
-        iteration_form = json.load((base_folder / "output/form/form_iteration_log.json").open())
+        logger.info(f"Task {task_id} - Running task ...")
 
-        result.beta = result_form["beta"]
-        result.resid = result_form["resid"]
-        result.it = result_form["it"]
-        result.Pf = result_form["Pf"]
-        result.status = ResultStatus.SUCCESS
-        result.variables_stats = result_form["variables"]
-        result.iteration_infos = iteration_form
+        watcher.start()
+        try:
+            run_form_core(input_dir=base_folder, output_dir=None, verbose_level=0)
+        finally:
+            watcher.stop()
+
+        outputs = {
+            "results": json.load((base_folder / "output/form/results.json").open()),
+            "iteration_infos": json.load((base_folder / "output/form/form_iteration_log.json").open()),
+        }
 
         logger.info(f"Task {task_id} - Analysis completed.")
 
     except TencimRunError as e:
         logger.warning(f"Task {task_id} - Tencim error.")
-        result.error = str(e)
-        result.status = ResultStatus.FAILED
+        _form_result_failed(result_id, result, e)
         raise e
 
     except (
@@ -235,22 +684,510 @@ def form_run(self, result_id: int):
         RCCriteriaInvalidOptionError,
     ) as e:
         logger.warning(f"Task {task_id} - Form error.")
-        result.error = str(e)
-        result.status = ResultStatus.FAILED
+        _form_result_failed(result_id, result, e)
         raise e
 
     except Exception as e:
         logger.warning(f"Task {task_id} - Generic error.")
-        result.error = str(e)
-        result.status = ResultStatus.FAILED
+        _form_result_failed(result_id, result, e)
         raise e
 
     finally:
+        logger.debug(f"Task {task_id} - Cleaning up the temporary directory...")
+        clean_temporary_simulation_folder(tmp_dir)
+        logger.debug(f"Task {task_id} - Cleaned temporary directory.")
+
+    _save_run_metrics("form", result_id, {"solve": perf_counter() - start}, **features)
+
+    return outputs
+
+
+def _solve_form_distributed(task_id: UUID, result_id: int) -> Signature:
+    """
+    Começa o **FORM** distribuido a partir dos arquivos gerados no `BlobStore`.
+
+    Cada iteração é um `chord` com as `n + 1` amostras (`form_sample_run`) e o
+    callback `form_distributed_step`, que faz a iteração e envia a próxima. As
+    amostras recebem apenas o digest dos arquivos gerados.
+
+    Parameters:
+        task_id: ID da task do celery
+        result_id: ID do resultado
+
+    Returns:
+        Retorna o `chord` da primeira iteração, que substitui a task do solver.
+
+    Raises:
+        TaskFileCaseNotFound: O resultado não tem os arquivos gerados.
+
+    Info:
+        Em caso de erro o resultado é salvo como `FAILED`.
+    """
+
+    result = _select_form_result(result_id)
+
+    base_dir = get_simulation_base_dir(result.case.user_id)
+
+    if not base_dir.exists():
+        base_dir.mkdir(parents=True)
+
+    tmp_dir = temporary_simulation_folder(base_dir)
+
+    try:
+        base_folder, features = _start_form(task_id, result, tmp_dir)
+
+        case = {
+            "result_id": result_id,
+            "user_id": result.case.user_id,
+            "digest": result.generated_case_files_digest,
+            "time_loop": _form_time_loop(result),
+            "features": features,
+            "start": time(),
+        }
+        state = form_initial_state(base_folder)
+        first_iteration = _form_distributed_chord(case, state, form_samples(base_folder, state))
+
+        logger.info(f"Task {task_id} - Samples of the first iteration sent.")
+
+    except Exception as e:
+        logger.warning(f"Task {task_id} - Form error.")
+        _form_result_failed(result_id, result, e)
+        raise e
+
+    finally:
+        logger.debug(f"Task {task_id} - Cleaning up the temporary directory...")
+        clean_temporary_simulation_folder(tmp_dir)
+        logger.debug(f"Task {task_id} - Cleaned temporary directory.")
+
+    return first_iteration
+
+
+def _persist_form(task_id: UUID, outputs: dict, result_id: int):
+    """
+    Salva as saídas do **FORM** no resultado.
+
+    Parameters:
+        task_id: ID da task do celery
+        outputs: Saídas do `_solve_form`
+        result_id: ID do resultado
+    """
+    result_form = outputs["results"]
+
+    start = perf_counter()
+    with SessionFactory() as session:
+        result = session.get(FormResult, result_id)
+
+        if result is None:
+            raise ResultNotFound("Result not found.")
+
+        result.beta = result_form["beta"]
+        result.resid = result_form["resid"]
+        result.it = result_form["it"]
+        result.Pf = result_form["Pf"]
+        result.status = ResultStatus.SUCCESS
+        result.variables_stats = result_form["variables"]
+        result.iteration_infos = outputs["iteration_infos"]
+
+        attached_ids = update_attached_results(session, result)
+        session.commit()
+
+    for id_ in (result_id, *attached_ids):
+        publish_status("form", id_, ResultStatus.SUCCESS)
+
+    logger.info(f"Task {task_id} - Result saved.")
+
+    _save_run_metrics("form", result_id, {"persist": perf_counter() - start}, iterations=result_form["it"])
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def form_prepare(self, result_id: int):
+    """
+    Etapa de preparo (I/O) da cadeia do **FORM**.
+
+    Parameters:
+        result_id: ID do resultado
+    """
+    _prepare_form(self.request.id, result_id)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def form_solve(self, result_id: int) -> dict:
+    """
+    Etapa do solver da cadeia do **FORM**.
+
+    Parameters:
+        result_id: ID do resultado
+
+    Returns:
+        Retorna as saídas do **FORM**, passadas para o `form_persist`. Com o
+        `FORM_DISTRIBUTED` a task é substituida pelo **FORM** distribuido.
+    """
+    if settings.FORM_DISTRIBUTED:
+        # No modo eager o `replace` retorna as saídas do FORM distribuido
+        outputs: dict = self.replace(_solve_form_distributed(self.request.id, result_id))
+        return outputs
+    return _solve_form(self.request.id, result_id)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def form_persist(self, outputs: dict, result_id: int):
+    """
+    Etapa de persistência (I/O) da cadeia do **FORM**.
+
+    Parameters:
+        outputs: Saídas do `form_solve`
+        result_id: ID do resultado
+    """
+    _persist_form(self.request.id, outputs, result_id)
+
+
+def run_form_pipeline(result_id: int, user_id: int, solver_queue: str) -> AsyncResult:
+    """
+    Envia a cadeia `form_prepare` -> `form_solve` -> `form_persist`.
+
+    O preparo e a persistência vão para a fila de I/O e apenas o solver
+    ocupa a `solver_queue`. A cadeia passa pelo fair-share do usuário.
+
+    Parameters:
+        result_id: ID do resultado
+        user_id: ID do usuário dono do resultado
+        solver_queue: Fila do `form_solve`
+
+    Returns:
+        Retorna o `AsyncResult` da cadeia.
+    """
+    pipeline = chain(
+        form_prepare.si(result_id=result_id).set(queue=io_queue()),
+        form_solve.si(result_id=result_id).set(queue=solver_queue),
+        form_persist.s(result_id=result_id).set(queue=io_queue()),
+    )
+    return submit(user_id, pipeline)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def form_run(self, result_id: int):
+    """
+    Roda as três etapas do **FORM** no mesmo worker.
+
+    As rotas usam o `run_form_pipeline`. Essa task é mantida para as
+    mensagens já enfileiradas. Com o `FORM_DISTRIBUTED` a task é substituida
+    pelo **FORM** distribuido seguido do `form_persist`.
+
+    Parameters:
+        result_id: ID do resultado
+    """
+
+    task_id = self.request.id
+
+    _prepare_form(task_id, result_id)
+    if settings.FORM_DISTRIBUTED:
+        persist = form_persist.s(result_id=result_id).set(queue=io_queue())
+        return self.replace(_solve_form_distributed(task_id, result_id) | persist)
+    outputs = _solve_form(task_id, result_id)
+    _persist_form(task_id, outputs, result_id)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def form_group_run(self, group_id: int):
+    """
+    Prepara o caso de um `FormResultGroup` e envia um **FORM** por ponto critico.
+
+    O caso é extraido, reescrito e os templates e o `case.yml` gerados apenas
+    uma vez. Os arquivos gerados vão para o `BlobStore` e cada ponto critico
+    (`form_group_point_run`) parte deles, apenas truncando o `case.dat`.
+
+    Parameters:
+        group_id: ID do grupo
+    """
+
+    task_id = self.request.id
+
+    with SessionFactory() as session:
+        stmt = (
+            select(FormResultGroup)
+            .where(FormResultGroup.id == group_id)
+            .options(joinedload(FormResultGroup.case, innerjoin=True).load_only(Case.user_id, Case.base_file_digest))
+        )
+        form_group = session.scalar(stmt)
+
+    if form_group is None:
+        raise ResultNotFound("Group not found.")
+
+    if form_group.case.base_file_digest is None:
+        raise TaskFileCaseNotFound("The case has no base file.")
+
+    user_id = form_group.case.user_id
+
+    base_dir = get_simulation_base_dir(user_id)
+
+    if not base_dir.exists():
+        base_dir.mkdir(parents=True)
+
+    tmp_dir = temporary_simulation_folder(base_dir)
+
+    try:
+        base_folder = prepare_reliability_case(task_id, form_group, tmp_dir)
+
         with SessionFactory() as session:
-            session.add(result)
+            save_generated_form_files(session, base_folder, form_group)
+            result_ids = session.scalars(
+                update(FormResult)
+                .where(FormResult.group_id == group_id)
+                .values(generated_case_files_digest=form_group.generated_case_files_digest)
+                .returning(FormResult.id),
+                execution_options={"synchronize_session": False},
+            ).all()
             session.commit()
-            session.refresh(result)
 
+    except Exception as e:
+        logger.warning(f"Task {task_id} - Generic error.")
+        _form_group_failed(group_id, form_group, e)
+        raise e
+
+    finally:
         logger.debug(f"Task {task_id} - Cleaning up the temporary directory...")
         clean_temporary_simulation_folder(tmp_dir)
         logger.debug(f"Task {task_id} - Cleaned temporary directory.")
+
+    # Assim como no sweep do tencim os pontos vão para a fila do solver do FORM
+    # (`task_routes`) para que todos os workers livres participem. Os resultados
+    # são salvos na fila de I/O.
+    submit_group(
+        user_id,
+        group(
+            chain(
+                form_group_point_run.si(result_id=result_id),
+                form_persist.s(result_id=result_id).set(queue=io_queue()),
+            )
+            for result_id in result_ids
+        ),
+    )
+
+
+def _form_group_failed(group_id: int, form_group: FormResultGroup, error: Exception):
+    form_group.error = str(error)
+
+    attached_ids: list[int] = []
+    with SessionFactory() as session:
+        session.add(form_group)
+        results = session.scalars(select(FormResult).where(FormResult.group_id == group_id)).all()
+        for result in results:
+            result.error = str(error)
+            result.status = ResultStatus.FAILED
+            attached_ids += [result.id, *update_attached_results(session, result)]
+        session.commit()
+
+    for id_ in attached_ids:
+        publish_status("form", id_, ResultStatus.FAILED, str(error))
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def form_group_point_run(self, result_id: int) -> dict:
+    """
+    Etapa do solver do **FORM** de um ponto critico de um `FormResultGroup`.
+
+    Parameters:
+        result_id: ID do resultado
+
+    Returns:
+        Retorna as saídas do **FORM**, passadas para o `form_persist`. Com o
+        `FORM_DISTRIBUTED` a task é substituida pelo **FORM** distribuido.
+    """
+    if settings.FORM_DISTRIBUTED:
+        # No modo eager o `replace` retorna as saídas do FORM distribuido
+        outputs: dict = self.replace(_solve_form_distributed(self.request.id, result_id))
+        return outputs
+    return _solve_form(self.request.id, result_id)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def monte_carlo_chunk_run(self, chunk_id: int):
+    """
+    Roda um lote de amostras do **Monte Carlo**.
+
+    As amostras do lote são geradas pelo `SamplesGeneratorMonteCarlo` com a
+    semente do lote, logo o resultado não depende de qual worker rodou o lote.
+    Ao terminar, os contadores e a estimativa parcial da probabilidade de
+    falha do resultado são atualizados com o `row lock` do resultado.
+
+    Parameters:
+        chunk_id: ID do lote
+    """
+    task_id = self.request.id
+
+    result_id = select(MonteCarloChunk.result_id).where(MonteCarloChunk.id == chunk_id).scalar_subquery()
+
+    with SessionFactory() as session:
+        session.execute(
+            update(MonteCarloChunk).where(MonteCarloChunk.id == chunk_id).values(status=ResultStatus.RUNNING)
+        )
+        started = session.execute(
+            update(MonteCarloResult)
+            .where(
+                MonteCarloResult.id == result_id,
+                MonteCarloResult.status == ResultStatus.CREATED,
+            )
+            .values(status=ResultStatus.RUNNING)
+            .returning(MonteCarloResult.id)
+        ).scalar_one_or_none()
+        session.commit()
+
+        if started is not None:
+            publish_status("montecarlo", started, ResultStatus.RUNNING)
+
+        stmt = (
+            select(MonteCarloChunk)
+            .where(MonteCarloChunk.id == chunk_id)
+            .options(
+                joinedload(MonteCarloChunk.result, innerjoin=True)
+                .joinedload(MonteCarloResult.case, innerjoin=True)
+                .load_only(Case.user_id, Case.base_file_digest),
+            )
+        )
+        chunk = session.scalar(stmt)
+
+    if chunk is None:
+        raise ResultNotFound("Result not found.")
+
+    result = chunk.result
+
+    base_dir = get_simulation_base_dir(result.case.user_id)
+
+    if not base_dir.exists():
+        base_dir.mkdir(parents=True)
+
+    start = perf_counter()
+    tmp_dir = temporary_simulation_folder(base_dir)
+    partial, error = None, None
+    try:
+        if result.case.base_file_digest is None:
+            raise TaskFileCaseNotFound("The case has no base file.")
+
+        base_folder = prepare_reliability_case(task_id, result, tmp_dir)
+        features = _case_dat_features(base_folder)
+        phases = {"prepare": perf_counter() - start}
+
+        simulation_conf = load_config(file_path=base_folder / "case.yml")
+        variables = simulation_conf.variables
+
+        L = cholesky(generate_correlation_matrix(simulation_conf.correlations, variables), lower=True)
+        generator = SamplesGeneratorMonteCarlo(
+            variables=variables,
+            n_samples=chunk.n_samples,
+            L=L,
+            seeds=spawn_seeds(chunk.seed, len(variables)),
+        )
+
+        logger.info(f"Task {task_id} - Running chunk {chunk.index} ({chunk.n_samples} samples) ...")
+        start = perf_counter()
+        rcs = run_samples_iteration_i(
+            samples=generator.all(),
+            input_dir=base_folder,
+            output_dir=base_folder / "output/monte_carlo",
+            iteration=chunk.index + 1,
+            rc_criteria=RCCriteria.str_to_enum(simulation_conf.rc_criteria),
+            RunnerClass=TencimRunnerByPassFailure,
+            verbose=False,
+        )
+        partial = failure_probability_from_rcs(rcs)
+        phases["solve"] = perf_counter() - start
+        logger.info(f"Task {task_id} - Chunk completed.")
+
+    except Exception as e:
+        logger.warning(f"Task {task_id} - Generic error.")
+        error = str(e)
+        raise e
+
+    finally:
+        with SessionFactory() as session:
+            reduce_monte_carlo_chunk(session, chunk, partial, error)
+
+        logger.debug(f"Task {task_id} - Cleaning up the temporary directory...")
+        clean_temporary_simulation_folder(tmp_dir)
+        logger.debug(f"Task {task_id} - Cleaned temporary directory.")
+
+    _save_run_metrics(
+        "monte_carlo",
+        chunk_id,
+        phases,
+        **features,
+        n_variables=len(variables),
+        n_samples=chunk.n_samples,
+    )
+
+
+def reduce_monte_carlo_chunk(
+    session: Session,
+    chunk: MonteCarloChunk,
+    partial: Optional[CoreMonteCarloResult],
+    error: Optional[str] = None,
+):
+    """
+    Salva o resultado do lote e atualiza a estimativa do **Monte Carlo**.
+
+    Parameters:
+        session: Sessão do banco
+        chunk: Lote
+        partial: Resultado do lote (`failure_probability_from_rcs`) ou `None` se falhou
+        error: Mensagem de erro do lote
+    """
+    result = session.scalar(select(MonteCarloResult).where(MonteCarloResult.id == chunk.result_id).with_for_update())
+    if result is None:
+        return
+
+    values: dict = {"finished_at": func.now()}
+    previous_status = result.status
+    estimate: Optional[MonteCarloEstimate] = None
+    result.chunks_done += 1
+
+    if partial is not None:
+        values |= {
+            "status": ResultStatus.SUCCESS,
+            "total": partial.total,
+            "valid_simulations": partial.valid_simulations,
+            "fail": partial.fail,
+        }
+        result.total += partial.total
+        result.valid_simulations += partial.valid_simulations
+        result.fail += partial.fail
+
+        estimate = monte_carlo_estimate(result.total, result.valid_simulations, result.fail)
+        result.Pf = estimate.Pf
+        result.estimator = estimate.estimator
+        result.Pf_lower = estimate.Pf_lower
+        result.Pf_upper = estimate.Pf_upper
+    else:
+        values |= {"status": ResultStatus.FAILED, "error": error}
+        result.status = ResultStatus.FAILED
+        result.error = f"Chunk {chunk.index}: {error}"
+
+    if result.chunks_done == result.chunks_total and result.status != ResultStatus.FAILED:
+        result.status = ResultStatus.SUCCESS
+
+    session.execute(update(MonteCarloChunk).where(MonteCarloChunk.id == chunk.id).values(**values))
+
+    # O `commit` expira o `result`
+    result_id, chunks_done, chunks_total = result.id, result.chunks_done, result.chunks_total
+    new_status, result_error = result.status, result.error
+
+    session.commit()
+
+    if estimate is not None and previous_status != ResultStatus.FAILED:
+        publish_result_event("montecarlo", result_id, "estimate", estimate_event(chunks_done, chunks_total, estimate))
+
+    if new_status != previous_status and new_status in (ResultStatus.SUCCESS, ResultStatus.FAILED):
+        publish_status("montecarlo", result_id, new_status, result_error)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def fair_share_release(self, user_id: int, lease_id: Optional[str] = None):
+    """
+    Libera a vaga de uma simulação no fair-share e envia as pendentes.
+
+    Ligada (`link` e `link_error`) às simulações enviadas pelo `dispatch`.
+
+    Parameters:
+        user_id: ID do usuário dono da simulação
+        lease_id: ID da vaga da simulação
+    """
+    release(user_id, lease_id)
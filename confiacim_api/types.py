@@ -1,2 +1,8 @@
+import numpy as np
+from numpy.typing import NDArray
+
 TArrayInt = tuple[int, ...]
 TArrayFloat = tuple[float, ...]
+
+TNDArrayInt = NDArray[np.int32]
+TNDArrayFloat = NDArray[np.float64]
@@ -1,8 +1,45 @@
+import hashlib
 import zipfile
+from dataclasses import dataclass
 from typing import BinaryIO
 
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FileInfos:
+    size: int
+    sha256: str
+
 
 def file_case_is_zipfile(case_file: BinaryIO) -> bool:
     is_zip = zipfile.is_zipfile(case_file)
     case_file.seek(0)
     return is_zip
+
+
+def scan_file(file: BinaryIO, chunk_size: int = CHUNK_SIZE) -> FileInfos:
+    """
+    Percorre o arquivo em blocos calculando o tamanho e o `sha256`.
+
+    Parameters:
+        file: Arquivo
+        chunk_size: Tamanho do bloco em bytes
+
+    Returns:
+        Retorna o tamanho e o `sha256` do arquivo.
+
+    Info:
+        Apenas um bloco fica em memória por vez. O arquivo volta para o
+        inicio no final.
+    """
+    digest = hashlib.sha256()
+    size = 0
+
+    file.seek(0)
+    while chunk := file.read(chunk_size):
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+
+    return FileInfos(size=size, sha256=digest.hexdigest())
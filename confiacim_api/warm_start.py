@@ -0,0 +1,60 @@
+import math
+from typing import Iterable
+
+from confiacim.variables import DistInfos, StochasticVariable
+
+
+def design_point(iteration_infos: dict, names: Iterable[str]) -> dict[str, float]:
+    """
+    Ponto de projeto de um resultado do **FORM**.
+
+    O ponto de projeto é o valor das variáveis na última iteração do
+    `iteration_infos`.
+
+    Parameters:
+        iteration_infos: Informações das iterações do resultado
+        names: Nomes das variáveis da nova simulação
+
+    Returns:
+        Retorna o valor de cada variável. As variáveis que não estão no
+        `iteration_infos` ficam de fora.
+    """
+    point = {}
+    for name in names:
+        values = iteration_infos.get(name)
+        if values and math.isfinite(values[-1]):
+            point[name] = values[-1]
+    return point
+
+
+def apply_initial_point(variables: list[dict], initial_point: dict[str, float]) -> list[dict]:
+    """
+    Define o `initial_point_factor` das variáveis do `confiacim` core.
+
+    O **FORM** começa com as variáveis em `mean * initial_point_factor`,
+    logo o fator é `valor / mean`.
+
+    Parameters:
+        variables: Variáveis do `confiacim` core
+        initial_point: Ponto inicial das variáveis
+
+    Returns:
+        Retorna as variáveis com o `initial_point_factor`.
+
+    Info:
+        As variáveis fora do `initial_point`, com média zero ou indefinida ou
+        com fator negativo começam na média.
+    """
+    new_variables = []
+    for variable in variables:
+        new_variable = variable.copy()
+
+        if (value := initial_point.get(variable["name"])) is not None:
+            mean = StochasticVariable(variable["name"], DistInfos(**variable["dist"])).mean
+            factor = value / mean if mean else math.nan
+            if math.isfinite(factor) and factor >= 0.0:
+                new_variable["initial_point_factor"] = float(factor)
+
+        new_variables.append(new_variable)
+
+    return new_variables
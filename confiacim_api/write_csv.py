@@ -1,41 +1,43 @@
 import csv
 from io import StringIO
+from typing import Iterator
 
 from confiacim_api.models import TencimResult
 
+CSV_CHUNK_ROWS = 1_000
 
-def write_rc_result_to_csv(results: TencimResult) -> StringIO:
-    """Transforma os results para CSV.
+RC_CSV_HEADERS = ("istep", "t", "rc_rankine", "mohr_coulomb_rc")
+
+
+def iter_rc_result_csv(results: TencimResult, chunk_rows: int = CSV_CHUNK_ROWS) -> Iterator[str]:
+    """Gera o CSV dos results em blocos.
 
     Params:
         results: Resultados de RC do tencim.
+        chunk_rows: Número de linhas de cada bloco.
 
     Returns:
-       csv: CSV do resultado.
+       Iterador com o cabeçalho e depois blocos de `chunk_rows` linhas do CSV.
 
     Info
-        Os CSV esta todo em memória essas abordagem pode ser ruim
-        caso existam muito passos de tempo na resposta
+        Apenas um bloco de texto fica em memória por vez, as linhas são
+        geradas a partir de fatias dos arrays do `numpy`. Resultados sem
+        alguma das curvas geram apenas o cabeçalho.
     """
-    csv_file_in_memory = StringIO()
-
-    headers = ["istep", "t", "rc_rankine", "mohr_coulomb_rc"]
-    writer = csv.DictWriter(csv_file_in_memory, fieldnames=headers)
-    writer.writeheader()
-
-    istep = results.istep if results.istep else ()
-    ts = results.t if results.t else ()
-    rankine_rc = results.rankine_rc if results.rankine_rc else ()
-    mohr_coulomb_rc = results.mohr_coulomb_rc if results.mohr_coulomb_rc else ()
-
-    for i, t, rankine, mohr_coulomb in zip(istep, ts, rankine_rc, mohr_coulomb_rc):
-        writer.writerow(
-            {
-                "istep": i,
-                "t": t,
-                "rc_rankine": rankine,
-                "mohr_coulomb_rc": mohr_coulomb,
-            }
-        )
-    csv_file_in_memory.seek(0)
-    return csv_file_in_memory
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(RC_CSV_HEADERS)
+    yield buffer.getvalue()
+
+    series = (results.istep, results.t, results.rankine_rc, results.mohr_coulomb_rc)
+    columns = [c for c in series if c is not None]
+    if len(columns) < len(series):
+        return
+
+    n = min(len(c) for c in columns)
+    for start in range(0, n, chunk_rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(zip(*(c[start : min(start + chunk_rows, n)].tolist() for c in columns)))
+        yield buffer.getvalue()
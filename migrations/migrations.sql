@@ -262,4 +262,324 @@ CREATE TABLE variable_groups (
 
 UPDATE alembic_version SET version_num='78513c2da84f' WHERE alembic_version.version_num = 'd2684f3b1df2';
 
+-- Running upgrade 78513c2da84f -> cb50b9572ac6
+
+ALTER TABLE cases ADD COLUMN base_file_digest VARCHAR(64);
+
+UPDATE alembic_version SET version_num='cb50b9572ac6' WHERE alembic_version.version_num = '78513c2da84f';
+
+-- Running upgrade cb50b9572ac6 -> 3859f408ad04
+
+ALTER TABLE form_results ADD COLUMN generated_case_files_digest VARCHAR(64);
+
+UPDATE cases
+        SET base_file_digest = encode(sha256(base_file), 'hex')
+        WHERE base_file IS NOT NULL AND base_file_digest IS NULL;;
+
+UPDATE form_results
+        SET generated_case_files_digest = encode(sha256(generated_case_files), 'hex')
+        WHERE generated_case_files IS NOT NULL;;
+
+UPDATE alembic_version SET version_num='3859f408ad04' WHERE alembic_version.version_num = 'cb50b9572ac6';
+
+-- Running upgrade 3859f408ad04 -> 739746f02965
+
+CREATE TABLE tencim_sweeps (
+    id SERIAL NOT NULL,
+    task_id UUID,
+    description TEXT,
+    case_id INTEGER NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    PRIMARY KEY (id),
+    FOREIGN KEY(case_id) REFERENCES cases (id)
+);
+
+ALTER TABLE tencim_results ADD COLUMN sweep_id INTEGER;
+
+CREATE INDEX ix_tencim_results_sweep_id ON tencim_results (sweep_id);
+
+ALTER TABLE tencim_results ADD CONSTRAINT tencim_results_sweep_id_fkey FOREIGN KEY(sweep_id) REFERENCES tencim_sweeps (id) ON DELETE SET NULL;
+
+UPDATE alembic_version SET version_num='739746f02965' WHERE alembic_version.version_num = '3859f408ad04';
+
+-- Running upgrade 739746f02965 -> a82211a10cca
+
+CREATE TABLE monte_carlo_results (
+    id SERIAL NOT NULL,
+    task_id UUID,
+    critical_point INTEGER,
+    n_samples INTEGER NOT NULL,
+    chunk_size INTEGER NOT NULL,
+    seed BIGINT NOT NULL,
+    chunks_total INTEGER NOT NULL,
+    chunks_done INTEGER DEFAULT '0' NOT NULL,
+    total INTEGER DEFAULT '0' NOT NULL,
+    valid_simulations INTEGER DEFAULT '0' NOT NULL,
+    fail INTEGER DEFAULT '0' NOT NULL,
+    "Pf" FLOAT,
+    estimator FLOAT,
+    "Pf_lower" FLOAT,
+    "Pf_upper" FLOAT,
+    error TEXT,
+    status result_status,
+    description TEXT,
+    config JSON,
+    case_id INTEGER NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    PRIMARY KEY (id),
+    FOREIGN KEY(case_id) REFERENCES cases (id)
+);
+
+CREATE TABLE monte_carlo_chunks (
+    id SERIAL NOT NULL,
+    index INTEGER NOT NULL,
+    seed BIGINT NOT NULL,
+    n_samples INTEGER NOT NULL,
+    status result_status,
+    total INTEGER DEFAULT '0' NOT NULL,
+    valid_simulations INTEGER DEFAULT '0' NOT NULL,
+    fail INTEGER DEFAULT '0' NOT NULL,
+    error TEXT,
+    finished_at TIMESTAMP WITHOUT TIME ZONE,
+    result_id INTEGER NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(result_id) REFERENCES monte_carlo_results (id) ON DELETE CASCADE,
+    CONSTRAINT monte_carlo_result_chunk_index UNIQUE (result_id, index)
+);
+
+CREATE INDEX ix_monte_carlo_chunks_result_id ON monte_carlo_chunks (result_id);
+
+UPDATE alembic_version SET version_num='a82211a10cca' WHERE alembic_version.version_num = '739746f02965';
+
+-- Running upgrade a82211a10cca -> b665e6a57eb7
+
+ALTER TABLE form_results ADD COLUMN fingerprint VARCHAR(64);
+
+ALTER TABLE form_results ADD COLUMN source_result_id INTEGER;
+
+CREATE INDEX ix_form_results_fingerprint ON form_results (fingerprint);
+
+ALTER TABLE form_results ADD CONSTRAINT form_results_source_result_id_fkey FOREIGN KEY(source_result_id) REFERENCES form_results (id) ON DELETE SET NULL;
+
+ALTER TABLE tencim_results ADD COLUMN fingerprint VARCHAR(64);
+
+ALTER TABLE tencim_results ADD COLUMN source_result_id INTEGER;
+
+CREATE INDEX ix_tencim_results_fingerprint ON tencim_results (fingerprint);
+
+ALTER TABLE tencim_results ADD CONSTRAINT tencim_results_source_result_id_fkey FOREIGN KEY(source_result_id) REFERENCES tencim_results (id) ON DELETE SET NULL;
+
+UPDATE alembic_version SET version_num='b665e6a57eb7' WHERE alembic_version.version_num = 'a82211a10cca';
+
+-- Running upgrade b665e6a57eb7 -> eb79af09d96a
+
+CREATE TABLE idempotency_keys (
+    id SERIAL NOT NULL,
+    key VARCHAR(255) NOT NULL,
+    scope VARCHAR(64) NOT NULL,
+    request_hash VARCHAR(64) NOT NULL,
+    status_code INTEGER,
+    response JSON,
+    expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    user_id INTEGER NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    PRIMARY KEY (id),
+    FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE,
+    CONSTRAINT user_scope_idempotency_key UNIQUE (user_id, scope, key)
+);
+
+CREATE INDEX ix_idempotency_keys_expires_at ON idempotency_keys (expires_at);
+
+UPDATE alembic_version SET version_num='eb79af09d96a' WHERE alembic_version.version_num = 'b665e6a57eb7';
+
+-- Running upgrade eb79af09d96a -> c86a7907d598
+
+ALTER TABLE form_results ADD COLUMN warm_start_from_id INTEGER;
+
+ALTER TABLE form_results ADD COLUMN initial_point JSON;
+
+ALTER TABLE form_results ADD CONSTRAINT form_results_warm_start_from_id_fkey FOREIGN KEY(warm_start_from_id) REFERENCES form_results (id) ON DELETE SET NULL;
+
+UPDATE alembic_version SET version_num='c86a7907d598' WHERE alembic_version.version_num = 'eb79af09d96a';
+
+-- Running upgrade c86a7907d598 -> bf1314a14815
+
+CREATE TABLE form_result_groups (
+    id SERIAL NOT NULL,
+    task_id UUID,
+    description TEXT,
+    config JSON,
+    error TEXT,
+    generated_case_files_digest VARCHAR(64),
+    case_id INTEGER NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+    PRIMARY KEY (id),
+    FOREIGN KEY(case_id) REFERENCES cases (id)
+);
+
+ALTER TABLE form_results ADD COLUMN group_id INTEGER;
+
+CREATE INDEX ix_form_results_group_id ON form_results (group_id);
+
+ALTER TABLE form_results ADD CONSTRAINT form_results_group_id_fkey FOREIGN KEY(group_id) REFERENCES form_result_groups (id) ON DELETE SET NULL;
+
+UPDATE alembic_version SET version_num='bf1314a14815' WHERE alembic_version.version_num = 'c86a7907d598';
+
+-- Running upgrade bf1314a14815 -> 609a5bd68bf9
+
+ALTER TABLE users ADD COLUMN max_running_jobs INTEGER;
+
+UPDATE alembic_version SET version_num='609a5bd68bf9' WHERE alembic_version.version_num = 'bf1314a14815';
+
+-- Running upgrade 609a5bd68bf9 -> f6b91ab6d318
+
+ALTER TABLE users ADD COLUMN max_queue_depth INTEGER;
+
+UPDATE alembic_version SET version_num='f6b91ab6d318' WHERE alembic_version.version_num = '609a5bd68bf9';
+
+-- Running upgrade f6b91ab6d318 -> f7dc32c05bf0
+
+CREATE TABLE run_metrics (
+    id SERIAL NOT NULL,
+    analysis VARCHAR(32) NOT NULL,
+    result_id INTEGER NOT NULL,
+    phases JSON NOT NULL,
+    duration FLOAT NOT NULL,
+    started_at TIMESTAMP WITHOUT TIME ZONE,
+    finished_at TIMESTAMP WITHOUT TIME ZONE,
+    n_steps INTEGER,
+    n_nodes INTEGER,
+    n_variables INTEGER,
+    iterations INTEGER,
+    n_samples INTEGER,
+    PRIMARY KEY (id),
+    CONSTRAINT analysis_run_metrics UNIQUE (analysis, result_id)
+);
+
+CREATE INDEX ix_run_metrics_finished_at ON run_metrics (finished_at);
+
+ALTER TABLE cases ADD COLUMN n_nodes INTEGER;
+
+ALTER TABLE cases ADD COLUMN n_steps INTEGER;
+
+UPDATE alembic_version SET version_num='f7dc32c05bf0' WHERE alembic_version.version_num = 'f6b91ab6d318';
+
+-- Running upgrade f7dc32c05bf0 -> 1d93041ac3d6
+
+ALTER TABLE tencim_results ADD COLUMN istep_bin BYTEA;
+
+UPDATE tencim_results
+            SET istep_bin = decode('3e693400', 'hex')
+                || int4send(cardinality(istep))
+                || coalesce(
+                    (SELECT string_agg(int4send(v), ''::bytea ORDER BY i) FROM unnest(istep) WITH ORDINALITY AS u(v, i)),
+                    ''::bytea
+                )
+            WHERE istep IS NOT NULL;;
+
+ALTER TABLE tencim_results DROP COLUMN istep;
+
+ALTER TABLE tencim_results RENAME istep_bin TO istep;
+
+ALTER TABLE tencim_results ADD COLUMN t_bin BYTEA;
+
+UPDATE tencim_results
+            SET t_bin = decode('3e663800', 'hex')
+                || int4send(cardinality(t))
+                || coalesce(
+                    (SELECT string_agg(float8send(v), ''::bytea ORDER BY i) FROM unnest(t) WITH ORDINALITY AS u(v, i)),
+                    ''::bytea
+                )
+            WHERE t IS NOT NULL;;
+
+ALTER TABLE tencim_results DROP COLUMN t;
+
+ALTER TABLE tencim_results RENAME t_bin TO t;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_bin BYTEA;
+
+UPDATE tencim_results
+            SET rankine_rc_bin = decode('3e663800', 'hex')
+                || int4send(cardinality(rankine_rc))
+                || coalesce(
+                    (SELECT string_agg(float8send(v), ''::bytea ORDER BY i) FROM unnest(rankine_rc) WITH ORDINALITY AS u(v, i)),
+                    ''::bytea
+                )
+            WHERE rankine_rc IS NOT NULL;;
+
+ALTER TABLE tencim_results DROP COLUMN rankine_rc;
+
+ALTER TABLE tencim_results RENAME rankine_rc_bin TO rankine_rc;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_bin BYTEA;
+
+UPDATE tencim_results
+            SET mohr_coulomb_rc_bin = decode('3e663800', 'hex')
+                || int4send(cardinality(mohr_coulomb_rc))
+                || coalesce(
+                    (SELECT string_agg(float8send(v), ''::bytea ORDER BY i) FROM unnest(mohr_coulomb_rc) WITH ORDINALITY AS u(v, i)),
+                    ''::bytea
+                )
+            WHERE mohr_coulomb_rc IS NOT NULL;;
+
+ALTER TABLE tencim_results DROP COLUMN mohr_coulomb_rc;
+
+ALTER TABLE tencim_results RENAME mohr_coulomb_rc_bin TO mohr_coulomb_rc;
+
+UPDATE alembic_version SET version_num='1d93041ac3d6' WHERE alembic_version.version_num = 'f7dc32c05bf0';
+
+-- Running upgrade 1d93041ac3d6 -> 2713a71813b2
+
+ALTER TABLE tencim_results ADD COLUMN rc_threshold FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_min FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_max FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_mean FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_min_istep INTEGER;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_min_t FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN rankine_rc_steps_below INTEGER;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_min FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_max FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_mean FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_min_istep INTEGER;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_min_t FLOAT;
+
+ALTER TABLE tencim_results ADD COLUMN mohr_coulomb_rc_steps_below INTEGER;
+
+CREATE INDEX ix_tencim_results_mohr_coulomb_rc_max ON tencim_results (mohr_coulomb_rc_max);
+
+CREATE INDEX ix_tencim_results_mohr_coulomb_rc_mean ON tencim_results (mohr_coulomb_rc_mean);
+
+CREATE INDEX ix_tencim_results_mohr_coulomb_rc_min ON tencim_results (mohr_coulomb_rc_min);
+
+CREATE INDEX ix_tencim_results_mohr_coulomb_rc_min_t ON tencim_results (mohr_coulomb_rc_min_t);
+
+CREATE INDEX ix_tencim_results_mohr_coulomb_rc_steps_below ON tencim_results (mohr_coulomb_rc_steps_below);
+
+CREATE INDEX ix_tencim_results_rankine_rc_max ON tencim_results (rankine_rc_max);
+
+CREATE INDEX ix_tencim_results_rankine_rc_mean ON tencim_results (rankine_rc_mean);
+
+CREATE INDEX ix_tencim_results_rankine_rc_min ON tencim_results (rankine_rc_min);
+
+CREATE INDEX ix_tencim_results_rankine_rc_min_t ON tencim_results (rankine_rc_min_t);
+
+CREATE INDEX ix_tencim_results_rankine_rc_steps_below ON tencim_results (rankine_rc_steps_below);
+
+UPDATE alembic_version SET version_num='2713a71813b2' WHERE alembic_version.version_num = '1d93041ac3d6';
+
 COMMIT;
@@ -0,0 +1,82 @@
+"""tencim results rc as numpy arrays
+
+Converte as séries do `tencim_results` de `ARRAY` para o formato binário da
+coluna `NumpyArray` (cabeçalho com dtype, flags e número de elementos seguido
+dos valores). A conversão é feita no `postgres` com `float8send`/`int4send`,
+logo os valores das linhas antigas ficam `big-endian` (`>f8`/`>i4` no
+cabeçalho). As novas simulações são salvas `little-endian`.
+
+Revision ID: 1d93041ac3d6
+Revises: f7dc32c05bf0
+Create Date: 2026-10-18 16:44:11.645259
+
+"""
+
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1d93041ac3d6"
+down_revision: Union[str, None] = "f7dc32c05bf0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# coluna, dtype no cabeçalho, função do postgres
+COLUMNS = (
+    ("istep", ">i4", "int4send"),
+    ("t", ">f8", "float8send"),
+    ("rankine_rc", ">f8", "float8send"),
+    ("mohr_coulomb_rc", ">f8", "float8send"),
+)
+
+
+def upgrade() -> None:
+    for name, dtype, send in COLUMNS:
+        op.add_column("tencim_results", sa.Column(f"{name}_bin", sa.LargeBinary(), nullable=True))
+
+        header = (dtype.encode() + b"\x00").hex()
+        op.execute(
+            f"""
+            UPDATE tencim_results
+            SET {name}_bin = decode('{header}', 'hex')
+                || int4send(cardinality({name}))
+                || coalesce(
+                    (SELECT string_agg({send}(v), ''::bytea ORDER BY i) FROM unnest({name}) WITH ORDINALITY AS u(v, i)),
+                    ''::bytea
+                )
+            WHERE {name} IS NOT NULL;
+            """
+        )
+
+        op.drop_column("tencim_results", name)
+        op.alter_column("tencim_results", f"{name}_bin", new_column_name=name)
+
+
+def downgrade() -> None:
+    header_size = 8
+
+    conn = op.get_bind()
+
+    for name, _, _ in COLUMNS:
+        op.alter_column("tencim_results", name, new_column_name=f"{name}_bin")
+        item_type = sa.Integer() if name == "istep" else sa.Float()
+        op.add_column("tencim_results", sa.Column(name, postgresql.ARRAY(item_type), nullable=True))
+
+        rows = conn.execute(sa.text(f"SELECT id, {name}_bin FROM tencim_results WHERE {name}_bin IS NOT NULL")).all()
+        for id_, value in rows:
+            value = bytes(value)
+            dtype, flags = value[:3].decode(), value[3]
+            payload = zlib.decompress(value[header_size:]) if flags & 0x01 else value[header_size:]
+            array = np.frombuffer(payload, dtype=dtype)
+            conn.execute(
+                sa.text(f"UPDATE tencim_results SET {name} = :value WHERE id = :id"),
+                {"value": array.tolist(), "id": id_},
+            )
+
+        op.drop_column("tencim_results", f"{name}_bin")
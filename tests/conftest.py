@@ -6,20 +6,25 @@ import factory.fuzzy
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from confiacim_api.app import app
+from confiacim_api.blob_store import get_blob_store
 from confiacim_api.conf import settings
 from confiacim_api.database import database_url, get_session
 from confiacim_api.models import (
     Base,
     Case,
     FormResult,
+    FormResultGroup,
     HidrationPropInfos,
     LoadsBaseCaseInfos,
     MaterialsBaseCaseAverageProps,
+    MonteCarloChunk,
+    MonteCarloResult,
     ResultStatus,
     TencimResult,
+    TencimSweep,
     User,
     VariableGroup,
 )
@@ -100,6 +105,28 @@ def db_connection():
     engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def blob_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "BLOB_STORE_DIR", tmp_path / "blob_store")
+    return get_blob_store()
+
+
+@pytest.fixture(autouse=True)
+def case_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "CASE_CACHE_DIR", tmp_path / "case_cache")
+    return tmp_path / "case_cache"
+
+
+@pytest.fixture(autouse=True)
+def events_database(monkeypatch):
+    monkeypatch.setattr(settings, "DB_NAME", f"{settings.DB_NAME}_test")
+
+    engine = create_engine(f"{database_url}_test", echo=settings.SQLALCHEMY_ECHO)
+    monkeypatch.setattr("confiacim_api.events.SessionFactory", sessionmaker(engine))
+    yield
+    engine.dispose()
+
+
 @pytest.fixture
 def session(db_connection):
 
@@ -342,6 +369,62 @@ def case_with_real_file_without_hidrationprop(session, user: User):
     return case
 
 
+@pytest.fixture
+def tencim_sweep(session, case_with_real_file: Case):
+    sweep = TencimSweep(case=case_with_real_file, description="Sweep")
+    results = [
+        TencimResult(case=case_with_real_file, sweep=sweep, critical_point=10, status=ResultStatus.SUCCESS),
+        TencimResult(case=case_with_real_file, sweep=sweep, critical_point=20, status=ResultStatus.FAILED),
+        TencimResult(case=case_with_real_file, sweep=sweep, critical_point=30, status=ResultStatus.RUNNING),
+        TencimResult(case=case_with_real_file, sweep=sweep, critical_point=40, status=ResultStatus.CREATED),
+    ]
+    session.add_all([sweep, *results])
+    session.commit()
+    session.refresh(sweep)
+
+    return sweep
+
+
+@pytest.fixture
+def form_result_group(session, case_form_with_real_file: Case, form_case_config: dict):
+    group = FormResultGroup(case=case_form_with_real_file, config=form_case_config, description="Group")
+    results = [
+        FormResult(
+            case=case_form_with_real_file,
+            group=group,
+            critical_point=30,
+            status=ResultStatus.CREATED,
+        ),
+        FormResult(
+            case=case_form_with_real_file,
+            group=group,
+            critical_point=10,
+            status=ResultStatus.SUCCESS,
+            beta=3.1,
+            Pf=9.6e-4,
+        ),
+        FormResult(
+            case=case_form_with_real_file,
+            group=group,
+            critical_point=20,
+            status=ResultStatus.SUCCESS,
+            beta=2.5,
+            Pf=6.2e-3,
+        ),
+        FormResult(
+            case=case_form_with_real_file,
+            group=group,
+            critical_point=40,
+            status=ResultStatus.FAILED,
+        ),
+    ]
+    session.add_all([group, *results])
+    session.commit()
+    session.refresh(group)
+
+    return group
+
+
 @pytest.fixture
 def tencim_results(session, case_with_real_file: Case):
     istep = (1, 2, 3)
@@ -475,6 +558,35 @@ def form_results(
     return new_result
 
 
+@pytest.fixture
+def monte_carlo_result(
+    session,
+    case_form_with_real_file: Case,
+    form_case_config: dict,
+):
+
+    new_result = MonteCarloResult(
+        case=case_form_with_real_file,
+        status=ResultStatus.CREATED,
+        config=form_case_config,
+        critical_point=160,
+        n_samples=4,
+        chunk_size=2,
+        seed=42,
+        chunks_total=2,
+        description="Descrição do caso",
+        chunks=[
+            MonteCarloChunk(index=0, seed=1, n_samples=2),
+            MonteCarloChunk(index=1, seed=2, n_samples=2),
+        ],
+    )
+    session.add(new_result)
+    session.commit()
+    session.refresh(new_result)
+
+    return new_result
+
+
 @pytest.fixture
 def form_results_with_generated_case_files(
     session,
@@ -573,3 +685,10 @@ def variable_group(session: Session, case: Case, variables_form: list, correlati
 @pytest.fixture
 def zip_file_fake():
     return BytesIO(b"Fake zip file.")
+
+
+@pytest.fixture
+def full_queue(monkeypatch, mocker):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 2)
+    monkeypatch.setattr(settings, "ADMISSION_WORKERS", 1)
+    mocker.patch("confiacim_api.admission.queue_depths", side_effect=lambda queues: dict.fromkeys(queues, 2))
@@ -0,0 +1,111 @@
+from zipfile import BadZipFile
+
+import pytest
+
+from confiacim_api.errors import (
+    LoadsFileNotFoundInZipError,
+    MaterialsFileNotFoundInZipError,
+)
+from confiacim_api.files_and_folders_handlers import CaseBundle
+
+
+@pytest.mark.unit
+def test_positive_case_bundle_index_members():
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        with CaseBundle(fp) as bundle:
+            members = bundle.members
+
+    assert set(members) == {
+        "loads.dat",
+        "initialtemperature.dat",
+        "case.dat",
+        "adiabat.dat",
+        "mesh.dat",
+        "initialstress.dat",
+        "materials.dat",
+        "hidrationprop.dat",
+    }
+
+    materials = members["materials.dat"]
+    assert materials.name == "materials.dat"
+    assert materials.file_size > 0
+    assert materials.compress_size > 0
+    assert materials.CRC > 0
+    assert materials.header_offset >= 0
+
+
+@pytest.mark.unit
+def test_positive_case_bundle_parse_each_member_only_once(mocker):
+
+    read_text_spy = mocker.spy(CaseBundle, "read_text")
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        with CaseBundle(fp) as bundle:
+            assert bundle.materials is bundle.materials
+            assert bundle.loads is bundle.loads
+
+    assert read_text_spy.call_count == 2
+
+
+@pytest.mark.unit
+def test_positive_case_bundle_from_blob(case_with_real_file):
+
+    with CaseBundle.from_blob(case_with_real_file) as bundle:
+        materials = bundle.materials
+        loads = bundle.loads
+        hidration = bundle.hidration
+        case_dat = bundle.case_dat
+        mesh = bundle.mesh
+
+    assert materials.E_c == pytest.approx(10960000000.0)
+    assert materials.E_f == pytest.approx(37920000000.0)
+
+    assert loads.nodalsource == pytest.approx(329.07)
+
+    assert hidration.cohesion_c.t == (0.0, 0.04, 1.0)
+
+    assert "end mesh" in case_dat
+    assert mesh != ""
+
+
+@pytest.mark.unit
+def test_positive_case_bundle_case_dat_infos(case_with_real_file):
+
+    with CaseBundle.from_blob(case_with_real_file) as bundle:
+        infos = bundle.case_dat_infos
+
+    assert infos is not None
+    assert infos.n_nodes is not None and infos.n_nodes > 0
+    assert infos.n_steps > 0
+
+
+@pytest.mark.unit
+def test_positive_case_bundle_without_hidration_must_return_none(case_with_real_file_without_hidrationprop):
+
+    with CaseBundle.from_blob(case_with_real_file_without_hidrationprop) as bundle:
+        assert bundle.hidration is None
+
+
+@pytest.mark.unit
+def test_negative_case_bundle_without_materials(case_with_real_file_without_materials):
+
+    with CaseBundle.from_blob(case_with_real_file_without_materials) as bundle:
+        with pytest.raises(MaterialsFileNotFoundInZipError, match="Materials file not found in zip."):
+            _ = bundle.materials
+
+
+@pytest.mark.unit
+def test_negative_case_bundle_without_loads(case_with_real_file_without_loads):
+
+    with CaseBundle.from_blob(case_with_real_file_without_loads) as bundle:
+        with pytest.raises(LoadsFileNotFoundInZipError, match="Loads file not found in zip."):
+            _ = bundle.loads
+
+
+@pytest.mark.unit
+def test_negative_case_bundle_invalid_zip():
+
+    with open("tests/fixtures/case.dat", mode="rb") as fp:
+        with pytest.raises(BadZipFile):
+            CaseBundle(fp)
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from confiacim_api.files_and_folders_handlers import CaseDatInfos, extract_case_dat_infos
+
+
+@pytest.mark.unit
+def test_positive_extract_case_dat_infos():
+
+    file_str = Path("tests/fixtures/case.dat").read_text()
+
+    infos = extract_case_dat_infos(file_str)
+
+    assert infos == CaseDatInfos(n_nodes=83, n_steps=31309)
+
+
+@pytest.mark.unit
+def test_positive_extract_case_dat_infos_sum_the_loops_of_each_dt():
+
+    file_str = "mesh\nnnode 10 numel 4\nend mesh\ndt 1.0\nloop 3\nend loop\ndt 2.0\nloop 5\nend loop\nstop\n"
+
+    infos = extract_case_dat_infos(file_str)
+
+    assert infos == CaseDatInfos(n_nodes=10, n_steps=8)
+
+
+@pytest.mark.unit
+def test_positive_extract_case_dat_infos_without_nnode():
+
+    infos = extract_case_dat_infos("dt 1.0\nloop 3\nend loop\nstop\n")
+
+    assert infos == CaseDatInfos(n_nodes=None, n_steps=3)
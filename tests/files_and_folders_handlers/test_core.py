@@ -1,5 +1,4 @@
 import shutil
-from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from uuid import uuid4
@@ -8,11 +7,16 @@ from zipfile import ZipFile
 import pytest
 from sqlalchemy import select
 
+from confiacim_api.errors import BlobNotFoundError
 from confiacim_api.files_and_folders_handlers import (
     add_nocliprc_macro,
     clean_temporary_simulation_folder,
+    extract_tencim_case,
     new_time_loop,
+    open_case_file,
+    open_form_generated_case_file,
     remove_tab_and_unnecessary_spaces,
+    replace_file_content,
     rewrite_case_file,
     rm_nocliprc_macro,
     rm_setpnode_and_setptime,
@@ -99,6 +103,8 @@ def test_unzip_tencim_case_from_db(session, user, tmp_path):
 
     case_from_db = session.scalar(select(Case).where(Case.tag == "case1"))
 
+    assert case_from_db.base_file_digest is not None
+
     unzip_tencim_case(case_from_db, tmp_dir)
 
     list_dir = {d.name for d in Path(tmp_dir.name).iterdir()}
@@ -119,6 +125,115 @@ def test_unzip_tencim_case_from_db(session, user, tmp_path):
     assert list_dir == expected
 
 
+@pytest.mark.integration
+def test_unzip_tencim_case_from_blob_store(session, user, tmp_path, blob_store):
+
+    tmp_dir = temporary_simulation_folder(tmp_path)
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        case = Case(tag="case1", user=user, base_file_digest=blob_store.put(fp))
+        session.add(case)
+        session.commit()
+        session.reset()
+
+    case_from_db = session.scalar(select(Case).where(Case.tag == "case1"))
+
+    assert case_from_db.base_file is None
+
+    unzip_tencim_case(case_from_db, tmp_dir)
+
+    list_dir = {d.name for d in Path(tmp_dir.name).iterdir()}
+
+    assert len(list_dir) == 8
+
+
+@pytest.mark.integration
+def test_extract_tencim_case_use_cache(session, user, tmp_path, blob_store, mocker):
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        case = Case(tag="case1", user=user, base_file_digest=blob_store.put(fp))
+        session.add(case)
+        session.commit()
+
+    open_spy = mocker.spy(blob_store.__class__, "open")
+
+    tmp_dir_1 = temporary_simulation_folder(tmp_path)
+    tmp_dir_2 = temporary_simulation_folder(tmp_path)
+
+    assert extract_tencim_case(case, tmp_dir_1) is False
+    assert extract_tencim_case(case, tmp_dir_2) is True
+
+    assert open_spy.call_count == 1
+
+    assert len(list(Path(tmp_dir_2.name).iterdir())) == 8
+
+
+@pytest.mark.integration
+def test_extract_tencim_case_without_cache(session, user, tmp_path, monkeypatch):
+
+    monkeypatch.setattr("confiacim_api.conf.settings.CASE_CACHE_MAX_SIZE", 0)
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        case = Case(tag="case1", user=user, base_file=fp.read())
+        session.add(case)
+        session.commit()
+
+    tmp_dir = temporary_simulation_folder(tmp_path)
+
+    assert extract_tencim_case(case, tmp_dir) is False
+
+    assert len(list(Path(tmp_dir.name).iterdir())) == 8
+
+
+@pytest.mark.unit
+def test_replace_file_content_break_hardlink(tmp_path):
+
+    original = tmp_path / "original.dat"
+    original.write_text("original")
+
+    link = tmp_path / "link.dat"
+    link.hardlink_to(original)
+
+    replace_file_content(link, "new")
+
+    assert link.read_text() == "new"
+    assert original.read_text() == "original"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["link.dat", "original.dat"]
+
+
+@pytest.mark.unit
+def test_open_case_file_prefer_blob_store(blob_store):
+
+    digest = blob_store.put_bytes(b"blob store")
+
+    case = Case(tag="case1", base_file=b"legacy")
+    case.base_file_digest = digest
+
+    with open_case_file(case) as file:
+        assert file.read() == b"blob store"
+
+
+@pytest.mark.unit
+def test_open_case_file_fallback_to_db(blob_store):
+
+    case = Case(tag="case1", base_file=b"legacy")
+
+    assert blob_store.exists(case.base_file_digest) is False
+
+    with open_case_file(case) as file:
+        assert file.read() == b"legacy"
+
+
+@pytest.mark.unit
+def test_negative_open_case_file_blob_not_found(blob_store):
+
+    case = Case(tag="case1")
+    case.base_file_digest = "404"
+
+    with pytest.raises(BlobNotFoundError, match="Blob 404 not found."):
+        open_case_file(case)
+
+
 @pytest.mark.unit
 def test_add_nocliprc_macro():
 
@@ -289,15 +404,16 @@ def test_zip_form_case(tmp_path):
 
 
 @pytest.mark.integration
-def test_salve_the_zip_in_db(session, tmp_path, form_results):
+def test_salve_the_zip_in_db(session, tmp_path, form_results, blob_store):
 
     shutil.copy2("tests/fixtures/case_form_generated.zip", tmp_path)
 
     save_zip_in_db(session, tmp_path / "case_form_generated.zip", form_results)
 
-    assert form_results.generated_case_files is not None
+    assert form_results.generated_case_files is None
+    assert blob_store.exists(form_results.generated_case_files_digest)
 
-    with ZipFile(BytesIO(form_results.generated_case_files), "r") as zip_ref:
+    with open_form_generated_case_file(form_results) as file, ZipFile(file, "r") as zip_ref:
         assert set(zip_ref.namelist()) == {
             "materials.dat",
             "templates/materials.jinja",
@@ -311,18 +427,19 @@ def test_salve_the_zip_in_db(session, tmp_path, form_results):
 
 
 @pytest.mark.integration
-def test_save_generated_form_files(session, tmp_path, form_results):
+def test_save_generated_form_files(session, tmp_path, form_results, blob_store):
     with open("tests/fixtures/case_form_generated.zip", mode="rb") as file:
         with ZipFile(file, "r") as zip_ref:
             zip_ref.extractall(tmp_path)
 
     save_generated_form_files(session, tmp_path, form_results)
 
-    assert form_results.generated_case_files is not None
+    assert form_results.generated_case_files is None
+    assert blob_store.exists(form_results.generated_case_files_digest)
 
     assert (tmp_path / "tmp_case_form.zip").exists() is False
 
-    with ZipFile(BytesIO(form_results.generated_case_files), "r") as zip_ref:
+    with open_form_generated_case_file(form_results) as file, ZipFile(file, "r") as zip_ref:
         assert set(zip_ref.namelist()) == {
             "materials.dat",
             "templates/materials.jinja",
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from confiacim_api.models import Case, MonteCarloChunk, MonteCarloResult, ResultStatus
+
+
+@pytest.mark.integration
+def test_create_monte_carlo_result(session: Session, case: Case):
+
+    new_result = MonteCarloResult(
+        case=case,
+        critical_point=12,
+        n_samples=250,
+        chunk_size=100,
+        seed=2**40,
+        chunks_total=3,
+        chunks=[MonteCarloChunk(index=i, seed=i, n_samples=n) for i, n in enumerate((100, 100, 50))],
+    )
+    session.add(new_result)
+    session.commit()
+    new_result_id = new_result.id
+    session.reset()
+
+    result_from_db = session.get(MonteCarloResult, new_result_id)
+
+    assert result_from_db is not None
+    assert result_from_db is not new_result
+
+    assert result_from_db.status == ResultStatus.CREATED
+    assert result_from_db.seed == 2**40
+    assert result_from_db.chunks_done == 0
+    assert result_from_db.total == 0
+    assert result_from_db.valid_simulations == 0
+    assert result_from_db.fail == 0
+    assert result_from_db.Pf is None
+
+    assert [c.n_samples for c in result_from_db.chunks] == [100, 100, 50]
+    assert {c.status for c in result_from_db.chunks} == {ResultStatus.CREATED}
+    assert {c.finished_at for c in result_from_db.chunks} == {None}
+
+    assert isinstance(result_from_db.created_at, datetime)
+
+
+@pytest.mark.integration
+def test_delete_case_must_delete_monte_carlo_results(session: Session, monte_carlo_result: MonteCarloResult):
+
+    session.delete(monte_carlo_result.case)
+    session.commit()
+
+    assert session.get(MonteCarloResult, monte_carlo_result.id) is None
+    assert session.query(MonteCarloChunk).count() == 0
+
+
+@pytest.mark.unit
+def test_str(monte_carlo_result):
+    expected = f"MonteCarloResult(id={monte_carlo_result.id}, case={monte_carlo_result.case.tag})"
+    assert str(monte_carlo_result) == expected
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import numpy as np
 import pytest
 from sqlalchemy.orm import Session
 
@@ -38,10 +39,16 @@ def test_create_case(session: Session, case: Case):
 
     assert result_from_db.id == new_result_id
     assert result_from_db.case.id == case_id
-    assert result_from_db.t == t
-    assert result_from_db.istep == istep
-    assert result_from_db.rankine_rc == rankine_rc
-    assert result_from_db.mohr_coulomb_rc == mohr_coulomb_rc
+    assert result_from_db.t is not None
+    assert result_from_db.istep is not None
+    assert result_from_db.rankine_rc is not None
+    assert result_from_db.mohr_coulomb_rc is not None
+    assert tuple(result_from_db.t) == t
+    assert tuple(result_from_db.istep) == istep
+    assert tuple(result_from_db.rankine_rc) == rankine_rc
+    assert tuple(result_from_db.mohr_coulomb_rc) == mohr_coulomb_rc
+    assert result_from_db.t.dtype == np.float64
+    assert result_from_db.istep.dtype == np.int32
     assert result_from_db.status == ResultStatus.RUNNING
     assert result_from_db.description == "Descrição do Resultado"
 
@@ -1,3 +1,4 @@
+import hashlib
 from io import BytesIO
 
 import pytest
@@ -11,6 +12,7 @@ from confiacim_api.errors import (
     MaterialsFileEmptyError,
     MaterialsFileNotFoundInZipError,
 )
+from confiacim_api.idempotency import REPLAYED_HEADER
 from confiacim_api.models import Case, User
 
 ROUTE_VIEW_NAME = "case_create"
@@ -22,7 +24,7 @@ def payload():
 
 
 @pytest.mark.integration
-def test_positive_create(client_auth: TestClient, session, user: User, payload):
+def test_positive_create(client_auth: TestClient, session, user: User, payload, blob_store):
 
     with open("tests/fixtures/case1.zip", mode="rb") as fp:
         resp = client_auth.post(
@@ -40,6 +42,12 @@ def test_positive_create(client_auth: TestClient, session, user: User, payload):
     assert case_from_db.user == user
     assert case_from_db.description == "Any description you want"
 
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        assert case_from_db.base_file_digest == hashlib.sha256(fp.read()).hexdigest()
+
+    assert case_from_db.base_file is None
+    assert blob_store.exists(case_from_db.base_file_digest)
+
     assert case_from_db.materials.E_c == pytest.approx(1.096e10)
     assert case_from_db.materials.poisson_c == pytest.approx(0.228)
     assert case_from_db.materials.thermal_expansion_c == pytest.approx(1.0e-05)
@@ -344,6 +352,28 @@ def test_positive_create_two_user_can_have_the_same_tag_name(
     assert session.scalar(select(func.count()).select_from(Case)) == 2
 
 
+@pytest.mark.integration
+def test_positive_create_idempotency_key_replay(client_auth: TestClient, session, payload, blob_store):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME)
+    headers = {"Idempotency-Key": "case-create-1"}
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        resp = client_auth.post(url, data=payload, files={"case_file": fp}, headers=headers)
+
+    assert resp.status_code == status.HTTP_201_CREATED
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        resp_replay = client_auth.post(url, data=payload, files={"case_file": fp}, headers=headers)
+
+    assert resp_replay.status_code == status.HTTP_201_CREATED
+    assert resp_replay.headers[REPLAYED_HEADER] == "true"
+
+    assert resp_replay.json() == resp.json()
+
+    assert session.scalar(select(func.count()).select_from(Case)) == 1
+
+
 @pytest.mark.integration
 def test_negative_file_problem_case_zipfile_without_materials(
     session,
@@ -372,7 +402,8 @@ def test_negative_file_problem_raise_materials_file_not_found_in_zipfile_error(
 ):
 
     mocker.patch(
-        "confiacim_api.routers.case.extract_materials_infos_from_blob",
+        "confiacim_api.routers.case.CaseBundle.materials",
+        new_callable=mocker.PropertyMock,
         side_effect=MaterialsFileNotFoundInZipError("Materials file not found in zip."),
     )
 
@@ -420,7 +451,7 @@ def test_negative_file_problem_raise_empty_materials_file(
 ):
 
     mocker.patch(
-        "confiacim_api.files_and_folders_handlers.materials.extract_materials_infos",
+        "confiacim_api.files_and_folders_handlers.bundle.extract_materials_infos",
         side_effect=MaterialsFileEmptyError("Empty materials file."),
     )
 
@@ -463,7 +494,7 @@ def test_negative_file_problem_raise_empty_loads_file(
 ):
 
     mocker.patch(
-        "confiacim_api.files_and_folders_handlers.loads.extract_loads_infos",
+        "confiacim_api.files_and_folders_handlers.bundle.extract_loads_infos",
         side_effect=LoadsFileEmptyError("Empty loads file."),
     )
 
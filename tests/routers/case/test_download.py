@@ -21,6 +21,106 @@ def test_download_case(
     assert resp.content == case_with_file.base_file
 
 
+@pytest.mark.integration
+def test_download_case_from_blob_store(
+    session,
+    client_auth: TestClient,
+    case: Case,
+    blob_store,
+):
+    case.base_file_digest = blob_store.put_bytes(b"Fake zip file.")
+    session.commit()
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case.id)
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"] == "application/zip"
+    assert resp.content == b"Fake zip file."
+
+
+@pytest.mark.integration
+def test_negative_download_case_blob_not_found(
+    session,
+    client_auth: TestClient,
+    case: Case,
+):
+    case.base_file_digest = "404"
+    session.commit()
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case.id)
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json() == {"detail": "File not found."}
+
+
+@pytest.mark.integration
+def test_download_case_etag(client_auth: TestClient, case_with_file: Case):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case_with_file.id)
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["etag"] == f'"{case_with_file.base_file_digest}"'
+    assert resp.headers["accept-ranges"] == "bytes"
+    assert resp.headers["content-length"] == str(len(b"Fake zip file."))
+    assert resp.headers["content-disposition"] == "attachment; filename=case-1.zip"
+
+
+@pytest.mark.integration
+def test_download_case_if_none_match_return_304(client_auth: TestClient, case_with_file: Case):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case_with_file.id)
+    resp = client_auth.get(url, headers={"If-None-Match": f'"{case_with_file.base_file_digest}"'})
+
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert resp.headers["etag"] == f'"{case_with_file.base_file_digest}"'
+    assert resp.content == b""
+
+
+@pytest.mark.integration
+def test_download_case_if_none_match_outdated_return_200(client_auth: TestClient, case_with_file: Case):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case_with_file.id)
+    resp = client_auth.get(url, headers={"If-None-Match": '"outdated"'})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.content == b"Fake zip file."
+
+
+@pytest.mark.integration
+def test_download_case_range(client_auth: TestClient, case_with_file: Case):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case_with_file.id)
+    resp = client_auth.get(url, headers={"Range": "bytes=5-7"})
+
+    assert resp.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert resp.headers["content-range"] == "bytes 5-7/14"
+    assert resp.headers["content-length"] == "3"
+    assert resp.content == b"zip"
+
+
+@pytest.mark.integration
+def test_download_case_range_if_range_outdated_return_full_file(client_auth: TestClient, case_with_file: Case):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case_with_file.id)
+    resp = client_auth.get(url, headers={"Range": "bytes=5-7", "If-Range": '"outdated"'})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.content == b"Fake zip file."
+
+
+@pytest.mark.integration
+def test_negative_download_case_range_not_satisfiable(client_auth: TestClient, case_with_file: Case):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case_with_file.id)
+    resp = client_auth.get(url, headers={"Range": "bytes=100-"})
+
+    assert resp.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert resp.headers["content-range"] == "bytes */14"
+
+
 @pytest.mark.integration
 def test_negative_case_not_found(client_auth: TestClient):
 
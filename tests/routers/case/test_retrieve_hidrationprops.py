@@ -35,6 +35,25 @@ def test_positive_retrieve(client_auth: TestClient, hidration_props: HidrationPr
     )
 
 
+@pytest.mark.integration
+def test_positive_retrieve_stride(client_auth: TestClient, hidration_props: HidrationPropInfos):
+
+    resp = client_auth.get(
+        app.url_path_for(ROUTE_RETRIEVE_NAME, case_id=hidration_props.case_id),
+        params={"stride": 2, "downsample": "minmax"},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["poisson_c_t"] == [1.0, 3.0]
+    assert body["poisson_c_values"] == [6.0, 4.0]
+
+    assert body["cohesion_c_t"] == [1.0]
+    assert body["cohesion_c_values"] == [10.0]
+
+
 @pytest.mark.integration
 def test_negative_case_without_hidration_props(client_auth: TestClient, case_with_file: Case):
 
@@ -35,6 +35,25 @@ def test_positive_retrieve(client_auth: TestClient, case_with_loads_info: Case):
     assert body["updated_at"] == (loads.updated_at.isoformat() if loads.updated_at is not None else None)
 
 
+@pytest.mark.integration
+def test_positive_retrieve_stride(client_auth: TestClient, case_with_loads_info: Case):
+
+    resp = client_auth.get(
+        app.url_path_for(ROUTE_retrieve_NAME, case_id=case_with_loads_info.id),
+        params={"stride": 2},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["mechanical_t"] == [1.0, 3.0]
+    assert body["mechanical_force"] == [20.0, 22.0]
+
+    assert body["thermal_t"] == [1.0, 2.0]
+    assert body["thermal_h"] == [6.0, 5.0]
+
+
 @pytest.mark.integration
 def test_negative_case_without_loads(client_auth: TestClient, case_with_file: Case):
 
@@ -1,9 +1,12 @@
+import hashlib
 from io import BytesIO
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+import confiacim_api.blob_store
 from confiacim_api.app import app
 from confiacim_api.errors import (
     MaterialsFileEmptyError,
@@ -11,6 +14,7 @@ from confiacim_api.errors import (
     MaterialsFileValueError,
 )
 from confiacim_api.files_and_folders_handlers import (
+    CaseDatInfos,
     HidrationProp,
     LoadsInfos,
     MaterialsInfos,
@@ -20,7 +24,9 @@ from confiacim_api.files_and_folders_handlers.loads import (
     MechanicalLoads,
     ThermalLoads,
 )
+from confiacim_api.idempotency import REPLAYED_HEADER
 from confiacim_api.models import Case
+from confiacim_api.routers import case as case_router
 
 ROUTE_VIEW_NAME = "upload_case_file"
 
@@ -32,58 +38,54 @@ def test_upload_case(
     case: Case,
     mocker,
     zip_file_fake: BytesIO,
+    blob_store,
 ):
     is_zipfile_mocker = mocker.patch(
         "confiacim_api.routers.case.file_case_is_zipfile",
         return_value=True,
     )
 
-    extract_materials_infos_from_blob_mocker = mocker.patch(
-        "confiacim_api.routers.case.extract_materials_infos_from_blob",
-        return_value=MaterialsInfos(
-            E_c=1.0,
-            poisson_c=0.2,
-            thermal_expansion_c=0.3,
-            thermal_conductivity_c=0.4,
-            volumetric_heat_capacity_c=0.5,
-            friction_angle_c=0.6,
-            cohesion_c=0.7,
-            #
-            E_f=1.0,
-            poisson_f=0.1,
-            thermal_expansion_f=0.2,
-            thermal_conductivity_f=0.3,
-            volumetric_heat_capacity_f=0.4,
-        ),
+    bundle = MagicMock()
+    bundle.materials = MaterialsInfos(
+        E_c=1.0,
+        poisson_c=0.2,
+        thermal_expansion_c=0.3,
+        thermal_conductivity_c=0.4,
+        volumetric_heat_capacity_c=0.5,
+        friction_angle_c=0.6,
+        cohesion_c=0.7,
+        #
+        E_f=1.0,
+        poisson_f=0.1,
+        thermal_expansion_f=0.2,
+        thermal_conductivity_f=0.3,
+        volumetric_heat_capacity_f=0.4,
     )
-
-    extract_loads_infos_from_blob_mocker = mocker.patch(
-        "confiacim_api.routers.case.extract_loads_infos_from_blob",
-        return_value=LoadsInfos(
-            nodalsource=100.0,
-            mechanical_loads=MechanicalLoads(t=(1, 2), force=(2.0, 3.0)),
-            thermal_loads=ThermalLoads(t=(1, 2, 3), h=(5.0, 5.0, 5.0), temperature=(300.0, 300.0, 300.0)),
-        ),
+    bundle.loads = LoadsInfos(
+        nodalsource=100.0,
+        mechanical_loads=MechanicalLoads(t=(1, 2), force=(2.0, 3.0)),
+        thermal_loads=ThermalLoads(t=(1, 2, 3), h=(5.0, 5.0, 5.0), temperature=(300.0, 300.0, 300.0)),
     )
-
-    extract_hidrationprop_infos_from_blob_mocker = mocker.patch(
-        "confiacim_api.routers.case.extract_hidration_infos_from_blob",
-        return_value=HidrationProp(
-            E_c=TimeSeries(
-                t=(1.0, 2.0),
-                values=(90.0, 80.0),
-            ),
-            poisson_c=TimeSeries(
-                t=(0.0, 2.0),
-                values=(0.18, 0.2),
-            ),
-            cohesion_c=TimeSeries(
-                t=(1.0, 2.0, 3.0),
-                values=(100.0, 80.0, 120.0),
-            ),
+    bundle.hidration = HidrationProp(
+        E_c=TimeSeries(
+            t=(1.0, 2.0),
+            values=(90.0, 80.0),
+        ),
+        poisson_c=TimeSeries(
+            t=(0.0, 2.0),
+            values=(0.18, 0.2),
+        ),
+        cohesion_c=TimeSeries(
+            t=(1.0, 2.0, 3.0),
+            values=(100.0, 80.0, 120.0),
         ),
     )
 
+    bundle.case_dat_infos = CaseDatInfos(n_nodes=83, n_steps=1200)
+
+    case_bundle_mocker = mocker.patch("confiacim_api.routers.case.CaseBundle")
+    case_bundle_mocker.return_value.__enter__.return_value = bundle
+
     resp = client_auth.post(
         app.url_path_for(ROUTE_VIEW_NAME, case_id=case.id),
         files={"case_file": zip_file_fake},
@@ -92,9 +94,7 @@ def test_upload_case(
     assert resp.status_code == status.HTTP_200_OK
 
     is_zipfile_mocker.assert_called_once()
-    extract_materials_infos_from_blob_mocker.assert_called_once()
-    extract_loads_infos_from_blob_mocker.assert_called_once()
-    extract_hidrationprop_infos_from_blob_mocker.assert_called_once()
+    case_bundle_mocker.assert_called_once()
 
     assert resp.json() == {"detail": "File upload success."}
 
@@ -131,7 +131,14 @@ def test_upload_case(
     assert case_from_db.hidration_props.cohesion_c_t == (1.0, 2.0, 3.0)
     assert case_from_db.hidration_props.cohesion_c_values == (100.0, 80.0, 120.0)
 
-    assert case_from_db.base_file == b"Fake zip file."
+    assert case_from_db.n_nodes == 83
+    assert case_from_db.n_steps == 1200
+
+    assert case_from_db.base_file is None
+    assert case_from_db.base_file_digest == hashlib.sha256(b"Fake zip file.").hexdigest()
+
+    with blob_store.open(case_from_db.base_file_digest) as fp:
+        assert fp.read() == b"Fake zip file."
 
 
 @pytest.mark.integration
@@ -184,6 +191,44 @@ def test_upload_case_real_file(
     assert case_from_db.hidration_props.cohesion_c_values == (800000.0, 800000.0, 19700000.0)
 
 
+@pytest.mark.integration
+def test_upload_case_idempotency_key(
+    client_auth: TestClient,
+    case: Case,
+    mocker,
+):
+
+    url = app.url_path_for(ROUTE_VIEW_NAME, case_id=case.id)
+    headers = {"Idempotency-Key": "upload-1"}
+
+    scan_file_spy = mocker.spy(case_router, "scan_file")
+    blob_scan_file_spy = mocker.spy(confiacim_api.blob_store, "scan_file")
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        resp = client_auth.post(url, files={"case_file": fp}, headers=headers)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    scan_file_spy.assert_called_once()
+    blob_scan_file_spy.assert_not_called()
+
+    update_case_file_spy = mocker.spy(case_router, "_update_case_file")
+
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        resp_replay = client_auth.post(url, files={"case_file": fp}, headers=headers)
+
+    assert resp_replay.status_code == status.HTTP_200_OK
+    assert resp_replay.headers[REPLAYED_HEADER] == "true"
+    assert resp_replay.json() == {"detail": "File upload success."}
+
+    update_case_file_spy.assert_not_called()
+
+    with open("tests/fixtures/case_without_hidration.zip", mode="rb") as fp:
+        resp = client_auth.post(url, files={"case_file": fp}, headers=headers)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.integration
 def test_upload_case_already_have_materials_but_without_hidration(
     session,
@@ -319,7 +364,7 @@ def test_negative_upload_file_raise_materials_file_value_error(
 ):
 
     mocker.patch(
-        "confiacim_api.files_and_folders_handlers.materials.extract_materials_infos",
+        "confiacim_api.files_and_folders_handlers.bundle.extract_materials_infos",
         side_effect=MaterialsFileValueError("Invalid material number: 1"),
     )
 
@@ -342,7 +387,7 @@ def test_negative_upload_file_raise_empty_materials_file(
 ):
 
     mocker.patch(
-        "confiacim_api.files_and_folders_handlers.materials.extract_materials_infos",
+        "confiacim_api.files_and_folders_handlers.bundle.extract_materials_infos",
         side_effect=MaterialsFileEmptyError("Empty materials file."),
     )
 
@@ -365,7 +410,8 @@ def test_negative_upload_file_raise_materials_file_not_found_in_zip_error(
 ):
 
     mocker.patch(
-        "confiacim_api.routers.case.extract_materials_infos_from_blob",
+        "confiacim_api.routers.case.CaseBundle.materials",
+        new_callable=mocker.PropertyMock,
         side_effect=MaterialsFileNotFoundInZipError("Materials file not found in zip."),
     )
 
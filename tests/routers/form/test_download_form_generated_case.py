@@ -26,6 +26,32 @@ def test_download_case(
     assert resp.content == form_results_with_generated_case_files.generated_case_files
 
 
+@pytest.mark.integration
+def test_download_case_range_and_etag(
+    client_auth: TestClient,
+    form_results_with_generated_case_files: FormResult,
+):
+
+    url = app.url_path_for(
+        ROUTE_VIEW_NAME,
+        case_id=form_results_with_generated_case_files.case.id,
+        result_id=form_results_with_generated_case_files.id,
+    )
+    etag = f'"{form_results_with_generated_case_files.generated_case_files_digest}"'
+
+    resp = client_auth.get(url, headers={"Range": "bytes=-10"})
+
+    assert form_results_with_generated_case_files.generated_case_files is not None
+
+    assert resp.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert resp.headers["etag"] == etag
+    assert resp.content == form_results_with_generated_case_files.generated_case_files[-10:]
+
+    resp = client_auth.get(url, headers={"If-None-Match": etag})
+
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+
 @pytest.mark.integration
 def test_negative_case_not_found(client_auth: TestClient, form_results_with_generated_case_files: FormResult):
 
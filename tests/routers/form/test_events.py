@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.conf import settings
+from confiacim_api.events import publish_status
+from confiacim_api.models import FormResult, ResultStatus
+
+ROUTE_NAME = "form_result_events"
+
+
+@pytest.fixture(autouse=True)
+def snapshot_session(mocker, session):
+    mocker.patch("confiacim_api.routers.form.SessionFactory", return_value=session)
+
+
+@pytest.mark.integration
+def test_positive_events_finished_result(client_auth: TestClient, session, form_results: FormResult):
+
+    form_results.status = ResultStatus.SUCCESS
+    form_results.iteration_infos = {"beta": [3.0, 2.5], "resid": [0.1, 0.001], "E_c": [100.0, 110.0]}
+    session.commit()
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=form_results.case_id,
+        result_id=form_results.id,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    assert resp.text == (
+        'event: iteration\ndata: {"it": 1, "beta": 3.0, "resid": 0.1, "variables": {"E_c": 100.0}}\n\n'
+        'event: iteration\ndata: {"it": 2, "beta": 2.5, "resid": 0.001, "variables": {"E_c": 110.0}}\n\n'
+        'event: status\ndata: {"status": "success"}\n\n'
+    )
+
+
+@pytest.mark.integration
+def test_positive_events_running_result_until_finished(
+    client_auth: TestClient,
+    session,
+    form_results: FormResult,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "EVENTS_HEARTBEAT", 0.1)
+
+    form_results.status = ResultStatus.RUNNING
+    session.commit()
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=form_results.case_id,
+        result_id=form_results.id,
+    )
+
+    done = threading.Event()
+
+    def worker():
+        while not done.wait(0.2):
+            publish_status("form", form_results.id, ResultStatus.FAILED, "Tencim error")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+
+    try:
+        resp = client_auth.get(url)
+    finally:
+        done.set()
+        thread.join()
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.text.startswith('event: status\ndata: {"status": "runnig"}\n\n')
+    assert resp.text.endswith('event: status\ndata: {"status": "failed", "error": "Tencim error"}\n\n')
+
+
+@pytest.mark.integration
+def test_negative_events_result_not_found(client_auth: TestClient, form_results: FormResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=form_results.case_id,
+        result_id=404,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_events_user_can_access_only_their_own_cases(
+    client: TestClient,
+    form_results: FormResult,
+    other_user_token: str,
+):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=form_results.case.id,
+        result_id=form_results.id,
+    )
+
+    resp = client.get(
+        url,
+        headers={"Authorization": f"Bearer {other_user_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_events_must_have_token(client: TestClient):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=1, result_id=1)
+
+    resp = client.get(url)
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+    assert resp.json() == {"detail": "Not authenticated"}
@@ -0,0 +1,96 @@
+import io
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import Case, FormResult, ResultStatus
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+ROUTE_NAME = "form_result_export"
+CASE_ROUTE_NAME = "form_case_export"
+
+
+@pytest.fixture
+def form_results_with_iterations(session, case_form_with_real_file: Case):
+    results = [
+        FormResult(
+            case=case_form_with_real_file,
+            status=ResultStatus.SUCCESS,
+            iteration_infos={"beta": [1.13, 1.07], "resid": [1.0, 0.05], "E_c": [1.05, 1.04]},
+        ),
+        FormResult(
+            case=case_form_with_real_file,
+            status=ResultStatus.SUCCESS,
+            iteration_infos={"beta": [2.0], "resid": [1.0], "poisson_c": [0.97]},
+        ),
+    ]
+    session.add_all(results)
+    session.commit()
+
+    return results
+
+
+@pytest.mark.integration
+def test_positive_export(client_auth: TestClient, form_results_with_iterations: list[FormResult]):
+
+    result = form_results_with_iterations[0]
+
+    url = app.url_path_for(ROUTE_NAME, case_id=result.case_id, result_id=result.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-disposition"] == (f"attachment; filename={result.case.tag}-form-{result.id}.parquet")
+
+    table = pq.read_table(io.BytesIO(resp.content))
+
+    assert table.to_pydict() == {
+        "result_id": [result.id, result.id],
+        "iteration": [1, 2],
+        "beta": [1.13, 1.07],
+        "resid": [1.0, 0.05],
+        "E_c": [1.05, 1.04],
+    }
+
+
+@pytest.mark.integration
+def test_positive_case_export(client_auth: TestClient, form_results_with_iterations: list[FormResult]):
+
+    first, second = form_results_with_iterations
+
+    url = app.url_path_for(CASE_ROUTE_NAME, case_id=first.case_id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    table = pq.read_table(io.BytesIO(resp.content))
+
+    assert table.schema.names == ["result_id", "iteration", "beta", "resid", "E_c", "poisson_c"]
+    assert table.column("result_id").to_pylist() == [first.id, first.id, second.id]
+    assert table.column("beta").to_pylist() == [1.13, 1.07, 2.0]
+
+
+@pytest.mark.integration
+def test_negative_export_result_not_found(client_auth: TestClient, form_results_with_iterations: list[FormResult]):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=form_results_with_iterations[0].case_id, result_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_case_export_case_not_found(client_auth: TestClient):
+
+    url = app.url_path_for(CASE_ROUTE_NAME, case_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Case not found"
@@ -0,0 +1,248 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from confiacim_api.app import app
+from confiacim_api.conf import settings
+from confiacim_api.fingerprint import form_config_fingerprint
+from confiacim_api.models import Case, FormResult, FormResultGroup, ResultStatus
+from confiacim_api.schemes.form import FormConfig
+
+ROUTE_NAME = "form_group_run"
+
+
+@pytest.fixture
+def form_config():
+    return {
+        "variables": [
+            {
+                "name": "E_c",
+                "dist": {
+                    "name": "lognormal",
+                    "params": {
+                        "param1": 1.0,
+                        "param2": 0.1,
+                    },
+                },
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def task_mocker(mocker):
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    return mocker.patch(
+        "confiacim_api.routers.form.form_group_task.apply_async",
+        return_value=task,
+    )
+
+
+@pytest.mark.integration
+def test_positive_group_list(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    form_config,
+    task_mocker,
+):
+
+    payload = {"form": form_config, "critical_points": [30, 10, 20, 10], "description": "Group"}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    group = session.scalars(select(FormResultGroup)).one()
+    results = session.scalars(select(FormResult).order_by(FormResult.id)).all()
+
+    assert body["group_id"] == group.id
+    assert body["task_id"] == str(group.task_id)
+    assert body["result_ids"] == [r.id for r in results]
+
+    assert group.description == "Group"
+    assert group.config == form_config
+    assert group.case == case_with_file
+
+    assert [r.critical_point for r in results] == [10, 20, 30]
+    assert all(r.group_id == group.id for r in results)
+    assert all(r.config == form_config for r in results)
+    assert all(r.status == ResultStatus.CREATED for r in results)
+    assert all(r.description == "Group" for r in results)
+    assert case_with_file.base_file_digest is not None
+    assert all(
+        r.fingerprint
+        == form_config_fingerprint(case_with_file.base_file_digest, FormConfig(**form_config), r.critical_point)
+        for r in results
+    )
+
+    task_mocker.assert_called_once_with(kwargs={"group_id": group.id}, queue="celery")
+
+
+@pytest.mark.integration
+def test_positive_group_range(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    form_config,
+    task_mocker,
+):
+
+    payload = {"form": form_config, "critical_points": {"start": 10, "stop": 50, "step": 20}}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    results = session.scalars(select(FormResult).order_by(FormResult.id)).all()
+
+    assert [r.critical_point for r in results] == [10, 30, 50]
+
+
+@pytest.mark.integration
+def test_negative_group_max_points(
+    client_auth: TestClient,
+    case_with_file: Case,
+    form_config,
+    task_mocker,
+):
+
+    payload = {"form": form_config, "critical_points": {"start": 1, "stop": 101}}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json()["detail"][0]["msg"] == "Value error, The group has 101 critical points, the maximum is 100."
+
+    task_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "critical_points, msg",
+    [
+        ([], "Value error, The group must have at least one critical point."),
+        ({"start": 10, "stop": 1}, "Value error, The range start (10) must be less than or equal to the stop (1)."),
+    ],
+)
+def test_negative_group_without_critical_points(
+    client_auth: TestClient,
+    case_with_file: Case,
+    form_config,
+    task_mocker,
+    critical_points,
+    msg,
+):
+
+    payload = {"form": form_config, "critical_points": critical_points}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json()["detail"][0]["msg"] == msg
+
+
+@pytest.mark.integration
+def test_negative_case_not_found(client_auth: TestClient, form_config, task_mocker):
+
+    payload = {"form": form_config, "critical_points": [10]}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=404), json=payload)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert resp.json() == {"detail": "Case not found."}
+
+
+@pytest.mark.integration
+def test_negative_case_without_base_file(client_auth: TestClient, case: Case, form_config, task_mocker):
+
+    payload = {"form": form_config, "critical_points": [10]}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json() == {"detail": "The case has no base file."}
+
+
+@pytest.mark.integration
+def test_negative_user_can_run_only_their_own_cases(
+    client: TestClient,
+    case_with_file: Case,
+    other_user_token,
+    form_config,
+    task_mocker,
+):
+
+    payload = {"form": form_config, "critical_points": [10]}
+
+    resp = client.post(
+        app.url_path_for(ROUTE_NAME, case_id=case_with_file.id),
+        headers={"Authorization": f"Bearer {other_user_token}"},
+        json=payload,
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_negative_need_have_token(client: TestClient, form_config):
+
+    resp = client.post(app.url_path_for(ROUTE_NAME, case_id=1), json={"form": form_config, "critical_points": [10]})
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.integration
+def test_negative_group_queue_full(
+    client_auth: TestClient,
+    session,
+    monkeypatch,
+    case_with_file: Case,
+    form_config,
+    task_mocker,
+    full_queue,
+):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 3)
+
+    payload = {"form": form_config, "critical_points": [10, 20]}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert "Retry-After" in resp.headers
+
+    task_mocker.assert_not_called()
+
+    assert session.scalars(select(FormResultGroup)).all() == []
+
+
+@pytest.mark.integration
+def test_negative_group_more_points_than_the_admission_limit(
+    client_auth: TestClient,
+    monkeypatch,
+    case_with_file: Case,
+    form_config,
+    task_mocker,
+):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 1)
+
+    payload = {"form": form_config, "critical_points": [10, 20]}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert resp.json() == {"detail": "The request has more simulations than the admission limit (1)."}
+
+    task_mocker.assert_not_called()
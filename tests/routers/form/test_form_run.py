@@ -6,8 +6,12 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 
+from confiacim_api.affinity import affinity_queue
 from confiacim_api.app import app
-from confiacim_api.models import Case, FormResult
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
+from confiacim_api.idempotency import REPLAYED_HEADER
+from confiacim_api.models import Case, FormResult, ResultStatus
 
 ROUTE_NAME = "form_run"
 
@@ -56,7 +60,7 @@ def test_positive_form_run(
     task.id = str(uuid4())
 
     form_run_mocker = mocker.patch(
-        "confiacim_api.routers.form.form_task.delay",
+        "confiacim_api.routers.form.run_form_pipeline",
         return_value=task,
     )
 
@@ -68,17 +72,76 @@ def test_positive_form_run(
     result = session.scalars(select(FormResult)).one()
 
     form_run_mocker.assert_called_once()
-    form_run_mocker.assert_called_with(result_id=result.id)
+    form_run_mocker.assert_called_with(result.id, case_with_file.user_id, solver_queue="celery")
 
     body = resp.json()
 
     assert body["result_id"] == result.id
     assert body["task_id"] == task.id
 
+    assert str(result.task_id) == task.id
     assert result.config == payload["form"]
     assert result.critical_point == 120
 
 
+@pytest.mark.integration
+def test_positive_run_with_affinity_queue(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    payload,
+    monkeypatch,
+):
+    monkeypatch.setattr("confiacim_api.conf.settings.AFFINITY_QUEUES", 4)
+    mocker.patch("confiacim_api.affinity.queue_depth", return_value=0)
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch("confiacim_api.routers.form.run_form_pipeline", return_value=task)
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+
+    resp = client_auth.post(url, json=payload)
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert case_with_file.base_file_digest is not None
+
+    queue = form_run_mocker.call_args.kwargs["solver_queue"]
+    assert queue == affinity_queue(case_with_file.base_file_digest, 4)
+
+
+@pytest.mark.integration
+def test_positive_run_with_form_queue(
+    client_auth: TestClient,
+    mocker,
+    case_with_file: Case,
+    payload,
+    monkeypatch,
+):
+    monkeypatch.setattr("confiacim_api.conf.settings.AFFINITY_QUEUES", 4)
+    monkeypatch.setattr(
+        celery_app.conf,
+        "task_routes",
+        {"confiacim_api.tasks.form_solve": {"queue": "celery.form"}},
+    )
+    mocker.patch("confiacim_api.affinity.queue_depth", return_value=0)
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch("confiacim_api.routers.form.run_form_pipeline", return_value=task)
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert case_with_file.base_file_digest is not None
+
+    queue = form_run_mocker.call_args.kwargs["solver_queue"]
+    assert queue == affinity_queue(case_with_file.base_file_digest, 4, "celery.form")
+
+
 @pytest.mark.integration
 def test_positive_form_run_with_description(
     client_auth: TestClient,
@@ -92,7 +155,7 @@ def test_positive_form_run_with_description(
     task.id = str(uuid4())
 
     form_run_mocker = mocker.patch(
-        "confiacim_api.routers.form.form_task.delay",
+        "confiacim_api.routers.form.run_form_pipeline",
         return_value=task,
     )
 
@@ -108,7 +171,7 @@ def test_positive_form_run_with_description(
     result = session.scalars(select(FormResult)).one()
 
     form_run_mocker.assert_called_once()
-    form_run_mocker.assert_called_with(result_id=result.id)
+    form_run_mocker.assert_called_with(result.id, case_with_file.user_id, solver_queue="celery")
 
     body = resp.json()
 
@@ -120,6 +183,311 @@ def test_positive_form_run_with_description(
     assert result.description == "Descricao do resultado."
 
 
+@pytest.fixture
+def form_result_success(client_auth: TestClient, session, mocker, case_with_file: Case, payload) -> FormResult:
+    task = MagicMock()
+    task.id = str(uuid4())
+    mocker.patch("confiacim_api.routers.form.run_form_pipeline", return_value=task)
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    result: FormResult = session.get(FormResult, resp.json()["result_id"])
+    result.status = ResultStatus.SUCCESS
+    result.beta = 1.07
+    result.resid = 1e-4
+    result.it = 3
+    result.Pf = 0.14
+    result.variables_stats = {"E_c": {"importance_factor": 24.7}}
+    result.iteration_infos = {"beta": [1.07], "resid": [1e-4]}
+    result.generated_case_files_digest = "a" * 64
+    session.commit()
+
+    return result
+
+
+@pytest.mark.integration
+def test_positive_form_run_cached_result(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    form_run_mocker = mocker.patch("confiacim_api.routers.form.run_form_pipeline")
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+
+    resp = client_auth.post(url, json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    form_run_mocker.assert_not_called()
+
+    body = resp.json()
+    assert body["task_id"] == str(form_result_success.task_id)
+    assert body["cached"] is True
+
+    result = session.get(FormResult, body["result_id"])
+
+    assert result.id != form_result_success.id
+    assert result.source_result_id == form_result_success.id
+    assert result.status == ResultStatus.SUCCESS
+    assert result.beta == form_result_success.beta
+    assert result.Pf == form_result_success.Pf
+    assert result.variables_stats == form_result_success.variables_stats
+    assert result.iteration_infos == form_result_success.iteration_infos
+    assert result.generated_case_files_digest == form_result_success.generated_case_files_digest
+
+
+@pytest.mark.integration
+def test_positive_form_run_cached_result_ignores_key_order(
+    client_auth: TestClient,
+    mocker,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    mocker.patch("confiacim_api.routers.form.run_form_pipeline")
+
+    reordered = {"form": payload["form"], "critical_point": payload["critical_point"]}
+    reordered["form"]["variables"][0]["dist"] = {
+        "params": {"param2": 0.1, "param1": 1.0},
+        "name": "lognormal",
+    }
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=reordered)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["cached"] is True
+
+
+@pytest.mark.integration
+def test_positive_form_run_force_skip_cached_result(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch(
+        "confiacim_api.routers.form.run_form_pipeline",
+        return_value=task,
+    )
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json={**payload, "force": True})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+    assert body["task_id"] == task.id
+    assert body["cached"] is False
+
+    form_run_mocker.assert_called_once()
+
+    result = session.get(FormResult, body["result_id"])
+    assert result.source_result_id is None
+    assert result.status == ResultStatus.CREATED
+
+
+@pytest.mark.integration
+def test_positive_form_run_other_user_result_is_not_reused(
+    client: TestClient,
+    session,
+    mocker,
+    other_user_token: str,
+    other_user,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    other_case = Case(tag="case1", user=other_user, base_file_digest=case_with_file.base_file_digest)
+    session.add(other_case)
+    session.commit()
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch(
+        "confiacim_api.routers.form.run_form_pipeline",
+        return_value=task,
+    )
+
+    resp = client.post(
+        app.url_path_for(ROUTE_NAME, case_id=other_case.id),
+        json=payload,
+        headers={"Authorization": f"Bearer {other_user_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["cached"] is False
+
+    form_run_mocker.assert_called_once()
+
+
+@pytest.mark.integration
+def test_positive_form_run_warm_start(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    form_result_success.iteration_infos = {
+        "beta": [1.13, 1.07],
+        "resid": [1.0, 1e-4],
+        "E_c": [1.05, 1.04],
+        "internal_pressure": [1.09, 1.10],
+    }
+    session.commit()
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch(
+        "confiacim_api.routers.form.run_form_pipeline",
+        return_value=task,
+    )
+
+    payload["critical_point"] = 121
+    payload["warm_start_from"] = form_result_success.id
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+    assert resp.status_code == status.HTTP_200_OK
+
+    form_run_mocker.assert_called_once()
+
+    result = session.get(FormResult, resp.json()["result_id"])
+
+    assert result.warm_start_from_id == form_result_success.id
+    assert result.initial_point == {"E_c": 1.04}
+
+
+@pytest.mark.integration
+def test_negative_form_run_warm_start_from_other_user_result(
+    client: TestClient,
+    session,
+    other_user_token: str,
+    other_user,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    other_case = Case(tag="case1", user=other_user, base_file_digest=case_with_file.base_file_digest)
+    session.add(other_case)
+    session.commit()
+
+    payload["warm_start_from"] = form_result_success.id
+
+    resp = client.post(
+        app.url_path_for(ROUTE_NAME, case_id=other_case.id),
+        json=payload,
+        headers={"Authorization": f"Bearer {other_user_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert resp.json() == {"detail": "Warm start result not found."}
+
+
+@pytest.mark.integration
+def test_negative_form_run_warm_start_from_result_without_iterations(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+):
+
+    form_result_success.iteration_infos = None
+    session.commit()
+
+    payload["warm_start_from"] = form_result_success.id
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json() == {"detail": "The warm start result has no iterations."}
+
+
+@pytest.mark.integration
+def test_positive_form_run_idempotency_key_replay(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    payload,
+):
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch(
+        "confiacim_api.routers.form.run_form_pipeline",
+        return_value=task,
+    )
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+    headers = {"Idempotency-Key": "form-run-1"}
+
+    resp = client_auth.post(url, json=payload, headers=headers)
+    assert resp.status_code == status.HTTP_200_OK
+    assert REPLAYED_HEADER not in resp.headers
+
+    resp_replay = client_auth.post(url, json=payload, headers=headers)
+    assert resp_replay.status_code == status.HTTP_200_OK
+    assert resp_replay.headers[REPLAYED_HEADER] == "true"
+
+    assert resp_replay.json() == resp.json()
+
+    form_run_mocker.assert_called_once()
+    assert len(session.scalars(select(FormResult)).all()) == 1
+
+
+@pytest.mark.integration
+def test_negative_form_run_idempotency_key_with_other_payload(
+    client_auth: TestClient,
+    mocker,
+    case_with_file: Case,
+    payload,
+):
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    form_run_mocker = mocker.patch(
+        "confiacim_api.routers.form.run_form_pipeline",
+        return_value=task,
+    )
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+    headers = {"Idempotency-Key": "form-run-1"}
+
+    resp = client_auth.post(url, json=payload, headers=headers)
+    assert resp.status_code == status.HTTP_200_OK
+
+    payload["critical_point"] = 121
+
+    resp = client_auth.post(url, json=payload, headers=headers)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json() == {"detail": "Idempotency-Key already used with a different request."}
+
+    form_run_mocker.assert_called_once()
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "variable, msg, type, loc",
@@ -402,3 +770,42 @@ def test_negative_user_can_only_run_owns_cases(
     assert resp.status_code == status.HTTP_404_NOT_FOUND
 
     assert resp.json() == {"detail": "Case not found."}
+
+
+@pytest.mark.integration
+def test_negative_form_run_queue_full(
+    client_auth: TestClient,
+    session,
+    mocker,
+    monkeypatch,
+    case_with_file: Case,
+    payload,
+    full_queue,
+):
+    monkeypatch.setattr(settings, "ADMISSION_FORM_RUNTIME", 600)
+
+    form_run_mocker = mocker.patch("confiacim_api.routers.form.run_form_pipeline")
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp.headers["Retry-After"] == "600"
+
+    form_run_mocker.assert_not_called()
+
+    assert session.scalars(select(FormResult)).all() == []
+
+
+@pytest.mark.integration
+def test_positive_form_run_cached_result_queue_full(
+    client_auth: TestClient,
+    case_with_file: Case,
+    payload,
+    form_result_success: FormResult,
+    full_queue,
+):
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["cached"] is True
@@ -3,7 +3,7 @@ from fastapi import status
 from fastapi.testclient import TestClient
 
 from confiacim_api.app import app
-from confiacim_api.models import FormResult
+from confiacim_api.models import FormResult, FormResultGroup
 
 ROUTE_NAME = "form_result_list"
 
@@ -36,6 +36,29 @@ def test_positive_list(client_auth: TestClient, form_results: FormResult):
     )
 
 
+@pytest.mark.integration
+def test_positive_list_filter_by_group(
+    client_auth: TestClient,
+    form_results: FormResult,
+    form_result_group: FormResultGroup,
+):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=form_result_group.case_id)
+
+    resp = client_auth.get(url)
+
+    assert resp.json()["total"] == 5
+
+    resp = client_auth.get(url, params={"group_id": form_result_group.id})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["total"] == 4
+    assert {r["id"] for r in body["items"]} == {r.id for r in form_result_group.results}
+
+
 @pytest.mark.integration
 def test_positive_check_fields(client_auth: TestClient, form_results: FormResult):
 
@@ -77,6 +77,10 @@ def test_positive_check_fields(client_auth: TestClient, form_results: FormResult
         "variables_stats",
         "iteration_infos",
         "description",
+        "source_result_id",
+        "group_id",
+        "warm_start_from_id",
+        "initial_point",
         "error",
         "status",
         "created_at",
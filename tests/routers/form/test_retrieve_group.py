@@ -0,0 +1,81 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import FormResultGroup, ResultStatus
+
+ROUTE_NAME = "form_group_retrieve"
+
+
+@pytest.mark.integration
+def test_positive_retrieve(client_auth: TestClient, form_result_group: FormResultGroup):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=form_result_group.case_id, group_id=form_result_group.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["id"] == form_result_group.id
+    assert body["description"] == "Group"
+    assert body["total"] == 4
+    assert body["created"] == 1
+    assert body["running"] == 0
+    assert body["success"] == 2
+    assert body["failed"] == 1
+    assert body["done"] is False
+
+    points = body["points"]
+
+    assert [p["critical_point"] for p in points] == [10, 20, 30, 40]
+    assert [p["status"] for p in points] == ["success", "success", "created", "failed"]
+    assert [p["beta"] for p in points] == [3.1, 2.5, None, None]
+    assert [p["Pf"] for p in points] == [9.6e-4, 6.2e-3, None, None]
+
+
+@pytest.mark.integration
+def test_positive_retrieve_done(session, client_auth: TestClient, form_result_group: FormResultGroup):
+
+    for result in form_result_group.results:
+        result.status = ResultStatus.SUCCESS
+    session.commit()
+
+    url = app.url_path_for(ROUTE_NAME, case_id=form_result_group.case_id, group_id=form_result_group.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["success"] == 4
+    assert body["done"] is True
+
+
+@pytest.mark.integration
+def test_negative_group_not_found(client_auth: TestClient, form_result_group: FormResultGroup):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=form_result_group.case_id, group_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert resp.json() == {"detail": "Group/Case not found"}
+
+
+@pytest.mark.integration
+def test_negative_user_can_retrieve_only_their_own_groups(
+    client: TestClient,
+    form_result_group: FormResultGroup,
+    other_user_token,
+):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=form_result_group.case_id, group_id=form_result_group.id)
+
+    resp = client.get(url, headers={"Authorization": f"Bearer {other_user_token}"})
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
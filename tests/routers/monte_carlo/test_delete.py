@@ -0,0 +1,32 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from confiacim_api.app import app
+from confiacim_api.models import MonteCarloChunk, MonteCarloResult
+
+ROUTE_NAME = "monte_carlo_result_delete"
+
+
+@pytest.mark.integration
+def test_positive_delete(client_auth: TestClient, session, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id, result_id=monte_carlo_result.id)
+
+    resp = client_auth.delete(url)
+
+    assert resp.status_code == status.HTTP_204_NO_CONTENT
+    assert session.get(MonteCarloResult, monte_carlo_result.id) is None
+    assert session.scalar(select(func.count()).select_from(MonteCarloChunk)) == 0
+
+
+@pytest.mark.integration
+def test_negative_delete_not_found(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id, result_id=404)
+
+    resp = client_auth.delete(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json() == {"detail": "Result/Case not found"}
@@ -0,0 +1,160 @@
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.conf import settings
+from confiacim_api.events import publish_result_event, publish_status
+from confiacim_api.models import MonteCarloResult, ResultStatus
+
+ROUTE_NAME = "monte_carlo_result_events"
+
+
+@pytest.fixture(autouse=True)
+def snapshot_session(mocker, session):
+    mocker.patch("confiacim_api.routers.monte_carlo.SessionFactory", return_value=session)
+
+
+def _events(text: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+@pytest.mark.integration
+def test_positive_events_finished_result(client_auth: TestClient, session, monte_carlo_result: MonteCarloResult):
+
+    now = datetime.now()
+    first, second = monte_carlo_result.chunks
+
+    first.status, first.finished_at = ResultStatus.SUCCESS, now
+    first.total, first.valid_simulations, first.fail = 2, 2, 1
+
+    second.status, second.finished_at = ResultStatus.SUCCESS, now + timedelta(seconds=1)
+    second.total, second.valid_simulations, second.fail = 2, 2, 0
+
+    monte_carlo_result.status = ResultStatus.SUCCESS
+    session.commit()
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=monte_carlo_result.case_id,
+        result_id=monte_carlo_result.id,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    (event_1, first_estimate), (event_2, second_estimate), last = _events(resp.text)
+
+    assert event_1 == event_2 == "estimate"
+
+    assert first_estimate["chunks_done"] == 1
+    assert first_estimate["chunks_total"] == 2
+    assert first_estimate["total"] == 2
+    assert first_estimate["Pf"] == pytest.approx(0.5)
+    assert first_estimate["Pf_lower"] < 0.5 < first_estimate["Pf_upper"]
+
+    assert second_estimate["chunks_done"] == 2
+    assert second_estimate["total"] == 4
+    assert second_estimate["Pf"] == pytest.approx(0.25)
+    assert second_estimate["Pf_lower"] < 0.25 < second_estimate["Pf_upper"]
+
+    assert last == ("status", {"status": "success"})
+
+
+@pytest.mark.integration
+def test_positive_events_running_result_until_finished(
+    client_auth: TestClient,
+    session,
+    monte_carlo_result: MonteCarloResult,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "EVENTS_HEARTBEAT", 0.1)
+
+    monte_carlo_result.status = ResultStatus.RUNNING
+    session.commit()
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=monte_carlo_result.case_id,
+        result_id=monte_carlo_result.id,
+    )
+
+    done = threading.Event()
+    estimate = {"chunks_done": 2, "chunks_total": 2, "Pf": 0.25, "Pf_lower": 0.05, "Pf_upper": 0.7}
+
+    def worker():
+        while not done.wait(0.2):
+            publish_result_event("montecarlo", monte_carlo_result.id, "estimate", estimate)
+            publish_status("montecarlo", monte_carlo_result.id, ResultStatus.SUCCESS)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+
+    try:
+        resp = client_auth.get(url)
+    finally:
+        done.set()
+        thread.join()
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.text.startswith('event: status\ndata: {"status": "runnig"}\n\n')
+    assert f"event: estimate\ndata: {json.dumps(estimate)}\n\n" in resp.text
+    assert resp.text.endswith('event: status\ndata: {"status": "success"}\n\n')
+
+
+@pytest.mark.integration
+def test_negative_events_result_not_found(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=monte_carlo_result.case_id,
+        result_id=404,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_events_user_can_access_only_their_own_cases(
+    client: TestClient,
+    monte_carlo_result: MonteCarloResult,
+    other_user_token: str,
+):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=monte_carlo_result.case_id,
+        result_id=monte_carlo_result.id,
+    )
+
+    resp = client.get(
+        url,
+        headers={"Authorization": f"Bearer {other_user_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_events_must_have_token(client: TestClient):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=1, result_id=1)
+
+    resp = client.get(url)
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+    assert resp.json() == {"detail": "Not authenticated"}
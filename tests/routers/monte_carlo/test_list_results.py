@@ -0,0 +1,67 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import MonteCarloResult
+
+ROUTE_NAME = "monte_carlo_result_list"
+
+
+@pytest.mark.integration
+def test_positive_list(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["total"] == 1
+
+    item = body["items"][0]
+
+    assert monte_carlo_result.status is not None
+
+    assert item["id"] == monte_carlo_result.id
+    assert item["status"] == monte_carlo_result.status.value
+    assert item["n_samples"] == 4
+    assert item["chunks_total"] == 2
+    assert item["chunks_done"] == 0
+    assert item["Pf"] is None
+    assert set(item) == {
+        "id",
+        "task_id",
+        "status",
+        "description",
+        "critical_point",
+        "n_samples",
+        "chunks_total",
+        "chunks_done",
+        "Pf",
+        "created_at",
+        "updated_at",
+    }
+
+
+@pytest.mark.integration
+def test_negative_list_case_not_found(client_auth: TestClient):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json() == {"detail": "Case not found"}
+
+
+@pytest.mark.integration
+def test_negative_list_must_be_authenticated(client: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id)
+
+    resp = client.get(url)
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,198 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from confiacim_api.app import app
+from confiacim_api.conf import settings
+from confiacim_api.models import Case, MonteCarloResult, ResultStatus
+from confiacim_api.monte_carlo import spawn_seeds
+
+ROUTE_NAME = "monte_carlo_run"
+
+
+@pytest.fixture
+def payload():
+    return {
+        "critical_point": 120,
+        "n_samples": 250,
+        "chunk_size": 100,
+        "seed": 42,
+        "monte_carlo": {
+            "variables": [
+                {
+                    "name": "E_c",
+                    "dist": {
+                        "name": "lognormal",
+                        "params": {
+                            "param1": 1.0,
+                            "param2": 0.1,
+                        },
+                    },
+                },
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def group_mocker(mocker):
+    group_result = MagicMock()
+    group_result.id = str(uuid4())
+
+    group_mocker = mocker.patch("confiacim_api.routers.monte_carlo.group")
+    group_mocker.return_value.apply_async.return_value = group_result
+
+    return group_mocker
+
+
+@pytest.mark.integration
+def test_positive_monte_carlo_run(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    payload,
+    group_mocker,
+):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+
+    resp = client_auth.post(url, json=payload)
+    assert resp.status_code == status.HTTP_200_OK
+
+    result = session.scalars(select(MonteCarloResult)).one()
+    body = resp.json()
+
+    assert body["result_id"] == result.id
+    assert body["task_id"] == group_mocker.return_value.apply_async.return_value.id
+    assert str(result.task_id) == body["task_id"]
+
+    assert result.status == ResultStatus.CREATED
+    assert result.config == payload["monte_carlo"]
+    assert result.critical_point == 120
+    assert result.n_samples == 250
+    assert result.chunk_size == 100
+    assert result.seed == 42
+    assert result.chunks_total == 3
+    assert result.chunks_done == 0
+
+    assert [c.index for c in result.chunks] == [0, 1, 2]
+    assert [c.n_samples for c in result.chunks] == [100, 100, 50]
+    assert [c.seed for c in result.chunks] == spawn_seeds(42, 3)
+    assert {c.status for c in result.chunks} == {ResultStatus.CREATED}
+
+    signatures = list(group_mocker.call_args.args[0])
+    assert [s.kwargs["chunk_id"] for s in signatures] == [c.id for c in result.chunks]
+
+
+@pytest.mark.integration
+def test_positive_monte_carlo_run_without_seed_must_generate_one(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    payload,
+    group_mocker,
+):
+
+    del payload["seed"]
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+
+    resp = client_auth.post(url, json=payload)
+    assert resp.status_code == status.HTTP_200_OK
+
+    result = session.scalars(select(MonteCarloResult)).one()
+
+    assert result.seed is not None
+    assert [c.seed for c in result.chunks] == spawn_seeds(result.seed, 3)
+
+
+@pytest.mark.integration
+def test_negative_monte_carlo_run_case_not_found(client_auth: TestClient, payload, group_mocker):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=404)
+
+    resp = client_auth.post(url, json=payload)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json() == {"detail": "Case not found."}
+
+    group_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+def test_negative_monte_carlo_run_case_without_base_file(client_auth: TestClient, case: Case, payload, group_mocker):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case.id)
+
+    resp = client_auth.post(url, json=payload)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert resp.json() == {"detail": "The case has no base file."}
+
+    group_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("n_samples", 0),
+        ("n_samples", 100_001),
+        ("chunk_size", 0),
+        ("chunk_size", 1_001),
+        ("seed", -1),
+    ],
+)
+def test_negative_monte_carlo_run_invalid_payload(
+    client_auth: TestClient,
+    case_with_file: Case,
+    payload,
+    group_mocker,
+    field,
+    value,
+):
+
+    payload[field] = value
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+
+    resp = client_auth.post(url, json=payload)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert resp.json()["detail"][0]["loc"] == ["body", field]
+
+    group_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+def test_negative_monte_carlo_run_must_be_authenticated(client: TestClient, case_with_file: Case, payload):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+
+    resp = client.post(url, json=payload)
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.integration
+def test_negative_monte_carlo_run_queue_full(
+    client_auth: TestClient,
+    session,
+    monkeypatch,
+    case_with_file: Case,
+    payload,
+    group_mocker,
+    full_queue,
+):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 4)
+    monkeypatch.setattr(settings, "ADMISSION_MONTE_CARLO_RUNTIME", 300)
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    # 3 lotes com 2 na fila, 1 acima do limite
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp.headers["Retry-After"] == "300"
+
+    group_mocker.assert_not_called()
+
+    assert session.scalars(select(MonteCarloResult)).all() == []
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import MonteCarloResult, ResultStatus
+
+ROUTE_NAME = "monte_carlo_result_retrieve"
+ESTIMATES_ROUTE_NAME = "monte_carlo_result_estimates"
+
+
+@pytest.fixture
+def monte_carlo_result_running(session, monte_carlo_result: MonteCarloResult):
+    now = datetime.now()
+    first, second = monte_carlo_result.chunks
+
+    # O segundo lote terminou primeiro
+    second.status, second.finished_at = ResultStatus.SUCCESS, now
+    second.total, second.valid_simulations, second.fail = 2, 2, 1
+
+    first.status, first.finished_at = ResultStatus.SUCCESS, now + timedelta(seconds=1)
+    first.total, first.valid_simulations, first.fail = 2, 1, 0
+
+    monte_carlo_result.status = ResultStatus.RUNNING
+    session.commit()
+    session.refresh(monte_carlo_result)
+
+    return monte_carlo_result
+
+
+@pytest.mark.integration
+def test_positive_retrieve(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id, result_id=monte_carlo_result.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["id"] == monte_carlo_result.id
+    assert body["status"] == ResultStatus.CREATED.value
+    assert body["critical_point"] == 160
+    assert body["n_samples"] == 4
+    assert body["chunk_size"] == 2
+    assert body["seed"] == 42
+    assert body["chunks_total"] == 2
+    assert body["chunks_done"] == 0
+    assert body["total"] == 0
+    assert body["Pf"] is None
+    assert body["Pf_lower"] is None
+    assert body["Pf_upper"] is None
+    assert body["config"] == monte_carlo_result.config
+    assert body["description"] == "Descrição do caso"
+
+
+@pytest.mark.integration
+def test_negative_retrieve_not_found(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id, result_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json() == {"detail": "Result/Case not found"}
+
+
+@pytest.mark.integration
+def test_negative_retrieve_result_of_other_user(
+    client: TestClient,
+    other_user_token: str,
+    monte_carlo_result: MonteCarloResult,
+):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=monte_carlo_result.case_id, result_id=monte_carlo_result.id)
+
+    resp = client.get(url, headers={"Authorization": f"Bearer {other_user_token}"})
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_positive_estimates(client_auth: TestClient, monte_carlo_result_running: MonteCarloResult):
+
+    url = app.url_path_for(
+        ESTIMATES_ROUTE_NAME,
+        case_id=monte_carlo_result_running.case_id,
+        result_id=monte_carlo_result_running.id,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    first, second = resp.json()
+
+    assert first["chunks_done"] == 1
+    assert first["total"] == 2
+    assert first["valid_simulations"] == 2
+    assert first["fail"] == 1
+    assert first["Pf"] == pytest.approx(0.5)
+    assert first["Pf_lower"] < 0.5 < first["Pf_upper"]
+
+    assert second["chunks_done"] == 2
+    assert second["total"] == 4
+    assert second["valid_simulations"] == 3
+    assert second["fail"] == 1
+    assert second["Pf"] == pytest.approx(1 / 3)
+    assert second["Pf_upper"] - second["Pf_lower"] < first["Pf_upper"] - first["Pf_lower"]
+
+
+@pytest.mark.integration
+def test_positive_estimates_without_finished_chunks(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(
+        ESTIMATES_ROUTE_NAME,
+        case_id=monte_carlo_result.case_id,
+        result_id=monte_carlo_result.id,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json() == []
+
+
+@pytest.mark.integration
+def test_negative_estimates_not_found(client_auth: TestClient, monte_carlo_result: MonteCarloResult):
+
+    url = app.url_path_for(ESTIMATES_ROUTE_NAME, case_id=404, result_id=monte_carlo_result.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json() == {"detail": "Result/Case not found"}
@@ -0,0 +1,66 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import TencimResult
+
+ROUTE_NAME = "tencim_result_events"
+
+
+@pytest.fixture(autouse=True)
+def snapshot_session(mocker, session):
+    mocker.patch("confiacim_api.routers.tencim.SessionFactory", return_value=session)
+
+
+@pytest.mark.integration
+def test_positive_events_finished_result(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text == 'event: status\ndata: {"status": "success"}\n\n'
+
+
+@pytest.mark.integration
+def test_negative_events_result_not_found(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=404,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_events_user_can_access_only_their_own_cases(
+    client: TestClient,
+    tencim_results: TencimResult,
+    other_user_token: str,
+):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client.get(
+        url,
+        headers={"Authorization": f"Bearer {other_user_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
@@ -0,0 +1,154 @@
+import io
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.errors import ExportDependencyError
+from confiacim_api.models import Case, ResultStatus, TencimResult
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+ROUTE_NAME = "tencim_result_export"
+CASE_ROUTE_NAME = "tencim_case_export"
+
+
+@pytest.mark.integration
+def test_positive_export_parquet(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_results.case_id, result_id=tencim_results.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert resp.headers["content-type"] == "application/vnd.apache.parquet"
+    assert resp.headers["content-disposition"] == (
+        f"attachment; filename={tencim_results.case.tag}-tencim-{tencim_results.id}.parquet"
+    )
+
+    table = pq.read_table(io.BytesIO(resp.content))
+
+    assert table.to_pydict() == {
+        "result_id": [tencim_results.id] * 3,
+        "istep": [1, 2, 3],
+        "t": [1.0, 2.0, 3.0],
+        "rankine_rc": [100.0, 90.0, 10.0],
+        "mohr_coulomb_rc": [100.0, 80.0, 30.0],
+    }
+
+
+@pytest.mark.integration
+def test_positive_export_arrow(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_results.case_id, result_id=tencim_results.id)
+
+    resp = client_auth.get(url, params={"format": "arrow"})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert resp.headers["content-type"] == "application/vnd.apache.arrow.file"
+    assert resp.headers["content-disposition"].endswith(".arrow")
+
+    table = pa.ipc.open_file(io.BytesIO(resp.content)).read_all()
+
+    assert table.column("istep").type == pa.int32()
+    assert table.column("mohr_coulomb_rc").to_pylist() == [100.0, 80.0, 30.0]
+
+
+@pytest.mark.integration
+def test_positive_case_export(
+    session,
+    client_auth: TestClient,
+    tencim_results: TencimResult,
+    case_with_real_file: Case,
+):
+
+    other = TencimResult(
+        case=case_with_real_file,
+        istep=(1, 2),
+        t=(1.0, 2.0),
+        rankine_rc=(50.0, 40.0),
+        mohr_coulomb_rc=(60.0, 20.0),
+        status=ResultStatus.SUCCESS,
+    )
+    # Resultado sem curvas não entra no arquivo
+    running = TencimResult(case=case_with_real_file, status=ResultStatus.RUNNING)
+    session.add_all([other, running])
+    session.commit()
+
+    url = app.url_path_for(CASE_ROUTE_NAME, case_id=case_with_real_file.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-disposition"] == f"attachment; filename={case_with_real_file.tag}-tencim.parquet"
+
+    table = pq.read_table(io.BytesIO(resp.content))
+
+    assert table.column("result_id").to_pylist() == [tencim_results.id] * 3 + [other.id] * 2
+    assert table.column("rankine_rc").to_pylist() == [100.0, 90.0, 10.0, 50.0, 40.0]
+
+
+@pytest.mark.integration
+def test_negative_export_invalid_format(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_results.case_id, result_id=tencim_results.id)
+
+    resp = client_auth.get(url, params={"format": "csv"})
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+def test_negative_export_without_pyarrow(mocker, client_auth: TestClient, tencim_results: TencimResult):
+
+    mocker.patch(
+        "confiacim_api.export.load_pyarrow",
+        side_effect=ExportDependencyError("Columnar export requires pyarrow."),
+    )
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_results.case_id, result_id=tencim_results.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_501_NOT_IMPLEMENTED
+    assert resp.json()["detail"] == "Columnar export requires pyarrow."
+
+
+@pytest.mark.integration
+def test_negative_export_result_not_found(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_results.case_id, result_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_case_export_user_can_export_only_their_own_cases(
+    client: TestClient,
+    tencim_results: TencimResult,
+    other_user_token: str,
+):
+
+    url = app.url_path_for(CASE_ROUTE_NAME, case_id=tencim_results.case_id)
+
+    resp = client.get(url, headers={"Authorization": f"Bearer {other_user_token}"})
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Case not found"
+
+
+@pytest.mark.integration
+def test_negative_export_must_have_token(client: TestClient):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=1, result_id=1)
+
+    resp = client.get(url)
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
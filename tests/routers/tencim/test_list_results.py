@@ -3,11 +3,42 @@ from fastapi import status
 from fastapi.testclient import TestClient
 
 from confiacim_api.app import app
-from confiacim_api.models import TencimResult
+from confiacim_api.models import Case, ResultStatus, TencimResult, TencimSweep
+from confiacim_api.rc_summary import RC_SUMMARY_FIELDS, apply_rc_summary
 
 ROUTE_NAME = "tencim_result_list"
 
 
+@pytest.fixture
+def summarized_results(session, case_with_real_file: Case):
+    curves = [
+        (100.0, 50.0, 80.0),
+        (100.0, -10.0, -20.0),
+        (100.0, 20.0, 30.0),
+    ]
+
+    results = []
+    for rankine_rc in curves:
+        result = TencimResult(
+            case=case_with_real_file,
+            istep=(1, 2, 3),
+            t=(1.0, 2.0, 3.0),
+            rankine_rc=rankine_rc,
+            mohr_coulomb_rc=rankine_rc,
+            status=ResultStatus.SUCCESS,
+        )
+        apply_rc_summary(result, threshold=0.0)
+        results.append(result)
+
+    # Resultado sem resumo
+    results.append(TencimResult(case=case_with_real_file, status=ResultStatus.CREATED))
+
+    session.add_all(results)
+    session.commit()
+
+    return case_with_real_file.id, [r.id for r in results]
+
+
 @pytest.mark.integration
 def test_positive_list(client_auth: TestClient, tencim_results: TencimResult):
 
@@ -35,6 +66,29 @@ def test_positive_list(client_auth: TestClient, tencim_results: TencimResult):
     )
 
 
+@pytest.mark.integration
+def test_positive_list_filter_by_sweep(
+    client_auth: TestClient,
+    tencim_results: TencimResult,
+    tencim_sweep: TencimSweep,
+):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_sweep.case_id)
+
+    resp = client_auth.get(url)
+
+    assert resp.json()["total"] == 5
+
+    resp = client_auth.get(url, params={"sweep_id": tencim_sweep.id})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["total"] == 4
+    assert {r["id"] for r in body["items"]} == {r.id for r in tencim_sweep.results}
+
+
 @pytest.mark.integration
 def test_positive_check_fields(client_auth: TestClient, tencim_results: TencimResult):
 
@@ -52,7 +106,15 @@ def test_positive_check_fields(client_auth: TestClient, tencim_results: TencimRe
 
     fields = response_tencim_results[0].keys()
 
-    exepected = {"id", "task_id", "status", "created_at", "updated_at", "description"}
+    exepected = {
+        "id",
+        "task_id",
+        "status",
+        "created_at",
+        "updated_at",
+        "description",
+        *RC_SUMMARY_FIELDS,
+    }
 
     assert set(fields) == exepected
 
@@ -95,3 +157,55 @@ def test_negative_list_result_must_have_token(client: TestClient):
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
 
     assert resp.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.integration
+def test_positive_list_order_by_rc_min(client_auth: TestClient, summarized_results: tuple[int, list[int]]):
+
+    case_id, (a, b, c, not_summarized) = summarized_results
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_id)
+
+    resp = client_auth.get(url, params={"order_by": "rankine_rc_min"})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert [r["id"] for r in resp.json()["items"]] == [b, c, a, not_summarized]
+
+    resp = client_auth.get(url, params={"order_by": "mohr_coulomb_rc_min_t", "desc": True})
+
+    assert [r["id"] for r in resp.json()["items"]] == [b, a, c, not_summarized]
+
+
+@pytest.mark.integration
+def test_positive_list_filter_by_rc_summary(client_auth: TestClient, summarized_results: tuple[int, list[int]]):
+
+    case_id, (a, b, c, _) = summarized_results
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_id)
+
+    resp = client_auth.get(url, params={"rankine_rc_min_lte": 20.0})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert {r["id"] for r in resp.json()["items"]} == {b, c}
+
+    resp = client_auth.get(url, params={"rankine_rc_min_gte": 0.0, "mohr_coulomb_rc_min_lte": 40.0})
+
+    assert {r["id"] for r in resp.json()["items"]} == {c}
+
+    resp = client_auth.get(url, params={"mohr_coulomb_rc_steps_below_gte": 1})
+
+    body = resp.json()
+    assert [r["id"] for r in body["items"]] == [b]
+    assert body["items"][0]["mohr_coulomb_rc_steps_below"] == 2
+    assert body["items"][0]["mohr_coulomb_rc_min"] == -20.0
+    assert body["items"][0]["mohr_coulomb_rc_min_istep"] == 3
+
+
+@pytest.mark.integration
+def test_negative_list_invalid_order_by(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_results.case_id)
+
+    resp = client_auth.get(url, params={"order_by": "rankine_rc"})
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
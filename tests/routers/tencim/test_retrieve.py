@@ -1,13 +1,34 @@
+import numpy as np
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from confiacim_api.app import app
-from confiacim_api.models import TencimResult
+from confiacim_api.models import Case, ResultStatus, TencimResult
 
 ROUTE_NAME = "tencim_result_retrieve"
 
 
+@pytest.fixture
+def long_tencim_result(session, case_with_real_file: Case):
+    t = np.linspace(0.0, 100.0, 20_000)
+    rankine_rc = 100.0 - 80.0 * np.exp(-((t - 63.7) ** 2) / 0.01) + np.sin(t)
+
+    result = TencimResult(
+        case=case_with_real_file,
+        istep=np.arange(1, len(t) + 1),
+        t=t,
+        rankine_rc=rankine_rc,
+        mohr_coulomb_rc=rankine_rc + 5.0,
+        status=ResultStatus.SUCCESS,
+    )
+    session.add(result)
+    session.commit()
+    session.refresh(result)
+
+    return result
+
+
 @pytest.mark.integration
 def test_positive_retrieve(client_auth: TestClient, tencim_results: TencimResult):
 
@@ -23,12 +44,17 @@ def test_positive_retrieve(client_auth: TestClient, tencim_results: TencimResult
 
     body = resp.json()
 
+    assert tencim_results.istep is not None
+    assert tencim_results.t is not None
+    assert tencim_results.rankine_rc is not None
+    assert tencim_results.mohr_coulomb_rc is not None
+
     assert body["id"] == tencim_results.id
     assert body["task_id"] == tencim_results.task_id
-    assert body["istep"] == list(tencim_results.istep) if tencim_results.istep else ""
-    assert body["t"] == list(tencim_results.t) if tencim_results.t else ""
-    assert body["rankine_rc"] == list(tencim_results.rankine_rc) if tencim_results.rankine_rc else ""
-    assert body["mohr_coulomb_rc"] == list(tencim_results.mohr_coulomb_rc) if tencim_results.mohr_coulomb_rc else ""
+    assert body["istep"] == tencim_results.istep.tolist()
+    assert body["t"] == tencim_results.t.tolist()
+    assert body["rankine_rc"] == tencim_results.rankine_rc.tolist()
+    assert body["mohr_coulomb_rc"] == tencim_results.mohr_coulomb_rc.tolist()
     assert body["critical_point"] == tencim_results.critical_point
     assert body["rc_limit"] == tencim_results.rc_limit
     assert body["error"] == tencim_results.error
@@ -65,6 +91,7 @@ def test_positive_check_fields(client_auth: TestClient, tencim_results: TencimRe
         "critical_point",
         "rc_limit",
         "description",
+        "source_result_id",
         "created_at",
         "updated_at",
     }
@@ -134,3 +161,92 @@ def test_negative_retrieve_result_must_have_token(client: TestClient):
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
 
     assert resp.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("downsample", ["lttb", "minmax"])
+def test_positive_retrieve_max_points(client_auth: TestClient, long_tencim_result: TencimResult, downsample: str):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=long_tencim_result.case_id,
+        result_id=long_tencim_result.id,
+    )
+
+    resp = client_auth.get(url, params={"max_points": 200, "downsample": downsample})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    n = len(body["t"])
+    assert n <= 200
+    assert len(body["istep"]) == len(body["rankine_rc"]) == len(body["mohr_coulomb_rc"]) == n
+
+    rankine_rc = long_tencim_result.rankine_rc
+    istep = long_tencim_result.istep
+    assert rankine_rc is not None
+    assert istep is not None
+
+    i_min = int(np.argmin(rankine_rc))
+
+    assert min(body["rankine_rc"]) == rankine_rc[i_min]
+    assert body["istep"][body["rankine_rc"].index(rankine_rc[i_min])] == istep[i_min]
+    assert body["istep"][0] == 1
+    assert body["istep"][-1] == len(rankine_rc)
+
+
+@pytest.mark.integration
+def test_positive_retrieve_stride(client_auth: TestClient, long_tencim_result: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=long_tencim_result.case_id,
+        result_id=long_tencim_result.id,
+    )
+
+    resp = client_auth.get(url, params={"stride": 1000})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert long_tencim_result.rankine_rc is not None
+
+    assert body["istep"][:3] == [1, 1001, 2001]
+    assert min(body["rankine_rc"]) == long_tencim_result.rankine_rc.min()
+
+
+@pytest.mark.integration
+def test_positive_retrieve_result_without_rc(client_auth: TestClient, case_with_result: Case):
+
+    result = case_with_result.tencim_results[0]
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_result.id, result_id=result.id)
+
+    resp = client_auth.get(url, params={"max_points": 100})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["rankine_rc"] is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"max_points": 2},
+        {"stride": 0},
+        {"downsample": "mean"},
+    ],
+)
+def test_negative_retrieve_invalid_decimation(client_auth: TestClient, tencim_results: TencimResult, params: dict):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client_auth.get(url, params=params)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
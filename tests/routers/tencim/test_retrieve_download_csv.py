@@ -27,6 +27,42 @@ def test_positive_csv_download(client_auth: TestClient, tencim_results: TencimRe
     assert resp.content == CSV_FILE
 
 
+@pytest.mark.integration
+def test_positive_csv_download_gzip(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client_auth.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert "content-length" not in resp.headers
+    assert resp.content == CSV_FILE
+
+
+@pytest.mark.integration
+def test_positive_csv_download_without_gzip(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client_auth.get(url, headers={"Accept-Encoding": "identity"})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert "content-encoding" not in resp.headers
+    assert resp.content == CSV_FILE
+
+
 @pytest.mark.integration
 def test_negative_csv_download_result_not_found(client_auth: TestClient, tencim_results: TencimResult):
 
@@ -0,0 +1,81 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import TencimResult
+
+ROUTE_NAME = "tencim_result_eta"
+
+
+@pytest.mark.integration
+def test_positive_retrieve_eta(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["result_id"] == tencim_results.id
+    assert body["status"] == "success"
+    assert body["position"] == 0
+    assert body["runtime"] > 0
+    assert body["history_runs"] == 0
+    assert body["start_at"] is not None
+    assert body["finish_at"] is not None
+
+
+@pytest.mark.integration
+def test_negative_retrieve_eta_result_not_found(client_auth: TestClient, tencim_results: TencimResult):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=404,
+    )
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_retrieve_eta_user_can_access_only_their_own_cases(
+    client: TestClient,
+    tencim_results: TencimResult,
+    other_user_token: str,
+):
+
+    url = app.url_path_for(
+        ROUTE_NAME,
+        case_id=tencim_results.case_id,
+        result_id=tencim_results.id,
+    )
+
+    resp = client.get(
+        url,
+        headers={"Authorization": f"Bearer {other_user_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "Result/Case not found"
+
+
+@pytest.mark.integration
+def test_negative_retrieve_eta_must_have_token(client: TestClient):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=1, result_id=1)
+
+    resp = client.get(url)
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+    assert resp.json() == {"detail": "Not authenticated"}
@@ -0,0 +1,74 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from confiacim_api.app import app
+from confiacim_api.models import ResultStatus, TencimSweep
+
+ROUTE_NAME = "tencim_sweep_retrieve"
+
+
+@pytest.mark.integration
+def test_positive_retrieve(client_auth: TestClient, tencim_sweep: TencimSweep):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_sweep.case_id, sweep_id=tencim_sweep.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["id"] == tencim_sweep.id
+    assert body["description"] == "Sweep"
+    assert body["total"] == 4
+    assert body["created"] == 1
+    assert body["running"] == 1
+    assert body["success"] == 1
+    assert body["failed"] == 1
+    assert body["done"] is False
+
+
+@pytest.mark.integration
+def test_positive_retrieve_done(session, client_auth: TestClient, tencim_sweep: TencimSweep):
+
+    for result in tencim_sweep.results:
+        result.status = ResultStatus.SUCCESS
+    session.commit()
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_sweep.case_id, sweep_id=tencim_sweep.id)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    assert body["success"] == 4
+    assert body["done"] is True
+
+
+@pytest.mark.integration
+def test_negative_sweep_not_found(client_auth: TestClient, tencim_sweep: TencimSweep):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_sweep.case_id, sweep_id=404)
+
+    resp = client_auth.get(url)
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert resp.json() == {"detail": "Sweep/Case not found"}
+
+
+@pytest.mark.integration
+def test_negative_user_can_retrieve_only_their_own_sweeps(
+    client: TestClient,
+    tencim_sweep: TencimSweep,
+    other_user_token,
+):
+
+    url = app.url_path_for(ROUTE_NAME, case_id=tencim_sweep.case_id, sweep_id=tencim_sweep.id)
+
+    resp = client.get(url, headers={"Authorization": f"Bearer {other_user_token}"})
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
@@ -1,13 +1,18 @@
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+import numpy as np
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 
 from confiacim_api.app import app
-from confiacim_api.models import Case, TencimResult, User
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
+from confiacim_api.fingerprint import tencim_fingerprint
+from confiacim_api.idempotency import REPLAYED_HEADER
+from confiacim_api.models import Case, ResultStatus, TencimResult, User
 
 ROUTE_NAME = "tencim_standalone_run"
 
@@ -24,7 +29,7 @@ def test_positive_run(
     task.id = str(uuid4())
 
     tencim_standalone_run_mocker = mocker.patch(
-        "confiacim_api.routers.tencim.tencim_run.delay",
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
         return_value=task,
     )
 
@@ -35,7 +40,7 @@ def test_positive_run(
     result = session.scalars(select(TencimResult)).one()
 
     tencim_standalone_run_mocker.assert_called_once()
-    tencim_standalone_run_mocker.assert_called_with(result_id=result.id)
+    tencim_standalone_run_mocker.assert_called_with((), {"result_id": result.id}, queue="celery")
 
     body = resp.json()
 
@@ -43,6 +48,29 @@ def test_positive_run(
     assert body["task_id"] == task.id
 
 
+@pytest.mark.integration
+def test_positive_run_with_tencim_queue(
+    client_auth: TestClient,
+    mocker,
+    monkeypatch,
+    case_with_file: Case,
+):
+    monkeypatch.setattr(
+        celery_app.conf,
+        "task_routes",
+        {"confiacim_api.tasks.tencim_standalone_run": {"queue": "celery.tencim"}},
+    )
+
+    tencim_standalone_run_mocker = mocker.patch("confiacim_api.routers.tencim.tencim_run.apply_async")
+    tencim_standalone_run_mocker.return_value.id = str(uuid4())
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json={})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert tencim_standalone_run_mocker.call_args.kwargs["queue"] == "celery.tencim"
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "value, boolean",
@@ -72,7 +100,7 @@ def test_positive_run_with_rc_limit(
     task.id = str(uuid4())
 
     tencim_standalone_run_mocker = mocker.patch(
-        "confiacim_api.routers.tencim.tencim_run.delay",
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
         return_value=task,
     )
 
@@ -85,7 +113,7 @@ def test_positive_run_with_rc_limit(
     result = session.scalars(select(TencimResult)).one()
 
     tencim_standalone_run_mocker.assert_called_once()
-    tencim_standalone_run_mocker.assert_called_with(result_id=result.id, rc_limit=boolean)
+    tencim_standalone_run_mocker.assert_called_with((), {"result_id": result.id, "rc_limit": boolean}, queue="celery")
 
     body = resp.json()
 
@@ -105,7 +133,7 @@ def test_positive_run_with_critical_point(
     task.id = str(uuid4())
 
     tencim_standalone_run_mocker = mocker.patch(
-        "confiacim_api.routers.tencim.tencim_run.delay",
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
         return_value=task,
     )
 
@@ -118,7 +146,7 @@ def test_positive_run_with_critical_point(
     result = session.scalars(select(TencimResult)).one()
 
     tencim_standalone_run_mocker.assert_called_once()
-    tencim_standalone_run_mocker.assert_called_with(result_id=result.id, critical_point=100)
+    tencim_standalone_run_mocker.assert_called_with((), {"result_id": result.id, "critical_point": 100}, queue="celery")
 
     body = resp.json()
 
@@ -140,7 +168,7 @@ def test_positive_run_with_description(
     task.id = str(uuid4())
 
     tencim_standalone_run_mocker = mocker.patch(
-        "confiacim_api.routers.tencim.tencim_run.delay",
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
         return_value=task,
     )
 
@@ -153,7 +181,7 @@ def test_positive_run_with_description(
     result = session.scalars(select(TencimResult)).one()
 
     tencim_standalone_run_mocker.assert_called_once()
-    tencim_standalone_run_mocker.assert_called_with(result_id=result.id)
+    tencim_standalone_run_mocker.assert_called_with((), {"result_id": result.id}, queue="celery")
 
     body = resp.json()
 
@@ -278,3 +306,244 @@ def test_negative_user_can_only_run_owns_cases(
     assert resp.status_code == status.HTTP_404_NOT_FOUND
 
     assert resp.json() == {"detail": "Case not found."}
+
+
+@pytest.fixture
+def tencim_result_success(session, case_with_file: Case):
+    assert case_with_file.base_file_digest is not None
+
+    result = TencimResult(
+        case=case_with_file,
+        critical_point=10,
+        rc_limit=True,
+        istep=(1, 2),
+        t=(1.0, 2.0),
+        rankine_rc=(100.0, 90.0),
+        mohr_coulomb_rc=(100.0, 80.0),
+        status=ResultStatus.SUCCESS,
+        fingerprint=tencim_fingerprint(case_with_file.base_file_digest, critical_point=10, rc_limit=True),
+    )
+    session.add(result)
+    session.commit()
+    session.refresh(result)
+
+    return result
+
+
+@pytest.mark.integration
+def test_positive_run_cached_result(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    tencim_result_success: TencimResult,
+):
+    tencim_standalone_run_mocker = mocker.patch("confiacim_api.routers.tencim.tencim_run.apply_async")
+
+    resp = client_auth.post(
+        app.url_path_for(ROUTE_NAME, case_id=case_with_file.id),
+        json={"critical_point": 10, "rc_limit": True, "description": "De novo"},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    tencim_standalone_run_mocker.assert_not_called()
+
+    body = resp.json()
+    assert body["task_id"] is None
+    assert body["cached"] is True
+
+    result = session.get(TencimResult, body["result_id"])
+
+    assert result.id != tencim_result_success.id
+    assert result.source_result_id == tencim_result_success.id
+    assert result.status == ResultStatus.SUCCESS
+    assert result.description == "De novo"
+    assert tencim_result_success.rankine_rc is not None
+    assert tencim_result_success.mohr_coulomb_rc is not None
+    np.testing.assert_array_equal(result.rankine_rc, tencim_result_success.rankine_rc)
+    np.testing.assert_array_equal(result.mohr_coulomb_rc, tencim_result_success.mohr_coulomb_rc)
+    assert result.fingerprint == tencim_result_success.fingerprint
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"critical_point": 10, "rc_limit": True, "force": True},
+        {"critical_point": 11, "rc_limit": True},
+        {"critical_point": 10, "rc_limit": False},
+    ],
+    ids=["force", "critical_point", "rc_limit"],
+)
+def test_positive_run_not_cached(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    tencim_result_success: TencimResult,
+    payload: dict,
+):
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    tencim_standalone_run_mocker = mocker.patch(
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
+        return_value=task,
+    )
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+    assert body["task_id"] == task.id
+    assert body["cached"] is False
+
+    result = session.get(TencimResult, body["result_id"])
+    assert result.source_result_id is None
+
+    tencim_standalone_run_mocker.assert_called_once()
+    assert "force" not in tencim_standalone_run_mocker.call_args.args[1]
+
+
+@pytest.mark.integration
+def test_positive_run_does_not_use_failed_result(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    tencim_result_success: TencimResult,
+):
+    tencim_result_success.status = ResultStatus.FAILED
+    session.commit()
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    tencim_standalone_run_mocker = mocker.patch(
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
+        return_value=task,
+    )
+
+    resp = client_auth.post(
+        app.url_path_for(ROUTE_NAME, case_id=case_with_file.id),
+        json={"critical_point": 10, "rc_limit": True},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["cached"] is False
+
+    tencim_standalone_run_mocker.assert_called_once()
+
+
+@pytest.mark.integration
+def test_positive_run_coalesced_with_running_result(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+    tencim_result_success: TencimResult,
+):
+    tencim_result_success.status = ResultStatus.RUNNING
+    tencim_result_success.task_id = uuid4()
+    session.commit()
+
+    tencim_standalone_run_mocker = mocker.patch("confiacim_api.routers.tencim.tencim_run.apply_async")
+
+    resp = client_auth.post(
+        app.url_path_for(ROUTE_NAME, case_id=case_with_file.id),
+        json={"critical_point": 10, "rc_limit": True},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    tencim_standalone_run_mocker.assert_not_called()
+
+    body = resp.json()
+    assert body["task_id"] == str(tencim_result_success.task_id)
+    assert body["cached"] is False
+    assert body["coalesced"] is True
+
+    result = session.get(TencimResult, body["result_id"])
+
+    assert result.source_result_id == tencim_result_success.id
+    assert result.status == ResultStatus.RUNNING
+    assert result.rankine_rc is None
+
+
+@pytest.mark.integration
+def test_positive_run_idempotency_key_replay(
+    client_auth: TestClient,
+    session,
+    mocker,
+    case_with_file: Case,
+):
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    tencim_standalone_run_mocker = mocker.patch(
+        "confiacim_api.routers.tencim.tencim_run.apply_async",
+        return_value=task,
+    )
+
+    url = app.url_path_for(ROUTE_NAME, case_id=case_with_file.id)
+    headers = {"Idempotency-Key": "tencim-run-1"}
+
+    resp = client_auth.post(url, json={"critical_point": 10}, headers=headers)
+    assert resp.status_code == status.HTTP_200_OK
+
+    resp_replay = client_auth.post(url, json={"critical_point": 10}, headers=headers)
+    assert resp_replay.status_code == status.HTTP_200_OK
+    assert resp_replay.headers[REPLAYED_HEADER] == "true"
+
+    assert resp_replay.json() == resp.json()
+
+    tencim_standalone_run_mocker.assert_called_once()
+    assert len(session.scalars(select(TencimResult)).all()) == 1
+
+
+@pytest.mark.integration
+def test_negative_run_queue_full(
+    client_auth: TestClient,
+    session,
+    mocker,
+    monkeypatch,
+    case_with_file: Case,
+    full_queue,
+):
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 60)
+
+    tencim_standalone_run_mocker = mocker.patch("confiacim_api.routers.tencim.tencim_run.apply_async")
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json={})
+
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp.headers["Retry-After"] == "60"
+    assert resp.json() == {"detail": "Too many simulations in the queue."}
+
+    tencim_standalone_run_mocker.assert_not_called()
+
+    assert session.scalars(select(TencimResult)).all() == []
+
+
+@pytest.mark.integration
+def test_positive_run_queue_full_user_without_limit(
+    client_auth: TestClient,
+    session,
+    mocker,
+    user: User,
+    case_with_file: Case,
+    full_queue,
+):
+    user.max_queue_depth = 0
+    session.commit()
+
+    task = MagicMock()
+    task.id = str(uuid4())
+
+    mocker.patch("confiacim_api.routers.tencim.tencim_run.apply_async", return_value=task)
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json={})
+
+    assert resp.status_code == status.HTTP_200_OK
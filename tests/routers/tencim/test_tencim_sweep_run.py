@@ -0,0 +1,236 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from confiacim_api.app import app
+from confiacim_api.conf import settings
+from confiacim_api.fingerprint import tencim_fingerprint
+from confiacim_api.models import Case, ResultStatus, TencimResult, TencimSweep
+
+ROUTE_NAME = "tencim_sweep_run"
+
+
+@pytest.fixture
+def group_mocker(mocker):
+    group_result = MagicMock()
+    group_result.id = str(uuid4())
+
+    group_mocker = mocker.patch("confiacim_api.routers.tencim.group")
+    group_mocker.return_value.apply_async.return_value = group_result
+
+    return group_mocker
+
+
+@pytest.mark.integration
+def test_positive_sweep_list(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    group_mocker,
+):
+
+    payload = {"critical_points": [10, 20], "rc_limits": [False, True], "description": "Sweep"}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+
+    sweep = session.scalars(select(TencimSweep)).one()
+    results = session.scalars(select(TencimResult).order_by(TencimResult.id)).all()
+
+    assert body["sweep_id"] == sweep.id
+    assert body["task_id"] == str(sweep.task_id)
+    assert body["result_ids"] == [r.id for r in results]
+
+    assert sweep.description == "Sweep"
+    assert sweep.case == case_with_file
+
+    assert [(r.critical_point, r.rc_limit) for r in results] == [
+        (10, False),
+        (10, True),
+        (20, False),
+        (20, True),
+    ]
+    assert all(r.sweep_id == sweep.id for r in results)
+    assert all(r.status == ResultStatus.CREATED for r in results)
+    assert all(r.description == "Sweep" for r in results)
+    assert case_with_file.base_file_digest is not None
+    assert all(
+        r.fingerprint == tencim_fingerprint(case_with_file.base_file_digest, r.critical_point, r.rc_limit)
+        for r in results
+    )
+
+    group_mocker.return_value.apply_async.assert_called_once()
+
+    signatures = list(group_mocker.call_args.args[0])
+    assert len(signatures) == 4
+    assert signatures[0].kwargs == {"result_id": results[0].id, "critical_point": 10, "rc_limit": False}
+    assert signatures[3].kwargs == {"result_id": results[3].id, "critical_point": 20, "rc_limit": True}
+
+
+@pytest.mark.integration
+def test_positive_sweep_range(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    group_mocker,
+):
+
+    payload = {"critical_points": {"start": 10, "stop": 50, "step": 20}}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    results = session.scalars(select(TencimResult).order_by(TencimResult.id)).all()
+
+    assert [(r.critical_point, r.rc_limit) for r in results] == [(10, False), (30, False), (50, False)]
+
+
+@pytest.mark.integration
+def test_positive_sweep_defaults(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    group_mocker,
+):
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json={})
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    result = session.scalars(select(TencimResult)).one()
+
+    assert result.critical_point is None
+    assert result.rc_limit is False
+
+
+@pytest.mark.integration
+def test_positive_sweep_duplicated_values(
+    client_auth: TestClient,
+    session,
+    case_with_file: Case,
+    group_mocker,
+):
+
+    payload = {"critical_points": [10, 10], "rc_limits": [True, True]}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert len(resp.json()["result_ids"]) == 1
+
+
+@pytest.mark.integration
+def test_negative_sweep_max_runs(
+    client_auth: TestClient,
+    case_with_file: Case,
+    group_mocker,
+):
+
+    payload = {"critical_points": {"start": 1, "stop": 501}}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json()["detail"][0]["msg"] == "Value error, The sweep has 501 runs, the maximum is 500."
+
+    group_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+def test_negative_sweep_empty_range(
+    client_auth: TestClient,
+    case_with_file: Case,
+    group_mocker,
+):
+
+    payload = {"critical_points": {"start": 10, "stop": 1}}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json()["detail"][0]["msg"] == (
+        "Value error, The range start (10) must be less than or equal to the stop (1)."
+    )
+
+
+@pytest.mark.integration
+def test_negative_case_not_found(client_auth: TestClient, group_mocker):
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=404), json={})
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert resp.json() == {"detail": "Case not found."}
+
+
+@pytest.mark.integration
+def test_negative_case_without_base_file(client_auth: TestClient, case: Case, group_mocker):
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case.id), json={})
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert resp.json() == {"detail": "The case has no base file."}
+
+
+@pytest.mark.integration
+def test_negative_user_can_run_only_their_own_cases(
+    client: TestClient,
+    case_with_file: Case,
+    other_user_token,
+    group_mocker,
+):
+
+    resp = client.post(
+        app.url_path_for(ROUTE_NAME, case_id=case_with_file.id),
+        headers={"Authorization": f"Bearer {other_user_token}"},
+        json={},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+def test_negative_must_have_token(client: TestClient, case_with_file: Case):
+
+    resp = client.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json={})
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+    assert resp.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.integration
+def test_negative_sweep_queue_full(
+    client_auth: TestClient,
+    session,
+    monkeypatch,
+    case_with_file: Case,
+    group_mocker,
+    full_queue,
+):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 4)
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 60)
+
+    payload = {"critical_points": [10, 20, 30]}
+
+    resp = client_auth.post(app.url_path_for(ROUTE_NAME, case_id=case_with_file.id), json=payload)
+
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp.headers["Retry-After"] == "60"
+
+    group_mocker.assert_not_called()
+
+    assert session.scalars(select(TencimSweep)).all() == []
+    assert session.scalars(select(TencimResult)).all() == []
@@ -122,3 +122,153 @@ def test_negative_need_have_admin_token(client: TestClient):
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
 
     assert resp.json()["detail"] == "Not authenticated"
+
+
+@pytest.mark.integration
+def test_fair_share_list(
+    client: TestClient,
+    user: User,
+    admin_user: User,
+    admin_token,
+    mocker,
+):
+
+    mocker.patch("confiacim_api.routers.admin.user_stats", return_value={"running": 2, "pending": 5})
+
+    resp = client.get(
+        app.url_path_for("admin_fair_share_list"),
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    assert {
+        "id": user.id,
+        "email": user.email,
+        "max_running_jobs": None,
+        "max_queue_depth": None,
+        "running": 2,
+        "pending": 5,
+    } in resp.json()
+
+
+@pytest.mark.integration
+def test_fair_share_update(
+    client: TestClient,
+    session,
+    user: User,
+    admin_token,
+    mocker,
+    monkeypatch,
+):
+
+    monkeypatch.setattr("confiacim_api.conf.settings.FAIR_SHARE_ENABLED", True)
+    mocker.patch("confiacim_api.routers.admin.user_stats", return_value={"running": 0, "pending": 0})
+    dispatch_mocker = mocker.patch("confiacim_api.routers.admin.dispatch")
+
+    resp = client.patch(
+        app.url_path_for("admin_fair_share_update", user_id=user.id),
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"max_running_jobs": 4},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["max_running_jobs"] == 4
+
+    session.refresh(user)
+    assert user.max_running_jobs == 4
+
+    dispatch_mocker.assert_called_once()
+
+
+@pytest.mark.integration
+def test_fair_share_update_back_to_default(
+    client: TestClient,
+    session,
+    user: User,
+    admin_token,
+):
+
+    user.max_running_jobs = 4
+    session.commit()
+
+    resp = client.patch(
+        app.url_path_for("admin_fair_share_update", user_id=user.id),
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"max_running_jobs": None},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["max_running_jobs"] is None
+
+
+@pytest.mark.integration
+def test_fair_share_update_max_queue_depth(
+    client: TestClient,
+    session,
+    user: User,
+    admin_token,
+):
+
+    user.max_running_jobs = 4
+    session.commit()
+
+    resp = client.patch(
+        app.url_path_for("admin_fair_share_update", user_id=user.id),
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"max_queue_depth": 100},
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+
+    body = resp.json()
+    assert body["max_queue_depth"] == 100
+    assert body["max_running_jobs"] == 4
+
+
+@pytest.mark.integration
+def test_negative_fair_share_update_negative_limit(client: TestClient, user: User, admin_token):
+
+    resp = client.patch(
+        app.url_path_for("admin_fair_share_update", user_id=user.id),
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"max_running_jobs": -1},
+    )
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+def test_negative_fair_share_update_user_not_found(client: TestClient, admin_token):
+
+    resp = client.patch(
+        app.url_path_for("admin_fair_share_update", user_id=404),
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"max_running_jobs": 1},
+    )
+
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.json()["detail"] == "User not found."
+
+
+@pytest.mark.integration
+def test_negative_only_admin_can_list_fair_share(client: TestClient, user: User, token: str):
+
+    resp = client.get(
+        app.url_path_for("admin_fair_share_list"),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.integration
+def test_negative_only_admin_can_update_fair_share(client: TestClient, user: User, token: str):
+
+    resp = client.patch(
+        app.url_path_for("admin_fair_share_update", user_id=user.id),
+        headers={"Authorization": f"Bearer {token}"},
+        json={"max_running_jobs": 1},
+    )
+
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
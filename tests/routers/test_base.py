@@ -42,6 +42,8 @@ def test_system_stats(mocker, client: TestClient):
     mocker.patch("confiacim_api.routers.base.count_tasks", return_value=2)
     mocker.patch("confiacim_api.routers.base.total_success_simulations", return_value=3)
     mocker.patch("confiacim_api.routers.base.count_case_with_simulation_success", return_value=10)
+    mocker.patch("confiacim_api.routers.base.known_queues", return_value=["celery", "celery.tencim"])
+    mocker.patch("confiacim_api.system_stats.queue_depth", side_effect=[5, 0])
 
     resp = client.get(app.url_path_for("system_stats"))
 
@@ -52,6 +54,7 @@ def test_system_stats(mocker, client: TestClient):
         "runnings_simulation": 2,
         "total_simulation": 3,
         "total_projects_with_simulations": 10,
+        "queues": {"celery": 5, "celery.tencim": 0},
     }
 
 
@@ -0,0 +1,30 @@
+import pytest
+from pydantic_core import ValidationError
+
+from confiacim_api.schemes.tencim import CriticalPointRange, TencimSweepCreateIn
+
+
+@pytest.mark.unit
+def test_critical_point_range_n_values():
+
+    assert CriticalPointRange(start=10, stop=50, step=20).n_values() == 3
+    assert CriticalPointRange(start=10, stop=10).n_values() == 1
+    assert CriticalPointRange(start=1, stop=1_000_000_000).n_values() == 1_000_000_000
+
+
+@pytest.mark.unit
+def test_sweep_huge_range_must_not_build_the_list(mocker):
+
+    values_spy = mocker.spy(CriticalPointRange, "values")
+
+    with pytest.raises(ValidationError, match="The sweep has 1000000000 runs, the maximum is 500."):
+        TencimSweepCreateIn(critical_points={"start": 1, "stop": 1_000_000_000})
+
+    values_spy.assert_not_called()
+
+
+@pytest.mark.unit
+def test_sweep_range_start_greater_than_stop():
+
+    with pytest.raises(ValidationError, match=r"The range start \(10\) must be less than or equal to the stop \(1\)."):
+        TencimSweepCreateIn(critical_points={"start": 10, "stop": 1})
@@ -1,6 +1,11 @@
 import pytest
+from celery.backends.cache import CacheBackend
 from confiacim.erros import FormStepUaInfError, TencimRunError
+from confiacim.samples import SamplesGeneratorForm
 
+import confiacim_api.tasks
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
 from confiacim_api.models import (
     Case,
     FormResult,
@@ -10,7 +15,12 @@ from confiacim_api.models import (
 from confiacim_api.tasks import (
     ResultNotFound,
     TaskFileCaseNotFound,
+    _form_distributed_chord,
+    form_persist,
+    form_prepare,
     form_run,
+    form_solve,
+    run_form_pipeline,
 )
 
 
@@ -20,6 +30,13 @@ def session_factory(mocker, session):
     return session
 
 
+@pytest.fixture
+def eager_celery(monkeypatch):
+    # O chord do FORM distribuido precisa de um backend de resultados
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(celery_app, "_backend_cache", CacheBackend(app=celery_app, backend="memory"))
+
+
 @pytest.fixture
 def form_results_tencim_fail(
     session,
@@ -51,10 +68,12 @@ def test_positive_form_run(
 
     mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
 
-    form_run(form_results.id)
+    result_id = form_results.id
+
+    form_run(result_id)
 
     with session_factory as session:
-        result_from_db = session.get(FormResult, form_results.id)
+        result_from_db = session.get(FormResult, result_id)
         assert result_from_db.status == ResultStatus.SUCCESS
 
         assert result_from_db.beta == pytest.approx(1.0745444487743427)
@@ -104,7 +123,41 @@ def test_positive_form_run(
         for db, expected in zip(result_from_db.iteration_infos["internal_temperature"], expected_values):
             assert db == pytest.approx(expected)
 
-        assert result_from_db.generated_case_files is not None
+        assert result_from_db.generated_case_files_digest is not None
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_form_run_warm_start(
+    form_results: FormResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    apply_initial_point_spy = mocker.spy(confiacim_api.tasks, "apply_initial_point")
+
+    form_results.initial_point = {
+        "E_c": 1.0495254852408304,
+        "poisson_c": 0.9787290075346774,
+        "internal_pressure": 1.0903871605051194,
+        "internal_temperature": 0.9950371902099893,
+    }
+    session_factory.commit()
+
+    result_id = form_results.id
+
+    form_run(result_id)
+
+    apply_initial_point_spy.assert_called_once()
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.SUCCESS
+
+        assert result_from_db.beta == pytest.approx(1.0745444487743427, rel=1e-4)
+        assert result_from_db.it < 3
 
 
 @pytest.mark.slow
@@ -119,10 +172,12 @@ def test_positive_form_run_with_critical_point(
 
     mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
     rewrite_case_file_mocker = mocker.spy(confiacim_api.tasks, "rewrite_case_file")
-    form_run(form_results_with_critical_point.id)
+    result_id = form_results_with_critical_point.id
+
+    form_run(result_id)
 
     with session_factory as session:
-        result_from_db = session.get(FormResult, form_results_with_critical_point.id)
+        result_from_db = session.get(FormResult, result_id)
         assert result_from_db.status == ResultStatus.SUCCESS
 
         assert result_from_db.beta == pytest.approx(3.3495977717461436)
@@ -217,3 +272,285 @@ def test_negative_form_run_error(
 
     assert "O vetor Ua_new tem valores infinitos." in result_from_db.error
     assert result_from_db.status == ResultStatus.FAILED
+
+
+@pytest.mark.integration
+def test_form_run_must_publish_status_events(
+    form_results: FormResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.run_form_core", side_effect=FormStepUaInfError)
+    publish_status_mocker = mocker.patch("confiacim_api.tasks.publish_status")
+
+    result_id = form_results.id
+
+    with pytest.raises(FormStepUaInfError):
+        form_run(result_id)
+
+    assert publish_status_mocker.call_count == 2
+
+    assert publish_status_mocker.call_args_list[0].args == ("form", result_id, ResultStatus.RUNNING)
+
+    kind, id_, status, error = publish_status_mocker.call_args_list[1].args
+    assert (kind, id_, status) == ("form", result_id, ResultStatus.FAILED)
+    assert "O vetor Ua_new tem valores infinitos." in error
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_form_run_must_publish_iteration_events(
+    form_results: FormResult,
+    session_factory,
+    mocker,
+    monkeypatch,
+    tmp_path,
+):
+
+    monkeypatch.setattr(settings, "EVENTS_POLL_INTERVAL", 0.05)
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.publish_status")
+    publish_event_mocker = mocker.patch("confiacim_api.tasks.publish_result_event")
+
+    result_id = form_results.id
+
+    form_run(result_id)
+
+    events = [c.args for c in publish_event_mocker.call_args_list]
+
+    assert [data["it"] for _, _, _, data in events] == [1, 2, 3]
+    assert all(c[:3] == ("form", result_id, "iteration") for c in events)
+    assert events[-1][3]["beta"] == pytest.approx(1.0745444487743427)
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_form_run_distributed(
+    form_results: FormResult,
+    session_factory,
+    eager_celery,
+    mocker,
+    monkeypatch,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    monkeypatch.setattr(settings, "FORM_DISTRIBUTED", True)
+    sample_spy = mocker.spy(confiacim_api.tasks, "run_samples_iteration_i")
+    prepare_spy = mocker.spy(confiacim_api.tasks, "prepare_reliability_case")
+
+    result_id = form_results.id
+
+    form_run.apply(args=(result_id,)).get()
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.SUCCESS
+
+        assert result_from_db.beta == pytest.approx(1.0745444487743427)
+        assert result_from_db.resid == pytest.approx(0.00013781849291374292)
+        assert result_from_db.it == 3
+        assert result_from_db.Pf == pytest.approx(0.14128936713932422)
+
+        assert result_from_db.variables_stats["E_c"]["importance_factor"] == pytest.approx(24.739161756102167)
+        assert result_from_db.variables_stats["internal_pressure"]["importance_factor"] == pytest.approx(
+            72.88392578370228
+        )
+
+        expected_values = (1.1336004085260278, 1.0746925408708417, 1.0745444487743427)
+        for db, expected in zip(result_from_db.iteration_infos["beta"], expected_values):
+            assert db == pytest.approx(expected)
+
+    # 3 iterações com 4 variáveis + base
+    assert sample_spy.call_count == 3 * 5
+    assert {len(c.kwargs["samples"]) for c in sample_spy.call_args_list} == {1}
+
+    # O caso é preparado uma vez, as amostras partem dos arquivos gerados
+    prepare_spy.assert_called_once()
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_form_chain_stages(
+    form_results: FormResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    run_form_core_spy = mocker.spy(confiacim_api.tasks, "run_form_core")
+
+    result_id = form_results.id
+
+    form_prepare(result_id)
+
+    run_form_core_spy.assert_not_called()
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.CREATED
+        assert result_from_db.generated_case_files_digest is not None
+
+    outputs = form_solve(result_id)
+
+    run_form_core_spy.assert_called_once()
+    assert outputs["results"]["beta"] == pytest.approx(1.0745444487743427)
+    assert len(outputs["iteration_infos"]["beta"]) == 3
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.RUNNING
+        assert result_from_db.beta is None
+
+    form_persist(outputs, result_id)
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.SUCCESS
+        assert result_from_db.beta == pytest.approx(1.0745444487743427)
+        assert result_from_db.it == 3
+        assert result_from_db.iteration_infos == outputs["iteration_infos"]
+
+
+@pytest.mark.integration
+def test_negative_form_prepare_error(
+    form_results: FormResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.generate_templates", side_effect=ValueError("Template error"))
+
+    result_id = form_results.id
+
+    with pytest.raises(ValueError, match="Template error"):
+        form_prepare(result_id)
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.FAILED
+        assert result_from_db.error == "Template error"
+        assert result_from_db.generated_case_files_digest is None
+
+    assert [p.name for p in tmp_path.iterdir()] == ["case_cache"]
+
+
+@pytest.mark.integration
+def test_negative_form_solve_without_generated_files(
+    form_results: FormResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.publish_status")
+
+    result_id = form_results.id
+
+    with pytest.raises(TaskFileCaseNotFound, match="The result has no generated files."):
+        form_solve(result_id)
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.FAILED
+
+
+@pytest.mark.unit
+def test_positive_run_form_pipeline(mocker, monkeypatch):
+
+    monkeypatch.setattr(settings, "IO_QUEUE", "celery.io")
+    chain_mocker = mocker.patch("confiacim_api.tasks.chain")
+    submit_mocker = mocker.patch("confiacim_api.tasks.submit")
+
+    task = run_form_pipeline(1, 7, solver_queue="celery.affinity.0")
+
+    assert task == submit_mocker.return_value
+    submit_mocker.assert_called_once_with(7, chain_mocker.return_value)
+
+    prepare, solve, persist = chain_mocker.call_args.args
+
+    assert (prepare.task, prepare.kwargs, prepare.options["queue"]) == (
+        "confiacim_api.tasks.form_prepare",
+        {"result_id": 1},
+        "celery.io",
+    )
+    assert (solve.task, solve.kwargs, solve.options["queue"]) == (
+        "confiacim_api.tasks.form_solve",
+        {"result_id": 1},
+        "celery.affinity.0",
+    )
+    assert (persist.task, persist.kwargs, persist.options["queue"]) == (
+        "confiacim_api.tasks.form_persist",
+        {"result_id": 1},
+        "celery.io",
+    )
+    assert prepare.immutable and solve.immutable and not persist.immutable
+
+
+@pytest.mark.unit
+def test_positive_form_distributed_chord(monkeypatch):
+
+    monkeypatch.setattr(settings, "IO_QUEUE", "celery.io")
+    monkeypatch.setattr(settings, "FORM_DISTRIBUTED_QUEUE", "celery.form_samples")
+
+    samples = SamplesGeneratorForm({"E_c": 1.0, "poisson_c": 2.0}).all()
+    case = {"result_id": 1, "user_id": 7, "digest": "abc", "time_loop": None}
+    state = {"it": 1, "Ua": [1.0, 2.0], "beta": 3.0, "iteration_infos": {}}
+
+    job = _form_distributed_chord(case, state, samples)
+
+    signatures = list(job.tasks)
+    assert {s.task for s in signatures} == {"confiacim_api.tasks.form_sample_run"}
+    assert [s.kwargs["sample_name"] for s in signatures] == ["base", "E_c", "poisson_c"]
+    assert signatures[1].kwargs["averages"] == {"E_c": pytest.approx(1.01), "poisson_c": 2.0}
+    assert {s.kwargs["iteration"] for s in signatures} == {2}
+    assert all(s.kwargs["case"] == case for s in signatures)
+    assert {s.options["queue"] for s in signatures} == {"celery.form_samples"}
+    assert {s.options["time_limit"] for s in signatures} == {settings.FORM_DISTRIBUTED_TIMEOUT}
+
+    assert job.body.task == "confiacim_api.tasks.form_distributed_step"
+    assert job.body.kwargs == {"case": case, "state": state, "names": ["base", "E_c", "poisson_c"]}
+    assert job.body.options["queue"] == "celery.io"
+
+
+@pytest.mark.unit
+def test_positive_form_solve_distributed_must_replace_the_task(mocker, monkeypatch):
+
+    monkeypatch.setattr(settings, "FORM_DISTRIBUTED", True)
+    distributed_mocker = mocker.patch("confiacim_api.tasks._solve_form_distributed")
+    solve_mocker = mocker.patch("confiacim_api.tasks._solve_form")
+    replace_mocker = mocker.patch.object(form_solve, "replace", return_value={"results": {}})
+
+    assert form_solve(1) == {"results": {}}
+
+    replace_mocker.assert_called_once_with(distributed_mocker.return_value)
+    solve_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+def test_negative_form_run_distributed_tencim_error(
+    form_results_tencim_fail: Case,
+    session_factory,
+    eager_celery,
+    mocker,
+    monkeypatch,
+    tmp_path,
+):
+
+    result_id = form_results_tencim_fail.id
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    monkeypatch.setattr(settings, "FORM_DISTRIBUTED", True)
+
+    with pytest.raises(TencimRunError):
+        form_run.apply(args=(result_id,)).get()
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+
+    assert "ERROR STOP 1" in result_from_db.error
+    assert result_from_db.status == ResultStatus.FAILED
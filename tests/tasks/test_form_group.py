@@ -0,0 +1,143 @@
+import pytest
+
+import confiacim_api.tasks
+from confiacim_api.celery import celery_app
+from confiacim_api.models import (
+    Case,
+    FormResult,
+    FormResultGroup,
+    ResultStatus,
+)
+from confiacim_api.tasks import (
+    ResultNotFound,
+    TaskFileCaseNotFound,
+    form_group_point_run,
+    form_group_run,
+)
+
+
+@pytest.fixture
+def session_factory(mocker, session):
+    mocker.patch("confiacim_api.tasks.SessionFactory", return_value=session)
+    return session
+
+
+@pytest.fixture
+def form_group(session, case_form_with_real_file: Case, form_case_config: dict):
+    group = FormResultGroup(case=case_form_with_real_file, config=form_case_config)
+    results = [
+        FormResult(case=case_form_with_real_file, group=group, config=form_case_config, critical_point=critical_point)
+        for critical_point in (150, 160)
+    ]
+    session.add_all([group, *results])
+    session.commit()
+    session.refresh(group)
+
+    return group
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_form_group_run(
+    form_group: FormResultGroup,
+    session_factory,
+    mocker,
+    monkeypatch,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    generate_templates_spy = mocker.spy(confiacim_api.tasks, "generate_templates")
+    rewrite_case_file_spy = mocker.spy(confiacim_api.tasks, "rewrite_case_file")
+    save_generated_form_files_spy = mocker.spy(confiacim_api.tasks, "save_generated_form_files")
+    extract_spy = mocker.spy(confiacim_api.tasks, "extract_form_generated_case")
+
+    group_id = form_group.id
+
+    form_group_run(group_id)
+
+    generate_templates_spy.assert_called_once()
+    rewrite_case_file_spy.assert_called_once()
+    assert rewrite_case_file_spy.call_args.kwargs["critical_point"] is None
+    save_generated_form_files_spy.assert_called_once()
+    assert extract_spy.call_count == 2
+
+    with session_factory as session:
+        group_from_db = session.get(FormResultGroup, group_id)
+        assert group_from_db.generated_case_files_digest is not None
+
+        result_150, result_160 = sorted(group_from_db.results, key=lambda r: r.critical_point)
+
+        assert result_150.status == ResultStatus.SUCCESS
+        assert result_160.status == ResultStatus.SUCCESS
+
+        assert result_150.generated_case_files_digest == group_from_db.generated_case_files_digest
+        assert result_160.generated_case_files_digest == group_from_db.generated_case_files_digest
+
+        # Mesmo resultado de um `form_run` com `critical_point=160`
+        assert result_160.beta == pytest.approx(3.3495977717461436)
+        assert result_160.it == 4
+        assert result_160.Pf == pytest.approx(0.00040464494007775854)
+
+        assert result_150.beta != pytest.approx(result_160.beta)
+
+
+@pytest.mark.integration
+def test_negative_form_group_run_prepare_error(
+    form_group: FormResultGroup,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.generate_templates", side_effect=ValueError("Template error"))
+    publish_status_mocker = mocker.patch("confiacim_api.tasks.publish_status")
+    point_run_mocker = mocker.patch("confiacim_api.tasks.form_group_point_run")
+
+    group_id = form_group.id
+
+    with pytest.raises(ValueError, match="Template error"):
+        form_group_run(group_id)
+
+    point_run_mocker.si.assert_not_called()
+
+    with session_factory as session:
+        group_from_db = session.get(FormResultGroup, group_id)
+        assert group_from_db.error == "Template error"
+
+        for result in group_from_db.results:
+            assert result.status == ResultStatus.FAILED
+            assert result.error == "Template error"
+
+    assert publish_status_mocker.call_count == 2
+
+
+@pytest.mark.integration
+def test_negative_form_group_run_group_not_found(session_factory):
+
+    with pytest.raises(ResultNotFound, match="Group not found."):
+        form_group_run(404)
+
+
+@pytest.mark.integration
+def test_negative_form_group_point_run_without_generated_files(
+    form_group: FormResultGroup,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.publish_status")
+
+    result_id = form_group.results[0].id
+
+    with pytest.raises(TaskFileCaseNotFound, match="The group has no generated files."):
+        form_group_point_run(result_id)
+
+    with session_factory as session:
+        result_from_db = session.get(FormResult, result_id)
+        assert result_from_db.status == ResultStatus.FAILED
+        assert result_from_db.error == "The group has no generated files."
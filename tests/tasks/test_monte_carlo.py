@@ -0,0 +1,159 @@
+import pytest
+
+from confiacim_api.models import MonteCarloChunk, MonteCarloResult, ResultStatus
+from confiacim_api.tasks import ResultNotFound, monte_carlo_chunk_run
+
+
+@pytest.fixture
+def session_factory(mocker, session):
+    mocker.patch("confiacim_api.tasks.SessionFactory", return_value=session)
+    return session
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_monte_carlo_chunk_run(
+    monte_carlo_result: MonteCarloResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    first, second = (c.id for c in monte_carlo_result.chunks)
+
+    monte_carlo_chunk_run(first)
+
+    with session_factory as session:
+        result_from_db = session.get(MonteCarloResult, monte_carlo_result.id)
+        chunk_from_db = session.get(MonteCarloChunk, first)
+
+        assert chunk_from_db.status == ResultStatus.SUCCESS
+        assert chunk_from_db.total == 2
+        assert chunk_from_db.finished_at is not None
+
+        assert result_from_db.status == ResultStatus.RUNNING
+        assert result_from_db.chunks_done == 1
+        assert result_from_db.total == 2
+        assert result_from_db.Pf is not None
+        assert result_from_db.Pf_lower is not None
+        assert result_from_db.Pf_upper is not None
+
+    monte_carlo_chunk_run(second)
+
+    with session_factory as session:
+        result_from_db = session.get(MonteCarloResult, monte_carlo_result.id)
+
+        assert result_from_db.status == ResultStatus.SUCCESS
+        assert result_from_db.chunks_done == 2
+        assert result_from_db.total == 4
+        assert result_from_db.valid_simulations == 4
+        assert result_from_db.Pf == pytest.approx(result_from_db.fail / 4)
+        assert result_from_db.Pf_lower <= result_from_db.Pf <= result_from_db.Pf_upper
+
+
+@pytest.mark.integration
+def test_positive_monte_carlo_chunk_samples_depend_only_on_the_chunk_seed(
+    monte_carlo_result: MonteCarloResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+    import confiacim_api.tasks
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    run_mocker = mocker.patch.object(
+        confiacim_api.tasks,
+        "run_samples_iteration_i",
+        return_value={"sample_1": {"min": 1.0, "last": 1.0}, "sample_2": {"min": -1.0, "last": -1.0}},
+    )
+    chunk = monte_carlo_result.chunks[0]
+
+    monte_carlo_chunk_run(chunk.id)
+    monte_carlo_chunk_run(chunk.id)
+
+    first_run, second_run = (c.kwargs["samples"] for c in run_mocker.call_args_list)
+    assert len(first_run) == 2
+    assert first_run == second_run
+
+    with session_factory as session:
+        chunk_from_db = session.get(MonteCarloChunk, chunk.id)
+        assert chunk_from_db.fail == 1
+        assert chunk_from_db.valid_simulations == 2
+
+
+@pytest.mark.integration
+def test_monte_carlo_chunk_run_must_publish_estimate_events(
+    monte_carlo_result: MonteCarloResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch(
+        "confiacim_api.tasks.run_samples_iteration_i",
+        return_value={"sample_1": {"min": 1.0, "last": 1.0}, "sample_2": {"min": -1.0, "last": -1.0}},
+    )
+    publish_event_mocker = mocker.patch("confiacim_api.tasks.publish_result_event")
+    publish_status_mocker = mocker.patch("confiacim_api.tasks.publish_status")
+    result_id = monte_carlo_result.id
+    first, second = (c.id for c in monte_carlo_result.chunks)
+
+    monte_carlo_chunk_run(first)
+    monte_carlo_chunk_run(second)
+
+    (first_call, second_call) = publish_event_mocker.call_args_list
+
+    kind, id_, event, data = first_call.args
+    assert (kind, id_, event) == ("montecarlo", result_id, "estimate")
+    assert data["chunks_done"] == 1
+    assert data["chunks_total"] == 2
+    assert data["Pf"] == pytest.approx(0.5)
+    assert data["Pf_lower"] < 0.5 < data["Pf_upper"]
+
+    kind, id_, event, data = second_call.args
+    assert data["chunks_done"] == 2
+    assert data["total"] == 4
+    assert data["fail"] == 2
+
+    published = [c.args[:3] for c in publish_status_mocker.call_args_list]
+    assert published == [
+        ("montecarlo", result_id, ResultStatus.RUNNING),
+        ("montecarlo", result_id, ResultStatus.SUCCESS),
+    ]
+
+
+@pytest.mark.integration
+def test_negative_monte_carlo_chunk_run_error_must_fail_the_result(
+    monte_carlo_result: MonteCarloResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    mocker.patch("confiacim_api.tasks.run_samples_iteration_i", side_effect=RuntimeError("Boom"))
+    chunk_id = monte_carlo_result.chunks[1].id
+
+    with pytest.raises(RuntimeError):
+        monte_carlo_chunk_run(chunk_id)
+
+    with session_factory as session:
+        result_from_db = session.get(MonteCarloResult, monte_carlo_result.id)
+        chunk_from_db = session.get(MonteCarloChunk, chunk_id)
+
+        assert chunk_from_db.status == ResultStatus.FAILED
+        assert chunk_from_db.error == "Boom"
+
+        assert result_from_db.status == ResultStatus.FAILED
+        assert result_from_db.error == "Chunk 1: Boom"
+        assert result_from_db.chunks_done == 1
+        assert result_from_db.total == 0
+
+
+@pytest.mark.integration
+def test_negative_monte_carlo_chunk_run_not_found(session_factory):
+
+    with pytest.raises(ResultNotFound, match="Result not found."):
+        monte_carlo_chunk_run(404)
@@ -1,9 +1,14 @@
+import numpy as np
 import pytest
 from confiacim.erros import TencimRunError
+from sqlalchemy import select
 
+from confiacim_api.conf import settings
+from confiacim_api.errors import BlobNotFoundError
 from confiacim_api.models import (
     Case,
     ResultStatus,
+    RunMetrics,
     TencimResult,
     User,
 )
@@ -50,6 +55,53 @@ def test_positive_tencim_standalone_run(
         assert result_from_db.status == ResultStatus.SUCCESS
 
 
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_tencim_standalone_run_must_save_the_rc_summary(
+    tencim_results: TencimResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    tencim_standalone_run(tencim_results.id)
+
+    with session_factory as session:
+        result_from_db = session.get(TencimResult, tencim_results.id)
+
+        assert result_from_db.rc_threshold == settings.RC_SUMMARY_THRESHOLD
+        assert result_from_db.rankine_rc_min == result_from_db.rankine_rc.min()
+        assert result_from_db.rankine_rc_min_t == result_from_db.t[result_from_db.rankine_rc.argmin()]
+        assert result_from_db.mohr_coulomb_rc_max == result_from_db.mohr_coulomb_rc.max()
+        assert result_from_db.mohr_coulomb_rc_steps_below is not None
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_tencim_standalone_run_must_save_the_run_metrics(
+    tencim_results: TencimResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    tencim_standalone_run(tencim_results.id, critical_point=100)
+
+    metrics = session_factory.scalars(
+        select(RunMetrics).where(
+            RunMetrics.analysis == "tencim",
+            RunMetrics.result_id == tencim_results.id,
+        )
+    ).one()
+
+    assert set(metrics.phases) == {"prepare", "solve"}
+    assert metrics.duration > 0
+    assert metrics.n_steps == 100
+    assert metrics.n_nodes is not None
+
+
 @pytest.mark.slow
 @pytest.mark.integration
 def test_positive_tencim_standalone_run_rc_limit(
@@ -106,6 +158,69 @@ def test_negative_tencim_standalone_run_tencim_error(
     assert result_from_db.status == ResultStatus.FAILED
 
 
+@pytest.mark.integration
+def test_tencim_standalone_run_must_publish_status_events(
+    tencim_results_case_fail: Case,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    result_id = tencim_results_case_fail.id
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    publish_status_mocker = mocker.patch("confiacim_api.tasks.publish_status")
+
+    with pytest.raises(TencimRunError):
+        tencim_standalone_run(result_id)
+
+    assert publish_status_mocker.call_count == 2
+
+    assert publish_status_mocker.call_args_list[0].args == ("tencim", result_id, ResultStatus.RUNNING)
+
+    kind, _, status, error = publish_status_mocker.call_args_list[1].args
+    assert (kind, status) == ("tencim", ResultStatus.FAILED)
+    assert "ERROR STOP 1" in error
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_positive_tencim_standalone_run_updates_attached_results(
+    session,
+    tencim_results: TencimResult,
+    session_factory,
+    mocker,
+    tmp_path,
+):
+
+    tencim_results.status = ResultStatus.CREATED
+    attached = TencimResult(
+        case=tencim_results.case,
+        source_result_id=tencim_results.id,
+        status=ResultStatus.CREATED,
+    )
+    session.add(attached)
+    session.commit()
+    attached_id = attached.id
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+    publish_status_mocker = mocker.patch("confiacim_api.tasks.publish_status")
+
+    tencim_standalone_run(tencim_results.id)
+
+    with session_factory as session:
+        result_from_db = session.get(TencimResult, tencim_results.id)
+        attached_from_db = session.get(TencimResult, attached_id)
+
+        assert attached_from_db.status == ResultStatus.SUCCESS
+        np.testing.assert_array_equal(attached_from_db.istep, result_from_db.istep)
+        np.testing.assert_array_equal(attached_from_db.rankine_rc, result_from_db.rankine_rc)
+        np.testing.assert_array_equal(attached_from_db.mohr_coulomb_rc, result_from_db.mohr_coulomb_rc)
+
+    published = [c.args[1:3] for c in publish_status_mocker.call_args_list]
+    assert (attached_id, ResultStatus.RUNNING) in published
+    assert (attached_id, ResultStatus.SUCCESS) in published
+
+
 @pytest.mark.integration
 def test_negative_tencim_standalone_run_file_result_not_found(session_factory):
 
@@ -125,3 +240,25 @@ def test_negative_tencim_standalone_run_file_not_found(session_factory, case):
 
     with pytest.raises(TaskFileCaseNotFound, match="The case has no base file."):
         tencim_standalone_run(result_id)
+
+
+@pytest.mark.integration
+def test_negative_tencim_standalone_run_blob_not_found(session_factory, case, mocker, tmp_path):
+
+    mocker.patch("confiacim_api.tasks.get_simulation_base_dir", return_value=tmp_path)
+
+    with session_factory as session:
+        case.base_file_digest = "404"
+        result = TencimResult(case=case)
+        session.add(result)
+        session.commit()
+        session.refresh(result)
+        result_id = result.id
+
+    with pytest.raises(BlobNotFoundError, match="Blob 404 not found."):
+        tencim_standalone_run(result_id)
+
+    with session_factory as session:
+        result_from_db = session.get(TencimResult, result_id)
+        assert result_from_db.status == ResultStatus.FAILED
+        assert result_from_db.error == "Blob 404 not found."
@@ -0,0 +1,152 @@
+import pytest
+from fastapi import HTTPException, status
+
+from confiacim_api.admission import (
+    admission_limit,
+    backlog_depth,
+    check_admission,
+    estimated_runtime,
+    retry_after,
+)
+from confiacim_api.conf import settings
+from confiacim_api.models import User
+
+TENCIM_TASK = "confiacim_api.tasks.tencim_standalone_run"
+
+
+@pytest.fixture
+def admission(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 10)
+    monkeypatch.setattr(settings, "ADMISSION_MAX_BACKLOG", 0)
+    monkeypatch.setattr(settings, "ADMISSION_WORKERS", 2)
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 60)
+
+
+@pytest.mark.integration
+def test_estimated_runtime_without_history(session, monkeypatch):
+
+    monkeypatch.setattr(settings, "ADMISSION_FORM_RUNTIME", 900)
+    monkeypatch.setattr(settings, "ADMISSION_MONTE_CARLO_RUNTIME", 0)
+
+    assert estimated_runtime(session, "confiacim_api.tasks.form_solve") == 900
+    assert estimated_runtime(session, "confiacim_api.tasks.form_group_point_run") == 900
+    assert estimated_runtime(session, "confiacim_api.tasks.monte_carlo_chunk_run") == 1
+
+
+@pytest.mark.unit
+def test_admission_limit_disabled(monkeypatch):
+
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 0)
+    monkeypatch.setattr(settings, "ADMISSION_MAX_BACKLOG", 0)
+
+    assert admission_limit(User(), 60) is None
+
+
+@pytest.mark.unit
+def test_admission_limit(monkeypatch, admission):
+
+    assert admission_limit(User(), 60) == 10
+
+    # 2 workers rodam 6 simulações de 60 s em 180 s
+    monkeypatch.setattr(settings, "ADMISSION_MAX_BACKLOG", 180)
+
+    assert admission_limit(User(), 60) == 6
+
+    # Backlog menor que uma simulação
+    assert admission_limit(User(), 3600) == 1
+
+
+@pytest.mark.unit
+def test_admission_limit_user_override(admission):
+
+    assert admission_limit(User(max_queue_depth=50), 60) == 50
+    assert admission_limit(User(max_queue_depth=0), 60) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "excess, runtime, expected",
+    [
+        (1, 60, 30),
+        (3, 60, 90),
+        (1, 1, 1),
+    ],
+)
+def test_retry_after(admission, excess, runtime, expected):
+    assert retry_after(excess, runtime) == expected
+
+
+@pytest.mark.unit
+def test_backlog_depth(monkeypatch, mocker):
+
+    monkeypatch.setattr(settings, "AFFINITY_QUEUES", 2)
+    queues = ["celery.tencim", "celery.tencim.affinity.0", "celery.tencim.affinity.1"]
+
+    queue_depths_mocker = mocker.patch(
+        "confiacim_api.admission.queue_depths",
+        return_value=dict(zip(queues, [1, 2, 3])),
+    )
+    pending_depth_mocker = mocker.patch("confiacim_api.admission.pending_depth", return_value=4)
+
+    assert backlog_depth("celery.tencim") == 10
+
+    queue_depths_mocker.assert_called_once_with(queues)
+    pending_depth_mocker.assert_called_once_with(queues)
+
+
+@pytest.mark.unit
+def test_backlog_depth_broker_not_available(mocker):
+
+    mocker.patch("confiacim_api.admission.queue_depths", return_value={"celery": None})
+
+    assert backlog_depth("celery") is None
+
+
+@pytest.mark.integration
+def test_check_admission_accept(session, mocker, admission):
+
+    mocker.patch("confiacim_api.admission.backlog_depth", return_value=9)
+
+    check_admission(session, User(), TENCIM_TASK)
+
+
+@pytest.mark.integration
+def test_check_admission_reject(session, mocker, admission):
+
+    mocker.patch("confiacim_api.admission.backlog_depth", return_value=10)
+
+    with pytest.raises(HTTPException) as e:
+        check_admission(session, User(), TENCIM_TASK, n_jobs=3)
+
+    assert e.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert e.value.headers == {"Retry-After": "90"}
+
+
+@pytest.mark.integration
+def test_check_admission_more_jobs_than_the_limit(session, mocker, admission):
+
+    backlog_depth_mocker = mocker.patch("confiacim_api.admission.backlog_depth")
+
+    with pytest.raises(HTTPException) as e:
+        check_admission(session, User(), TENCIM_TASK, n_jobs=11)
+
+    assert e.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    backlog_depth_mocker.assert_not_called()
+
+
+@pytest.mark.integration
+def test_check_admission_broker_not_available(session, mocker, admission):
+
+    mocker.patch("confiacim_api.admission.backlog_depth", return_value=None)
+
+    check_admission(session, User(), TENCIM_TASK)
+
+
+@pytest.mark.integration
+def test_check_admission_user_without_limit(session, mocker, admission):
+
+    backlog_depth_mocker = mocker.patch("confiacim_api.admission.backlog_depth")
+
+    check_admission(session, User(max_queue_depth=0), TENCIM_TASK, n_jobs=100)
+
+    backlog_depth_mocker.assert_not_called()
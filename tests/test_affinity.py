@@ -0,0 +1,143 @@
+import pytest
+
+from confiacim_api.affinity import (
+    affinity_queue,
+    io_queue,
+    known_queues,
+    select_queue,
+    task_queue,
+)
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
+
+
+@pytest.fixture
+def affinity_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "AFFINITY_QUEUES", 4)
+    monkeypatch.setattr(settings, "AFFINITY_SPILLOVER_DEPTH", 2)
+
+
+@pytest.mark.unit
+def test_affinity_queue_is_stable():
+
+    queues = {affinity_queue("abc", 4) for _ in range(10)}
+
+    assert queues == {affinity_queue("abc", 4)}
+    assert affinity_queue("abc", 4).startswith("celery.affinity.")
+
+
+@pytest.mark.unit
+def test_affinity_queue_spread_keys():
+
+    queues = {affinity_queue(str(i), 4) for i in range(100)}
+
+    assert queues == {f"celery.affinity.{i}" for i in range(4)}
+
+
+@pytest.mark.unit
+def test_affinity_queue_with_base_queue():
+    assert affinity_queue("abc", 4, "celery.form") == affinity_queue("abc", 4).replace("celery", "celery.form", 1)
+
+
+@pytest.fixture
+def task_routes(monkeypatch):
+    monkeypatch.setattr(
+        celery_app.conf,
+        "task_routes",
+        {
+            "confiacim_api.tasks.tencim_standalone_run": {"queue": "celery.tencim"},
+            "confiacim_api.tasks.form_solve": {"queue": "celery.form"},
+        },
+    )
+
+
+@pytest.mark.unit
+def test_task_queue(task_routes):
+    assert task_queue("confiacim_api.tasks.form_solve") == "celery.form"
+    assert task_queue("confiacim_api.tasks.form_prepare") == "celery"
+
+
+@pytest.mark.unit
+def test_select_queue_disabled(mocker):
+
+    queue_depth_mocker = mocker.patch("confiacim_api.affinity.queue_depth")
+
+    assert select_queue("abc") == "celery"
+
+    queue_depth_mocker.assert_not_called()
+
+
+@pytest.mark.unit
+def test_select_queue_without_key(affinity_enabled):
+    assert select_queue(None) == "celery"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("depth", [0, 1])
+def test_select_queue_affinity(affinity_enabled, mocker, depth):
+
+    mocker.patch("confiacim_api.affinity.queue_depth", return_value=depth)
+
+    assert select_queue("abc") == affinity_queue("abc", 4)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("depth", [2, 10, None])
+def test_select_queue_spillover(affinity_enabled, mocker, depth):
+
+    mocker.patch("confiacim_api.affinity.queue_depth", return_value=depth)
+
+    assert select_queue("abc") == "celery"
+
+
+@pytest.mark.unit
+def test_io_queue_default():
+    assert io_queue() == "celery"
+
+
+@pytest.mark.unit
+def test_io_queue(monkeypatch):
+
+    monkeypatch.setattr(settings, "IO_QUEUE", "celery.io")
+
+    assert io_queue() == "celery.io"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("depth", [0, 1])
+def test_select_queue_affinity_with_base_queue(affinity_enabled, mocker, depth):
+
+    mocker.patch("confiacim_api.affinity.queue_depth", return_value=depth)
+
+    assert select_queue("abc", queue="celery.form") == affinity_queue("abc", 4, "celery.form")
+
+
+@pytest.mark.unit
+def test_select_queue_spillover_with_base_queue(affinity_enabled, mocker):
+
+    mocker.patch("confiacim_api.affinity.queue_depth", return_value=2)
+
+    assert select_queue("abc", queue="celery.form") == "celery.form"
+
+
+@pytest.mark.unit
+def test_known_queues_default():
+    assert known_queues() == ["celery"]
+
+
+@pytest.mark.unit
+def test_known_queues(task_routes, monkeypatch):
+
+    monkeypatch.setattr(settings, "AFFINITY_QUEUES", 2)
+    monkeypatch.setattr(settings, "FORM_DISTRIBUTED_QUEUE", "celery.form_samples")
+
+    assert known_queues() == [
+        "celery",
+        "celery.tencim",
+        "celery.form",
+        "celery.form_samples",
+        "celery.tencim.affinity.0",
+        "celery.tencim.affinity.1",
+        "celery.form.affinity.0",
+        "celery.form.affinity.1",
+    ]
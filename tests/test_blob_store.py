@@ -0,0 +1,138 @@
+import hashlib
+import os
+from io import BytesIO
+
+import pytest
+
+import confiacim_api.blob_store
+from confiacim_api.blob_store import (
+    BlobStore,
+    FileSystemBlobStore,
+    get_blob_store,
+    register_blob_store_backend,
+)
+from confiacim_api.conf import settings
+from confiacim_api.errors import BlobNotFoundError, BlobStoreBackendError
+
+
+@pytest.mark.unit
+def test_put_and_open(tmp_path):
+
+    store = FileSystemBlobStore(tmp_path)
+
+    digest = store.put(BytesIO(b"Fake zip file."))
+
+    assert digest == hashlib.sha256(b"Fake zip file.").hexdigest()
+    assert store.path(digest) == tmp_path / digest[:2] / digest[2:4] / digest
+    assert store.exists(digest)
+    assert store.size(digest) == len(b"Fake zip file.")
+
+    with store.open(digest) as fp:
+        assert fp.read() == b"Fake zip file."
+
+
+@pytest.mark.unit
+def test_put_identical_content_is_stored_once(tmp_path, mocker):
+
+    store = FileSystemBlobStore(tmp_path)
+
+    write_spy = mocker.spy(store, "_write")
+
+    digest_1 = store.put_bytes(b"Fake zip file.")
+    digest_2 = store.put_bytes(b"Fake zip file.")
+
+    assert digest_1 == digest_2
+    assert write_spy.call_count == 1
+    assert list(store.digests()) == [digest_1]
+
+
+@pytest.mark.unit
+def test_put_leaves_no_temporary_files(tmp_path):
+
+    store = FileSystemBlobStore(tmp_path)
+
+    store.put_bytes(b"Fake zip file.")
+
+    assert os.listdir(tmp_path / "tmp") == []
+
+
+@pytest.mark.unit
+def test_put_rewinds_the_file(tmp_path):
+
+    store = FileSystemBlobStore(tmp_path)
+
+    file = BytesIO(b"Fake zip file.")
+    store.put(file)
+
+    assert file.tell() == 0
+
+
+@pytest.mark.unit
+def test_put_with_digest_must_not_hash_the_file_again(tmp_path, mocker):
+
+    store = FileSystemBlobStore(tmp_path)
+    scan_file_spy = mocker.spy(confiacim_api.blob_store, "scan_file")
+
+    content = b"Fake zip file."
+    digest = hashlib.sha256(content).hexdigest()
+
+    assert store.put(BytesIO(content), digest) == digest
+
+    scan_file_spy.assert_not_called()
+
+    with store.open(digest) as fp:
+        assert fp.read() == content
+
+
+@pytest.mark.unit
+def test_delete(tmp_path):
+
+    store = FileSystemBlobStore(tmp_path)
+
+    digest = store.put_bytes(b"Fake zip file.")
+    store.delete(digest)
+
+    assert store.exists(digest) is False
+    assert list(store.digests()) == []
+
+
+@pytest.mark.unit
+def test_negative_open_blob_not_found(tmp_path):
+
+    store = FileSystemBlobStore(tmp_path)
+
+    with pytest.raises(BlobNotFoundError, match="Blob 404 not found."):
+        store.open("404")
+
+
+@pytest.mark.unit
+def test_get_blob_store_filesystem(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(settings, "BLOB_STORE_DIR", tmp_path)
+
+    store = get_blob_store()
+
+    assert isinstance(store, FileSystemBlobStore)
+    assert store.root == tmp_path
+
+
+@pytest.mark.unit
+def test_get_blob_store_registered_backend(tmp_path, monkeypatch, mocker):
+
+    backend = mocker.MagicMock(spec=BlobStore)
+
+    monkeypatch.setattr("confiacim_api.blob_store.BLOB_STORE_BACKENDS", {})
+    monkeypatch.setattr(settings, "BLOB_STORE_BACKEND", "s3")
+
+    register_blob_store_backend("s3", lambda: backend)
+
+    assert get_blob_store() is backend
+
+
+@pytest.mark.unit
+def test_negative_get_blob_store_backend_not_registered(monkeypatch):
+
+    monkeypatch.setattr(settings, "BLOB_STORE_BACKEND", "s3")
+
+    with pytest.raises(BlobStoreBackendError, match="Blob store backend 's3' not registered."):
+        get_blob_store()
@@ -0,0 +1,170 @@
+import os
+from io import BytesIO
+from pathlib import Path
+from zipfile import BadZipFile, ZipFile
+
+import pytest
+
+from confiacim_api.case_cache import ExtractedCaseCache, get_case_cache
+from confiacim_api.conf import settings
+
+
+def _zip(files: dict[str, bytes]) -> bytes:
+    buffer = BytesIO()
+    with ZipFile(buffer, "w") as zip_ref:
+        for name, content in files.items():
+            zip_ref.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def case_zip():
+    return _zip({"case.dat": b"case", "templates/materials.jinja": b"template"})
+
+
+@pytest.mark.unit
+def test_checkout_miss_then_hit(tmp_path, case_zip, mocker):
+
+    cache = ExtractedCaseCache(tmp_path / "cache", max_size=1024)
+    opener = mocker.Mock(side_effect=lambda: BytesIO(case_zip))
+
+    dst_1 = tmp_path / "w1"
+    dst_1.mkdir()
+    dst_2 = tmp_path / "w2"
+    dst_2.mkdir()
+
+    assert cache.checkout("abc", opener, dst_1) is False
+    assert cache.checkout("abc", opener, dst_2) is True
+
+    assert opener.call_count == 1
+
+    for dst in (dst_1, dst_2):
+        assert (dst / "case.dat").read_bytes() == b"case"
+        assert (dst / "templates/materials.jinja").read_bytes() == b"template"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["size"] == len(b"case") + len(b"template")
+
+
+@pytest.mark.unit
+def test_checkout_hardlink(tmp_path, case_zip):
+
+    cache = ExtractedCaseCache(tmp_path / "cache", max_size=1024)
+
+    dst = tmp_path / "w"
+    dst.mkdir()
+
+    cache.checkout("abc", lambda: BytesIO(case_zip), dst)
+
+    assert os.path.samefile(dst / "case.dat", cache.entry_path("abc") / "case.dat")
+
+
+@pytest.mark.unit
+def test_checkout_copy(tmp_path, case_zip):
+
+    cache = ExtractedCaseCache(tmp_path / "cache", max_size=1024, link_mode="copy")
+
+    dst = tmp_path / "w"
+    dst.mkdir()
+
+    cache.checkout("abc", lambda: BytesIO(case_zip), dst)
+
+    assert not os.path.samefile(dst / "case.dat", cache.entry_path("abc") / "case.dat")
+    assert (dst / "case.dat").read_bytes() == b"case"
+
+
+@pytest.mark.unit
+def test_evict_least_recently_used(tmp_path):
+
+    cache = ExtractedCaseCache(tmp_path / "cache", max_size=25)
+
+    for i, digest in enumerate(("a", "b")):
+        dst = tmp_path / f"w{digest}"
+        dst.mkdir()
+        cache.checkout(digest, lambda: BytesIO(_zip({"case.dat": b"x" * 10})), dst)
+        os.utime(cache.entry_path(digest), (i, i))
+
+    # "a" passa a ser a mais recente
+    dst = tmp_path / "wa2"
+    dst.mkdir()
+    cache.checkout("a", lambda: BytesIO(b""), dst)
+
+    dst = tmp_path / "wc"
+    dst.mkdir()
+    cache.checkout("c", lambda: BytesIO(_zip({"case.dat": b"x" * 10})), dst)
+
+    assert cache.entry_path("a").exists()
+    assert not cache.entry_path("b").exists()
+    assert cache.entry_path("c").exists()
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["evicted_bytes"] == 10
+    assert stats["size"] == 20
+
+    # Os arquivos do diretório de trabalho continuam validos
+    assert (tmp_path / "wb/case.dat").read_bytes() == b"x" * 10
+
+
+@pytest.mark.unit
+def test_populate_error_leaves_no_entry(tmp_path):
+
+    cache = ExtractedCaseCache(tmp_path / "cache", max_size=1024)
+
+    dst = tmp_path / "w"
+    dst.mkdir()
+
+    with pytest.raises(BadZipFile):
+        cache.checkout("abc", lambda: BytesIO(b"not a zip"), dst)
+
+    assert not cache.entry_path("abc").exists()
+    assert list(cache.tmp_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_clear(tmp_path, case_zip):
+
+    cache = ExtractedCaseCache(tmp_path / "cache", max_size=1024)
+
+    dst = tmp_path / "w"
+    dst.mkdir()
+    cache.checkout("abc", lambda: BytesIO(case_zip), dst)
+
+    cache.clear()
+
+    assert cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "evicted_bytes": 0,
+        "entries": 0,
+        "size": 0,
+        "max_size": 1024,
+    }
+
+
+@pytest.mark.unit
+def test_negative_invalid_link_mode(tmp_path):
+
+    with pytest.raises(ValueError, match="Invalid link mode 'symlink'"):
+        ExtractedCaseCache(tmp_path, max_size=1024, link_mode="symlink")
+
+
+@pytest.mark.unit
+def test_get_case_cache_disabled(monkeypatch):
+
+    monkeypatch.setattr(settings, "CASE_CACHE_MAX_SIZE", 0)
+
+    assert get_case_cache() is None
+
+
+@pytest.mark.unit
+def test_get_case_cache(case_cache_dir: Path):
+
+    cache = get_case_cache()
+
+    assert cache is not None
+    assert cache.root == case_cache_dir
@@ -1,4 +1,4 @@
-from confiacim_api.celery import get_config_transport
+from confiacim_api.celery import get_config_transport, get_task_routes
 
 
 def test_get_config_transport():
@@ -20,3 +20,40 @@ def test_get_config_transport_with_master_name():
         "visibility_timeout": 86400,
         "master_name": "mymaster",
     }
+
+
+def test_get_task_routes_without_queues():
+
+    Settings = type(
+        "Settings",
+        (),
+        {"TENCIM_QUEUE": None, "FORM_QUEUE": None, "MONTE_CARLO_QUEUE": None, "IO_QUEUE": None},
+    )
+
+    assert get_task_routes(Settings()) == {}
+
+
+def test_get_task_routes():
+
+    Settings = type(
+        "Settings",
+        (),
+        {
+            "TENCIM_QUEUE": "celery.tencim",
+            "FORM_QUEUE": "celery.form",
+            "MONTE_CARLO_QUEUE": None,
+            "IO_QUEUE": "celery.io",
+        },
+    )
+
+    assert get_task_routes(Settings()) == {
+        "confiacim_api.tasks.tencim_standalone_run": {"queue": "celery.tencim"},
+        "confiacim_api.tasks.form_run": {"queue": "celery.form"},
+        "confiacim_api.tasks.form_solve": {"queue": "celery.form"},
+        "confiacim_api.tasks.form_group_point_run": {"queue": "celery.form"},
+        "confiacim_api.tasks.form_prepare": {"queue": "celery.io"},
+        "confiacim_api.tasks.form_persist": {"queue": "celery.io"},
+        "confiacim_api.tasks.form_distributed_step": {"queue": "celery.io"},
+        "confiacim_api.tasks.form_group_run": {"queue": "celery.io"},
+        "confiacim_api.tasks.fair_share_release": {"queue": "celery.io"},
+    }
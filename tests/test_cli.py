@@ -1,9 +1,19 @@
+import os
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from sqlalchemy import select
 from typer.testing import CliRunner
 
 from confiacim_api.cli import app as cli
-from confiacim_api.models import User
+from confiacim_api.models import (
+    Case,
+    FormResult,
+    IdempotencyKey,
+    ResultStatus,
+    TencimResult,
+    User,
+)
 
 
 @pytest.fixture
@@ -171,3 +181,177 @@ def test_negative_delete_admin_user_must_be_admin(runner, session_cli, user):
     assert result.exit_code == 0
 
     assert f"Admin com o email '{user.email}' não encontrado!" in result.stdout
+
+
+@pytest.mark.cli
+def test_blobs_migrate(
+    runner,
+    session_cli,
+    case_with_file: Case,
+    form_results_with_generated_case_files: FormResult,
+    blob_store,
+):
+
+    case_id, case_digest = case_with_file.id, case_with_file.base_file_digest
+    result_id = form_results_with_generated_case_files.id
+    result_digest = form_results_with_generated_case_files.generated_case_files_digest
+
+    result = runner.invoke(cli, ["blobs", "migrate"])
+
+    assert result.exit_code == 0
+    assert "1 resultados do FORM migrados" in result.stdout
+
+    with session_cli() as session:
+        case = session.get(Case, case_id)
+        form_result = session.get(FormResult, result_id)
+
+        assert case.base_file is None
+        assert case.base_file_digest == case_digest
+
+        assert form_result.generated_case_files is None
+        assert form_result.generated_case_files_digest == result_digest
+
+    with blob_store.open(case_digest) as fp:
+        assert fp.read() == b"Fake zip file."
+
+    assert blob_store.exists(result_digest)
+
+
+@pytest.mark.cli
+def test_blobs_gc(runner, session_cli, case: Case, blob_store):
+
+    with session_cli() as session:
+        case = session.get(Case, case.id)
+        case.base_file_digest = blob_store.put_bytes(b"referenced")
+        session.commit()
+        referenced = case.base_file_digest
+
+    orphan = blob_store.put_bytes(b"orphan")
+    recent_orphan = blob_store.put_bytes(b"recent orphan")
+
+    os.utime(blob_store.path(orphan), (0, 0))
+
+    result = runner.invoke(cli, ["blobs", "gc"])
+
+    assert result.exit_code == 0
+    assert "1 blobs removidos" in result.stdout
+
+    assert blob_store.exists(referenced)
+    assert blob_store.exists(orphan) is False
+    assert blob_store.exists(recent_orphan)
+
+
+@pytest.mark.cli
+def test_blobs_gc_dry_run(runner, session_cli, blob_store):
+
+    orphan = blob_store.put_bytes(b"orphan")
+
+    result = runner.invoke(cli, ["blobs", "gc", "--min-age", "0", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert orphan in result.stdout
+    assert "1 blobs encontrados" in result.stdout
+
+    assert blob_store.exists(orphan)
+
+
+@pytest.mark.cli
+def test_case_cache_stats(runner):
+
+    result = runner.invoke(cli, ["case-cache", "stats"])
+
+    assert result.exit_code == 0
+
+    assert "hits" in result.stdout
+    assert "evictions" in result.stdout
+
+
+@pytest.mark.cli
+def test_case_cache_clear(runner, case_cache_dir):
+
+    (case_cache_dir / "entries/abc").mkdir(parents=True)
+
+    result = runner.invoke(cli, ["case-cache", "clear"])
+
+    assert result.exit_code == 0
+    assert "Cache de casos limpo" in result.stdout
+
+    assert list((case_cache_dir / "entries").iterdir()) == []
+
+
+@pytest.mark.cli
+def test_case_cache_disabled(runner, monkeypatch):
+
+    monkeypatch.setattr("confiacim_api.conf.settings.CASE_CACHE_MAX_SIZE", 0)
+
+    result = runner.invoke(cli, ["case-cache", "stats"])
+
+    assert result.exit_code == 0
+    assert "Cache de casos desabilitado" in result.stdout
+
+
+@pytest.mark.cli
+def test_idempotency_keys_purge(runner, session_cli, user: User):
+
+    now = datetime.now(timezone.utc)
+
+    with session_cli() as session:
+        session.add_all(
+            [
+                IdempotencyKey(
+                    key="expired",
+                    scope="form_run",
+                    request_hash="0" * 64,
+                    expires_at=now - timedelta(seconds=1),
+                    user_id=user.id,
+                ),
+                IdempotencyKey(
+                    key="valid",
+                    scope="form_run",
+                    request_hash="0" * 64,
+                    expires_at=now + timedelta(hours=1),
+                    user_id=user.id,
+                ),
+            ]
+        )
+        session.commit()
+
+    result = runner.invoke(cli, ["idempotency-keys", "purge"])
+
+    assert result.exit_code == 0
+    assert "1 chaves expiradas removidas" in result.stdout
+
+    with session_cli() as session:
+        assert session.scalars(select(IdempotencyKey.key)).all() == ["valid"]
+
+
+@pytest.mark.cli
+def test_tencim_backfill_summary(runner, session_cli, tencim_results: TencimResult, case_with_real_file: Case):
+
+    result_id = tencim_results.id
+
+    with session_cli() as session:
+        # Resultado sem curvas não é resumido
+        session.add(TencimResult(case=case_with_real_file, status=ResultStatus.CREATED))
+        session.commit()
+
+    result = runner.invoke(cli, ["tencim", "backfill-summary", "--batch-size", "1"])
+
+    assert result.exit_code == 0
+    assert "1 resultados do TENCIM resumidos" in result.stdout
+
+    with session_cli() as session:
+        tencim_result = session.get(TencimResult, result_id)
+
+        assert tencim_result.rc_threshold == 0.0
+        assert tencim_result.rankine_rc_min == 10.0
+        assert tencim_result.rankine_rc_min_istep == 3
+        assert tencim_result.mohr_coulomb_rc_mean == pytest.approx(70.0)
+
+    result = runner.invoke(cli, ["tencim", "backfill-summary"])
+
+    assert "0 resultados do TENCIM resumidos" in result.stdout
+
+    result = runner.invoke(cli, ["tencim", "backfill-summary", "--all"])
+
+    assert "1 resultados do TENCIM resumidos" in result.stdout
@@ -1,7 +1,7 @@
 import pytest
 
 from confiacim_api.models import TencimResult
-from confiacim_api.write_csv import write_rc_result_to_csv
+from confiacim_api.write_csv import iter_rc_result_csv
 
 CSV_FILE = "istep,t,rc_rankine,mohr_coulomb_rc\r\n1,1.0,100.0,100.0\r\n2,2.0,90.0,80.0\r\n3,3.0,10.0,30.0\r\n"
 
@@ -9,6 +9,22 @@ CSV_FILE = "istep,t,rc_rankine,mohr_coulomb_rc\r\n1,1.0,100.0,100.0\r\n2,2.0,90.
 @pytest.mark.unit
 def test_tencim_results_to_csv(tencim_results: TencimResult):
 
-    csv_file = write_rc_result_to_csv(tencim_results)
+    assert "".join(iter_rc_result_csv(tencim_results)) == CSV_FILE
 
-    assert csv_file.read() == CSV_FILE
+
+@pytest.mark.unit
+def test_tencim_results_to_csv_in_chunks(tencim_results: TencimResult):
+
+    chunks = list(iter_rc_result_csv(tencim_results, chunk_rows=2))
+
+    assert chunks == [
+        "istep,t,rc_rankine,mohr_coulomb_rc\r\n",
+        "1,1.0,100.0,100.0\r\n2,2.0,90.0,80.0\r\n",
+        "3,3.0,10.0,30.0\r\n",
+    ]
+
+
+@pytest.mark.unit
+def test_tencim_results_to_csv_without_rc():
+
+    assert "".join(iter_rc_result_csv(TencimResult())) == "istep,t,rc_rankine,mohr_coulomb_rc\r\n"
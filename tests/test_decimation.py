@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from confiacim_api.decimation import (
+    MINMAX,
+    SeriesGroup,
+    decimate_indices,
+    decimate_series,
+    lttb_indices,
+    minmax_indices,
+    stride_indices,
+)
+
+
+@pytest.fixture
+def rc_curve():
+    t = np.linspace(0.0, 100.0, 100_000)
+    rc = 100.0 - 80.0 * np.exp(-((t - 63.7) ** 2) / 0.01) + np.sin(t)
+    return t, rc
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "n, stride, expected",
+    [
+        (10, 3, [0, 3, 6, 9]),
+        (10, 4, [0, 4, 8, 9]),
+        (3, 10, [0, 2]),
+        (1, 2, [0]),
+        (0, 2, []),
+    ],
+)
+def test_stride_indices(n, stride, expected):
+    assert stride_indices(n, stride).tolist() == expected
+
+
+@pytest.mark.unit
+def test_lttb_indices(rc_curve):
+
+    t, rc = rc_curve
+
+    indices = lttb_indices(t, rc, 500)
+
+    assert len(indices) == 500
+    assert indices[0] == 0
+    assert indices[-1] == len(t) - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.unit
+def test_lttb_indices_must_keep_the_peaks():
+
+    x = np.arange(100, dtype=float)
+    y = np.zeros(100)
+    y[37] = 10.0
+
+    assert 37 in lttb_indices(x, y, 10)
+
+
+@pytest.mark.unit
+def test_lttb_indices_without_reduction():
+
+    x = np.arange(5, dtype=float)
+
+    assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.unit
+def test_minmax_indices(rc_curve):
+
+    _, rc = rc_curve
+
+    indices = minmax_indices(rc, 200)
+
+    assert len(indices) <= 200
+    assert indices[0] == 0
+    assert indices[-1] == len(rc) - 1
+    assert np.argmin(rc) in indices
+    assert np.argmax(rc) in indices
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("downsample", ["lttb", "minmax"])
+def test_decimate_indices_must_keep_the_global_minimum(downsample, rc_curve):
+
+    t, rc = rc_curve
+    other = rc[::-1].copy()
+
+    indices = decimate_indices(t, [rc, other], max_points=100, downsample=downsample)
+
+    assert len(indices) <= 100
+    assert np.argmin(rc) in indices
+    assert np.argmin(other) in indices
+
+
+@pytest.mark.unit
+def test_decimate_indices_stride(rc_curve):
+
+    t, rc = rc_curve
+
+    indices = decimate_indices(t, [rc], stride=1000)
+
+    assert indices[0] == 0
+    assert indices[-1] == len(t) - 1
+    assert np.argmin(rc) in indices
+    assert len(indices) == 102
+
+
+@pytest.mark.unit
+def test_decimate_indices_stride_and_max_points(rc_curve):
+
+    t, rc = rc_curve
+
+    indices = decimate_indices(t, [rc], max_points=50, stride=10, downsample=MINMAX)
+
+    assert len(indices) <= 50
+    assert np.argmin(rc) in indices
+
+
+@pytest.mark.unit
+def test_decimate_series():
+
+    data = {
+        "t": (0.0, 1.0, 2.0, 3.0, 4.0, 5.0),
+        "istep": (1, 2, 3, 4, 5, 6),
+        "rc": (5.0, 4.0, 1.0, 4.0, 5.0, 6.0),
+        "other": None,
+        "id": 1,
+    }
+
+    groups = (
+        SeriesGroup(x="t", ys=("rc",), extra=("istep",)),
+        SeriesGroup(x="t", ys=("other",)),
+    )
+
+    result = decimate_series(data, groups, stride=4)
+
+    assert result == {
+        "t": [0.0, 2.0, 4.0, 5.0],
+        "istep": [1, 3, 5, 6],
+        "rc": [5.0, 1.0, 5.0, 6.0],
+        "other": None,
+        "id": 1,
+    }
+
+
+@pytest.mark.unit
+def test_decimate_series_without_decimation():
+
+    data = {"t": (0.0, 1.0), "rc": (1.0, 2.0)}
+
+    assert decimate_series(data, (SeriesGroup(x="t", ys=("rc",)),)) is data
@@ -0,0 +1,199 @@
+import asyncio
+import json
+
+import psycopg
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from confiacim_api.events import (
+    IterationLogWatcher,
+    ResultEventsListener,
+    _conninfo,
+    format_sse,
+    iteration_event,
+    iteration_events,
+    publish_result_event,
+    result_channel,
+)
+
+ITERATION_INFOS = {
+    "beta": [3.0, 2.5],
+    "resid": [0.1, 0.001],
+    "E_c": [100.0, 110.0],
+}
+
+
+@pytest.mark.unit
+def test_result_channel():
+    assert result_channel("form", 1) == "confiacim_form_result_1"
+    assert result_channel("tencim", 1) != result_channel("form", 1)
+
+
+@pytest.mark.unit
+def test_format_sse():
+    assert format_sse("status", {"status": "success"}) == 'event: status\ndata: {"status": "success"}\n\n'
+
+
+@pytest.mark.unit
+def test_iteration_event():
+    assert iteration_event(ITERATION_INFOS, 1) == {
+        "it": 2,
+        "beta": 2.5,
+        "resid": 0.001,
+        "variables": {"E_c": 110.0},
+    }
+
+
+@pytest.mark.unit
+def test_iteration_events():
+    assert iteration_events(None) == []
+    assert [data["it"] for _, data in iteration_events(ITERATION_INFOS)] == [1, 2]
+
+
+@pytest.mark.unit
+def test_publish_result_event_never_raises(mocker):
+    error = OperationalError("pg_notify", {}, Exception("down"))
+    mocker.patch("confiacim_api.events.SessionFactory", side_effect=error)
+
+    publish_result_event("form", 1, "status", {"status": "success"})
+
+
+@pytest.mark.integration
+def test_publish_result_event_is_delivered(db_connection):
+
+    with psycopg.connect(_conninfo(), autocommit=True) as conn:
+        conn.execute(f"LISTEN {result_channel('form', 1)}")
+
+        publish_result_event("form", 1, "status", {"status": "runnig"})
+
+        notifies = list(conn.notifies(timeout=5, stop_after=1))
+
+    assert len(notifies) == 1
+    assert json.loads(notifies[0].payload) == {"event": "status", "data": {"status": "runnig"}}
+
+
+class FakeAsyncConnection:
+    def __init__(self):
+        self.commands = []
+        self.handlers = []
+        self.pending: asyncio.Queue = asyncio.Queue()
+
+    def add_notify_handler(self, callback):
+        self.handlers.append(callback)
+
+    async def execute(self, command):
+        self.commands.append(command.as_string(None))
+
+    async def notifies(self):
+        while True:
+            notify = await self.pending.get()
+            if isinstance(notify, Exception):
+                raise notify
+            yield notify
+
+    async def close(self):
+        pass
+
+    def notify(self, channel, event, data):
+        payload = json.dumps({"event": event, "data": data})
+        self.pending.put_nowait(psycopg.Notify(channel, payload, 0))
+
+
+@pytest.fixture
+def fake_connections(mocker):
+    connections = []
+
+    async def connect(*args, **kwargs):
+        connections.append(FakeAsyncConnection())
+        return connections[-1]
+
+    mocker.patch("confiacim_api.events.psycopg.AsyncConnection.connect", side_effect=connect)
+    return connections
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_result_events_listener_shares_one_connection(fake_connections):
+
+    listener = ResultEventsListener()
+
+    first = await listener.subscribe("channel_1")
+    second = await listener.subscribe("channel_1")
+    other = await listener.subscribe("channel_2")
+
+    assert len(fake_connections) == 1
+    conn = fake_connections[0]
+    assert conn.commands == ['LISTEN "channel_1"', 'LISTEN "channel_2"']
+
+    conn.notify("channel_1", "status", {"status": "success"})
+
+    assert await asyncio.wait_for(first.get(), 1) == ("status", {"status": "success"})
+    assert await asyncio.wait_for(second.get(), 1) == ("status", {"status": "success"})
+    assert other.empty()
+
+    await listener.unsubscribe("channel_1", first)
+    assert conn.commands[-1] == 'LISTEN "channel_2"'
+
+    await listener.unsubscribe("channel_1", second)
+    await listener.unsubscribe("channel_2", other)
+    assert conn.commands[2:] == ['UNLISTEN "channel_1"', 'UNLISTEN "channel_2"']
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_result_events_listener_connection_lost(fake_connections):
+
+    listener = ResultEventsListener()
+
+    queue = await listener.subscribe("channel_1")
+
+    fake_connections[0].pending.put_nowait(psycopg.OperationalError("down"))
+
+    assert await asyncio.wait_for(queue.get(), 1) is None
+
+    await listener.unsubscribe("channel_1", queue)
+    await listener.subscribe("channel_1")
+
+    assert len(fake_connections) == 2
+    assert fake_connections[1].commands == ['LISTEN "channel_1"']
+
+
+@pytest.mark.unit
+def test_iteration_log_watcher_check(tmp_path):
+
+    path = tmp_path / "form_iteration_log.json"
+    calls = []
+
+    watcher = IterationLogWatcher(path, lambda infos, seen: calls.append(seen), interval=60)
+
+    watcher.check()
+    assert calls == []
+
+    path.write_text('{"beta": [3.0')
+    watcher.check()
+    assert calls == []
+
+    path.write_text(json.dumps({"beta": [3.0], "resid": [0.1]}))
+    watcher.check()
+    watcher.check()
+    assert calls == [0]
+
+    path.write_text(json.dumps(ITERATION_INFOS))
+    watcher.check()
+    assert calls == [0, 1]
+
+
+@pytest.mark.unit
+def test_iteration_log_watcher_stop_reads_last_iterations(tmp_path):
+
+    path = tmp_path / "form_iteration_log.json"
+    calls = []
+
+    watcher = IterationLogWatcher(path, lambda infos, seen: calls.append(seen), interval=60)
+    watcher.start()
+
+    path.write_text(json.dumps(ITERATION_INFOS))
+    watcher.stop()
+
+    assert not watcher.is_alive()
+    assert calls == [0]
@@ -0,0 +1,102 @@
+import io
+
+import numpy as np
+import pytest
+
+from confiacim_api.errors import ExportDependencyError
+from confiacim_api.export import (
+    ARROW,
+    PARQUET,
+    TENCIM_EXPORT_FIELDS,
+    form_chunks,
+    load_pyarrow,
+    rebatch,
+    tencim_chunks,
+    write_export,
+)
+
+
+@pytest.mark.unit
+def test_rebatch():
+
+    chunks = [{"a": np.arange(0, 5)}, {"a": np.arange(5, 7)}, {"a": np.arange(7, 15)}]
+
+    batches = list(rebatch(chunks, batch_rows=4))
+
+    assert [len(b["a"]) for b in batches] == [4, 4, 4, 3]
+    np.testing.assert_array_equal(np.concatenate([b["a"] for b in batches]), np.arange(15))
+
+
+@pytest.mark.unit
+def test_rebatch_empty():
+    assert list(rebatch([], batch_rows=4)) == []
+
+
+@pytest.mark.unit
+def test_tencim_chunks():
+
+    rows = [
+        (1, np.array([1, 2, 3]), np.array([1.0, 2.0, 3.0]), np.array([10.0, 9.0, 8.0]), np.array([7.0, 6.0, 5.0])),
+        (2, None, None, None, None),
+        (3, np.array([1, 2]), np.array([1.0, 2.0]), np.array([1.0, 2.0]), np.array([3.0])),
+    ]
+
+    chunks = list(tencim_chunks(rows))
+
+    assert len(chunks) == 2
+    assert list(chunks[0]) == [name for name, _ in TENCIM_EXPORT_FIELDS]
+    np.testing.assert_array_equal(chunks[0]["result_id"], [1, 1, 1])
+    np.testing.assert_array_equal(chunks[0]["rankine_rc"], [10.0, 9.0, 8.0])
+    np.testing.assert_array_equal(chunks[1]["result_id"], [3])
+
+
+@pytest.mark.unit
+def test_form_chunks_missing_variable_must_be_nan():
+
+    rows = [
+        (1, {"beta": [1.1, 1.0], "resid": [1.0, 0.01], "E_c": [1.05, 1.04]}),
+        (2, None),
+        (3, {"beta": [2.0], "resid": [1.0]}),
+    ]
+
+    chunks = list(form_chunks(rows, ["beta", "resid", "E_c"]))
+
+    assert len(chunks) == 2
+    np.testing.assert_array_equal(chunks[0]["iteration"], [1, 2])
+    np.testing.assert_array_equal(chunks[0]["E_c"], [1.05, 1.04])
+    np.testing.assert_array_equal(chunks[1]["result_id"], [3])
+    assert np.isnan(chunks[1]["E_c"]).all()
+
+
+@pytest.mark.unit
+def test_load_pyarrow_not_installed(mocker):
+
+    mocker.patch("confiacim_api.export.importlib.import_module", side_effect=ImportError)
+
+    with pytest.raises(ExportDependencyError, match="Columnar export requires pyarrow."):
+        load_pyarrow()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("export_format", [PARQUET, ARROW])
+def test_write_export(export_format):
+
+    pa = pytest.importorskip("pyarrow")
+
+    chunks = [
+        {"result_id": np.array([1, 1]), "t": np.array([1.0, 2.0])},
+        # Linhas migradas ficam `big-endian`
+        {"result_id": np.array([2]), "t": np.array([3.0], dtype=">f8")},
+    ]
+
+    file = write_export(chunks, (("result_id", np.int64), ("t", np.float64)), export_format)
+
+    if export_format == PARQUET:
+        table = pytest.importorskip("pyarrow.parquet").read_table(io.BytesIO(file.read()))
+    else:
+        table = pa.ipc.open_file(io.BytesIO(file.read())).read_all()
+
+    assert table.schema.names == ["result_id", "t"]
+    assert table.schema.field("result_id").type == pa.int64()
+    assert table.column("result_id").to_pylist() == [1, 1, 2]
+    assert table.column("t").to_pylist() == [1.0, 2.0, 3.0]
@@ -0,0 +1,365 @@
+import json
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+import pytest
+from celery import chain, group, signature
+from freezegun import freeze_time
+
+from confiacim_api.celery import celery_app
+from confiacim_api.conf import settings
+from confiacim_api.fair_share import (
+    RELEASE_TASK,
+    dispatch,
+    leases_key,
+    max_running_jobs,
+    pending_depth,
+    pending_key,
+    release,
+    signature_queues,
+    submit,
+    submit_group,
+    user_stats,
+)
+from confiacim_api.models import User
+from confiacim_api.tasks import (
+    fair_share_release,
+    form_persist,
+    form_solve,
+    tencim_standalone_run,
+)
+
+
+class FakeRedis:
+    """Apenas os comandos usados pelo fair-share."""
+
+    def __init__(self):
+        self.lists: dict[str, list] = defaultdict(list)
+        self.zsets: dict[str, dict[str, float]] = defaultdict(dict)
+        self.values: dict[str, int] = {}
+
+    def rpush(self, key, value):
+        self.lists[key].append(str(value))
+        return len(self.lists[key])
+
+    def lpop(self, key):
+        return self.lists[key].pop(0) if self.lists[key] else None
+
+    def llen(self, key):
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        return list(self.lists[key])
+
+    def lrem(self, key, count, value):
+        self.lists[key] = [v for v in self.lists[key] if v != str(value)]
+
+    def lmove(self, src, dst, wherefrom, whereto):
+        value = self.lpop(src)
+        if value is not None:
+            self.rpush(dst, value)
+        return value
+
+    def hincrby(self, key, field, amount):
+        self.values[f"{key}:{field}"] = self.values.get(f"{key}:{field}", 0) + amount
+        return self.values[f"{key}:{field}"]
+
+    def hset(self, key, field, value):
+        self.values[f"{key}:{field}"] = value
+
+    def hmget(self, key, fields):
+        return [self.values.get(f"{key}:{field}") for field in fields]
+
+    def zadd(self, key, mapping):
+        self.zsets[key].update(mapping)
+        return len(mapping)
+
+    def zrem(self, key, member):
+        return int(self.zsets[key].pop(member, None) is not None)
+
+    def zcard(self, key):
+        return len(self.zsets[key])
+
+    def zremrangebyscore(self, key, min, max):
+        expired = [m for m, score in self.zsets[key].items() if score <= max]
+        for member in expired:
+            del self.zsets[key][member]
+        return len(expired)
+
+
+@pytest.fixture
+def redis(mocker):
+    client = FakeRedis()
+    mocker.patch("confiacim_api.fair_share.get_redis", return_value=client)
+    return client
+
+
+@pytest.fixture
+def fair_share(monkeypatch, mocker, session, redis):
+    monkeypatch.setattr(settings, "FAIR_SHARE_ENABLED", True)
+    monkeypatch.setattr(settings, "FAIR_SHARE_MAX_RUNNING_JOBS", 2)
+    mocker.patch("confiacim_api.fair_share.SessionFactory", return_value=session)
+    return redis
+
+
+@pytest.fixture
+def dispatched(mocker):
+    sent: list[dict] = []
+
+    def fake_signature(data, app):
+        sig = signature(data, app=app)
+        sig.apply_async = lambda: sent.append(json.loads(json.dumps(sig)))
+        return sig
+
+    mocker.patch("confiacim_api.fair_share.signature", side_effect=fake_signature)
+    return sent
+
+
+def _result_ids(sent: list[dict]) -> list[int]:
+    return [data["kwargs"]["result_id"] for data in sent]
+
+
+@pytest.mark.unit
+def test_submit_disabled(redis):
+
+    sig = MagicMock()
+
+    assert submit(1, sig) == sig.apply_async.return_value
+
+    assert redis.lists == {}
+
+
+@pytest.mark.unit
+def test_submit_group_disabled(redis):
+
+    group_sig = MagicMock()
+
+    assert submit_group(1, group_sig) == group_sig.apply_async.return_value.id
+
+    assert redis.lists == {}
+
+
+@pytest.mark.integration
+def test_submit_must_respect_the_user_limit(fair_share, dispatched, user: User):
+
+    user_id = user.id
+
+    results = [submit(user_id, tencim_standalone_run.si(result_id=i)) for i in range(5)]
+
+    assert _result_ids(dispatched) == [0, 1]
+    assert [data["options"]["task_id"] for data in dispatched] == [r.id for r in results[:2]]
+
+    assert fair_share.zcard(leases_key(user_id)) == 2
+    assert fair_share.llen(pending_key(user_id)) == 3
+
+
+@pytest.mark.integration
+def test_submit_must_link_the_release(fair_share, dispatched, user: User):
+
+    submit(user.id, tencim_standalone_run.si(result_id=1))
+
+    (data,) = dispatched
+    (lease_id,) = fair_share.zsets[leases_key(user.id)]
+
+    for callback in (*data["options"]["link"], *data["options"]["link_error"]):
+        assert callback["task"] == RELEASE_TASK
+        assert callback["kwargs"] == {"user_id": user.id, "lease_id": lease_id}
+        assert callback["immutable"] is True
+
+
+@pytest.mark.integration
+def test_submit_chain(fair_share, dispatched, user: User):
+
+    pipeline = chain(form_solve.si(result_id=1), form_persist.s(result_id=1))
+
+    result = submit(user.id, pipeline)
+
+    (data,) = dispatched
+    assert data["subtask_type"] == "chain"
+    assert data["kwargs"]["tasks"][-1]["options"]["task_id"] == result.id
+
+
+@pytest.mark.integration
+def test_round_robin_between_users(fair_share, dispatched, user: User, other_user: User):
+
+    user_id, other_user_id = user.id, other_user.id
+
+    for i in range(5):
+        submit(user_id, tencim_standalone_run.si(result_id=i))
+
+    # O outro usuário não espera as simulações pendentes do primeiro
+    submit(other_user_id, tencim_standalone_run.si(result_id=100))
+
+    assert _result_ids(dispatched) == [0, 1, 100]
+
+
+@pytest.mark.integration
+def test_release_must_dispatch_the_next(fair_share, dispatched, user: User):
+
+    user_id = user.id
+
+    for i in range(3):
+        submit(user_id, tencim_standalone_run.si(result_id=i))
+
+    lease_id = dispatched[0]["options"]["link"][0]["kwargs"]["lease_id"]
+
+    assert release(user_id, lease_id) == 1
+
+    assert _result_ids(dispatched) == [0, 1, 2]
+    assert lease_id not in fair_share.zsets[leases_key(user_id)]
+    assert fair_share.zcard(leases_key(user_id)) == 2
+    assert fair_share.llen(pending_key(user_id)) == 0
+    assert fair_share.lists["fair_share:users"] == []
+
+
+@pytest.mark.integration
+def test_release_without_lease_id_must_keep_the_leases(fair_share, dispatched, user: User):
+
+    user_id = user.id
+
+    for i in range(3):
+        submit(user_id, tencim_standalone_run.si(result_id=i))
+
+    assert release(user_id) == 0
+
+    assert _result_ids(dispatched) == [0, 1]
+    assert fair_share.zcard(leases_key(user_id)) == 2
+
+
+@pytest.mark.integration
+def test_expired_leases_must_free_the_slots(fair_share, dispatched, monkeypatch, user: User):
+
+    monkeypatch.setattr(settings, "FAIR_SHARE_LEASE_TTL", 60)
+    user_id = user.id
+
+    with freeze_time("2024-01-01 12:00:00"):
+        for i in range(3):
+            submit(user_id, tencim_standalone_run.si(result_id=i))
+
+    # Os workers das duas primeiras morreram sem rodar o `fair_share_release`
+    with freeze_time("2024-01-01 12:00:59"):
+        assert dispatch() == 0
+        assert user_stats(user_id) == {"running": 2, "pending": 1}
+
+    with freeze_time("2024-01-01 12:01:01"):
+        assert dispatch() == 1
+        assert user_stats(user_id) == {"running": 1, "pending": 0}
+
+    assert _result_ids(dispatched) == [0, 1, 2]
+
+
+@pytest.mark.integration
+def test_user_max_running_jobs(fair_share, dispatched, session, user: User):
+
+    user.max_running_jobs = 4
+    session.commit()
+    user_id = user.id
+
+    submit_group(user_id, group(tencim_standalone_run.si(result_id=i) for i in range(6)))
+
+    assert _result_ids(dispatched) == [0, 1, 2, 3]
+    assert user_stats(user_id) == {"running": 4, "pending": 2}
+
+
+@pytest.mark.integration
+def test_user_without_slots(fair_share, dispatched, session, user: User):
+
+    user.max_running_jobs = 0
+    session.commit()
+    user_id = user.id
+
+    submit(user_id, tencim_standalone_run.si(result_id=1))
+
+    assert dispatched == []
+    assert user_stats(user_id) == {"running": 0, "pending": 1}
+
+
+@pytest.mark.integration
+def test_max_running_jobs(session, user: User):
+
+    assert max_running_jobs(session, user.id) == settings.FAIR_SHARE_MAX_RUNNING_JOBS
+
+    user.max_running_jobs = 5
+    session.commit()
+
+    assert max_running_jobs(session, user.id) == 5
+
+
+@pytest.mark.unit
+def test_user_stats_disabled(redis):
+    assert user_stats(1) == {"running": 0, "pending": 0}
+
+
+@pytest.mark.integration
+def test_dispatch_without_pending(fair_share):
+    assert dispatch() == 0
+
+
+@pytest.mark.unit
+def test_fair_share_release_task(mocker):
+
+    release_mocker = mocker.patch("confiacim_api.tasks.release")
+
+    fair_share_release(3, "lease")
+
+    release_mocker.assert_called_once_with(3, "lease")
+
+
+@pytest.mark.integration
+def test_pending_signatures_are_json(fair_share, session, user: User):
+
+    user.max_running_jobs = 0
+    session.commit()
+    user_id = user.id
+
+    submit(user_id, tencim_standalone_run.si(result_id=1))
+
+    data = json.loads(fair_share.lpop(pending_key(user_id)))
+
+    assert data["task"] == "confiacim_api.tasks.tencim_standalone_run"
+
+
+@pytest.mark.integration
+def test_pending_depth(fair_share, dispatched, session, user: User, other_user: User):
+
+    user.max_running_jobs = 0
+    other_user.max_running_jobs = 0
+    session.commit()
+    user_id, other_user_id = user.id, other_user.id
+
+    for i in range(3):
+        submit(user_id, tencim_standalone_run.si(result_id=i).set(queue="celery.tencim"))
+    submit(other_user_id, tencim_standalone_run.si(result_id=100).set(queue="celery.tencim.affinity.0"))
+    submit(other_user_id, chain(form_solve.si(result_id=1).set(queue="celery.form"), form_persist.s(result_id=1)))
+
+    # Simulações do FORM pendentes não contam na fila do TENCIM
+    assert pending_depth(["celery.tencim", "celery.tencim.affinity.0"]) == 4
+    assert pending_depth(["celery.form"]) == 1
+
+    other_user.max_running_jobs = 2
+    session.commit()
+    dispatch()
+
+    assert pending_depth(["celery.tencim", "celery.tencim.affinity.0"]) == 3
+    assert pending_depth(["celery.form"]) == 0
+
+
+@pytest.mark.unit
+def test_signature_queues(monkeypatch):
+
+    monkeypatch.setattr(settings, "IO_QUEUE", "celery.io")
+    monkeypatch.setattr(celery_app.conf, "task_routes", {"confiacim_api.tasks.form_solve": {"queue": "celery.form"}})
+
+    assert signature_queues(tencim_standalone_run.si(result_id=1)) == ["celery"]
+    assert signature_queues(tencim_standalone_run.si(result_id=1).set(queue="celery.tencim")) == ["celery.tencim"]
+
+    pipeline = chain(
+        form_solve.si(result_id=1),
+        form_persist.s(result_id=1).set(queue="celery.io"),
+    )
+    assert signature_queues(json.loads(json.dumps(pipeline))) == ["celery.form", "celery.io"]
+
+
+@pytest.mark.unit
+def test_pending_depth_disabled(redis):
+    assert pending_depth(["celery"]) == 0
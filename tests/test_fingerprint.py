@@ -0,0 +1,102 @@
+import pytest
+from confiacim import __version__ as confiacim_version
+
+from confiacim_api.conf import settings
+from confiacim_api.fingerprint import (
+    canonical_fingerprint,
+    form_fingerprint,
+    solver_versions,
+    tencim_fingerprint,
+    tencim_run_fingerprint,
+)
+from confiacim_api.schemes import FormConfigCreateIn, TencimCreateRunIn
+
+DIGEST = "a" * 64
+
+
+@pytest.fixture
+def form_config():
+    return {
+        "critical_point": 120,
+        "form": {
+            "variables": [
+                {
+                    "name": "E_c",
+                    "dist": {"name": "lognormal", "params": {"param1": 1.0, "param2": 0.1}},
+                },
+            ],
+        },
+    }
+
+
+@pytest.mark.unit
+def test_canonical_fingerprint_key_order():
+    assert canonical_fingerprint("tencim", DIGEST, {"a": 1, "b": 2}) == canonical_fingerprint(
+        "tencim", DIGEST, {"b": 2, "a": 1}
+    )
+
+
+@pytest.mark.unit
+def test_canonical_fingerprint_depends_on_versions(mocker):
+    fingerprint = canonical_fingerprint("tencim", DIGEST, {})
+
+    mocker.patch("confiacim_api.fingerprint.solver_versions", return_value="Confiacim 0.17.0 (tencim1D 25.01.01)")
+
+    assert canonical_fingerprint("tencim", DIGEST, {}) != fingerprint
+
+
+@pytest.mark.unit
+def test_solver_versions_from_settings(monkeypatch, mocker):
+    subprocess_mocker = mocker.patch("subprocess.run")
+
+    monkeypatch.setattr(settings, "TENCIM_VERSION", None)
+    assert solver_versions() == f"Confiacim {confiacim_version}"
+
+    monkeypatch.setattr(settings, "TENCIM_VERSION", "tencim1D 25.01.01")
+    assert solver_versions() == f"Confiacim {confiacim_version} (tencim1D 25.01.01)"
+
+    subprocess_mocker.assert_not_called()
+
+
+@pytest.mark.unit
+def test_canonical_fingerprint_depends_on_kind_and_case():
+    fingerprint = canonical_fingerprint("tencim", DIGEST, {})
+
+    assert canonical_fingerprint("form", DIGEST, {}) != fingerprint
+    assert canonical_fingerprint("tencim", "b" * 64, {}) != fingerprint
+
+
+@pytest.mark.unit
+def test_form_fingerprint_ignores_description_and_force(form_config):
+    fingerprint = form_fingerprint(DIGEST, FormConfigCreateIn(**form_config))
+
+    other = FormConfigCreateIn(**form_config, description="Outra descrição", force=True)
+
+    assert form_fingerprint(DIGEST, other) == fingerprint
+
+
+@pytest.mark.unit
+def test_form_fingerprint_normalizes_params(form_config):
+    fingerprint = form_fingerprint(DIGEST, FormConfigCreateIn(**form_config))
+
+    form_config["form"]["variables"][0]["dist"]["params"]["param1"] = 1
+
+    assert form_fingerprint(DIGEST, FormConfigCreateIn(**form_config)) == fingerprint
+
+
+@pytest.mark.unit
+def test_form_fingerprint_depends_on_critical_point(form_config):
+    fingerprint = form_fingerprint(DIGEST, FormConfigCreateIn(**form_config))
+
+    form_config["critical_point"] = 121
+
+    assert form_fingerprint(DIGEST, FormConfigCreateIn(**form_config)) != fingerprint
+
+
+@pytest.mark.unit
+def test_tencim_run_fingerprint():
+    assert tencim_run_fingerprint(DIGEST, TencimCreateRunIn()) == tencim_fingerprint(DIGEST, None, False)
+    assert tencim_run_fingerprint(DIGEST, TencimCreateRunIn(critical_point=10, description="x", force=True)) == (
+        tencim_fingerprint(DIGEST, 10, False)
+    )
+    assert tencim_fingerprint(DIGEST, 10, True) != tencim_fingerprint(DIGEST, 10, False)
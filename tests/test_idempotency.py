@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+
+from confiacim_api.idempotency import REPLAYED_HEADER, request_hash, run_idempotent
+from confiacim_api.models import IdempotencyKey, User
+from confiacim_api.schemes import ResultCeleryTaskOut
+
+
+@pytest.fixture
+def handler(mocker):
+    return mocker.Mock(return_value={"result_id": 1, "task_id": None})
+
+
+def _run(session, user, handler, key="key-1", hash="a" * 64, **kwargs):
+    return run_idempotent(
+        session,
+        user,
+        key=key,
+        scope="form_run",
+        hash=lambda: hash,
+        handler=handler,
+        response_model=ResultCeleryTaskOut,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+def test_request_hash():
+    assert request_hash(1, {"a": 1, "b": [1.0]}) == request_hash(1, {"b": [1.0], "a": 1})
+    assert request_hash(1, {"a": 1}) != request_hash(2, {"a": 1})
+
+
+@pytest.mark.integration
+def test_run_idempotent_without_key(session, user: User, handler):
+
+    assert _run(session, user, handler, key=None) == handler.return_value
+    assert _run(session, user, handler, key=None) == handler.return_value
+
+    assert handler.call_count == 2
+    assert session.scalars(select(IdempotencyKey)).all() == []
+
+
+@pytest.mark.integration
+def test_run_idempotent_replay(session, user: User, handler):
+
+    assert _run(session, user, handler) == handler.return_value
+
+    replay = _run(session, user, handler)
+
+    handler.assert_called_once()
+
+    assert isinstance(replay, JSONResponse)
+    assert replay.status_code == status.HTTP_200_OK
+    assert replay.headers[REPLAYED_HEADER] == "true"
+    assert replay.body == JSONResponse({"result_id": 1, "task_id": None, "cached": False, "coalesced": False}).body
+
+
+@pytest.mark.integration
+def test_run_idempotent_replay_status_code(session, user: User, handler):
+
+    _run(session, user, handler, status_code=status.HTTP_201_CREATED)
+
+    assert _run(session, user, handler).status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.integration
+def test_run_idempotent_key_per_user_and_scope(session, user: User, other_user: User, handler):
+
+    _run(session, user, handler)
+    _run(session, other_user, handler)
+    run_idempotent(session, user, key="key-1", scope="tencim_standalone_run", hash=lambda: "a" * 64, handler=handler)
+
+    assert handler.call_count == 3
+
+
+@pytest.mark.integration
+def test_run_idempotent_different_request(session, user: User, handler):
+
+    _run(session, user, handler)
+
+    with pytest.raises(HTTPException) as e:
+        _run(session, user, handler, hash="b" * 64)
+
+    assert e.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert e.value.detail == "Idempotency-Key already used with a different request."
+
+
+@pytest.mark.integration
+def test_run_idempotent_request_in_progress(session, user: User, handler):
+
+    session.add(
+        IdempotencyKey(
+            user_id=user.id,
+            scope="form_run",
+            key="key-1",
+            request_hash="a" * 64,
+            expires_at=datetime.now() + timedelta(hours=1),
+        )
+    )
+    session.commit()
+
+    with pytest.raises(HTTPException) as e:
+        _run(session, user, handler)
+
+    assert e.value.status_code == status.HTTP_409_CONFLICT
+    handler.assert_not_called()
+
+
+@pytest.mark.integration
+def test_run_idempotent_expired_key(session, user: User, handler):
+
+    session.add(
+        IdempotencyKey(
+            user_id=user.id,
+            scope="form_run",
+            key="key-1",
+            request_hash="b" * 64,
+            response={"result_id": 2},
+            status_code=200,
+            expires_at=datetime.now() - timedelta(hours=1),
+        )
+    )
+    session.commit()
+
+    assert _run(session, user, handler) == handler.return_value
+
+    handler.assert_called_once()
+
+
+@pytest.mark.integration
+def test_run_idempotent_handler_error_release_the_key(session, user: User, handler):
+
+    handler.side_effect = [HTTPException(status_code=404), handler.return_value]
+
+    with pytest.raises(HTTPException):
+        _run(session, user, handler)
+
+    assert session.scalars(select(IdempotencyKey)).all() == []
+
+    assert _run(session, user, handler) == handler.return_value
+    assert handler.call_count == 2
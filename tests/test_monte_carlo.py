@@ -0,0 +1,81 @@
+import pytest
+
+from confiacim_api.monte_carlo import (
+    chunk_sizes,
+    monte_carlo_estimate,
+    pf_confidence_interval,
+    spawn_seeds,
+)
+
+
+@pytest.mark.unit
+def test_positive_spawn_seeds_must_be_reproducible():
+
+    seeds = spawn_seeds(42, 3)
+
+    assert len(seeds) == 3
+    assert len(set(seeds)) == 3
+    assert seeds == spawn_seeds(42, 3)
+    assert seeds != spawn_seeds(43, 3)
+    assert spawn_seeds(42, 5)[:3] == seeds
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "n_samples, chunk_size, expected",
+    [
+        (4, 2, [2, 2]),
+        (5, 2, [2, 2, 1]),
+        (3, 10, [3]),
+        (10_000, 1_000, [1_000] * 10),
+    ],
+)
+def test_positive_chunk_sizes(n_samples, chunk_size, expected):
+    assert chunk_sizes(n_samples, chunk_size) == expected
+
+
+@pytest.mark.unit
+def test_positive_pf_confidence_interval():
+
+    lower, upper = pf_confidence_interval(5, 100)
+
+    assert lower == pytest.approx(0.021543679)
+    assert upper == pytest.approx(0.111750469)
+
+
+@pytest.mark.unit
+def test_positive_pf_confidence_interval_without_failures():
+
+    lower, upper = pf_confidence_interval(0, 100)
+
+    assert lower == 0.0
+    assert upper == pytest.approx(0.036993498)
+
+
+@pytest.mark.unit
+def test_positive_pf_confidence_interval_without_simulations():
+    assert pf_confidence_interval(0, 0) == (None, None)
+
+
+@pytest.mark.unit
+def test_positive_monte_carlo_estimate():
+
+    estimate = monte_carlo_estimate(100, 80, 4)
+
+    assert estimate.total == 100
+    assert estimate.valid_simulations == 80
+    assert estimate.fail == 4
+    assert estimate.Pf == pytest.approx(0.05)
+    assert estimate.estimator == pytest.approx(0.487339717)
+    assert estimate.Pf_lower < estimate.Pf < estimate.Pf_upper
+
+
+@pytest.mark.unit
+def test_positive_monte_carlo_estimate_without_valid_simulations():
+
+    estimate = monte_carlo_estimate(4, 0, 0)
+
+    assert estimate.Pf is None
+    assert estimate.estimator is None
+    assert estimate.Pf_lower is None
+    assert estimate.Pf_upper is None
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from sqlalchemy import select
+
+from confiacim_api.models import Case, TencimResult
+from confiacim_api.numpy_array import (
+    HEADER,
+    NumpyArray,
+    decode_array,
+    encode_array,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ((1.0, 2.5, -3.25), np.float64),
+        ([1, 2, 3], np.int32),
+        (np.arange(10, dtype=np.int64), np.int32),
+        ((), np.float64),
+    ],
+)
+def test_encode_decode_array(values, dtype):
+
+    array = decode_array(encode_array(values, dtype))
+
+    assert array.dtype == np.dtype(dtype)
+    assert array.tolist() == list(values)
+
+
+@pytest.mark.unit
+def test_encode_array_format():
+
+    value = encode_array([1.0, 2.0], np.float64)
+
+    assert HEADER.unpack_from(value) == (b"<f8", 0, 2)
+    assert value[HEADER.size :] == np.array([1.0, 2.0], dtype="<f8").tobytes()
+
+
+@pytest.mark.unit
+def test_decode_array_must_be_a_view_of_the_bytes():
+
+    array = decode_array(encode_array(np.linspace(0.0, 1.0, 100), np.float64))
+
+    assert not array.flags.owndata
+    assert not array.flags.writeable
+
+
+@pytest.mark.unit
+def test_decode_array_big_endian():
+
+    value = HEADER.pack(b">i4", 0, 3) + np.array([1, 2, 3], dtype=">i4").tobytes()
+
+    assert decode_array(value).tolist() == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_encode_decode_array_compressed():
+
+    values = np.arange(10_000, dtype=np.int32)
+
+    value = encode_array(values, np.int32, compress=True)
+
+    assert len(value) < values.nbytes
+    np.testing.assert_array_equal(decode_array(value), values)
+
+
+@pytest.mark.unit
+def test_numpy_array_compare_values():
+
+    column_type = NumpyArray(np.float64)
+
+    assert column_type.compare_values(np.array([1.0, 2.0]), np.array([1.0, 2.0]))
+    assert not column_type.compare_values(np.array([1.0, 2.0]), np.array([1.0]))
+    assert not column_type.compare_values(np.array([1.0]), None)
+    assert column_type.compare_values(None, None)
+
+
+@pytest.mark.integration
+def test_numpy_array_column(session, case: Case):
+
+    result = TencimResult(case=case, istep=np.arange(1, 100_001), t=np.linspace(0.0, 1.0, 100_000))
+    session.add(result)
+    session.commit()
+    session.reset()
+
+    istep, t = session.execute(select(TencimResult.istep, TencimResult.t)).one()
+
+    assert istep.dtype == np.int32
+    assert istep[-1] == 100_000
+    np.testing.assert_array_equal(t, np.linspace(0.0, 1.0, 100_000))
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from confiacim_api.models import TencimResult
+from confiacim_api.rc_summary import (
+    RC_SUMMARY_FIELDS,
+    apply_rc_summary,
+    rc_stats,
+    rc_summary,
+)
+
+
+@pytest.mark.unit
+def test_rc_stats():
+
+    stats = rc_stats(
+        istep=(1, 2, 3, 4, 5),
+        t=(10.0, 20.0, 30.0, 40.0, 50.0),
+        rc=(100.0, -5.0, 20.0, -5.0, 40.0),
+        threshold=0.0,
+    )
+
+    assert stats == {
+        "rc_min": -5.0,
+        "rc_max": 100.0,
+        "rc_mean": pytest.approx(30.0),
+        "rc_min_istep": 2,
+        "rc_min_t": 20.0,
+        "rc_steps_below": 2,
+    }
+
+
+@pytest.mark.unit
+def test_rc_stats_empty():
+
+    stats = rc_stats(istep=(), t=(), rc=(), threshold=0.0)
+
+    assert stats["rc_min"] is None
+    assert stats["rc_min_istep"] is None
+    assert stats["rc_steps_below"] == 0
+
+
+@pytest.mark.unit
+def test_rc_summary():
+
+    result = TencimResult(
+        istep=np.array([1, 2, 3]),
+        t=np.array([1.0, 2.0, 3.0]),
+        rankine_rc=np.array([100.0, 90.0, 10.0]),
+        mohr_coulomb_rc=np.array([100.0, 80.0, 30.0]),
+    )
+
+    summary = rc_summary(result, threshold=50.0)
+
+    assert set(summary) == set(RC_SUMMARY_FIELDS)
+    assert summary["rc_threshold"] == 50.0
+    assert summary["rankine_rc_min"] == 10.0
+    assert summary["rankine_rc_min_istep"] == 3
+    assert summary["rankine_rc_steps_below"] == 1
+    assert summary["mohr_coulomb_rc_max"] == 100.0
+    assert summary["mohr_coulomb_rc_min_t"] == 3.0
+    assert summary["mohr_coulomb_rc_steps_below"] == 1
+
+
+@pytest.mark.unit
+def test_apply_rc_summary_result_without_rc():
+
+    result = TencimResult()
+
+    apply_rc_summary(result, threshold=0.0)
+
+    assert result.rc_threshold == 0.0
+    assert result.rankine_rc_min is None
+    assert result.mohr_coulomb_rc_steps_below == 0
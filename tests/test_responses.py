@@ -0,0 +1,95 @@
+import gzip
+import zlib
+
+import pytest
+
+from confiacim_api.errors import RangeNotSatisfiableError
+from confiacim_api.responses import accepts_gzip, etag_matches, gzip_chunks, parse_range
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-499", (0, 499)),
+        ("bytes=500-", (500, 999)),
+        ("bytes=-200", (800, 999)),
+        ("bytes=-2000", (0, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=0-0", (0, 0)),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header",
+    [
+        "items=0-10",
+        "bytes=0-10,20-30",
+        "bytes=10-5",
+        "bytes=a-b",
+        "bytes=",
+        "bytes=-",
+    ],
+)
+def test_parse_range_unsupported_return_none(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+def test_negative_parse_range_not_satisfiable(header):
+    with pytest.raises(RangeNotSatisfiableError, match="Range not satisfiable."):
+        parse_range(header, 1000)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("deflate, GZIP;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("identity", False),
+        ("deflate", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.unit
+def test_gzip_chunks():
+
+    chunks = [b"istep,t\r\n", b"1,1.0\r\n" * 100, b"2,2.0\r\n"]
+
+    compressed = list(gzip_chunks(chunks))
+
+    assert gzip.decompress(b"".join(compressed)) == b"".join(chunks)
+
+    # Cada bloco pode ser descompactado assim que chega
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk, compressed_chunk in zip(chunks, compressed):
+        assert decompressor.decompress(compressed_chunk) == chunk
@@ -0,0 +1,213 @@
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from confiacim_api.models import Case, FormResult, ResultStatus, TencimResult, User
+from confiacim_api.result_reuse import (
+    find_reusable_result,
+    lock_fingerprint,
+    reuse_result,
+    update_attached_results,
+)
+
+FINGERPRINT = "f" * 64
+
+
+def _tencim_result(session, case: Case, status: ResultStatus, **kwargs) -> TencimResult:
+    result = TencimResult(case=case, status=status, fingerprint=FINGERPRINT, **kwargs)
+    session.add(result)
+    session.commit()
+    session.refresh(result)
+    return result
+
+
+@pytest.mark.integration
+def test_find_reusable_result_prefers_success(session, case: Case):
+
+    _tencim_result(session, case, ResultStatus.RUNNING)
+    success = _tencim_result(session, case, ResultStatus.SUCCESS)
+    _tencim_result(session, case, ResultStatus.FAILED)
+
+    assert find_reusable_result(session, TencimResult, case.user_id, FINGERPRINT) == success
+
+
+@pytest.mark.integration
+def test_find_reusable_result_in_flight(session, case: Case):
+
+    _tencim_result(session, case, ResultStatus.FAILED)
+    running = _tencim_result(session, case, ResultStatus.RUNNING)
+
+    assert find_reusable_result(session, TencimResult, case.user_id, FINGERPRINT) == running
+
+
+@pytest.mark.integration
+def test_find_reusable_result_ignores_old_in_flight(session, case: Case):
+
+    _tencim_result(session, case, ResultStatus.CREATED, created_at=datetime.now() - timedelta(days=2))
+
+    assert find_reusable_result(session, TencimResult, case.user_id, FINGERPRINT) is None
+
+
+@pytest.mark.integration
+def test_find_reusable_result_ignores_attached_results(session, case: Case):
+
+    source = _tencim_result(session, case, ResultStatus.FAILED)
+    _tencim_result(session, case, ResultStatus.RUNNING, source_result_id=source.id)
+
+    assert find_reusable_result(session, TencimResult, case.user_id, FINGERPRINT) is None
+
+
+@pytest.mark.integration
+def test_find_reusable_result_only_user_results(session, case: Case, other_user):
+
+    _tencim_result(session, case, ResultStatus.SUCCESS)
+
+    assert find_reusable_result(session, TencimResult, other_user.id, FINGERPRINT) is None
+    assert find_reusable_result(session, FormResult, case.user_id, FINGERPRINT) is None
+
+
+@pytest.mark.integration
+def test_lock_fingerprint_is_reentrant(session):
+
+    lock_fingerprint(session, FINGERPRINT)
+    lock_fingerprint(session, FINGERPRINT)
+
+
+@pytest.mark.unit
+def test_reuse_result_in_flight():
+
+    source = TencimResult(id=1, status=ResultStatus.RUNNING, rankine_rc=(1.0,))
+    result = TencimResult()
+
+    reuse_result(result, source)
+
+    assert result.source_result_id == 1
+    assert result.status == ResultStatus.RUNNING
+    assert result.rankine_rc is None
+
+
+@pytest.mark.unit
+def test_reuse_result_success():
+
+    source = FormResult(id=1, status=ResultStatus.SUCCESS, beta=1.5, Pf=0.06, iteration_infos={"beta": [1.5]})
+    result = FormResult()
+
+    reuse_result(result, source)
+
+    assert result.source_result_id == 1
+    assert result.status == ResultStatus.SUCCESS
+    assert result.beta == 1.5
+    assert result.Pf == 0.06
+    assert result.iteration_infos == {"beta": [1.5]}
+
+
+@pytest.mark.integration
+def test_update_attached_results(session, case: Case):
+
+    source = _tencim_result(session, case, ResultStatus.RUNNING)
+    attached = _tencim_result(session, case, ResultStatus.RUNNING, source_result_id=source.id)
+    cached = _tencim_result(session, case, ResultStatus.SUCCESS, source_result_id=source.id, istep=(7,))
+
+    source.status = ResultStatus.SUCCESS
+    source.istep = np.array([1, 2], dtype=np.int32)
+    source.t = np.array([1.0, 2.0])
+    source.rankine_rc = np.array([10.0, 9.0])
+    source.mohr_coulomb_rc = np.array([11.0, 8.0])
+
+    assert update_attached_results(session, source) == [attached.id]
+    session.commit()
+
+    session.refresh(attached)
+    session.refresh(cached)
+
+    assert attached.status == ResultStatus.SUCCESS
+    assert attached.istep is not None
+    assert attached.mohr_coulomb_rc is not None
+    assert cached.istep is not None
+    assert attached.istep.tolist() == [1, 2]
+    assert attached.mohr_coulomb_rc.tolist() == [11.0, 8.0]
+    assert cached.istep.tolist() == [7]
+
+
+@pytest.mark.integration
+def test_update_attached_results_failed(session, case: Case):
+
+    source = _tencim_result(session, case, ResultStatus.RUNNING)
+    attached = _tencim_result(session, case, ResultStatus.CREATED, source_result_id=source.id)
+
+    source.status = ResultStatus.FAILED
+    source.error = "ERROR STOP 1"
+
+    update_attached_results(session, source)
+    session.commit()
+    session.refresh(attached)
+
+    assert attached.status == ResultStatus.FAILED
+    assert attached.error == "ERROR STOP 1"
+    assert attached.istep is None
+
+
+@pytest.mark.integration
+def test_update_attached_results_waits_for_the_route(db_connection):
+    """
+    A rota liga um resultado ao `source` em execução e, antes do seu `commit`,
+    o worker salva o status final do `source`.
+    """
+
+    engine = db_connection.engine
+
+    with Session(engine) as session:
+        user = User(email="race@email.com", password="123456")
+        case = Case(tag="race", user=user)
+        source = TencimResult(case=case, status=ResultStatus.RUNNING, fingerprint=FINGERPRINT)
+        session.add_all([user, case, source])
+        session.commit()
+        user_id, case_id, source_id = user.id, case.id, source.id
+
+    def worker():
+        with Session(engine) as session:
+            result = session.get(TencimResult, source_id)
+            assert result is not None
+            result.status = ResultStatus.SUCCESS
+            result.istep = np.array([1, 2], dtype=np.int32)
+            update_attached_results(session, result)
+            session.commit()
+
+    try:
+        with Session(engine) as route:
+            lock_fingerprint(route, FINGERPRINT)
+            found = find_reusable_result(route, TencimResult, user_id, FINGERPRINT)
+            assert found is not None
+            assert found.status == ResultStatus.RUNNING
+
+            attached = TencimResult(case_id=case_id, fingerprint=FINGERPRINT)
+            reuse_result(attached, found)
+            route.add(attached)
+            route.flush()
+            attached_id = attached.id
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join(timeout=0.5)
+            # O worker espera a trava da rota
+            assert thread.is_alive()
+
+            route.commit()
+
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+        with Session(engine) as session:
+            attached_from_db = session.get(TencimResult, attached_id)
+            assert attached_from_db is not None
+            assert attached_from_db.status == ResultStatus.SUCCESS
+            assert attached_from_db.istep is not None
+            assert attached_from_db.istep.tolist() == [1, 2]
+
+    finally:
+        with Session(engine) as session:
+            session.delete(session.get(User, user_id))
+            session.commit()
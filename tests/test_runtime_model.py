@@ -0,0 +1,194 @@
+import math
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from confiacim_api.conf import settings
+from confiacim_api.models import (
+    Case,
+    FormResult,
+    ResultStatus,
+    RunMetrics,
+    TencimResult,
+)
+from confiacim_api.runtime_model import (
+    RuntimeModel,
+    fit_runtime_model,
+    result_eta,
+    result_features,
+    save_run_metrics,
+)
+
+
+@pytest.mark.integration
+def test_save_run_metrics_must_merge_the_phases(session):
+
+    save_run_metrics(session, "form", 1, {"prepare": 2.0})
+    save_run_metrics(session, "form", 1, {"solve": 10.0}, n_steps=100, n_nodes=None)
+    save_run_metrics(session, "form", 1, {"persist": 0.5}, iterations=4)
+
+    metrics = session.scalars(select(RunMetrics).where(RunMetrics.analysis == "form")).one()
+
+    assert metrics.result_id == 1
+    assert metrics.phases == {"prepare": 2.0, "solve": 10.0, "persist": 0.5}
+    assert metrics.duration == pytest.approx(12.5)
+    assert metrics.n_steps == 100
+    assert metrics.n_nodes is None
+    assert metrics.iterations == 4
+    assert metrics.started_at is not None
+    assert metrics.finished_at is not None
+
+
+@pytest.mark.integration
+def test_fit_runtime_model_without_history(session, monkeypatch):
+
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 120)
+
+    model = fit_runtime_model(session, "tencim")
+
+    assert model.coef is None
+    assert model.n_runs == 0
+    assert model.predict(n_steps=1000, n_nodes=100) == 120
+
+
+@pytest.mark.integration
+def test_fit_runtime_model_with_little_history_must_use_the_mean(session):
+
+    save_run_metrics(session, "tencim", 1, {"solve": 10.0}, n_steps=100, n_nodes=10)
+    save_run_metrics(session, "tencim", 2, {"solve": 40.0}, n_steps=400, n_nodes=10)
+
+    model = fit_runtime_model(session, "tencim")
+
+    assert model.coef is None
+    assert model.n_runs == 2
+    assert model.predict(n_steps=1000) == pytest.approx(20.0)
+
+
+@pytest.mark.integration
+def test_fit_runtime_model_power_law(session):
+
+    # t = 0.01 * (1 + n_steps) * (1 + n_nodes)^0.5
+    runs = [(100, 100), (200, 400), (400, 100), (800, 900), (1600, 400), (300, 2500)]
+    for i, (n_steps, n_nodes) in enumerate(runs):
+        seconds = 0.01 * (n_steps + 1) * math.sqrt(n_nodes + 1)
+        save_run_metrics(session, "tencim", i + 1, {"solve": seconds}, n_steps=n_steps, n_nodes=n_nodes)
+
+    model = fit_runtime_model(session, "tencim")
+
+    assert model.n_runs == len(runs)
+    assert model.coef == pytest.approx((math.log(0.01), 1.0, 0.5), abs=1e-2)
+    assert model.predict(n_steps=3200, n_nodes=1600) == pytest.approx(0.01 * 3201 * math.sqrt(1601), rel=1e-2)
+
+
+@pytest.mark.unit
+def test_runtime_model_predict_missing_features_must_use_the_mean():
+
+    model = RuntimeModel(
+        analysis="tencim",
+        features=("n_steps", "n_nodes"),
+        coef=(0.0, 1.0, 1.0),
+        feature_means=(math.log(10.0), math.log(20.0)),
+        default=60.0,
+        n_runs=10,
+    )
+
+    assert model.predict(n_steps=9, n_nodes=19) == pytest.approx(200.0)
+    assert model.predict(n_steps=9) == pytest.approx(200.0)
+    assert model.predict() == pytest.approx(200.0)
+
+
+@pytest.mark.unit
+def test_result_features():
+
+    case = Case(n_steps=1000, n_nodes=83)
+
+    assert result_features("tencim", TencimResult(critical_point=None), case) == {"n_steps": 1000, "n_nodes": 83}
+    assert result_features("tencim", TencimResult(critical_point=160), case) == {"n_steps": 160, "n_nodes": 83}
+
+    form_result = FormResult(config={"variables": [{"name": "E_c"}, {"name": "poisson_c"}]})
+
+    assert result_features("form", form_result, case) == {"n_steps": 1000, "n_nodes": 83, "n_variables": 2}
+
+
+@pytest.mark.integration
+def test_result_eta_finished(session, tencim_results: TencimResult):
+
+    save_run_metrics(session, "tencim", tencim_results.id, {"prepare": 1.0, "solve": 9.0})
+
+    eta = result_eta(session, "tencim", tencim_results)
+
+    assert eta["status"] == ResultStatus.SUCCESS
+    assert eta["position"] == 0
+    assert eta["runtime"] == pytest.approx(10.0)
+    assert eta["finish_at"] > eta["start_at"]
+
+
+@pytest.mark.integration
+def test_result_eta_running(session, monkeypatch, tencim_results: TencimResult):
+
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 60)
+
+    tencim_results.status = ResultStatus.RUNNING
+    session.commit()
+
+    eta = result_eta(session, "tencim", tencim_results)
+
+    assert eta["runtime"] == 60
+    assert eta["position"] == 0
+    assert eta["finish_at"] >= eta["start_at"]
+
+
+@pytest.mark.integration
+def test_result_eta_in_the_queue(session, monkeypatch, case_with_real_file: Case):
+
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 60)
+    monkeypatch.setattr(settings, "ADMISSION_WORKERS", 2)
+
+    results = [TencimResult(case=case_with_real_file, status=ResultStatus.CREATED) for _ in range(3)]
+    session.add_all(results)
+    session.commit()
+
+    # Resultado reaproveitado não entra na fila
+    reused = TencimResult(case=case_with_real_file, status=ResultStatus.CREATED, source_result_id=results[0].id)
+    last = TencimResult(case=case_with_real_file, status=ResultStatus.CREATED)
+    session.add_all([reused, last])
+    session.commit()
+
+    first_eta = result_eta(session, "tencim", results[0])
+    last_eta = result_eta(session, "tencim", last)
+
+    assert first_eta["position"] == 0
+    assert last_eta["position"] == 3
+
+    # 3 simulações de 60 s na frente divididas entre 2 workers
+    assert (last_eta["start_at"] - first_eta["start_at"]).total_seconds() == pytest.approx(90.0, abs=1.0)
+    assert (last_eta["finish_at"] - last_eta["start_at"]).total_seconds() == pytest.approx(60.0)
+
+
+@pytest.mark.integration
+def test_result_eta_must_ignore_the_stale_queue(session, monkeypatch, case_with_real_file: Case):
+
+    monkeypatch.setattr(settings, "ADMISSION_TENCIM_RUNTIME", 60)
+    monkeypatch.setattr(settings, "ETA_MAX_QUEUE_AGE", 3600)
+
+    now = session.scalar(select(func.localtimestamp()))
+
+    stale = TencimResult(
+        case=case_with_real_file,
+        status=ResultStatus.CREATED,
+        created_at=now - timedelta(days=2),
+    )
+    running = TencimResult(case=case_with_real_file, status=ResultStatus.RUNNING)
+    session.add_all([stale, running])
+    session.commit()
+
+    queued = TencimResult(case=case_with_real_file, status=ResultStatus.CREATED)
+    session.add(queued)
+    session.commit()
+
+    eta = result_eta(session, "tencim", queued)
+
+    # Apenas a simulação rodando está na frente
+    assert eta["position"] == 0
+    assert (eta["start_at"] - now).total_seconds() == pytest.approx(60.0, abs=5.0)
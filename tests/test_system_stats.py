@@ -11,6 +11,7 @@ from confiacim_api.models import (
 from confiacim_api.system_stats import (
     count_case_with_simulation_success,
     count_tasks,
+    queues_depth,
     total_success_simulations,
 )
 
@@ -50,6 +51,14 @@ def test_count_tasks():
     assert count_tasks(inspector_active_return) == 2
 
 
+@pytest.mark.unit
+def test_queues_depth(mocker):
+
+    mocker.patch("confiacim_api.system_stats.queue_depth", side_effect=[3, None])
+
+    assert queues_depth(["celery.tencim", "celery.form"]) == {"celery.tencim": 3, "celery.form": None}
+
+
 @pytest.mark.unit
 def test_total_success_simulations(session: Session, user: User):
 
@@ -1,6 +1,9 @@
+import hashlib
+from io import BytesIO
+
 import pytest
 
-from confiacim_api.utils import file_case_is_zipfile
+from confiacim_api.utils import file_case_is_zipfile, scan_file
 
 
 @pytest.mark.unit
@@ -15,3 +18,28 @@ def test_negative_case_file_is_zipfile():
     with open("tests/fixtures/case.dat", mode="rb") as fp:
         assert not file_case_is_zipfile(fp)
         assert fp.tell() == 0
+
+
+@pytest.mark.unit
+def test_scan_file():
+    with open("tests/fixtures/case1.zip", mode="rb") as fp:
+        content = fp.read()
+        fp.seek(0)
+
+        infos = scan_file(fp, chunk_size=1024)
+
+        assert fp.tell() == 0
+
+    assert infos.size == len(content)
+    assert infos.sha256 == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.unit
+def test_scan_file_reads_in_chunks(mocker):
+    fp = BytesIO(b"a" * 2500)
+    read_spy = mocker.spy(fp, "read")
+
+    infos = scan_file(fp, chunk_size=1000)
+
+    assert infos.size == 2500
+    assert [c.args for c in read_spy.call_args_list] == [(1000,), (1000,), (1000,), (1000,)]
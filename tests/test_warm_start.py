@@ -0,0 +1,57 @@
+import pytest
+
+from confiacim_api.warm_start import apply_initial_point, design_point
+
+
+@pytest.fixture
+def core_variables():
+    return [
+        {"name": "E_c", "dist": {"name": "lognormal", "params": {"mean": 2.0, "cov": 0.1}}},
+        {"name": "poisson_c", "dist": {"name": "normal", "params": {"mean": 0.0, "cov": 0.1}}},
+        {"name": "internal_pressure", "dist": {"name": "normal", "params": {"mean": 1.0, "cov": 0.1}}},
+    ]
+
+
+@pytest.mark.unit
+def test_design_point():
+
+    iteration_infos = {
+        "beta": [1.13, 1.07],
+        "resid": [1.0, 1e-4],
+        "E_c": [1.05, 1.04],
+        "poisson_c": [0.97, 0.98],
+    }
+
+    assert design_point(iteration_infos, ["E_c", "poisson_c", "internal_pressure"]) == {
+        "E_c": 1.04,
+        "poisson_c": 0.98,
+    }
+
+
+@pytest.mark.unit
+def test_design_point_ignore_not_finite_values():
+
+    iteration_infos = {"E_c": [1.05, float("nan")], "poisson_c": []}
+
+    assert design_point(iteration_infos, ["E_c", "poisson_c"]) == {}
+
+
+@pytest.mark.unit
+def test_apply_initial_point(core_variables):
+
+    variables = apply_initial_point(core_variables, {"E_c": 2.2, "internal_pressure": 0.9})
+
+    assert variables[0]["initial_point_factor"] == pytest.approx(1.1)
+    assert "initial_point_factor" not in variables[1]
+    assert variables[2]["initial_point_factor"] == pytest.approx(0.9)
+
+    assert "initial_point_factor" not in core_variables[0]
+
+
+@pytest.mark.unit
+def test_apply_initial_point_zero_mean_or_negative_factor(core_variables):
+
+    variables = apply_initial_point(core_variables, {"poisson_c": 0.2, "internal_pressure": -1.0})
+
+    assert "initial_point_factor" not in variables[1]
+    assert "initial_point_factor" not in variables[2]